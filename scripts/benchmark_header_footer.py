@@ -0,0 +1,140 @@
+"""
+Benchmark HeaderFooterRemover against its original quadratic algorithm.
+
+Builds a synthetic deposition transcript (25-line pages with a repeated
+caption, running header, page footer and reporter footer, plus short
+answers such as "A. Yes." that repeat without being headers), then runs
+HeaderFooterRemover.process() and the original algorithm, which rescanned
+every line once per frequent line. Fails if the results differ.
+
+Usage (from project root):
+    python scripts/benchmark_header_footer.py
+    python scripts/benchmark_header_footer.py --lines 20000 --repeat 3
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.preprocessing import HeaderFooterRemover  # noqa: E402
+from src.preprocessing.base import PreprocessingResult  # noqa: E402
+
+LINES_PER_PAGE = 25
+
+SHORT_ANSWERS = [
+    "A. Yes.", "A. No.", "A. I don't recall.", "A. Correct.", "Q. Okay.",
+    "MR. SMITH: Objection.", "MS. JONES: Note my objection.", "A. I believe so.",
+    "Q. And then what happened?", "A. That's right.", "THE WITNESS: Yes.",
+]
+
+
+def build_transcript(line_count: int, seed: int = 0) -> str:
+    """Synthetic transcript of about line_count lines."""
+    rng = random.Random(seed)
+    lines = []
+    page = 1
+    while len(lines) < line_count:
+        lines.append(f"SMITH DEPOSITION - Page {page}")
+        lines.append("SUPREME COURT OF THE STATE OF NEW YORK")
+        lines.append("JOHN DOE, Plaintiff, v. ACME CORP., Defendant.")
+        for number in range(1, LINES_PER_PAGE - 4):
+            if rng.random() < 0.3:
+                body = rng.choice(SHORT_ANSWERS)
+            else:
+                body = f"Q. Testimony line {page}-{number} about the {rng.randint(1, 10**6)} event."
+            lines.append(f"{number:>2} {body}")
+        lines.append(f"- {page} -")
+        lines.append("Veritext Reporting Service, LLC")
+        page += 1
+    return '\n'.join(lines[:line_count])
+
+
+def original_process(remover: HeaderFooterRemover, text: str) -> PreprocessingResult:
+    """HeaderFooterRemover.process() as it was before the linear-time rewrite."""
+    lines = text.split('\n')
+
+    line_counts: Counter = Counter()
+    for line in lines:
+        normalized = remover._normalize_line(line)
+        if normalized:
+            line_counts[normalized] += 1
+
+    lines_to_remove: set[str] = set()
+    for normalized_line, count in line_counts.items():
+        if count >= remover.MIN_OCCURRENCES:
+            for line in lines:
+                if remover._normalize_line(line) == normalized_line:
+                    if remover._is_header_footer_candidate(line):
+                        lines_to_remove.add(normalized_line)
+                        break
+
+    result_lines = []
+    removed_count = 0
+    removed_examples = []
+    for line in lines:
+        normalized = remover._normalize_line(line)
+        if normalized in lines_to_remove:
+            removed_count += 1
+            if len(removed_examples) < 5:
+                removed_examples.append(line.strip()[:50])
+        else:
+            result_lines.append(line)
+
+    return PreprocessingResult(
+        text='\n'.join(result_lines),
+        changes_made=removed_count,
+        metadata={
+            'unique_patterns_removed': len(lines_to_remove),
+            'total_lines_removed': removed_count,
+            'examples': removed_examples,
+        }
+    )
+
+
+def best_time(fn, repeat: int):
+    """Best wall time in ms over repeat runs, plus the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--lines', type=int, default=100_000, help='Transcript length in lines')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per implementation (best is kept)')
+    args = parser.parse_args(argv)
+
+    text = build_transcript(args.lines)
+    remover = HeaderFooterRemover()
+
+    original_ms, original = best_time(lambda: original_process(remover, text), args.repeat)
+    current_ms, current = best_time(lambda: remover.process(text), args.repeat)
+
+    print(f"{args.lines} lines, {len(text) // 1024} KB, "
+          f"{current.metadata['unique_patterns_removed']} header/footer patterns, "
+          f"{current.changes_made} lines removed")
+    print(f"  original: {original_ms:10.1f} ms")
+    print(f"  current:  {current_ms:10.1f} ms  ({original_ms / max(current_ms, 1e-9):.1f}x)")
+
+    same = (current.text, current.changes_made, current.metadata) == (
+        original.text, original.changes_made, original.metadata
+    )
+    if not same:
+        print("Results differ!")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Benchmark PatternBank against trying each pattern in turn.
+
+Runs the three regex banks that use PatternBank over a synthetic deposition
+transcript (see benchmark_header_footer.py) and reports the cost per input:
+HeaderFooterRemover.HEADER_FOOTER_PATTERNS per line, TitlePageRemover's
+scoring patterns per 25-line page, and the chunking section patterns
+(config/chunking_patterns.txt) per 5-line paragraph. Fails if any result
+differs from the one-pattern-at-a-time loop.
+
+Usage (from project root):
+    python scripts/benchmark_pattern_bank.py
+    python scripts/benchmark_pattern_bank.py --lines 20000 --repeat 5
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.benchmark_header_footer import LINES_PER_PAGE, build_transcript  # noqa: E402
+from src.preprocessing import HeaderFooterRemover, TitlePageRemover  # noqa: E402
+from src.utils.pattern_bank import PatternBank  # noqa: E402
+
+CHUNKING_PATTERNS_FILE = project_root / "config" / "chunking_patterns.txt"
+PARAGRAPH_LINES = 5
+
+
+def load_chunking_patterns() -> list[re.Pattern]:
+    """Section patterns compiled as ChunkingEngine compiles them."""
+    patterns = []
+    for line in CHUNKING_PATTERNS_FILE.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            patterns.append(re.compile(line, re.MULTILINE | re.IGNORECASE))
+    return patterns
+
+
+def loop_first(patterns: list[re.Pattern], text: str) -> int | None:
+    """Index of the first pattern that matches, trying each in turn."""
+    for index, pattern in enumerate(patterns):
+        if pattern.search(text):
+            return index
+    return None
+
+
+def loop_all(patterns: list[re.Pattern], text: str) -> list[int]:
+    """Indexes of every pattern that matches, trying each in turn."""
+    return [index for index, pattern in enumerate(patterns) if pattern.search(text)]
+
+
+def bank_first(bank: PatternBank, text: str) -> int | None:
+    """Index of the first pattern that matches, using the bank."""
+    found = bank.search(text)
+    return found[0] if found else None
+
+
+def best_time(fn, repeat: int):
+    """Best wall time in ms over repeat runs, plus the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--lines', type=int, default=50_000, help='Transcript length in lines')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation (best is kept)')
+    args = parser.parse_args(argv)
+
+    lines = build_transcript(args.lines).split('\n')
+    pages = ['\n'.join(lines[i:i + LINES_PER_PAGE]) for i in range(0, len(lines), LINES_PER_PAGE)]
+    paragraphs = ['\n'.join(lines[i:i + PARAGRAPH_LINES]) for i in range(0, len(lines), PARAGRAPH_LINES)]
+
+    scoring = [pattern for pattern, _ in
+               TitlePageRemover.TITLE_PAGE_PATTERNS + TitlePageRemover.CONTENT_PATTERNS]
+    chunking = load_chunking_patterns()
+    cases = [
+        ("header/footer", "line", HeaderFooterRemover.HEADER_FOOTER_PATTERNS, lines, loop_first, bank_first),
+        ("title page", "page", scoring, pages, loop_all, PatternBank.matching),
+        ("chunk sections", "paragraph", chunking, paragraphs, loop_first, bank_first),
+    ]
+
+    print(f"{len(lines)} lines, {len(pages)} pages, {len(paragraphs)} paragraphs")
+    same = True
+    for name, unit, patterns, texts, loop_fn, bank_fn in cases:
+        bank = PatternBank(patterns)
+        loop_ms, expected = best_time(
+            lambda fn=loop_fn, patterns=patterns, texts=texts: [fn(patterns, t) for t in texts],
+            args.repeat)
+        bank_ms, actual = best_time(
+            lambda fn=bank_fn, bank=bank, texts=texts: [fn(bank, t) for t in texts],
+            args.repeat)
+        per_loop = loop_ms * 1000 / len(texts)
+        per_bank = bank_ms * 1000 / len(texts)
+        print(f"  {name:<15} {len(patterns):>3} patterns: "
+              f"{per_loop:8.2f} -> {per_bank:8.2f} us/{unit}  ({per_loop / max(per_bank, 1e-9):.1f}x)")
+        if actual != expected:
+            print(f"  {name}: results differ!")
+            same = False
+
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Compare serial and pipelined progressive summarization.
+
+Summarizes one document with ProgressiveDocumentSummarizer twice: serially
+(pipeline window 1, every chunk sees its predecessor's summary) and with
+chunks inside each batch window summarized concurrently. Reports wall time
+for each mode, how many chunk prompts had no local context, and how close
+the pipelined output stays to the serial one (ROUGE-1 F1 of the final
+summary and the mean over chunk summaries).
+
+Summaries are sampled, so two serial runs also differ; --noise-floor runs
+serial a second time to show how much of the gap is sampling alone. The
+response cache is bypassed so both modes reach Ollama.
+
+With --stub-latency no Ollama server is needed: every request sleeps for
+the given time and echoes the prompt, which measures latency only.
+
+Usage (from project root, Ollama running):
+    python scripts/benchmark_progressive_pipeline.py
+    python scripts/benchmark_progressive_pipeline.py --file transcript.txt --window 4 --noise-floor
+    python scripts/benchmark_progressive_pipeline.py --stub-latency 0.5 --lines 3000
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.benchmark_header_footer import build_transcript  # noqa: E402
+from src.ai import OllamaModelManager  # noqa: E402
+from src.config import OLLAMA_MAX_CONCURRENT_REQUESTS  # noqa: E402
+from src.summarization import ProgressiveDocumentSummarizer  # noqa: E402
+
+_WORD = re.compile(r"[a-z0-9']+")
+_PAGE_BREAK = re.compile(r"\n(?=SMITH DEPOSITION - Page)")
+
+
+class RecordingSummarizer(ProgressiveDocumentSummarizer):
+    """ProgressiveDocumentSummarizer that keeps every chunk summary and its local context."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chunk_summaries: dict[int, str] = {}
+        self.missing_local_context = 0
+
+    async def _summarize_chunk(self, progressive, chunk_num, chunk_text, target_words=75):
+        """Summarize as usual, counting prompts whose previous chunk was still in flight."""
+        previous = progressive.df.loc[progressive.df['chunk_num'] == chunk_num - 1, 'chunk_summary']
+        if not previous.empty and not previous.iloc[0]:
+            self.missing_local_context += 1
+        summary = await super()._summarize_chunk(progressive, chunk_num, chunk_text, target_words)
+        self.chunk_summaries[chunk_num] = summary
+        return summary
+
+
+class StubModelManager:
+    """Model manager stand-in: each request sleeps, then echoes the prompt's last words."""
+
+    loaded_model_name = "stub"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self._slots: asyncio.Semaphore | None = None
+
+    async def agenerate_text(self, prompt: str, max_tokens: int = 500, **kwargs) -> str:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(OLLAMA_MAX_CONCURRENT_REQUESTS)
+        async with self._slots:
+            await asyncio.sleep(self.latency)
+        return " ".join(prompt.split()[-max_tokens // 2:])
+
+
+def synthetic_document(line_count: int) -> str:
+    """Synthetic transcript with a blank line between pages, so it chunks like a real one."""
+    return _PAGE_BREAK.sub("\n\n", build_transcript(line_count))
+
+
+def rouge1_f1(candidate: str, reference: str) -> float:
+    """Unigram-overlap F1 between two texts (lowercased words)."""
+    cand = Counter(_WORD.findall(candidate.lower()))
+    ref = Counter(_WORD.findall(reference.lower()))
+    overlap = sum((cand & ref).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(cand.values())
+    recall = overlap / sum(ref.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def run_mode(model_manager, text: str, window: int, max_words: int) -> dict:
+    """Summarize text with the given pipeline window."""
+    summarizer = RecordingSummarizer(model_manager, pipeline_window=window)
+    start = time.perf_counter()
+    result = summarizer.summarize(text, "benchmark.txt", max_words=max_words)
+    seconds = time.perf_counter() - start
+    if not result.success:
+        raise RuntimeError(f"window {window}: {result.error_message}")
+    return {
+        'window': window,
+        'seconds': seconds,
+        'chunks': result.chunk_count,
+        'missing_local_context': summarizer.missing_local_context,
+        'summary': result.summary,
+        'chunk_summaries': summarizer.chunk_summaries,
+    }
+
+
+def compare(run: dict, reference: dict) -> tuple[float, float]:
+    """ROUGE-1 F1 of the final summary and mean over chunk summaries against reference."""
+    final = rouge1_f1(run['summary'], reference['summary'])
+    chunk_scores = [
+        rouge1_f1(summary, reference['chunk_summaries'].get(num, ""))
+        for num, summary in run['chunk_summaries'].items()
+    ]
+    return final, sum(chunk_scores) / max(len(chunk_scores), 1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--file', type=Path,
+                        help='Plain-text document (default: synthetic transcript)')
+    parser.add_argument('--lines', type=int, default=1000,
+                        help='Synthetic transcript length in lines')
+    parser.add_argument('--window', type=int, default=OLLAMA_MAX_CONCURRENT_REQUESTS,
+                        help='Pipeline window for the pipelined run')
+    parser.add_argument('--max-words', type=int, default=200, help='Final summary length')
+    parser.add_argument('--noise-floor', action='store_true',
+                        help='Run serial twice to measure sampling noise')
+    parser.add_argument('--stub-latency', type=float,
+                        help='Seconds per request for a stub model (no Ollama)')
+    args = parser.parse_args(argv)
+
+    text = args.file.read_text(encoding='utf-8') if args.file else synthetic_document(args.lines)
+
+    if args.stub_latency is not None:
+        model_manager = StubModelManager(args.stub_latency)
+    else:
+        model_manager = OllamaModelManager(use_cache=False)
+        if not model_manager.is_connected:
+            print("Ollama is not reachable; start it or use --stub-latency")
+            return 1
+
+    serial = run_mode(model_manager, text, 1, args.max_words)
+    pipelined = run_mode(model_manager, text, args.window, args.max_words)
+    runs = [serial, pipelined]
+    if args.noise_floor:
+        runs.append(run_mode(model_manager, text, 1, args.max_words))
+
+    print(f"{len(text.split())} words, {serial['chunks']} chunks")
+    print(f"  {'mode':<14} {'seconds':>8} {'speedup':>8} {'no local ctx':>13} "
+          f"{'final F1':>9} {'chunk F1':>9}")
+    labels = ("serial", f"window {args.window}", "serial again")[:len(runs)]
+    for label, run in zip(labels, runs, strict=True):
+        final, chunk = compare(run, serial) if run is not serial else (1.0, 1.0)
+        print(f"  {label:<14} {run['seconds']:8.1f} {serial['seconds'] / run['seconds']:7.2f}x "
+              f"{run['missing_local_context']:>13} {final:9.3f} {chunk:9.3f}")
+    if args.stub_latency is not None:
+        print("  (stub model: F1 scores reflect prompt echoes, not summary quality)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
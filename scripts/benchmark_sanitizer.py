@@ -0,0 +1,101 @@
+"""
+Benchmark CharacterSanitizer against the original multi-pass implementation.
+
+Extracts the digital text of every document in sampleDocuments/ (PDF pages
+via pdfplumber, TXT as-is), then sanitizes each text with both
+CharacterSanitizer and LegacyCharacterSanitizer. Reports the best-of-N time
+per document and the speedup, and fails if text or stats ever differ.
+
+Usage (from project root):
+    python scripts/benchmark_sanitizer.py
+    python scripts/benchmark_sanitizer.py --repeat 5 --scale 20
+    python scripts/benchmark_sanitizer.py path/to/docs --no-transliterate
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import pdfplumber  # noqa: E402
+
+from src.sanitization import CharacterSanitizer  # noqa: E402
+from tests.legacy_sanitizer import LegacyCharacterSanitizer  # noqa: E402
+
+
+def load_texts(directory: Path) -> list[tuple[str, str]]:
+    """Return (name, raw text) for each PDF/TXT file in directory."""
+    texts = []
+    for path in sorted(directory.iterdir()):
+        suffix = path.suffix.lower()
+        if suffix == '.pdf':
+            with pdfplumber.open(path) as pdf:
+                text = '\n'.join(page.extract_text() or '' for page in pdf.pages)
+        elif suffix == '.txt':
+            text = path.read_text(encoding='utf-8', errors='ignore')
+        else:
+            continue
+        texts.append((path.name, text))
+    return texts
+
+
+def best_time(sanitizer, text: str, repeat: int) -> tuple[float, tuple[str, dict]]:
+    """Best wall time in ms over repeat runs, plus the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = sanitizer.sanitize(text)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('directory', nargs='?', default=project_root / 'sampleDocuments', type=Path)
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per document (best is kept)')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='Repeat each text this many times to simulate longer documents')
+    parser.add_argument('--no-transliterate', action='store_true')
+    args = parser.parse_args(argv)
+
+    texts = load_texts(args.directory)
+    if not texts:
+        print(f"No PDF/TXT files found in {args.directory}")
+        return 1
+
+    transliterate = not args.no_transliterate
+    fused = CharacterSanitizer(transliterate=transliterate)
+    legacy = LegacyCharacterSanitizer(transliterate=transliterate)
+
+    print(f"{'document':<60}{'chars':>10}{'legacy ms':>12}{'fused ms':>12}{'speedup':>9}")
+    legacy_total = fused_total = 0.0
+    mismatches = 0
+    for name, text in texts:
+        text = text * args.scale
+        legacy_ms, legacy_result = best_time(legacy, text, args.repeat)
+        fused_ms, fused_result = best_time(fused, text, args.repeat)
+        legacy_total += legacy_ms
+        fused_total += fused_ms
+
+        if fused_result != legacy_result:
+            mismatches += 1
+            name = f"{name} (MISMATCH)"
+        print(f"{name[:59]:<60}{len(text):>10}{legacy_ms:>12.1f}{fused_ms:>12.1f}"
+              f"{legacy_ms / max(fused_ms, 1e-9):>8.1f}x")
+
+    print(f"{'total':<60}{'':>10}{legacy_total:>12.1f}{fused_total:>12.1f}"
+          f"{legacy_total / max(fused_total, 1e-9):>8.1f}x")
+
+    if mismatches:
+        print(f"{mismatches} document(s) sanitized differently!")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,493 @@
+"""
+Regression benchmark suite for the document pipeline.
+
+Runs extraction, sanitization, each preprocessor (and the streaming
+pipeline as a whole), chunking, BM25/FAISS indexing and vocabulary
+extraction over the documents in sampleDocuments/ and over synthetic
+deposition transcripts scaled 1x/10x/100x. Each stage records its
+throughput (MB/s, plus chunks/s where it produces or consumes chunks) and
+the peak Python memory of one traced run (tracemalloc; allocations in
+worker processes are not counted).
+
+Results are compared with a JSON baseline, and the run fails if a stage's
+throughput falls, or its peak memory grows, by more than the tolerance.
+Stages whose dependencies or models are missing (faiss, the embeddings
+model, a spaCy model) are reported as skipped, never as regressions.
+Baselines are machine-specific: record one on the machine you compare on.
+
+Usage (from project root):
+    python scripts/benchmark_suite.py --save-baseline
+    python scripts/benchmark_suite.py
+    python scripts/benchmark_suite.py --scales 1,10 --no-extraction --tolerance 0.5
+    python -m pytest -m benchmark
+"""
+
+import argparse
+import gc
+import json
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.benchmark_header_footer import build_transcript  # noqa: E402
+from src.preprocessing import create_default_pipeline  # noqa: E402
+from src.sanitization import CharacterSanitizer  # noqa: E402
+
+SAMPLE_DIR = project_root / "sampleDocuments"
+BASELINE_PATH = project_root / "tests" / "benchmarks" / "baseline.json"
+
+# Allowed slowdown / memory growth before a stage counts as regressed (0.25 = 25%)
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_SCALES = (1, 10, 100)
+
+# Lines in the 1x synthetic transcript (about 200 pages, 300 KB)
+BASE_TRANSCRIPT_LINES = 5_000
+
+# Stages faster than this are too noisy to compare throughput
+MIN_COMPARABLE_SECONDS = 0.01
+
+# Peak memory may always grow by this much (small stages vary by allocator noise)
+MEMORY_SLACK_MB = 1.0
+
+# spaCy NER over more text than this would dominate the whole run
+VOCABULARY_MAX_CHARS = 2_000_000
+
+MB = 1024 * 1024
+
+
+class StageSkipped(Exception):
+    """A stage cannot run here (missing dependency or model)."""
+
+
+@dataclass
+class StageResult:
+    """
+    Measurements for one stage on one workload.
+
+    Attributes:
+        megabytes: Input size in MB (file size for extraction, text otherwise)
+        seconds: Best wall time over the timed runs
+        mb_per_s: Input megabytes per second
+        chunks_per_s: Chunks produced or indexed per second (None if not chunk-based)
+        peak_mb: Peak traced Python memory during one run (None if not measured)
+    """
+
+    megabytes: float
+    seconds: float
+    mb_per_s: float
+    chunks_per_s: float | None = None
+    peak_mb: float | None = None
+
+
+def text_megabytes(texts: list[str]) -> float:
+    """Size of texts in MB of UTF-8."""
+    return sum(len(text.encode('utf-8', errors='surrogatepass')) for text in texts) / MB
+
+
+def measure(run: Callable[[], int | None], megabytes: float, repeat: int,
+            trace_memory: bool) -> StageResult:
+    """
+    Time a stage and optionally trace its peak memory in a separate run.
+
+    Args:
+        run: Runs the stage once and returns the number of chunks (or None)
+        megabytes: Input size for the throughput figure
+        repeat: Timed runs (the best is kept)
+        trace_memory: Whether to do an extra run under tracemalloc
+
+    Returns:
+        StageResult
+    """
+    best = float('inf')
+    chunks = None
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        start = time.perf_counter()
+        chunks = run()
+        best = min(best, time.perf_counter() - start)
+    best = max(best, 1e-9)
+
+    peak_mb = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            peak_mb = tracemalloc.get_traced_memory()[1] / MB
+        finally:
+            tracemalloc.stop()
+
+    return StageResult(
+        megabytes=round(megabytes, 4),
+        seconds=round(best, 6),
+        mb_per_s=round(megabytes / best, 4),
+        chunks_per_s=round(chunks / best, 2) if chunks is not None else None,
+        peak_mb=round(peak_mb, 3) if peak_mb is not None else None,
+    )
+
+
+_models: dict[str, object] = {}
+
+
+def load_model(name: str, factory: Callable[[], object]) -> object:
+    """
+    Load a model once per run, raising StageSkipped if it is unavailable.
+
+    A failure is remembered too, so a missing model is not retried per workload.
+    """
+    if name not in _models:
+        try:
+            _models[name] = factory()
+        except Exception as e:
+            _models[name] = StageSkipped(f"{type(e).__name__}: {e}")
+    model = _models[name]
+    if isinstance(model, StageSkipped):
+        raise model
+    return model
+
+
+def _load_embeddings():
+    import faiss  # noqa: F401
+
+    from src.retrieval.algorithms.faiss_semantic import FAISSRetriever
+    return FAISSRetriever()._ensure_embeddings()
+
+
+def _load_vocabulary_extractor():
+    from src.vocabulary import VocabularyExtractor
+
+    extractor = VocabularyExtractor()
+    _ = extractor.nlp  # Property access loads the spaCy model
+    return extractor
+
+
+def for_each(function: Callable, texts: list[str]) -> Callable[[], None]:
+    """Stage run that applies function to every text."""
+    def run():
+        for text in texts:
+            function(text)
+    return run
+
+
+def stage_name(preprocessor_name: str) -> str:
+    """"Header/Footer Remover" -> "preprocess.header_footer_remover"."""
+    return 'preprocess.' + re.sub(r'\W+', '_', preprocessor_name.lower()).strip('_')
+
+
+def extraction_stage(paths: list[Path]) -> tuple[Callable[[], None], list[str]]:
+    """
+    Build the extraction stage for document files.
+
+    Extracts every file once (untimed) to get the texts for later stages.
+
+    Returns:
+        (run callable, extracted texts of the documents that succeeded)
+    """
+    from src.extraction import RawTextExtractor
+
+    extractor = RawTextExtractor(use_cache=False)
+
+    def extract_all() -> list[str]:
+        texts = []
+        for path in paths:
+            result = extractor.process_document(str(path))
+            if result.get('status') == 'success' and result.get('extracted_text'):
+                texts.append(result['extracted_text'])
+        return texts
+
+    def run():
+        extract_all()
+
+    return run, extract_all()
+
+
+def text_stages(texts: list[str], vocabulary_max_chars: int) -> Iterator[tuple[str, Callable]]:
+    """
+    Yield (stage name, setup) for every stage that runs on extracted text.
+
+    Each setup returns (run callable, input megabytes) or raises StageSkipped.
+    Stages are yielded in pipeline order and each feeds the next: sanitized
+    text is preprocessed, preprocessed text is chunked, chunks are indexed.
+    """
+    sanitizer = CharacterSanitizer()
+    yield 'sanitization', lambda: (for_each(sanitizer.sanitize, texts), text_megabytes(texts))
+    sanitized = [sanitizer.sanitize(text)[0] for text in texts]
+
+    # Each preprocessor on the output of the ones before it, as the pipeline runs them
+    stage_input = sanitized
+    for preprocessor in create_default_pipeline().preprocessors:
+        inputs = stage_input
+        yield stage_name(preprocessor.name), lambda p=preprocessor, inputs=inputs: (
+            for_each(p.process, inputs), text_megabytes(inputs)
+        )
+        stage_input = [preprocessor.process(text).text for text in inputs]
+    preprocessed = stage_input
+
+    def run_pipeline(text: str):
+        create_default_pipeline().process(text)
+    yield 'preprocessing', lambda: (for_each(run_pipeline, sanitized), text_megabytes(sanitized))
+
+    from src.briefing.chunker import DocumentChunker
+
+    chunker = DocumentChunker()
+    documents = [{'filename': f'doc{i}', 'text': text} for i, text in enumerate(preprocessed)]
+    briefing_chunks = chunker.chunk_documents(documents)
+
+    def run_chunker():
+        return len(chunker.chunk_documents(documents))
+    yield 'chunking', lambda: (run_chunker, text_megabytes(preprocessed))
+
+    from src.retrieval.base import DocumentChunk
+
+    chunks = [
+        DocumentChunk(text=chunk.text, chunk_id=str(chunk.chunk_id),
+                      filename=chunk.source_document, chunk_num=chunk.chunk_index)
+        for chunk in briefing_chunks
+    ]
+    chunk_megabytes = text_megabytes([chunk.text for chunk in chunks])
+
+    def bm25_setup():
+        if not chunks:
+            raise StageSkipped("no chunks")
+        try:
+            from src.retrieval.algorithms.bm25_plus import BM25PlusRetriever
+        except ImportError as e:
+            raise StageSkipped(str(e)) from e
+
+        def run():
+            BM25PlusRetriever().index_documents(chunks)
+            return len(chunks)
+        return run, chunk_megabytes
+    yield 'bm25_index', bm25_setup
+
+    def faiss_setup():
+        if not chunks:
+            raise StageSkipped("no chunks")
+        # Models are loaded outside the timed runs
+        embeddings = load_model('embeddings', _load_embeddings)
+        from src.retrieval.algorithms.faiss_semantic import FAISSRetriever
+
+        def run():
+            FAISSRetriever(embeddings).index_documents(chunks)
+            return len(chunks)
+        return run, chunk_megabytes
+    yield 'faiss_index', faiss_setup
+
+    def vocabulary_setup():
+        total_chars = sum(map(len, preprocessed))
+        if total_chars > vocabulary_max_chars:
+            raise StageSkipped(f"{total_chars} chars exceeds --vocabulary-max-chars")
+        extractor = load_model('vocabulary', _load_vocabulary_extractor)
+        return for_each(extractor.extract, preprocessed), text_megabytes(preprocessed)
+    yield 'vocabulary', vocabulary_setup
+
+
+def load_workloads(
+    scales: list[int], include_samples: bool
+) -> list[tuple[str, list[Path] | None, list[str]]]:
+    """
+    Build the workloads: sample documents plus synthetic transcripts.
+
+    Returns:
+        List of (workload name, document paths or None, texts). For sample
+        documents the texts are filled in by the extraction stage.
+    """
+    workloads = []
+    if include_samples and SAMPLE_DIR.is_dir():
+        paths = sorted(
+            path for path in SAMPLE_DIR.iterdir() if path.suffix.lower() in ('.pdf', '.txt', '.rtf')
+        )
+        if paths:
+            workloads.append(('sample', paths, []))
+    for scale in scales:
+        workloads.append((f'synthetic_{scale}x', None, [build_transcript(BASE_TRANSCRIPT_LINES * scale)]))
+    return workloads
+
+
+def run_suite(
+    scales: list[int] = DEFAULT_SCALES,
+    repeat: int = 3,
+    trace_memory: bool = True,
+    include_samples: bool = True,
+    vocabulary_max_chars: int = VOCABULARY_MAX_CHARS,
+    log: Callable[[str], None] = print,
+) -> dict:
+    """
+    Run every stage over every workload.
+
+    Args:
+        scales: Synthetic transcript sizes, in multiples of BASE_TRANSCRIPT_LINES
+        repeat: Timed runs per stage (the best is kept); extraction runs once
+        trace_memory: Whether to measure peak memory with an extra traced run
+        include_samples: Whether to extract and benchmark sampleDocuments/
+        vocabulary_max_chars: Skip vocabulary extraction above this workload size
+        log: Progress output
+
+    Returns:
+        Dict with 'environment', 'stages' ({"workload/stage": StageResult dict})
+        and 'skipped' ({"workload/stage": reason})
+    """
+    results: dict = {
+        'environment': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'scales': list(scales),
+            'repeat': repeat,
+        },
+        'stages': {},
+        'skipped': {},
+    }
+
+    for workload, paths, texts in load_workloads(list(scales), include_samples):
+        if paths is not None:
+            run, texts = extraction_stage(paths)
+            file_megabytes = sum(path.stat().st_size for path in paths) / MB
+            result = measure(run, file_megabytes, 1, trace_memory)
+            results['stages'][f'{workload}/extraction'] = asdict(result)
+            log(format_row(f'{workload}/extraction', result))
+        if not texts:
+            results['skipped'][f'{workload}/*'] = "no text extracted"
+            continue
+
+        for stage, setup in text_stages(texts, vocabulary_max_chars):
+            key = f'{workload}/{stage}'
+            try:
+                run, megabytes = setup()
+            except StageSkipped as e:
+                results['skipped'][key] = str(e)
+                log(f"{key:<50} skipped: {e}")
+                continue
+            result = measure(run, megabytes, repeat, trace_memory)
+            results['stages'][key] = asdict(result)
+            log(format_row(key, result))
+
+    return results
+
+
+def compare_results(current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """
+    Find stages that regressed against a baseline.
+
+    A stage regresses if its throughput drops below baseline / (1 + tolerance)
+    (i.e. it takes more than (1 + tolerance) times as long) or its peak memory
+    exceeds baseline * (1 + tolerance) + MEMORY_SLACK_MB. Stages missing from
+    either run are ignored.
+
+    Args:
+        current: Results from run_suite()
+        baseline: Baseline results from run_suite()
+        tolerance: Allowed fractional slowdown / memory growth
+
+    Returns:
+        One description per regression (empty if none)
+    """
+    regressions = []
+    for key, base in baseline.get('stages', {}).items():
+        result = current.get('stages', {}).get(key)
+        if result is None:
+            continue
+
+        slower = result['mb_per_s'] < base['mb_per_s'] / (1 + tolerance)
+        if slower and base['seconds'] >= MIN_COMPARABLE_SECONDS:
+            regressions.append(
+                f"{key}: throughput {base['mb_per_s']:.3f} -> {result['mb_per_s']:.3f} MB/s "
+                f"({result['mb_per_s'] / base['mb_per_s'] - 1:+.0%})"
+            )
+
+        if base.get('peak_mb') is not None and result.get('peak_mb') is not None:
+            if result['peak_mb'] > base['peak_mb'] * (1 + tolerance) + MEMORY_SLACK_MB:
+                regressions.append(
+                    f"{key}: peak memory {base['peak_mb']:.1f} -> {result['peak_mb']:.1f} MB"
+                )
+    return regressions
+
+
+def format_row(key: str, result: StageResult) -> str:
+    """One line of the results table."""
+    chunks = f"{result.chunks_per_s:10.1f} ch/s" if result.chunks_per_s is not None else " " * 15
+    peak = f"{result.peak_mb:9.1f} MB peak" if result.peak_mb is not None else ""
+    return (f"{key:<50}{result.megabytes:9.2f} MB {result.seconds:9.3f} s "
+            f"{result.mb_per_s:9.2f} MB/s{chunks}{peak}")
+
+
+def load_baseline(path: Path) -> dict | None:
+    """Read a baseline file, or None if there is none."""
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_results(results: dict, path: Path) -> None:
+    """Write results as JSON, creating the directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def parse_scales(value: str) -> list[int]:
+    """Parse "1,10,100" into [1, 10, 100]."""
+    return [int(part) for part in value.split(',') if part.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scales', type=parse_scales, default=list(DEFAULT_SCALES),
+                        help='Synthetic transcript scales, comma-separated (default: 1,10,100)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage (best is kept)')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Allowed slowdown / memory growth as a fraction (default: 0.25)')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='Baseline JSON file')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Write this run as the new baseline instead of comparing')
+    parser.add_argument('--output', type=Path, help='Also write this run\'s results to a JSON file')
+    parser.add_argument('--no-extraction', action='store_true',
+                        help='Skip sampleDocuments/ (extraction and the stages on its text)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the traced peak-memory runs')
+    parser.add_argument('--vocabulary-max-chars', type=int, default=VOCABULARY_MAX_CHARS)
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        scales=args.scales,
+        repeat=args.repeat,
+        trace_memory=not args.no_memory,
+        include_samples=not args.no_extraction,
+        vocabulary_max_chars=args.vocabulary_max_chars,
+    )
+    if args.output:
+        save_results(results, args.output)
+
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+
+    regressions = compare_results(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%} tolerance:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nNo regressions beyond {args.tolerance:.0%} tolerance")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -23,12 +23,39 @@ Deprecated Managers:
 - LlamaCppModelManager: Legacy implementation kept for reference only
 """
 
+# Shared HTTP client: pooled keep-alive connections to the Ollama server
+from .ollama_client import OllamaClient, get_ollama_client
+
 # Primary AI Model Manager: Ollama-based
 # - REST API integration with local Ollama service
 # - Supports any model available on https://ollama.ai/library
-from .ollama_model_manager import OllamaModelManager
+from .ollama_model_manager import GenerationCancelled, GenerationStats, OllamaModelManager
+
+# Async request scheduler: bounded concurrency, priority lanes, deadlines
+from .ollama_scheduler import DeadlineExceeded, OllamaScheduler, Priority, get_ollama_scheduler
+
+# On-disk cache of generated text for repeated deterministic prompts
+from .response_cache import ResponseCache, get_response_cache
+
+# Context budgeting: real tokenizer when installed, calibrated estimate otherwise
+from .token_counter import TokenCounter, get_token_counter
 
 # DEFAULT: Use Ollama for all AI operations
 ModelManager = OllamaModelManager
 
-__all__ = ['ModelManager', 'OllamaModelManager']
+__all__ = [
+    'ModelManager',
+    'OllamaModelManager',
+    'GenerationCancelled',
+    'GenerationStats',
+    'OllamaClient',
+    'get_ollama_client',
+    'OllamaScheduler',
+    'Priority',
+    'DeadlineExceeded',
+    'get_ollama_scheduler',
+    'ResponseCache',
+    'get_response_cache',
+    'TokenCounter',
+    'get_token_counter',
+]
@@ -0,0 +1,394 @@
+"""
+Ollama HTTP Client
+
+One pooled, keep-alive HTTP session shared by every caller of the Ollama
+REST API.
+
+Chunk extraction and multi-document summarization call Ollama from up to
+OLLAMA_POOL_SIZE threads at once. Module-level requests.post() opens a new
+TCP connection for every call. OllamaClient keeps up to OLLAMA_POOL_SIZE
+connections alive and reuses them; a thread that finds them all busy waits
+for one rather than opening an extra connection.
+
+Connection errors (including a kept-alive connection reset by the server)
+and transient 5xx responses are retried with exponential backoff. Every
+request records its latency: time spent opening a connection (0 when one
+was reused), time to the response headers, and total time including the
+body.
+
+Streaming endpoints (Ollama's NDJSON "stream": true responses) are read with
+stream_json(), which yields each JSON object as it arrives and closes the
+connection when the caller stops early, so the server stops generating.
+
+Usage:
+    from src.ai.ollama_client import get_ollama_client
+
+    client = get_ollama_client()
+    response = client.post("/api/generate", json=payload, timeout=600)
+    response.metrics.ttfb_ms       # RequestMetrics of this call
+    client.get_stats()             # Aggregate counters and average latencies
+
+    for part in client.stream_json("/api/generate", json=payload, stop_event=event):
+        print(part.get("response", ""), end="")
+"""
+
+import codecs
+import json
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from src.config import (
+    OLLAMA_API_BASE,
+    OLLAMA_MAX_RETRIES,
+    OLLAMA_POOL_SIZE,
+    OLLAMA_RETRY_BACKOFF_SECONDS,
+    OLLAMA_RETRY_STATUSES,
+)
+from src.logging_config import debug_log
+
+# Seconds spent in connect() by the current thread since the last reset
+_connect_time = threading.local()
+
+
+def _record_connect(start: float) -> None:
+    _connect_time.seconds = getattr(_connect_time, 'seconds', 0.0) + time.perf_counter() - start
+    _connect_time.count = getattr(_connect_time, 'count', 0) + 1
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """HTTPConnection that records how long connecting took."""
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _record_connect(start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """HTTPSConnection that records how long connecting (and the TLS handshake) took."""
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _record_connect(start)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools time every new connection."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class NDJSONDecoder:
+    """
+    Incremental decoder for an NDJSON body that arrives in arbitrary chunks.
+
+    Bytes go through an incremental UTF-8 decoder, so multi-byte characters
+    split across network chunks are reassembled. Shared by OllamaClient and
+    OllamaScheduler.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._pending = ''
+
+    def feed(self, data: bytes) -> list[dict]:
+        """Decode a chunk and return the JSON objects whose lines it completes."""
+        *lines, self._pending = (self._pending + self._decoder.decode(data)).split('\n')
+        return [json.loads(line) for line in lines if line.strip()]
+
+    def close(self) -> list[dict]:
+        """Return the object on a last line with no trailing newline, if any."""
+        self._pending += self._decoder.decode(b'', final=True)
+        return [json.loads(self._pending)] if self._pending.strip() else []
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Latency of one client call, across all of its attempts.
+
+    Attributes:
+        method: HTTP method
+        path: API path (e.g. "/api/generate")
+        status: Final HTTP status, or None if no response was received
+        attempts: Requests sent (1 + retries)
+        connections_opened: New connections opened (0 when a kept-alive one was reused)
+        connect_ms: Time spent opening connections
+        ttfb_ms: Time from the first attempt to the final response's headers
+        total_ms: Time from the first attempt until the body was read
+                  (equal to ttfb_ms for streamed responses)
+    """
+    method: str
+    path: str
+    status: int | None = None
+    attempts: int = 0
+    connections_opened: int = 0
+    connect_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    total_ms: float = 0.0
+
+
+class OllamaClient:
+    """
+    Thread-safe, connection-pooled HTTP client for the Ollama REST API.
+
+    Attributes:
+        api_base: Base URL of the Ollama server
+        pool_size: Most connections kept open (and used at once)
+        max_retries: Retries after a connection error or retryable status
+        backoff_seconds: Delay before the first retry, doubled for each later one
+        retry_statuses: HTTP statuses that are retried
+    """
+
+    def __init__(
+        self,
+        api_base: str = OLLAMA_API_BASE,
+        pool_size: int = OLLAMA_POOL_SIZE,
+        max_retries: int = OLLAMA_MAX_RETRIES,
+        backoff_seconds: float = OLLAMA_RETRY_BACKOFF_SECONDS,
+        retry_statuses: tuple[int, ...] = OLLAMA_RETRY_STATUSES,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            api_base: Base URL of the Ollama server
+            pool_size: Most connections kept open; extra concurrent callers wait
+            max_retries: Retries after a connection error or retryable status
+            backoff_seconds: Delay before the first retry, doubled for each later one
+            retry_statuses: HTTP statuses that are retried
+        """
+        self.api_base = api_base.rstrip('/')
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.retry_statuses = frozenset(retry_statuses)
+
+        self.session = requests.Session()
+        adapter = _TimedAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'retries': 0,
+            'errors': 0,
+            'connections_opened': 0,
+            'connect_ms': 0.0,
+            'ttfb_ms': 0.0,
+            'total_ms': 0.0,
+        }
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request (see request())."""
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request (see request())."""
+        return self.request('POST', path, **kwargs)
+
+    def request(
+        self, method: str, path: str, stream: bool = False, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request over a pooled connection, retrying transient failures.
+
+        Connection errors and responses with a status in retry_statuses are
+        retried up to max_retries times; timeouts, including connect timeouts,
+        are not. The last response is returned whatever its status, so callers
+        check status_code as with requests.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. "/api/generate")
+            stream: Return as soon as the headers arrive and leave the body
+                   unread (the caller must read or close the response)
+            **kwargs: Passed to requests (json, timeout, ...)
+
+        Returns:
+            The response, with its RequestMetrics as `response.metrics`
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails after
+                all retries, or times out
+        """
+        url = f"{self.api_base}{path}"
+        metrics = RequestMetrics(method=method, path=path)
+        start = time.perf_counter()
+        attempt = 0
+
+        try:
+            while True:
+                attempt += 1
+                metrics.attempts = attempt
+                _connect_time.seconds = 0.0
+                _connect_time.count = 0
+                try:
+                    response = self.session.request(method, url, stream=True, **kwargs)
+                except requests.exceptions.ConnectTimeout:
+                    # A ConnectionError subclass, but a timeout: raised like the others
+                    self._add_connect_time(metrics)
+                    raise
+                except requests.exceptions.ConnectionError as e:
+                    self._add_connect_time(metrics)
+                    if attempt > self.max_retries:
+                        raise
+                    self._backoff(attempt, f"{method} {path} failed ({e.__class__.__name__})")
+                    continue
+
+                self._add_connect_time(metrics)
+                if response.status_code in self.retry_statuses and attempt <= self.max_retries:
+                    response.close()
+                    self._backoff(attempt, f"{method} {path} returned {response.status_code}")
+                    continue
+                break
+
+            metrics.status = response.status_code
+            metrics.ttfb_ms = (time.perf_counter() - start) * 1000
+            if not stream:
+                response.content  # noqa: B018 - read the body and release the connection
+            metrics.total_ms = (time.perf_counter() - start) * 1000
+        except Exception:
+            metrics.total_ms = (time.perf_counter() - start) * 1000
+            self._record(metrics, failed=True)
+            raise
+
+        self._record(metrics, failed=False)
+        response.metrics = metrics
+        return response
+
+    def stream_json(
+        self, path: str, stop_event: threading.Event | None = None, **kwargs: Any
+    ) -> Iterator[dict]:
+        """
+        POST to a streaming endpoint and yield each NDJSON object as it arrives.
+
+        The body is decoded with an incremental UTF-8 decoder, so multi-byte
+        characters split across network chunks are reassembled. stop_event is
+        checked as each chunk arrives; once it is set (or the caller stops
+        iterating) the connection is closed rather than returned to the pool,
+        which tells the server to stop work.
+
+        Args:
+            path: API path (e.g. "/api/generate")
+            stop_event: Optional event that ends the stream early when set
+            **kwargs: Passed to requests (json, timeout, ...)
+
+        Yields:
+            Parsed JSON objects, one per line
+
+        Raises:
+            requests.exceptions.RequestException: On connection failure, timeout,
+                or a non-2xx status
+        """
+        response = self.post(path, stream=True, **kwargs)
+        try:
+            response.raise_for_status()
+            decoder = NDJSONDecoder()
+            # chunk_size=None yields each chunk of the chunked response as it arrives
+            for data in response.iter_content(chunk_size=None):
+                if stop_event is not None and stop_event.is_set():
+                    return
+                yield from decoder.feed(data)
+            yield from decoder.close()
+        finally:
+            # Closes the socket if the body was not fully read
+            response.close()
+
+    def _add_connect_time(self, metrics: RequestMetrics) -> None:
+        """Add the current thread's connect time for the last attempt to metrics."""
+        metrics.connect_ms += getattr(_connect_time, 'seconds', 0.0) * 1000
+        metrics.connections_opened += getattr(_connect_time, 'count', 0)
+
+    def _backoff(self, attempt: int, reason: str) -> None:
+        """Sleep before retry number `attempt`."""
+        delay = self.backoff_seconds * (2 ** (attempt - 1))
+        debug_log(f"[OLLAMA CLIENT] {reason}; retry {attempt}/{self.max_retries} in {delay:.2f}s")
+        time.sleep(delay)
+
+    def _record(self, metrics: RequestMetrics, failed: bool) -> None:
+        """Add one call's metrics to the aggregate counters."""
+        with self._lock:
+            stats = self._stats
+            stats['requests'] += 1
+            stats['retries'] += metrics.attempts - 1
+            stats['errors'] += failed
+            stats['connections_opened'] += metrics.connections_opened
+            stats['connect_ms'] += metrics.connect_ms
+            stats['ttfb_ms'] += metrics.ttfb_ms
+            stats['total_ms'] += metrics.total_ms
+        debug_log(f"[OLLAMA CLIENT] {metrics.method} {metrics.path} -> {metrics.status} "
+                  f"in {metrics.total_ms:.1f}ms (connect {metrics.connect_ms:.1f}ms, "
+                  f"ttfb {metrics.ttfb_ms:.1f}ms, attempts {metrics.attempts})")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get aggregate request statistics.
+
+        Returns:
+            Dict with requests, retries, errors, connections_opened, pool_size,
+            and avg_connect_ms, avg_ttfb_ms, avg_total_ms per request
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        count = stats['requests'] or 1
+        return {
+            'requests': stats['requests'],
+            'retries': stats['retries'],
+            'errors': stats['errors'],
+            'connections_opened': stats['connections_opened'],
+            'pool_size': self.pool_size,
+            'avg_connect_ms': round(stats['connect_ms'] / count, 2),
+            'avg_ttfb_ms': round(stats['ttfb_ms'] / count, 2),
+            'avg_total_ms': round(stats['total_ms'] / count, 2),
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.session.close()
+
+
+# Global singleton instance
+_ollama_client: OllamaClient | None = None
+_ollama_client_lock = threading.Lock()
+
+
+def get_ollama_client() -> OllamaClient:
+    """
+    Get the global OllamaClient singleton.
+
+    Returns:
+        OllamaClient instance
+    """
+    global _ollama_client
+    with _ollama_client_lock:
+        if _ollama_client is None:
+            _ollama_client = OllamaClient()
+        return _ollama_client
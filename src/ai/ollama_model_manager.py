@@ -12,17 +12,38 @@ Structured Output Support (Ollama v0.5+):
 - generate_structured() method for JSON schema-constrained output
 - Used by Case Briefing Generator for reliable extraction
 - Falls back to regex JSON parsing if needed
+
+Streaming Support:
+- stream_text() yields tokens as Ollama generates them and reports
+  time-to-first-token and tokens/sec via GenerationStats
+- generate_text()/generate_summary() stream when given on_token or stop_event;
+  setting the event closes the connection and raises GenerationCancelled
+
+Scheduling:
+- Generation requests are queued in the shared OllamaScheduler, which bounds
+  how many reach Ollama at once and serves Priority.INTERACTIVE first
+- agenerate_text()/agenerate_structured() are the async versions;
+  generate_text()/generate_structured() block on them for thread-based callers
+
+Response Cache:
+- Deterministic (temperature 0) requests are answered from the on-disk
+  ResponseCache when the same model, prompt and sampling settings were seen
+  before; see LLM_RESPONSE_CACHE_* in config
 """
 
 import json
 import re
+import threading
 import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from typing import Any
 
+import httpx
 import requests
 
 from ..config import (
-    OLLAMA_API_BASE,
+    LLM_RESPONSE_CACHE_ENABLED,
     OLLAMA_CONTEXT_WINDOW,
     OLLAMA_MODEL_NAME,
     OLLAMA_TIMEOUT_SECONDS,
@@ -31,10 +52,37 @@ from ..config import (
 )
 from ..logging_config import debug, debug_log, warning
 from ..prompting import get_prompt_config, PromptTemplateManager
+from .ollama_client import OllamaClient, get_ollama_client
+from .ollama_scheduler import DeadlineExceeded, OllamaScheduler, Priority, get_ollama_scheduler
 from .prompt_formatter import wrap_prompt_for_model
+from .response_cache import ResponseCache, get_response_cache
+from .token_counter import TokenCounter, get_token_counter
 from .summary_post_processor import SummaryPostProcessor
 
 
+class GenerationCancelled(RuntimeError):
+    """Raised when a streamed generation is stopped by its stop event."""
+
+
+@dataclass
+class GenerationStats:
+    """
+    Timing of one streamed generation.
+
+    Attributes:
+        tokens: Tokens generated
+        ttft_ms: Time to first token (None if none arrived)
+        total_ms: Time from sending the request to the end of the stream
+        tokens_per_sec: Generation speed, excluding prompt evaluation
+        cancelled: True if the stop event ended the stream
+    """
+    tokens: int = 0
+    ttft_ms: float | None = None
+    total_ms: float = 0.0
+    tokens_per_sec: float = 0.0
+    cancelled: bool = False
+
+
 class OllamaModelManager:
     """
     Manages Ollama-based AI models for case summarization.
@@ -43,9 +91,26 @@ class OllamaModelManager:
     No version conflicts, commercial-safe, cross-platform.
     """
 
-    def __init__(self):
-        """Initialize the Ollama model manager."""
-        self.api_base = OLLAMA_API_BASE
+    def __init__(
+        self,
+        client: OllamaClient | None = None,
+        scheduler: OllamaScheduler | None = None,
+        response_cache: ResponseCache | None = None,
+        use_cache: bool = LLM_RESPONSE_CACHE_ENABLED
+    ):
+        """
+        Initialize the Ollama model manager.
+
+        Args:
+            client: HTTP client for the Ollama API (default: the shared pooled client)
+            scheduler: Request scheduler for generation (default: the shared scheduler)
+            response_cache: Cache for generated text (default: the shared on-disk cache)
+            use_cache: If True, answer cacheable requests from the response cache
+        """
+        self.client = client or get_ollama_client()
+        self.scheduler = scheduler or get_ollama_scheduler()
+        self.response_cache = (response_cache or get_response_cache()) if use_cache else None
+        self.api_base = self.client.api_base
         self.model_name = OLLAMA_MODEL_NAME
         self.current_model_name = OLLAMA_MODEL_NAME  # For compatibility with worker code
         self.timeout = OLLAMA_TIMEOUT_SECONDS
@@ -85,10 +150,7 @@ class OllamaModelManager:
             bool: True if Ollama is accessible, False otherwise
         """
         try:
-            response = requests.get(
-                f"{self.api_base}/api/tags",
-                timeout=5
-            )
+            response = self.client.get("/api/tags", timeout=5)
             self.is_connected = response.status_code == 200
             if self.is_connected:
                 debug("Successfully connected to Ollama")
@@ -121,10 +183,7 @@ class OllamaModelManager:
 
         if self.is_connected:
             try:
-                response = requests.get(
-                    f"{self.api_base}/api/tags",
-                    timeout=10
-                )
+                response = self.client.get("/api/tags", timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     for model in data.get('models', []):
@@ -210,124 +269,372 @@ class OllamaModelManager:
             self._check_connection()
         return self.is_connected
 
+    @property
+    def token_counter(self) -> TokenCounter:
+        """Token counter for the current model (real tokenizer when installed)."""
+        return get_token_counter(self.model_name)
+
     def generate_text(
         self,
         prompt: str,
         max_tokens: int = 500,
         temperature: float = None,
-        top_p: float = None
+        top_p: float = None,
+        on_token: Callable[[str], None] | None = None,
+        stop_event: threading.Event | None = None,
+        priority: Priority = Priority.BATCH,
+        deadline: float | None = None
     ) -> str:
         """
         Generate text using Ollama REST API.
 
+        Blocking wrapper around agenerate_text() for thread-based callers; the
+        request is queued in the shared OllamaScheduler. Must not be called from
+        the scheduler's event loop (await agenerate_text() there).
+
+        Passing on_token or stop_event switches to streaming, so partial
+        output can be shown and generation can be cancelled.
+
         Args:
             prompt: The input prompt
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0-1.0)
             top_p: Nucleus sampling parameter
+            on_token: Optional callback(token) called with each token as it arrives
+            stop_event: Optional event that cancels generation when set
+            priority: Scheduler lane (Priority.INTERACTIVE for requests a user waits on)
+            deadline: Optional seconds until the request is abandoned
 
         Returns:
             str: Generated text
 
         Raises:
             RuntimeError: If Ollama is not available
+            GenerationCancelled: If stop_event was set before generation finished
+            DeadlineExceeded: If the deadline passed before generation finished
         """
-        if not self.is_model_loaded():
-            raise RuntimeError(
-                f"Ollama not available at {self.api_base}. "
-                "Please ensure Ollama is running: https://ollama.ai"
-            )
+        return self.scheduler.run(self.agenerate_text(
+            prompt, max_tokens, temperature, top_p, on_token, stop_event, priority, deadline
+        ))
 
-        if temperature is None:
-            temperature = self.prompt_config.summary_temperature
-        if top_p is None:
-            top_p = self.prompt_config.top_p
-
-        debug(f"Generating text (max_tokens={max_tokens}, temp={temperature}, top_p={top_p})")
-        debug_log("\n[OLLAMA GENERATE] Starting text generation")
-        debug_log(f"[OLLAMA GENERATE] Model: {self.model_name}")
-        debug_log(f"[OLLAMA GENERATE] Max tokens: {max_tokens}")
-        debug_log(f"[OLLAMA GENERATE] Prompt length: {len(prompt)} chars")
-        debug_log(f"[OLLAMA GENERATE] Temperature: {temperature}, Top P: {top_p}")
+    async def agenerate_text(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = None,
+        top_p: float = None,
+        on_token: Callable[[str], None] | None = None,
+        stop_event: threading.Event | None = None,
+        priority: Priority = Priority.BATCH,
+        deadline: float | None = None,
+        stats: GenerationStats | None = None
+    ) -> str:
+        """
+        Generate text using Ollama REST API (async).
 
-        try:
-            # Wrap prompt for model-specific format compatibility (Phase 2.7)
-            wrapped_prompt = wrap_prompt_for_model(self.model_name, prompt)
-            debug_log(f"[OLLAMA GENERATE] Wrapped prompt length: {len(wrapped_prompt)} chars")
-
-            # Check if prompt may exceed context window (1 token ≈ 4 chars)
-            estimated_tokens = len(wrapped_prompt) // 4
-            context_window = OLLAMA_CONTEXT_WINDOW
-            if estimated_tokens > context_window - 300:  # Leave room for output
-                warning(
-                    f"Prompt ({estimated_tokens} estimated tokens) may be truncated. "
-                    f"Context window is {context_window} tokens."
-                )
-                debug_log(f"[OLLAMA GENERATE] WARNING: Prompt may exceed context window!")
+        Args and exceptions as for generate_text(), plus:
+            stats: Optional GenerationStats filled in when streaming
 
-            # Build request payload with explicit context window
-            payload = {
-                "model": self.model_name,
-                "prompt": wrapped_prompt,
-                "temperature": temperature,
-                "top_p": top_p,
-                "stream": False,  # Non-streaming to avoid UTF-8 issues
-                "num_predict": max_tokens,
-                "options": {
-                    "num_ctx": context_window,  # Explicit context window for CPU performance
-                },
-            }
+        Returns:
+            str: Generated text
+        """
+        streaming = on_token is not None or stop_event is not None
+        payload = self._build_generate_payload(
+            prompt, max_tokens, temperature, top_p, stream=streaming
+        )
 
-            debug_log("[OLLAMA GENERATE] ===== ORIGINAL PROMPT START =====")
-            debug_log(prompt)
-            debug_log("[OLLAMA GENERATE] ===== ORIGINAL PROMPT END =====")
-            debug_log("[OLLAMA GENERATE] ===== WRAPPED PROMPT START =====")
-            debug_log(wrapped_prompt)
-            debug_log("[OLLAMA GENERATE] ===== WRAPPED PROMPT END =====")
+        cache_key = self._cache_key(payload)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                debug_log(f"[OLLAMA GENERATE] Response cache hit ({len(cached)} chars)")
+                if on_token is not None and cached:
+                    on_token(cached)
+                return cached.strip()
 
+        try:
             # Make request to Ollama
-            start_time = time.time()
-            response = requests.post(
-                f"{self.api_base}/api/generate",
-                json=payload,
-                timeout=self.timeout
+            start_time = time.perf_counter()
+            if streaming:
+                stats = stats if stats is not None else GenerationStats()
+                pieces = []
+                first_token_time = None
+
+                def on_part(part: dict):
+                    nonlocal first_token_time
+                    token = part.get('response', '')
+                    if token:
+                        if first_token_time is None:
+                            first_token_time = time.perf_counter()
+                            stats.ttft_ms = (first_token_time - start_time) * 1000
+                        stats.tokens += 1
+                        pieces.append(token)
+                        if on_token is not None:
+                            on_token(token)
+
+                last = await self.scheduler.request(
+                    "/api/generate", json=payload, priority=priority, deadline=deadline,
+                    on_part=on_part, stop_event=stop_event
+                )
+                done = last if last is not None and last.get('done') else None
+                self._finish_stream(stats, start_time, first_token_time, done, stop_event)
+                if done is not None:
+                    self.token_counter.calibrate(payload['prompt'], done.get('prompt_eval_count'))
+                generated_text = ''.join(pieces)
+                if cache_key is not None and done is not None and generated_text:
+                    self.response_cache.put(cache_key, generated_text, model=self.model_name)
+                return generated_text.strip()
+
+            result = await self.scheduler.request(
+                "/api/generate", json=payload, priority=priority, deadline=deadline
             )
 
-            if response.status_code != 200:
-                raise RuntimeError(f"Ollama returned status {response.status_code}: {response.text}")
-
             # Parse response
-            result = response.json()
             generated_text = result.get('response', '')
             tokens_used = result.get('eval_count', 0)
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
+            self.token_counter.calibrate(payload['prompt'], result.get('prompt_eval_count'))
 
             debug_log(f"[OLLAMA GENERATE] Generation complete: {tokens_used} tokens in {elapsed:.2f}s")
             debug_log(f"[OLLAMA GENERATE] Output length: {len(generated_text)} chars")
             debug_log(f"[OLLAMA GENERATE] Output preview (first 100 chars): {generated_text[:100]}")
 
+            if cache_key is not None and generated_text:
+                self.response_cache.put(cache_key, generated_text, model=self.model_name)
+
             return generated_text.strip()
 
-        except requests.exceptions.Timeout as e:
+        except (GenerationCancelled, DeadlineExceeded):
+            raise
+        except httpx.TimeoutException as e:
             raise RuntimeError(
                 f"Generation timeout after {self.timeout} seconds. "
                 "Try reducing summary length or increasing OLLAMA_TIMEOUT_SECONDS in config."
             ) from e
-        except requests.exceptions.ConnectionError as e:
+        except httpx.TransportError as e:
             raise RuntimeError(
                 f"Cannot connect to Ollama at {self.api_base}. "
                 "Is Ollama running? Start with: ollama serve"
             ) from e
         except Exception as e:
+            if isinstance(e, httpx.HTTPStatusError):
+                status, body = e.response.status_code, e.response.text
+                e = RuntimeError(f"Ollama returned status {status}: {body}")
             debug(f"Text generation failed: {str(e)}")
             debug_log(f"[OLLAMA GENERATE] Error: {str(e)}")
             raise RuntimeError(f"Text generation failed: {str(e)}") from e
 
+    def stream_text(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = None,
+        top_p: float = None,
+        stop_event: threading.Event | None = None,
+        stats: GenerationStats | None = None
+    ) -> Iterator[str]:
+        """
+        Generate text using Ollama's streaming API, yielding tokens as they arrive.
+
+        Reads the stream directly over the pooled OllamaClient, outside the
+        scheduler, for callers that want a plain iterator. stop_event is
+        checked as each token arrives. When it is set the connection is
+        closed, which makes Ollama stop generating, and GenerationCancelled
+        is raised.
+
+        Args:
+            prompt: The input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-1.0)
+            top_p: Nucleus sampling parameter
+            stop_event: Optional event that cancels generation when set
+            stats: Optional GenerationStats filled in as the stream runs
+
+        Yields:
+            str: Generated tokens, in order
+
+        Raises:
+            RuntimeError: If Ollama is not available or the request fails
+            GenerationCancelled: If stop_event was set before generation finished
+        """
+        payload = self._build_generate_payload(prompt, max_tokens, temperature, top_p, stream=True)
+        stats = stats if stats is not None else GenerationStats()
+        start_time = time.perf_counter()
+        first_token_time = None
+        done = None
+
+        try:
+            for part in self.client.stream_json(
+                "/api/generate", json=payload, timeout=self.timeout, stop_event=stop_event
+            ):
+                token = part.get('response', '')
+                if token:
+                    if first_token_time is None:
+                        first_token_time = time.perf_counter()
+                        stats.ttft_ms = (first_token_time - start_time) * 1000
+                    stats.tokens += 1
+                    yield token
+                if part.get('done'):
+                    done = part
+        except requests.exceptions.Timeout as e:
+            raise RuntimeError(
+                f"Generation timeout after {self.timeout} seconds. "
+                "Try reducing summary length or increasing OLLAMA_TIMEOUT_SECONDS in config."
+            ) from e
+        except requests.exceptions.ConnectionError as e:
+            raise RuntimeError(
+                f"Cannot connect to Ollama at {self.api_base}. "
+                "Is Ollama running? Start with: ollama serve"
+            ) from e
+        except requests.exceptions.RequestException as e:
+            debug_log(f"[OLLAMA STREAM] Error: {str(e)}")
+            raise RuntimeError(f"Text generation failed: {str(e)}") from e
+
+        self._finish_stream(stats, start_time, first_token_time, done, stop_event)
+
+    def _cache_key(self, payload: dict) -> str | None:
+        """
+        Get the response cache key for a generate payload.
+
+        Args:
+            payload: /api/generate request payload
+
+        Returns:
+            Key string, or None if caching is off or the request is not cacheable
+        """
+        if self.response_cache is None or not self.response_cache.applies_to(payload):
+            return None
+        return self.response_cache.make_key(payload)
+
+    def _finish_stream(
+        self,
+        stats: GenerationStats,
+        start_time: float,
+        first_token_time: float | None,
+        done: dict | None,
+        stop_event: threading.Event | None
+    ) -> None:
+        """
+        Complete a stream's GenerationStats and raise if it was cancelled.
+
+        Args:
+            stats: Stats filled in while streaming
+            start_time: perf_counter() when the request was sent
+            first_token_time: perf_counter() when the first token arrived
+            done: Ollama's final ("done") object, or None if the stream ended early
+            stop_event: The stream's stop event
+
+        Raises:
+            GenerationCancelled: If stop_event ended the stream
+        """
+        stats.total_ms = (time.perf_counter() - start_time) * 1000
+        if done is not None and done.get('eval_count') and done.get('eval_duration'):
+            # Ollama's own count and timing (nanoseconds) exclude prompt evaluation
+            stats.tokens = done['eval_count']
+            stats.tokens_per_sec = done['eval_count'] / (done['eval_duration'] / 1e9)
+        elif first_token_time is not None:
+            generation_seconds = time.perf_counter() - first_token_time
+            stats.tokens_per_sec = stats.tokens / generation_seconds if generation_seconds else 0.0
+
+        if stop_event is not None and stop_event.is_set() and done is None:
+            stats.cancelled = True
+            debug_log(f"[OLLAMA STREAM] Cancelled after {stats.tokens} tokens")
+            raise GenerationCancelled(f"Generation cancelled after {stats.tokens} tokens")
+
+        ttft = f"{stats.ttft_ms:.0f}ms" if stats.ttft_ms is not None else "n/a"
+        debug_log(f"[OLLAMA STREAM] Generation complete: {stats.tokens} tokens in "
+                  f"{stats.total_ms / 1000:.2f}s (TTFT {ttft}, "
+                  f"{stats.tokens_per_sec:.1f} tokens/s)")
+
+    def _build_generate_payload(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float | None,
+        top_p: float | None,
+        stream: bool
+    ) -> dict:
+        """
+        Build the /api/generate payload, wrapping the prompt for the model.
+
+        Args:
+            prompt: The input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (None = prompt config default)
+            top_p: Nucleus sampling parameter (None = prompt config default)
+            stream: Whether Ollama should stream NDJSON tokens
+
+        Returns:
+            dict: Request payload
+
+        Raises:
+            RuntimeError: If Ollama is not available
+        """
+        if not self.is_model_loaded():
+            raise RuntimeError(
+                f"Ollama not available at {self.api_base}. "
+                "Please ensure Ollama is running: https://ollama.ai"
+            )
+
+        if temperature is None:
+            temperature = self.prompt_config.summary_temperature
+        if top_p is None:
+            top_p = self.prompt_config.top_p
+
+        debug(f"Generating text (max_tokens={max_tokens}, temp={temperature}, top_p={top_p})")
+        debug_log("\n[OLLAMA GENERATE] Starting text generation")
+        debug_log(f"[OLLAMA GENERATE] Model: {self.model_name}")
+        debug_log(f"[OLLAMA GENERATE] Max tokens: {max_tokens}")
+        debug_log(f"[OLLAMA GENERATE] Prompt length: {len(prompt)} chars")
+        debug_log(f"[OLLAMA GENERATE] Temperature: {temperature}, Top P: {top_p}")
+
+        # Wrap prompt for model-specific format compatibility (Phase 2.7)
+        wrapped_prompt = wrap_prompt_for_model(self.model_name, prompt)
+        debug_log(f"[OLLAMA GENERATE] Wrapped prompt length: {len(wrapped_prompt)} chars")
+
+        # Check if prompt may exceed context window
+        counter = self.token_counter
+        prompt_tokens = counter.count(wrapped_prompt)
+        context_window = OLLAMA_CONTEXT_WINDOW
+        if prompt_tokens > context_window - 300:  # Leave room for output
+            kind = "" if counter.is_exact else " estimated"
+            warning(
+                f"Prompt ({prompt_tokens}{kind} tokens) may be truncated. "
+                f"Context window is {context_window} tokens."
+            )
+            debug_log(f"[OLLAMA GENERATE] WARNING: Prompt may exceed context window!")
+
+        debug_log("[OLLAMA GENERATE] ===== ORIGINAL PROMPT START =====")
+        debug_log(prompt)
+        debug_log("[OLLAMA GENERATE] ===== ORIGINAL PROMPT END =====")
+        debug_log("[OLLAMA GENERATE] ===== WRAPPED PROMPT START =====")
+        debug_log(wrapped_prompt)
+        debug_log("[OLLAMA GENERATE] ===== WRAPPED PROMPT END =====")
+
+        # Build request payload with explicit context window.
+        # Sampling settings only take effect inside "options"; Ollama ignores
+        # them at the top level of the payload.
+        # Streaming is only used when a caller consumes tokens (stream_text);
+        # its bytes go through an incremental UTF-8 decoder.
+        return {
+            "model": self.model_name,
+            "prompt": wrapped_prompt,
+            "stream": stream,
+            "options": {
+                "num_ctx": context_window,  # Explicit context window for CPU performance
+                "temperature": temperature,
+                "top_p": top_p,
+                "num_predict": max_tokens,
+            },
+        }
+
     def generate_summary(
         self,
         case_text: str,
         max_words: int = 200,
-        preset_id: str = "factual-summary"
+        preset_id: str = "factual-summary",
+        on_token: Callable[[str], None] | None = None,
+        stop_event: threading.Event | None = None
     ) -> str:
         """
         Generate a case summary from document text via Ollama.
@@ -340,9 +647,15 @@ class OllamaModelManager:
             case_text: The cleaned case document text
             max_words: Target summary length in words (100-500)
             preset_id: Template preset to use
+            on_token: Optional callback(token) streaming the first draft as it is
+                     generated (length enforcement may condense it afterwards)
+            stop_event: Optional event that cancels generation when set
 
         Returns:
             str: Complete summary text (within target length or best effort)
+
+        Raises:
+            GenerationCancelled: If stop_event was set before generation finished
         """
         # Get word count range from config
         min_words, max_words_range = self.prompt_config.get_word_count_range(max_words)
@@ -378,7 +691,9 @@ class OllamaModelManager:
 
         summary = self.generate_text(
             prompt=prompt,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            on_token=on_token,
+            stop_event=stop_event
         )
 
         # Delegate length enforcement to post-processor
@@ -417,9 +732,39 @@ class OllamaModelManager:
         prompt: str,
         max_tokens: int = 1000,
         temperature: float = 0.0,
+        priority: Priority = Priority.BATCH,
+        deadline: float | None = None,
     ) -> dict[str, Any] | None:
         """
-        Generate structured JSON output using Ollama's format mode.
+        Generate structured JSON output (blocking wrapper for agenerate_structured()).
+
+        Args:
+            prompt: The prompt including JSON schema instructions
+            max_tokens: Maximum tokens to generate (default 1000)
+            temperature: Sampling temperature (default 0.0 for deterministic)
+            priority: Scheduler lane
+            deadline: Optional seconds until the request is abandoned
+
+        Returns:
+            Parsed JSON as dict, or None if the request or parsing fails
+
+        Raises:
+            RuntimeError: If Ollama is not available
+        """
+        return self.scheduler.run(
+            self.agenerate_structured(prompt, max_tokens, temperature, priority, deadline)
+        )
+
+    async def agenerate_structured(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.0,
+        priority: Priority = Priority.BATCH,
+        deadline: float | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Generate structured JSON output using Ollama's format mode (async).
 
         Uses temperature=0 for deterministic extraction and format="json"
         to constrain output to valid JSON. Falls back to regex JSON
@@ -431,9 +776,11 @@ class OllamaModelManager:
             prompt: The prompt including JSON schema instructions
             max_tokens: Maximum tokens to generate (default 1000)
             temperature: Sampling temperature (default 0.0 for deterministic)
+            priority: Scheduler lane
+            deadline: Optional seconds until the request is abandoned
 
         Returns:
-            Parsed JSON as dict, or None if parsing fails
+            Parsed JSON as dict, or None if the request or parsing fails
 
         Raises:
             RuntimeError: If Ollama is not available
@@ -454,12 +801,12 @@ class OllamaModelManager:
             payload = {
                 "model": self.model_name,
                 "prompt": prompt,
-                "temperature": temperature,
                 "stream": False,
-                "num_predict": max_tokens,
                 "format": "json",  # Ollama v0.5+ structured output mode
                 "options": {
                     "num_ctx": OLLAMA_CONTEXT_WINDOW,
+                    "temperature": temperature,
+                    "num_predict": max_tokens,
                 },
             }
 
@@ -467,20 +814,19 @@ class OllamaModelManager:
             debug_log(prompt[:500] + "..." if len(prompt) > 500 else prompt)
             debug_log("[OLLAMA STRUCTURED] ===== PROMPT END =====")
 
+            cache_key = self._cache_key(payload)
+            cached = self.response_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                debug_log(f"[OLLAMA STRUCTURED] Response cache hit ({len(cached)} chars)")
+                return self._parse_json_response(cached.strip())
+
             # Make request to Ollama
             start_time = time.time()
-            response = requests.post(
-                f"{self.api_base}/api/generate",
-                json=payload,
-                timeout=self.timeout
+            result = await self.scheduler.request(
+                "/api/generate", json=payload, priority=priority, deadline=deadline
             )
 
-            if response.status_code != 200:
-                debug_log(f"[OLLAMA STRUCTURED] Error: Status {response.status_code}")
-                return None
-
             # Parse response
-            result = response.json()
             generated_text = result.get('response', '').strip()
             tokens_used = result.get('eval_count', 0)
             elapsed = time.time() - start_time
@@ -494,15 +840,23 @@ class OllamaModelManager:
 
             if parsed is not None:
                 debug_log(f"[OLLAMA STRUCTURED] Successfully parsed JSON with {len(parsed)} keys")
+                if cache_key is not None:
+                    self.response_cache.put(cache_key, generated_text, model=self.model_name)
             else:
                 debug_log("[OLLAMA STRUCTURED] Failed to parse JSON response")
 
             return parsed
 
-        except requests.exceptions.Timeout:
+        except httpx.HTTPStatusError as e:
+            debug_log(f"[OLLAMA STRUCTURED] Error: Status {e.response.status_code}")
+            return None
+        except httpx.TimeoutException:
             debug_log(f"[OLLAMA STRUCTURED] Timeout after {self.timeout}s")
             return None
-        except requests.exceptions.ConnectionError:
+        except DeadlineExceeded as e:
+            debug_log(f"[OLLAMA STRUCTURED] {e}")
+            return None
+        except httpx.TransportError:
             debug_log(f"[OLLAMA STRUCTURED] Connection error to {self.api_base}")
             return None
         except Exception as e:
@@ -0,0 +1,507 @@
+"""
+Ollama Request Scheduler
+
+Asyncio-based client for the Ollama REST API with a bounded, prioritized
+request queue. Generation calls from every part of the app go through one
+scheduler, so many requests can be in flight as coroutines on a single event
+loop instead of each holding an OS thread blocked on a socket.
+
+Scheduling:
+- At most max_concurrent requests are sent to Ollama at once; the rest wait
+  here. Keeping this near Ollama's own parallelism (OLLAMA_NUM_PARALLEL)
+  means the queue builds up in the scheduler, where it can be reordered,
+  rather than in Ollama's first-come-first-served queue.
+- Waiting requests are served by priority lane, then in arrival order:
+  Priority.INTERACTIVE (Q&A a user is waiting on) ahead of Priority.BATCH
+  (document summaries, briefing extraction).
+- A request may carry a deadline in seconds. If it expires while queued the
+  request is never sent; if it expires in flight the request is abandoned.
+  Either way DeadlineExceeded is raised.
+
+Connection errors and transient 5xx statuses are retried with backoff, as in
+OllamaClient, and each request records the same RequestMetrics: time spent
+opening connections (0 when one was reused), time to the response headers,
+and total time; get_stats() reports their averages. The event loop runs in one daemon thread; thread-based callers
+use the sync facade (post(), run(), submit()), async callers await request().
+
+Usage:
+    from src.ai.ollama_scheduler import Priority, get_ollama_scheduler
+
+    scheduler = get_ollama_scheduler()
+
+    # From threads (blocks until done)
+    result = scheduler.post("/api/generate", json=payload, priority=Priority.INTERACTIVE)
+
+    # From coroutines
+    result = await scheduler.request("/api/generate", json=payload, deadline=30)
+
+    # Run a batch of coroutines concurrently from a thread
+    results = scheduler.run(asyncio.gather(*coroutines))
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from enum import IntEnum
+from typing import Any, TypeVar
+
+import httpx
+
+from src.ai.ollama_client import NDJSONDecoder, RequestMetrics
+from src.config import (
+    OLLAMA_API_BASE,
+    OLLAMA_MAX_CONCURRENT_REQUESTS,
+    OLLAMA_MAX_RETRIES,
+    OLLAMA_POOL_SIZE,
+    OLLAMA_RETRY_BACKOFF_SECONDS,
+    OLLAMA_RETRY_STATUSES,
+    OLLAMA_TIMEOUT_SECONDS,
+)
+from src.logging_config import debug_log
+
+T = TypeVar('T')
+
+
+class Priority(IntEnum):
+    """Request lanes; lower values are served first."""
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request's deadline passes before it completes."""
+
+
+class OllamaScheduler:
+    """
+    Semaphore-bounded, prioritized asyncio client for the Ollama REST API.
+
+    Attributes:
+        api_base: Base URL of the Ollama server
+        max_concurrent: Most requests sent to Ollama at once
+        pool_size: Most HTTP connections kept open
+        max_retries: Retries after a connection error or retryable status
+        backoff_seconds: Delay before the first retry, doubled for each later one
+        retry_statuses: HTTP statuses that are retried
+        timeout: HTTP timeout in seconds for each attempt
+    """
+
+    def __init__(
+        self,
+        api_base: str = OLLAMA_API_BASE,
+        max_concurrent: int = OLLAMA_MAX_CONCURRENT_REQUESTS,
+        pool_size: int = OLLAMA_POOL_SIZE,
+        max_retries: int = OLLAMA_MAX_RETRIES,
+        backoff_seconds: float = OLLAMA_RETRY_BACKOFF_SECONDS,
+        retry_statuses: tuple[int, ...] = OLLAMA_RETRY_STATUSES,
+        timeout: float = OLLAMA_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize the scheduler. The event loop starts on first use.
+
+        Args:
+            api_base: Base URL of the Ollama server
+            max_concurrent: Most requests sent to Ollama at once
+            pool_size: Most HTTP connections kept open
+            max_retries: Retries after a connection error or retryable status
+            backoff_seconds: Delay before the first retry, doubled for each later one
+            retry_statuses: HTTP statuses that are retried
+            timeout: HTTP timeout in seconds for each attempt
+        """
+        self.api_base = api_base.rstrip('/')
+        self.max_concurrent = max_concurrent
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.retry_statuses = frozenset(retry_statuses)
+        self.timeout = timeout
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._http: httpx.AsyncClient | None = None
+        self._start_lock = threading.Lock()
+
+        # Slot bookkeeping, only touched on the event loop
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'interactive': 0,
+            'batch': 0,
+            'retries': 0,
+            'errors': 0,
+            'deadline_exceeded': 0,
+            'max_in_flight': 0,
+            'connections_opened': 0,
+            'queue_ms': 0.0,
+            'connect_ms': 0.0,
+            'ttfb_ms': 0.0,
+            'total_ms': 0.0,
+        }
+
+    # --- Sync facade -----------------------------------------------------
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future:
+        """
+        Schedule a coroutine on the scheduler's event loop.
+
+        Args:
+            coro: Coroutine to run (typically awaiting request())
+
+        Returns:
+            concurrent.futures.Future with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Run a coroutine on the event loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Optional seconds to wait for the result
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the scheduler's own event loop
+                (await the coroutine there instead)
+        """
+        self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("OllamaScheduler.run() called from its event loop; await instead")
+        return self.submit(coro).result(timeout)
+
+    def post(
+        self,
+        path: str,
+        json: dict,
+        priority: Priority = Priority.BATCH,
+        deadline: float | None = None,
+    ) -> dict:
+        """
+        Send a request through the scheduler and block until it completes.
+
+        Args:
+            path: API path (e.g. "/api/generate")
+            json: Request payload
+            priority: Lane to queue the request in
+            deadline: Optional seconds from now until the request is abandoned
+
+        Returns:
+            The decoded JSON response
+        """
+        return self.run(self.request(path, json=json, priority=priority, deadline=deadline))
+
+    # --- Async API -------------------------------------------------------
+
+    async def request(
+        self,
+        path: str,
+        json: dict,
+        priority: Priority = Priority.BATCH,
+        deadline: float | None = None,
+        on_part: Callable[[dict], None] | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> dict | None:
+        """
+        Queue a request, wait for a slot, and send it.
+
+        May be awaited from any event loop; requests from other loops are
+        forwarded to the scheduler's own.
+
+        Args:
+            path: API path (e.g. "/api/generate")
+            json: Request payload
+            priority: Lane to queue the request in
+            deadline: Optional seconds from now until the request is abandoned
+            on_part: Optional callback for streamed NDJSON responses, called
+                    with each JSON object as it arrives
+            stop_event: Optional event that ends a streamed response early,
+                       closing its connection so the server stops work
+
+        Returns:
+            The decoded JSON response; for streamed responses the last object
+            received, or None if stopped before any arrived
+
+        Raises:
+            DeadlineExceeded: If the deadline passed before the request completed
+            httpx.HTTPError: On connection failure, timeout, or an error status
+                after retries
+        """
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is not loop:
+            return await asyncio.wrap_future(self.submit(self.request(
+                path, json, priority, deadline, on_part, stop_event)))
+
+        expires = None if deadline is None else time.monotonic() + deadline
+        queued = time.perf_counter()
+        await self._acquire(priority, expires, path)
+        started = time.perf_counter()
+        metrics = RequestMetrics(method='POST', path=path)
+        failed = False
+
+        try:
+            send = self._send(path, json, on_part, stop_event, metrics)
+            if expires is None:
+                return await send
+            try:
+                return await asyncio.wait_for(send, expires - time.monotonic())
+            except TimeoutError:
+                self._count('deadline_exceeded')
+                raise DeadlineExceeded(f"{path} missed its {deadline}s deadline") from None
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._release()
+            finished = time.perf_counter()
+            metrics.total_ms = (finished - started) * 1000
+            self._record(priority, metrics, failed, started - queued, finished - queued)
+
+    # --- Internals -------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread if it is not running."""
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="ollama-scheduler",
+                                          daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _acquire(self, priority: Priority, expires: float | None, path: str) -> None:
+        """Wait for a request slot, serving waiters by (priority, arrival)."""
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+        else:
+            slot = self._loop.create_future()
+            heapq.heappush(self._waiters, (int(priority), next(self._sequence), slot))
+            try:
+                if expires is None:
+                    await slot
+                else:
+                    # A slot handed over just as the deadline passes is still taken
+                    await asyncio.wait_for(slot, expires - time.monotonic())
+            except TimeoutError:
+                self._count('deadline_exceeded')
+                raise DeadlineExceeded(f"{path} expired while queued") from None
+            except asyncio.CancelledError:
+                if slot.done() and not slot.cancelled():
+                    self._release()  # Pass on a slot handed over as we were cancelled
+                raise
+
+        with self._stats_lock:
+            self._stats['max_in_flight'] = max(self._stats['max_in_flight'], self._in_flight)
+
+    def _release(self) -> None:
+        """Hand the finished request's slot to the next waiter, or free it."""
+        while self._waiters:
+            _, _, slot = heapq.heappop(self._waiters)
+            if not slot.done():  # Skips waiters that expired or were cancelled
+                slot.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating it on the event loop."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.api_base,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.pool_size,
+                                    max_keepalive_connections=self.pool_size),
+            )
+        return self._http
+
+    async def _send(
+        self,
+        path: str,
+        json: dict,
+        on_part: Callable[[dict], None] | None,
+        stop_event: threading.Event | None,
+        metrics: RequestMetrics,
+    ) -> dict | None:
+        """Send one request, retrying transient failures, and fill in its metrics."""
+        delivered = [False]  # Streams are not retried once parts have been delivered
+        extensions = {'trace': self._tracer(metrics, time.perf_counter())}
+        while True:
+            metrics.attempts += 1
+            try:
+                if on_part is not None:
+                    return await self._stream(
+                        path, json, on_part, stop_event, delivered, metrics, extensions)
+                response = await self._client().post(path, json=json, extensions=extensions)
+                metrics.status = response.status_code
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status not in self.retry_statuses or metrics.attempts > self.max_retries:
+                    raise
+                reason = f"returned {status}"
+            except httpx.TransportError as e:
+                if (isinstance(e, httpx.TimeoutException) or delivered[0]
+                        or metrics.attempts > self.max_retries):
+                    raise
+                reason = f"failed ({e.__class__.__name__})"
+
+            delay = self.backoff_seconds * (2 ** (metrics.attempts - 1))
+            debug_log(f"[OLLAMA SCHEDULER] {path} {reason}; "
+                      f"retry {metrics.attempts}/{self.max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _tracer(
+        metrics: RequestMetrics, start: float
+    ) -> Callable[[str, dict], Coroutine[Any, Any, None]]:
+        """
+        Build an httpx trace hook that adds connect time and TTFB to metrics.
+
+        httpx reports each step of a request as "<phase>.started" followed by
+        "<phase>.complete" or "<phase>.failed". Connecting is the TCP connect
+        plus any TLS handshake; neither happens when a kept-alive connection
+        is reused. TTFB is measured from `start` (the first attempt) to the
+        last response's headers.
+        """
+        connecting = start
+
+        async def trace(event: str, info: dict) -> None:
+            nonlocal connecting
+            now = time.perf_counter()
+            phase, _, stage = event.rpartition('.')
+            if phase in ('connection.connect_tcp', 'connection.start_tls'):
+                if stage == 'started':
+                    connecting = now
+                    return
+                metrics.connect_ms += (now - connecting) * 1000
+                if phase == 'connection.connect_tcp' and stage == 'complete':
+                    metrics.connections_opened += 1
+            elif phase.endswith('.receive_response_headers') and stage == 'complete':
+                metrics.ttfb_ms = (now - start) * 1000
+
+        return trace
+
+    async def _stream(
+        self,
+        path: str,
+        json: dict,
+        on_part: Callable[[dict], None],
+        stop_event: threading.Event | None,
+        delivered: list[bool],
+        metrics: RequestMetrics,
+        extensions: dict,
+    ) -> dict | None:
+        """Send a streaming request and pass each NDJSON object to on_part."""
+        last = None
+        async with self._client().stream(
+            'POST', path, json=json, extensions=extensions
+        ) as response:
+            metrics.status = response.status_code
+            response.raise_for_status()
+            decoder = NDJSONDecoder()
+            async for data in response.aiter_bytes():
+                if stop_event is not None and stop_event.is_set():
+                    # Leaving the block with the body unread closes the connection
+                    return last
+                for last in decoder.feed(data):
+                    delivered[0] = True
+                    on_part(last)
+            for last in decoder.close():
+                on_part(last)
+        return last
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def _record(
+        self,
+        priority: Priority,
+        metrics: RequestMetrics,
+        failed: bool,
+        queue_s: float,
+        total_s: float,
+    ) -> None:
+        """Add one request's outcome to the aggregate counters."""
+        with self._stats_lock:
+            stats = self._stats
+            stats['requests'] += 1
+            stats['interactive' if priority == Priority.INTERACTIVE else 'batch'] += 1
+            stats['retries'] += max(0, metrics.attempts - 1)
+            stats['errors'] += failed
+            stats['connections_opened'] += metrics.connections_opened
+            stats['queue_ms'] += queue_s * 1000
+            stats['connect_ms'] += metrics.connect_ms
+            stats['ttfb_ms'] += metrics.ttfb_ms
+            stats['total_ms'] += total_s * 1000
+        debug_log(f"[OLLAMA SCHEDULER] {metrics.method} {metrics.path} -> {metrics.status} "
+                  f"in {metrics.total_ms:.1f}ms (queued {queue_s * 1000:.1f}ms, "
+                  f"connect {metrics.connect_ms:.1f}ms, ttfb {metrics.ttfb_ms:.1f}ms, "
+                  f"attempts {metrics.attempts})")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get aggregate scheduler statistics.
+
+        Returns:
+            Dict with requests, interactive, batch, retries, errors,
+            deadline_exceeded, max_in_flight, connections_opened,
+            max_concurrent, and avg_queue_ms, avg_connect_ms, avg_ttfb_ms,
+            avg_total_ms per request (avg_total_ms includes time queued)
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        requests = stats.pop('requests')
+        timings = {key: stats.pop(key) for key in ('queue_ms', 'connect_ms', 'ttfb_ms', 'total_ms')}
+        count = requests or 1
+        return {
+            'requests': requests,
+            **stats,
+            'max_concurrent': self.max_concurrent,
+            **{f'avg_{key}': round(value / count, 2) for key, value in timings.items()},
+        }
+
+    def close(self) -> None:
+        """Close connections and stop the event loop."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        if self._http is not None:
+            asyncio.run_coroutine_threadsafe(self._http.aclose(), loop).result()
+            self._http = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+# Global singleton instance
+_ollama_scheduler: OllamaScheduler | None = None
+_ollama_scheduler_lock = threading.Lock()
+
+
+def get_ollama_scheduler() -> OllamaScheduler:
+    """
+    Get the global OllamaScheduler singleton.
+
+    Returns:
+        OllamaScheduler instance
+    """
+    global _ollama_scheduler
+    with _ollama_scheduler_lock:
+        if _ollama_scheduler is None:
+            _ollama_scheduler = OllamaScheduler()
+        return _ollama_scheduler
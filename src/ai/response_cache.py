@@ -0,0 +1,316 @@
+"""
+LLM Response Cache Module
+
+Persistent on-disk cache for Ollama /api/generate responses.
+
+Re-running a summary or briefing on the same case re-sends byte-identical
+prompts (chunking is deterministic), and each one costs seconds to minutes
+of CPU inference. This cache stores the generated text keyed by a hash of
+everything that determines it: model name, wrapped prompt, output format
+and the generation options (temperature, top_p, num_predict, num_ctx). A
+repeated request is answered from disk without reaching Ollama.
+
+Only deterministic requests (temperature 0) are cached unless
+LLM_RESPONSE_CACHE_ALL_TEMPERATURES is set; at higher temperatures a cached
+answer replaces a fresh sample, which is only wanted for fast re-runs.
+
+Storage: %APPDATA%/LocalScribe/cache/llm_responses.sqlite3
+Eviction: LRU by last use (updated on every hit), capped at
+LLM_RESPONSE_CACHE_MAX_MB of response text.
+
+Command line:
+    python -m src.ai.response_cache --stats
+    python -m src.ai.response_cache --purge
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.config import (
+    CACHE_DIR,
+    LLM_RESPONSE_CACHE_ALL_TEMPERATURES,
+    LLM_RESPONSE_CACHE_MAX_MB,
+)
+from src.logging_config import debug_log
+
+# Bump when the key fields or table layout change; older databases are cleared
+CACHE_FORMAT_VERSION = 2
+
+# Payload fields that determine the generated text, besides "options"
+_KEY_FIELDS = ('model', 'prompt', 'format')
+
+
+class ResponseCache:
+    """
+    SQLite-backed LLM response cache with LRU eviction and hit/miss counters.
+
+    Thread-safe: one connection is shared and serialized with a lock.
+
+    Example:
+        cache = ResponseCache()
+        if cache.applies_to(payload):
+            key = cache.make_key(payload)
+            text = cache.get(key)
+            if text is None:
+                text = generate(payload)
+                cache.put(key, text, model=payload['model'])
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        max_size_mb: float = LLM_RESPONSE_CACHE_MAX_MB,
+        cache_all_temperatures: bool = LLM_RESPONSE_CACHE_ALL_TEMPERATURES,
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: SQLite file. Defaults to CACHE_DIR/llm_responses.sqlite3.
+            max_size_mb: Total response size before least-recently-used entries are evicted
+            cache_all_temperatures: Also cache requests with temperature above 0
+        """
+        self.db_path = Path(db_path) if db_path else CACHE_DIR / "llm_responses.sqlite3"
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.cache_all_temperatures = cache_all_temperatures
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _init_schema(self) -> None:
+        """Create the table, discarding databases written by another format version."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != CACHE_FORMAT_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS responses")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT,"
+            " response TEXT NOT NULL,"
+            " size_bytes INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON responses (last_used)")
+        self._conn.execute(f"PRAGMA user_version = {CACHE_FORMAT_VERSION}")
+
+    def applies_to(self, payload: dict) -> bool:
+        """
+        Check whether a request may be answered from the cache.
+
+        Args:
+            payload: /api/generate request payload
+
+        Returns:
+            True for options.temperature 0, or any temperature if cache_all_temperatures
+        """
+        return (self.cache_all_temperatures
+                or payload.get('options', {}).get('temperature') == 0)
+
+    @staticmethod
+    def make_key(payload: dict) -> str:
+        """
+        Build a cache key from a /api/generate payload.
+
+        Args:
+            payload: Request payload (prompt already wrapped for the model)
+
+        Returns:
+            Hex key string
+        """
+        fields = {name: payload.get(name) for name in _KEY_FIELDS}
+        # Every Ollama generation option (sampling, num_predict, num_ctx) lives here
+        fields['options'] = payload.get('options', {})
+        digest = hashlib.sha256(f"v{CACHE_FORMAT_VERSION}|".encode())
+        digest.update(json.dumps(fields, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            The generated text, or None on a miss
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    # Touch for LRU ordering
+                    self._conn.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+                    )
+        except sqlite3.Error as e:
+            debug_log(f"[RESPONSE CACHE] Lookup failed for {key[:12]}: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, response: str, model: str | None = None) -> bool:
+        """
+        Store a generated response.
+
+        Triggers eviction if the cache exceeds its size cap.
+
+        Args:
+            key: Key from make_key()
+            response: Generated text
+            model: Model name, kept for inspection
+
+        Returns:
+            True if the entry was written
+        """
+        size = len(response.encode('utf-8'))
+        now = time.time()
+        try:
+            with self._lock:
+                old = self._conn.execute(
+                    "SELECT size_bytes FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, size, now, now),
+                )
+                self._total_bytes += size - (old[0] if old else 0)
+        except sqlite3.Error as e:
+            debug_log(f"[RESPONSE CACHE] Failed to write entry {key[:12]}: {e}")
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used entries until under the size cap.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if self._total_bytes <= self.max_size_bytes:
+                return 0
+
+            victims = []
+            excess = self._total_bytes - self.max_size_bytes
+            for key, size in self._conn.execute(
+                "SELECT key, size_bytes FROM responses ORDER BY last_used"
+            ):
+                if excess <= 0:
+                    break
+                victims.append((key,))
+                excess -= size
+                self._total_bytes -= size
+
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+            remaining = self._total_bytes
+
+        debug_log(f"[RESPONSE CACHE] Evicted {len(victims)} entries "
+                  f"({remaining / (1024 * 1024):.1f}MB remaining)")
+        return len(victims)
+
+    def purge(self) -> int:
+        """
+        Delete every cache entry.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM responses").rowcount
+            self._total_bytes = 0
+            self._conn.execute("VACUUM")
+        debug_log(f"[RESPONSE CACHE] Purged {removed} entries")
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, size_mb, max_size_mb, hits, misses, hit_rate, db_path
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            size_bytes = self._total_bytes
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'size_mb': round(size_bytes / (1024 * 1024), 2),
+            'max_size_mb': round(self.max_size_bytes / (1024 * 1024), 2),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'db_path': str(self.db_path),
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Global singleton instance
+_response_cache: ResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the global ResponseCache singleton.
+
+    Returns:
+        ResponseCache instance
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
+
+
+def main():
+    """Command-line interface to inspect and purge the LLM response cache."""
+    parser = argparse.ArgumentParser(description="LocalScribe LLM response cache maintenance")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--stats', action='store_true', help='Show cache size and entry count (default)')
+    group.add_argument('--purge', action='store_true', help='Delete all cached responses')
+    args = parser.parse_args()
+
+    cache = get_response_cache()
+
+    if args.purge:
+        print(f"Removed {cache.purge()} cached response(s)")
+    else:
+        stats = cache.get_stats()
+        print(f"Cache database: {stats['db_path']}")
+        print(f"Entries: {stats['entries']}")
+        print(f"Size: {stats['size_mb']} MB / {stats['max_size_mb']} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Token Counter Module
+
+Counts prompt tokens for context-window budgeting.
+
+With OLLAMA_CONTEXT_WINDOW at 2048 tokens, a len(text) // 4 guess either
+overfills the window (Ollama silently drops the start of the prompt) or
+leaves hundreds of tokens unused (more chunks, more LLM calls). TokenCounter
+uses the model's real tokenizer when a Hugging Face tokenizer.json for it
+is installed in TOKENIZERS_DIR, and otherwise a chars-per-token estimate
+that is recalibrated from the prompt_eval_count Ollama reports.
+
+Counts are memoized per model (LRU), since the same chunk and summary
+strings are measured repeatedly while prompts are packed.
+
+Usage:
+    from src.ai.token_counter import get_token_counter
+
+    counter = get_token_counter("gemma3:1b")
+    if counter.count(prompt) > OLLAMA_CONTEXT_WINDOW - 300:
+        ...
+    batches = counter.pack(summaries, budget=1500)
+"""
+
+import functools
+import math
+import threading
+from pathlib import Path
+
+from src.config import (
+    OLLAMA_MODEL_NAME,
+    TOKEN_COUNT_CACHE_SIZE,
+    TOKEN_ESTIMATE_CHARS_PER_TOKEN,
+    TOKENIZERS_DIR,
+)
+from src.logging_config import debug_log
+
+try:
+    from tokenizers import Tokenizer
+    HAS_TOKENIZERS = True
+except ImportError:
+    HAS_TOKENIZERS = False
+
+# Observed ratios outside this range come from truncated or prefix-cached prompts
+_PLAUSIBLE_CHARS_PER_TOKEN = (2.0, 6.0)
+
+# Characters of observed prompts needed before the estimate is recalibrated
+_MIN_CALIBRATION_CHARS = 2000
+
+
+def find_tokenizer_file(model_name: str, tokenizers_dir: Path = TOKENIZERS_DIR) -> Path | None:
+    """
+    Locate a tokenizer.json for an Ollama model name.
+
+    Looks for the full name first ("gemma3:1b" -> gemma3_1b.json), then the
+    family ("gemma3.json"), since sizes of one family share a tokenizer.
+
+    Args:
+        model_name: Ollama model name
+        tokenizers_dir: Directory holding tokenizer files
+
+    Returns:
+        Path to the tokenizer file, or None if there is none
+    """
+    safe_name = model_name.replace(':', '_').replace('/', '_')
+    family = model_name.split(':')[0].split('/')[-1]
+    for name in (safe_name, family):
+        path = Path(tokenizers_dir) / f"{name}.json"
+        if path.is_file():
+            return path
+    return None
+
+
+class TokenCounter:
+    """
+    Counts tokens for one model, exactly or by calibrated estimate.
+
+    Thread-safe: counts are memoized in an LRU cache and calibration
+    updates are serialized with a lock.
+
+    Attributes:
+        model_name: Ollama model the counts are for
+        is_exact: True if the model's real tokenizer is loaded
+        chars_per_token: Current estimate ratio (used when not exact)
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        tokenizer_path: Path | None = None,
+        chars_per_token: float = TOKEN_ESTIMATE_CHARS_PER_TOKEN,
+        cache_size: int = TOKEN_COUNT_CACHE_SIZE,
+    ):
+        """
+        Initialize the counter, loading the tokenizer if one is available.
+
+        Args:
+            model_name: Ollama model name
+            tokenizer_path: tokenizer.json to load (default: find_tokenizer_file())
+            chars_per_token: Starting ratio for the estimator
+            cache_size: Number of memoized counts to keep
+        """
+        self.model_name = model_name
+        self.chars_per_token = chars_per_token
+        self._tokenizer = self._load_tokenizer(tokenizer_path or find_tokenizer_file(model_name))
+        self._lock = threading.Lock()
+        self._observed_chars = 0
+        self._observed_tokens = 0
+        self._count_cached = functools.lru_cache(maxsize=cache_size)(self._count)
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether counts come from the model's real tokenizer."""
+        return self._tokenizer is not None
+
+    def _load_tokenizer(self, path: Path | None):
+        """Load a Hugging Face tokenizer file, or return None to estimate."""
+        if path is None:
+            debug_log(f"[TOKENS] No tokenizer file for {self.model_name}; estimating")
+            return None
+        if not HAS_TOKENIZERS:
+            debug_log(f"[TOKENS] 'tokenizers' not installed; estimating for {self.model_name}")
+            return None
+        try:
+            tokenizer = Tokenizer.from_file(str(path))
+        except Exception as e:
+            debug_log(f"[TOKENS] Failed to load {path}: {e}; estimating")
+            return None
+        debug_log(f"[TOKENS] Loaded tokenizer for {self.model_name} from {path}")
+        return tokenizer
+
+    def count(self, text: str) -> int:
+        """
+        Count the tokens in a string.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Token count (exact, or estimated and rounded up)
+        """
+        if not text:
+            return 0
+        return self._count_cached(text)
+
+    def _count(self, text: str) -> int:
+        """Count without memoization."""
+        if self._tokenizer is not None:
+            return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def calibrate(self, text: str, token_count: int | None) -> None:
+        """
+        Refine the estimate from a prompt's real token count.
+
+        Called with Ollama's prompt_eval_count after each generation. Ignored
+        when the real tokenizer is loaded or the ratio is implausible.
+
+        Args:
+            text: The prompt exactly as sent
+            token_count: Tokens Ollama evaluated for it
+        """
+        if self.is_exact or not token_count or not text:
+            return
+        low, high = _PLAUSIBLE_CHARS_PER_TOKEN
+        if not low <= len(text) / token_count <= high:
+            return
+
+        with self._lock:
+            self._observed_chars += len(text)
+            self._observed_tokens += token_count
+            if self._observed_chars < _MIN_CALIBRATION_CHARS:
+                return
+            ratio = self._observed_chars / self._observed_tokens
+            if abs(ratio - self.chars_per_token) / self.chars_per_token < 0.05:
+                return
+            debug_log(f"[TOKENS] {self.model_name}: recalibrated to {ratio:.2f} chars/token")
+            self.chars_per_token = ratio
+            self._count_cached.cache_clear()
+
+    def pack(self, texts: list[str], budget: int, separator: str = "\n\n") -> list[list[int]]:
+        """
+        Greedily group consecutive texts so each group fits a token budget.
+
+        Args:
+            texts: Texts in order
+            budget: Most tokens per group (texts plus separators)
+            separator: String the texts will be joined with
+
+        Returns:
+            Groups of indices into texts; every group holds at least one text,
+            so a text larger than the budget gets a group of its own
+        """
+        separator_tokens = self.count(separator)
+        groups: list[list[int]] = []
+        current: list[int] = []
+        used = 0
+        for i, text in enumerate(texts):
+            tokens = self.count(text)
+            needed = tokens + (separator_tokens if current else 0)
+            if current and used + needed > budget:
+                groups.append(current)
+                current, used, needed = [], 0, tokens
+            current.append(i)
+            used += needed
+        if current:
+            groups.append(current)
+        return groups
+
+
+# Per-model counters, created on first use
+_token_counters: dict[str, TokenCounter] = {}
+_token_counters_lock = threading.Lock()
+
+
+def get_token_counter(model_name: str = OLLAMA_MODEL_NAME) -> TokenCounter:
+    """
+    Get the shared TokenCounter for a model.
+
+    Args:
+        model_name: Ollama model name
+
+    Returns:
+        TokenCounter instance
+    """
+    with _token_counters_lock:
+        counter = _token_counters.get(model_name)
+        if counter is None:
+            counter = _token_counters[model_name] = TokenCounter(model_name)
+        return counter
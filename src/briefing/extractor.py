@@ -15,8 +15,7 @@ Each chunk is processed independently to extract:
 The extracted data is later aggregated by the DataAggregator (REDUCE phase).
 """
 
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
@@ -144,35 +143,80 @@ Output JSON with: parties (plaintiffs/defendants), allegations, defenses, names_
         """
         debug_log(f"[ChunkExtractor] Processing chunk {chunk.chunk_id} from {chunk.source_document}")
 
-        # Build the prompt from template
-        prompt = self._prompt_template.format(
-            doc_type=chunk.document_type,
-            source=chunk.source_document,
-            chunk_text=chunk.text,
-        )
-
         # Call Ollama structured output
         try:
             response = self.ollama_manager.generate_structured(
-                prompt=prompt,
+                prompt=self._build_prompt(chunk),
                 max_tokens=self.max_tokens,
                 temperature=0.0,  # Deterministic for extraction
             )
+        except Exception as e:
+            debug_log(f"[ChunkExtractor] Error processing chunk {chunk.chunk_id}: {e}")
+            return self._empty_extraction(chunk, success=False)
 
-            if response is None:
-                debug_log(f"[ChunkExtractor] No response for chunk {chunk.chunk_id}")
-                return self._empty_extraction(chunk, success=False)
+        return self._to_extraction(chunk, response)
 
-            # Parse the response into ChunkExtraction
-            extraction = self._parse_response(chunk, response)
-            debug_log(f"[ChunkExtractor] Chunk {chunk.chunk_id}: extracted {self._count_items(extraction)} items")
+    async def aextract(self, chunk: BriefingChunk) -> ChunkExtraction:
+        """
+        Async version of extract() for use on the Ollama scheduler's event loop.
+
+        Args:
+            chunk: BriefingChunk to process
+
+        Returns:
+            ChunkExtraction with extracted data
+        """
+        debug_log(f"[ChunkExtractor] Processing chunk {chunk.chunk_id} from {chunk.source_document}")
+
+        try:
+            response = await self.ollama_manager.agenerate_structured(
+                prompt=self._build_prompt(chunk),
+                max_tokens=self.max_tokens,
+                temperature=0.0,  # Deterministic for extraction
+            )
+        except Exception as e:
+            debug_log(f"[ChunkExtractor] Error processing chunk {chunk.chunk_id}: {e}")
+            return self._empty_extraction(chunk, success=False)
+
+        return self._to_extraction(chunk, response)
+
+    def _build_prompt(self, chunk: BriefingChunk) -> str:
+        """Fill the extraction prompt template for a chunk."""
+        return self._prompt_template.format(
+            doc_type=chunk.document_type,
+            source=chunk.source_document,
+            chunk_text=chunk.text,
+        )
+
+    def _to_extraction(
+        self,
+        chunk: BriefingChunk,
+        response: dict[str, Any] | None,
+    ) -> ChunkExtraction:
+        """
+        Turn a structured-output response into a ChunkExtraction.
+
+        Args:
+            chunk: Source chunk for metadata
+            response: Parsed JSON response, or None if generation failed
 
-            return extraction
+        Returns:
+            ChunkExtraction with parsed data (empty and unsuccessful on failure)
+        """
+        if response is None:
+            debug_log(f"[ChunkExtractor] No response for chunk {chunk.chunk_id}")
+            return self._empty_extraction(chunk, success=False)
 
+        try:
+            # Parse the response into ChunkExtraction
+            extraction = self._parse_response(chunk, response)
         except Exception as e:
             debug_log(f"[ChunkExtractor] Error processing chunk {chunk.chunk_id}: {e}")
             return self._empty_extraction(chunk, success=False)
 
+        debug_log(f"[ChunkExtractor] Chunk {chunk.chunk_id}: extracted {self._count_items(extraction)} items")
+        return extraction
+
     def extract_batch(
         self,
         chunks: list[BriefingChunk],
@@ -251,58 +295,46 @@ Output JSON with: parties (plaintiffs/defendants), allegations, defenses, names_
         max_workers: int = 2,
     ) -> list[ChunkExtraction]:
         """
-        Extract chunks in parallel using ThreadPoolExecutor.
+        Extract chunks concurrently on the Ollama scheduler's event loop.
 
-        Results are returned in chunk_id order regardless of completion order.
+        All chunks are submitted as coroutines; at most max_workers are in
+        flight at once (the scheduler applies its own global cap on top).
+        No worker threads are created. Results are returned in chunk_id
+        order regardless of completion order.
 
         Args:
             chunks: Chunks to process
             progress_callback: Progress callback
-            max_workers: Maximum concurrent workers
+            max_workers: Maximum concurrent extractions
 
         Returns:
             List of extractions ordered by chunk_id
         """
         total = len(chunks)
-        completed_count = 0
-        count_lock = threading.Lock()
-
-        # Dict to store results by chunk_id for ordering
-        results: dict[int, ChunkExtraction] = {}
-
         debug_log(f"[ChunkExtractor] Starting parallel extraction: {total} chunks, {max_workers} workers")
 
-        def extract_with_tracking(chunk: BriefingChunk) -> ChunkExtraction:
-            """Extract a chunk and track progress."""
-            nonlocal completed_count
-            result = self.extract(chunk)
+        async def extract_all() -> list[ChunkExtraction]:
+            semaphore = asyncio.Semaphore(max_workers)
+            completed_count = 0
+
+            async def extract_with_tracking(chunk: BriefingChunk) -> ChunkExtraction:
+                """Extract a chunk and track progress."""
+                nonlocal completed_count
+                async with semaphore:
+                    result = await self.aextract(chunk)
 
-            with count_lock:
+                # Callbacks run on the loop thread, one at a time
                 completed_count += 1
                 if progress_callback:
                     progress_callback(completed_count, total)
+                return result
+
+            return await asyncio.gather(*(extract_with_tracking(chunk) for chunk in chunks))
 
-            return result
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all chunks
-            future_to_chunk = {
-                executor.submit(extract_with_tracking, chunk): chunk
-                for chunk in chunks
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_chunk):
-                chunk = future_to_chunk[future]
-                try:
-                    extraction = future.result()
-                    results[chunk.chunk_id] = extraction
-                except Exception as e:
-                    debug_log(f"[ChunkExtractor] Parallel extraction error for chunk {chunk.chunk_id}: {e}")
-                    results[chunk.chunk_id] = self._empty_extraction(chunk, success=False)
+        results = self.ollama_manager.scheduler.run(extract_all())
 
         # Sort by chunk_id to maintain order
-        extractions = [results[cid] for cid in sorted(results.keys())]
+        extractions = sorted(results, key=lambda extraction: extraction.chunk_id)
 
         debug_log(f"[ChunkExtractor] Parallel batch complete: {len(extractions)} chunks processed")
         return extractions
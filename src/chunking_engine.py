@@ -20,8 +20,10 @@ from langchain_core.documents import Document
 from langchain_experimental.text_splitter import SemanticChunker
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
-from src.config import CHUNK_OVERLAP_FRACTION
+from src.ai.token_counter import get_token_counter
+from src.config import CHUNK_OVERLAP_FRACTION, OLLAMA_MODEL_NAME
 from src.logging_config import debug_log, debug_timing, error, info
+from src.utils.pattern_bank import PatternBank
 
 
 @dataclass
@@ -64,6 +66,7 @@ class ChunkingEngine:
         self.config = self._load_config(config_path)
         self.patterns = self._load_patterns()
         self.compiled_patterns = self._compile_patterns()
+        self.pattern_bank = PatternBank(self.compiled_patterns)
 
         # Initialize LangChain components
         debug_log("Initializing LangChain components for semantic chunking...")
@@ -126,13 +129,17 @@ class ChunkingEngine:
                 error(f"Invalid regex pattern '{pattern}': {e}")
         return compiled
 
-    def chunk_pdf(self, file_path: Path, max_tokens: int) -> list[Chunk]:
+    def chunk_pdf(
+        self, file_path: Path, max_tokens: int, model_name: str = OLLAMA_MODEL_NAME
+    ) -> list[Chunk]:
         """
         Load and chunk a PDF using semantic chunking with a "safety split".
 
         Args:
             file_path: Path to the PDF file.
             max_tokens: The maximum number of tokens a chunk can have.
+            model_name: Ollama model the chunks are for; max_tokens is counted
+                        with its tokenizer.
 
         Returns:
             List of Chunk objects.
@@ -153,19 +160,21 @@ class ChunkingEngine:
             debug_log(f"Split PDF into {len(semantic_docs)} initial semantic chunks.")
 
             # --- Safety Split Logic ---
+            # Sizes are measured in tokens of the target model (real tokenizer
+            # when installed, calibrated estimate otherwise)
             final_docs = []
-            # A simple rule of thumb: 1 token ~ 4 characters
-            max_chars = max_tokens * 4
+            count_tokens = get_token_counter(model_name).count
 
             secondary_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=max_chars,
-                chunk_overlap=int(max_chars * CHUNK_OVERLAP_FRACTION),
-                length_function=len,
+                chunk_size=max_tokens,
+                chunk_overlap=int(max_tokens * CHUNK_OVERLAP_FRACTION),
+                length_function=count_tokens,
             )
 
             for doc in semantic_docs:
-                if len(doc.page_content) > max_chars:
-                    debug_log(f"Semantic chunk is too large ({len(doc.page_content)} chars > {max_chars} chars). Applying safety split.")
+                doc_tokens = count_tokens(doc.page_content)
+                if doc_tokens > max_tokens:
+                    debug_log(f"Semantic chunk is too large ({doc_tokens} tokens > {max_tokens} tokens). Applying safety split.")
                     sub_texts = secondary_splitter.split_text(doc.page_content)
 
                     for sub_text in sub_texts:
@@ -226,13 +235,14 @@ class ChunkingEngine:
         Returns:
             Section name if matched, None otherwise
         """
-        for pattern in self.compiled_patterns:
-            match = pattern.search(text)
-            if match:
-                # Extract the matched text as section name (first 50 chars)
-                matched_text = match.group(0)
-                section_name = matched_text[:50] if len(matched_text) > 50 else matched_text
-                return section_name
+        # First pattern in file order that matches, as if each were tried in turn
+        found = self.pattern_bank.search(text)
+        if found:
+            # Extract the matched text as section name (first 50 chars)
+            _, match = found
+            matched_text = match.group(0)
+            section_name = matched_text[:50] if len(matched_text) > 50 else matched_text
+            return section_name
         return None
 
     def _build_chunks(self, paragraphs: list[tuple[str, int]]) -> list[Chunk]:
@@ -57,13 +57,89 @@ CORPUS_DIR.mkdir(parents=True, exist_ok=True)
 # File Processing Limits
 MAX_FILE_SIZE_MB = 500
 LARGE_FILE_WARNING_MB = 100
+# TXT/RTF files at or above this size are memory-mapped and normalized/sanitized in
+# line-aligned windows of LARGE_TEXT_WINDOW_MB instead of as one string, so only one
+# window's intermediate copies are alive at a time
+LARGE_TEXT_STREAMING_MB = 20
+LARGE_TEXT_WINDOW_MB = 4
 MIN_LINE_LENGTH = 15
 MIN_DICTIONARY_CONFIDENCE = 60  # Percentage
+# Pages with less digital text than this are treated as scanned and sent to OCR
+# (catches image-only pages that carry only a Bates stamp or page number)
+MIN_DIGITAL_PAGE_CHARS = 100
+
+# Dictionary confidence sampling
+# Texts longer than CONFIDENCE_SAMPLE_CHARS are scored on CONFIDENCE_SAMPLE_WINDOWS
+# evenly spaced windows instead of every token. Scoring stops early once the 95%
+# confidence interval lies entirely above or below MIN_DICTIONARY_CONFIDENCE and at
+# least CONFIDENCE_MIN_SAMPLE_TOKENS tokens were seen, so cost per page is bounded.
+CONFIDENCE_SAMPLE_CHARS = 4000
+CONFIDENCE_SAMPLE_WINDOWS = 8
+CONFIDENCE_MIN_SAMPLE_TOKENS = 100
 
 # OCR Configuration
 OCR_DPI = 300
 OCR_CONFIDENCE_THRESHOLD = 70  # Files below this are pre-unchecked
 
+# OCR Engine (bounded-memory, process-parallel)
+# A 300 DPI letter page is ~25MB as a bitmap; Tesseract adds ~100-200MB per process.
+# Pages are rasterized in windows of OCR_WINDOW_PAGES inside each worker, and at
+# most OCR_MAX_WINDOWS_IN_FLIGHT windows are queued per worker, so peak bitmap
+# memory is bounded by workers x window size instead of the document length.
+OCR_WINDOW_PAGES = 4
+OCR_MAX_WINDOWS_IN_FLIGHT = 2  # Per worker
+OCR_WORKER_RAM_GB = 0.5  # Passed to get_optimal_workers()
+OCR_MAX_WORKERS = 4
+
+# Adaptive OCR resolution
+# Pages are first OCR'd at OCR_FAST_DPI (a quarter of the pixels of 300 DPI). Pages
+# whose text scores below OCR_CONFIDENCE_THRESHOLD on the dictionary check are
+# re-rasterized and re-OCR'd at OCR_DPI. Pages whose grayscale pixel variance is
+# below OCR_BLANK_PAGE_VARIANCE are treated as blank and never sent to Tesseract.
+OCR_ADAPTIVE_DPI = True
+OCR_FAST_DPI = 150
+OCR_BLANK_PAGE_VARIANCE = 30.0
+
+# Batch Extraction (headless CLI: python -m src.extraction.batch_extractor)
+# Documents are extracted in parallel worker processes, each running OCR
+# single-threaded, so RAM per worker covers one document's OCR window.
+BATCH_EXTRACTION_WORKER_RAM_GB = 1.0  # Passed to get_optimal_workers()
+BATCH_EXTRACTION_MAX_WORKERS = 8
+BATCH_EXTRACTION_MAX_IN_FLIGHT = 2  # Queued documents per worker
+
+# Extraction Cache
+# Final extraction results are cached in CACHE_DIR/extraction, keyed by file content
+# hash + extractor/sanitizer versions + OCR settings, so reopening a case skips OCR.
+# Inspect or purge with: python -m src.extraction.extraction_cache --stats | --purge
+EXTRACTION_CACHE_ENABLED = True
+EXTRACTION_CACHE_MAX_MB = 500  # Least-recently-used entries evicted above this
+
+# Character Sanitizer
+# Text is sanitized in line-aligned chunks of about SANITIZER_CHUNK_CHARS. Chunks of
+# plain printable ASCII skip ftfy/NFKC/unidecode (which cannot change them), so a
+# transcript with a curly quote every few pages only pays for the chunks containing
+# them. Small chunks measured fastest on the sample documents (~4 lines each).
+SANITIZER_CHUNK_CHARS = 256
+# Texts of at least SANITIZER_PARALLEL_MIN_CHARS (e.g. a large OCR dump) are split at
+# line breaks into SANITIZER_PARALLEL_SEGMENT_CHARS segments that are sanitized in a
+# process pool; output is identical to the serial path. Below the threshold, process
+# startup costs more than it saves.
+SANITIZER_PARALLEL_MIN_CHARS = 8_000_000
+SANITIZER_PARALLEL_SEGMENT_CHARS = 1_000_000
+SANITIZER_WORKER_RAM_GB = 0.25  # Passed to get_optimal_workers()
+SANITIZER_MAX_WORKERS = 4
+
+# Document Preprocessing
+# combine_document_texts() preprocesses each document on its own (header/footer counts
+# and title page detection stay within a document) and memoizes the result in memory by
+# content hash, so re-running a summary on the same case skips preprocessing. Uncached
+# documents run in worker processes once they total PREPROCESSING_PARALLEL_MIN_CHARS;
+# below that, process startup costs more than it saves.
+PREPROCESSING_CACHE_MAX_MB = 200  # Least-recently-used entries evicted above this
+PREPROCESSING_PARALLEL_MIN_CHARS = 2_000_000
+PREPROCESSING_WORKER_RAM_GB = 0.25  # Passed to get_optimal_workers()
+PREPROCESSING_MAX_WORKERS = 4
+
 # AI Model Configuration
 OLLAMA_API_BASE = "http://localhost:11434"  # Default Ollama API endpoint
 OLLAMA_MODEL_NAME = "gemma3:1b"  # Default model for the application
@@ -71,11 +147,51 @@ OLLAMA_MODEL_FALLBACK = "gemma3:1b"  # Fallback if the primary model fails
 OLLAMA_TIMEOUT_SECONDS = 600  # 10 minutes for long summaries
 QUEUE_TIMEOUT_SECONDS = 2.0  # Timeout for multiprocessing queue operations
 
+# Ollama HTTP Client
+# All Ollama calls share one keep-alive connection pool (src/ai/ollama_client.py).
+# The pool size matches the most extraction workers (ChunkExtractor caps at 8), so
+# parallel chunk calls never open extra connections; callers beyond it wait for one.
+# Connection errors and the 5xx statuses below are retried with exponential backoff
+# (0.5s, 1s, ...); timeouts are not, since a slow model would only time out again.
+OLLAMA_POOL_SIZE = 8
+OLLAMA_MAX_RETRIES = 2
+OLLAMA_RETRY_BACKOFF_SECONDS = 0.5
+OLLAMA_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Ollama Request Scheduler
+# Generation requests go through an asyncio scheduler (src/ai/ollama_scheduler.py)
+# that sends at most this many to Ollama at once. Keep it near the server's
+# OLLAMA_NUM_PARALLEL (1-4 by default): extra requests then queue in the scheduler,
+# where interactive Q&A is served ahead of batch summarization, instead of in
+# Ollama's first-come-first-served queue.
+OLLAMA_MAX_CONCURRENT_REQUESTS = 4
+
+# LLM Response Cache
+# Generated text is cached in CACHE_DIR/llm_responses.sqlite3, keyed by model, wrapped
+# prompt, format and options (temperature, top_p, num_predict, num_ctx), so re-running a case
+# answers repeated prompts from disk. Only temperature-0 requests (e.g. briefing
+# extraction) are cached unless LLM_RESPONSE_CACHE_ALL_TEMPERATURES is set, which
+# replays earlier samples for summaries too (fast re-runs, no fresh variation).
+# Inspect or purge with: python -m src.ai.response_cache --stats | --purge
+LLM_RESPONSE_CACHE_ENABLED = True
+LLM_RESPONSE_CACHE_ALL_TEMPERATURES = False
+LLM_RESPONSE_CACHE_MAX_MB = 100  # Least-recently-used entries evicted above this
+
 # Context Window Configuration
 # Optimized for CPU inference on business laptops (8-16GB RAM, no GPU)
 # Research shows: 2k context = ~150 tokens/sec, 8k = ~43 t/s, 64k = ~9 t/s
 OLLAMA_CONTEXT_WINDOW = 2048  # Tokens - matches Ollama's default for CPU performance
 
+# Token Counting
+# Prompt, chunk and reduce-phase budgets are measured with the model's own tokenizer
+# when a Hugging Face tokenizer.json for it is in TOKENIZERS_DIR, named after the model
+# ("gemma3_1b.json") or its family ("gemma3.json"); Ollama's API does not expose one.
+# Otherwise tokens are estimated at TOKEN_ESTIMATE_CHARS_PER_TOKEN, recalibrated from
+# the prompt_eval_count Ollama reports for each generation.
+TOKENIZERS_DIR = MODELS_DIR / "tokenizers"
+TOKEN_ESTIMATE_CHARS_PER_TOKEN = 4.0
+TOKEN_COUNT_CACHE_SIZE = 4096  # Memoized counts per model (least recently used dropped)
+
 # --- New Model Configuration System ---
 MODEL_CONFIG_FILE = Path(__file__).parent.parent / "config" / "models.yaml"
 MODEL_CONFIGS = {}
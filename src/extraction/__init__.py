@@ -4,8 +4,25 @@ Extraction Package
 This package handles Step 1-2 of the document processing pipeline:
 - Step 1: Extract raw text from files (PDF/TXT/RTF)
 - Step 2: Apply basic normalization (de-hyphenation, page removal, etc.)
+
+OCREngine provides bounded-memory, process-parallel OCR for scanned pages.
+ExtractionCache stores final results keyed by file content and settings.
+get_english_words() shares one lazily loaded dictionary across extractors.
+DictionaryConfidenceEstimator scores pages by sampling, with confidence intervals.
 """
 
+from src.extraction.dictionary_confidence import ConfidenceEstimate, DictionaryConfidenceEstimator
+from src.extraction.english_dictionary import get_english_words
+from src.extraction.extraction_cache import ExtractionCache, get_extraction_cache
+from src.extraction.ocr_engine import OCREngine
 from src.extraction.raw_text_extractor import RawTextExtractor
 
-__all__ = ['RawTextExtractor']
+__all__ = [
+    'ConfidenceEstimate',
+    'DictionaryConfidenceEstimator',
+    'ExtractionCache',
+    'OCREngine',
+    'RawTextExtractor',
+    'get_english_words',
+    'get_extraction_cache',
+]
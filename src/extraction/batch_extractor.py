@@ -0,0 +1,362 @@
+"""
+Batch Extraction Module
+
+Headless, process-parallel extraction of many documents to a JSONL file.
+
+The GUI extracts one case at a time. Pre-extracting a nightly drop of
+thousands of documents needs something that runs on a server, survives
+interruption, and keeps every core busy. This module:
+
+1. Expands the inputs (files, directories, glob patterns) into a sorted list
+   of supported documents
+2. Extracts them in a pool of worker processes, each holding its own
+   RawTextExtractor (OCR runs single-process inside each worker)
+3. Appends one JSON record per document to the output file as soon as it
+   finishes, flushing after every line
+4. On --resume, skips documents that already have a record and drops a
+   truncated final line left behind by a crash
+
+Command line:
+    python -m src.extraction.batch_extractor ./drop --output extracted.jsonl
+    python -m src.extraction.batch_extractor "scans/**/*.pdf" -o out.jsonl --workers 6
+    python -m src.extraction.batch_extractor ./drop -o extracted.jsonl --resume
+
+Record format (one line per document):
+    {"file_path": ..., "filename": ..., "status": ..., "method": ...,
+     "confidence": ..., "page_count": ..., "file_size": ..., "case_numbers": [...],
+     "from_cache": ..., "error_message": ..., "timings": {stage: ms, ...},
+     "elapsed_ms": ..., "extracted_text": ...}
+"""
+
+import argparse
+import glob
+import json
+import sys
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Any
+
+from src.config import (
+    BATCH_EXTRACTION_MAX_IN_FLIGHT,
+    BATCH_EXTRACTION_MAX_WORKERS,
+    BATCH_EXTRACTION_WORKER_RAM_GB,
+    EXTRACTION_CACHE_ENABLED,
+)
+from src.extraction.raw_text_extractor import SUPPORTED_EXTENSIONS, RawTextExtractor
+from src.extraction.timing_summary import format_timing_summary, summarize_timings
+from src.logging_config import debug_log, info
+from src.parallel import ExecutorStrategy, ProcessPoolStrategy, SequentialStrategy
+
+# Result fields copied into each JSONL record
+RECORD_FIELDS = (
+    'file_path',
+    'filename',
+    'status',
+    'method',
+    'confidence',
+    'page_count',
+    'file_size',
+    'case_numbers',
+    'from_cache',
+    'error_message',
+    'timings',
+)
+
+# One extractor per worker process, created on the worker's first document
+_worker_extractor: RawTextExtractor | None = None
+
+
+def extract_for_batch(task: tuple[str, str, bool]) -> dict[str, Any]:
+    """
+    Extract one document and build its JSONL record.
+
+    Runs inside a worker process, so it must stay a module-level function
+    with picklable arguments.
+
+    Args:
+        task: (file_path, jurisdiction, use_cache)
+
+    Returns:
+        Record dict (RECORD_FIELDS plus elapsed_ms and extracted_text)
+    """
+    global _worker_extractor
+    file_path, jurisdiction, use_cache = task
+
+    if _worker_extractor is None or _worker_extractor.jurisdiction != jurisdiction:
+        _worker_extractor = RawTextExtractor(
+            jurisdiction=jurisdiction, use_cache=use_cache,
+            ocr_max_workers=1, sanitizer_max_workers=1,
+        )
+
+    start = time.perf_counter()
+    result = _worker_extractor.process_document(file_path)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    record = {field: result.get(field) for field in RECORD_FIELDS}
+    record['elapsed_ms'] = round(elapsed_ms, 1)
+    record['extracted_text'] = result.get('extracted_text', '')
+    return record
+
+
+def discover_files(inputs: Iterable[str]) -> list[Path]:
+    """
+    Expand files, directories and glob patterns into supported documents.
+
+    Directories are searched recursively. Unsupported extensions are ignored.
+
+    Args:
+        inputs: Paths or glob patterns (e.g. "drop/**/*.pdf")
+
+    Returns:
+        Sorted, de-duplicated list of resolved document paths
+    """
+    found: set[Path] = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = (p for p in path.rglob('*') if p.is_file())
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = (Path(p) for p in glob.glob(item, recursive=True))
+
+        for candidate in candidates:
+            if candidate.is_file() and candidate.suffix.lower() in SUPPORTED_EXTENSIONS:
+                found.add(candidate.resolve())
+
+    return sorted(found)
+
+
+def load_completed(output_path: Path) -> set[str]:
+    """
+    Read the file paths already recorded in a JSONL output file.
+
+    A final line that is not valid JSON (a record cut off by a crash) is
+    truncated from the file so that appended records start on a clean line.
+
+    Args:
+        output_path: JSONL output file (may not exist)
+
+    Returns:
+        Set of file_path values with a complete record
+    """
+    if not output_path.exists():
+        return set()
+
+    completed: set[str] = set()
+    valid_bytes = 0
+    with open(output_path, 'rb') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b'\n'):
+                break
+            completed.add(record['file_path'])
+            valid_bytes += len(line)
+
+    if valid_bytes < output_path.stat().st_size:
+        debug_log(f"[BATCH] Truncating partial record at byte {valid_bytes} of {output_path.name}")
+        with open(output_path, 'r+b') as f:
+            f.truncate(valid_bytes)
+
+    return completed
+
+
+class BatchExtractor:
+    """
+    Extracts many documents in parallel and appends JSONL records.
+
+    Attributes:
+        jurisdiction: Passed to every worker's RawTextExtractor
+        use_cache: Whether workers consult the ExtractionCache
+        max_workers: Worker processes (from get_optimal_workers() by default)
+    """
+
+    def __init__(
+        self,
+        jurisdiction: str = "ny",
+        use_cache: bool = EXTRACTION_CACHE_ENABLED,
+        max_workers: int | None = None,
+        strategy: ExecutorStrategy | None = None,
+    ):
+        """
+        Initialize the batch extractor.
+
+        Args:
+            jurisdiction: Legal jurisdiction (ny, ca, federal)
+            use_cache: Reuse and populate the on-disk ExtractionCache
+            max_workers: Number of worker processes. Defaults to
+                        get_optimal_workers(BATCH_EXTRACTION_WORKER_RAM_GB,
+                        BATCH_EXTRACTION_MAX_WORKERS).
+            strategy: ExecutorStrategy to use instead of a ProcessPoolStrategy
+                     (e.g. SequentialStrategy for tests). Not shut down here.
+        """
+        self.jurisdiction = jurisdiction
+        self.use_cache = use_cache
+        self._strategy = strategy
+
+        if strategy is not None:
+            self.max_workers = strategy.max_workers
+        elif max_workers is not None:
+            self.max_workers = max(1, max_workers)
+        else:
+            from src.system_resources import get_optimal_workers
+            self.max_workers = get_optimal_workers(
+                task_ram_gb=BATCH_EXTRACTION_WORKER_RAM_GB,
+                max_workers=BATCH_EXTRACTION_MAX_WORKERS,
+            )
+
+    def run(
+        self,
+        file_paths: list[Path],
+        output_path: str | Path,
+        resume: bool = False,
+        progress_callback: Callable[[dict, int, int], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Extract documents and append one record per document to output_path.
+
+        Args:
+            file_paths: Documents to extract
+            output_path: JSONL file to write
+            resume: Keep existing records and skip their documents;
+                   otherwise the output file is overwritten
+            progress_callback: Optional callback(record, done, total) after each document
+
+        Returns:
+            Summary dict with total, skipped, success, warning, error, elapsed_s,
+            and timing (summarize_timings() over the documents extracted this run)
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        completed = load_completed(output_path) if resume else set()
+        pending_paths = [str(p) for p in file_paths if str(p) not in completed]
+        summary = {
+            'total': len(file_paths),
+            'skipped': len(file_paths) - len(pending_paths),
+            'success': 0,
+            'warning': 0,
+            'error': 0,
+            'elapsed_s': 0.0,
+        }
+        info(f"Batch extraction: {len(pending_paths)} to extract, {summary['skipped']} already done, "
+             f"{self.max_workers} worker(s)")
+
+        strategy = self._strategy
+        owns_strategy = strategy is None
+        if owns_strategy:
+            strategy = SequentialStrategy() if self.max_workers == 1 else ProcessPoolStrategy(self.max_workers)
+
+        max_in_flight = self.max_workers * BATCH_EXTRACTION_MAX_IN_FLIGHT
+        start = time.perf_counter()
+        pending: set[Future] = set()
+        done_count = 0
+        timing_records: list[dict] = []
+
+        with open(output_path, 'a' if resume else 'w', encoding='utf-8') as out:
+
+            def collect(done: set[Future]):
+                nonlocal done_count
+                for future in done:
+                    record = future.result()
+                    out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    out.flush()
+                    summary[record['status']] = summary.get(record['status'], 0) + 1
+                    timing_records.append({'filename': record['filename'], 'timings': record['timings']})
+                    done_count += 1
+                    if progress_callback:
+                        progress_callback(record, done_count, len(pending_paths))
+
+            try:
+                for file_path in pending_paths:
+                    # Backpressure: finished records (with their text) never pile up
+                    while len(pending) >= max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+
+                    pending.add(strategy.submit(
+                        extract_for_batch, (file_path, self.jurisdiction, self.use_cache)
+                    ))
+
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            finally:
+                if owns_strategy:
+                    strategy.shutdown(wait=True, cancel_futures=True)
+
+        summary['elapsed_s'] = round(time.perf_counter() - start, 2)
+        summary['timing'] = summarize_timings(timing_records)
+        return summary
+
+
+def main():
+    """Command-line interface for headless batch extraction."""
+    parser = argparse.ArgumentParser(
+        description="LocalScribe batch extraction - extract many documents to JSONL",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Extract every PDF/TXT/RTF under a directory
+  python -m src.extraction.batch_extractor ./drop --output extracted.jsonl
+
+  # Glob pattern, fixed worker count
+  python -m src.extraction.batch_extractor "scans/**/*.pdf" -o out.jsonl --workers 6
+
+  # Continue an interrupted run
+  python -m src.extraction.batch_extractor ./drop -o extracted.jsonl --resume
+        """
+    )
+    parser.add_argument('inputs', nargs='+', help='Files, directories or glob patterns')
+    parser.add_argument('-o', '--output', required=True, help='JSONL output file')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: sized to available CPU and RAM)')
+    parser.add_argument('--jurisdiction', default='ny', choices=['ny', 'ca', 'federal'],
+                        help='Legal jurisdiction (default: ny)')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the extraction cache')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--resume', action='store_true',
+                      help='Skip documents already in the output file and append the rest')
+    mode.add_argument('--overwrite', action='store_true', help='Replace an existing output file')
+    args = parser.parse_args()
+
+    output_path = Path(args.output)
+    if output_path.exists() and not (args.resume or args.overwrite):
+        parser.error(f"{output_path} exists; pass --resume to continue it or --overwrite to replace it")
+
+    file_paths = discover_files(args.inputs)
+    if not file_paths:
+        parser.error("No PDF, TXT or RTF files matched the inputs")
+
+    extractor = BatchExtractor(
+        jurisdiction=args.jurisdiction,
+        use_cache=not args.no_cache,
+        max_workers=args.workers,
+    )
+
+    def report(record: dict, done: int, total: int):
+        print(f"[{done}/{total}] {record['status'].upper():7} {record['filename']} "
+              f"({record['elapsed_ms'] / 1000:.1f}s)", flush=True)
+
+    summary = extractor.run(file_paths, output_path, resume=args.resume, progress_callback=report)
+
+    extracted = summary['success'] + summary['warning'] + summary['error']
+    rate = extracted / summary['elapsed_s'] if summary['elapsed_s'] else 0.0
+    print("\n" + "=" * 60)
+    print(f"Total: {summary['total']} | Skipped: {summary['skipped']} | Success: {summary['success']} | "
+          f"Warnings: {summary['warning']} | Errors: {summary['error']}")
+    print(f"Elapsed: {summary['elapsed_s']:.1f}s ({rate:.2f} docs/s) -> {output_path}")
+    if summary['timing']['documents']:
+        print(format_timing_summary(summary['timing']))
+    print("=" * 60)
+
+    sys.exit(1 if summary['error'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Dictionary Confidence Module
+
+Estimates what percentage of a text's words are valid English words - the
+heuristic that decides whether a PDF page's digital text is usable or the
+page must be OCR'd.
+
+The original check ran re.findall() over text.lower(), copying the whole
+text and materializing a list of every token before counting. This
+estimator instead:
+
+1. Streams tokens with re.finditer() and lowercases one token at a time
+2. Scores short texts exactly (every token, identical to the old result)
+3. For texts longer than CONFIDENCE_SAMPLE_CHARS, scores evenly spaced
+   (stratified) windows whose combined size equals the sample budget
+4. Reports a 95% Wilson confidence interval, and stops sampling as soon as
+   the interval lies entirely above or below the OCR decision threshold
+
+Usage:
+    from src.extraction.dictionary_confidence import DictionaryConfidenceEstimator
+
+    estimator = DictionaryConfidenceEstimator(english_words)
+    page_scores = estimator.score_pages(page_texts)
+    page_scores[0].confidence          # 87.5
+    page_scores[0].interval            # (82.1, 91.4)
+"""
+
+import math
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from src.config import (
+    CONFIDENCE_MIN_SAMPLE_TOKENS,
+    CONFIDENCE_SAMPLE_CHARS,
+    CONFIDENCE_SAMPLE_WINDOWS,
+    MIN_DICTIONARY_CONFIDENCE,
+)
+
+# Same tokenization as the original findall() over lowercased text
+_TOKEN_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+
+# z-score for a 95% confidence interval
+_Z_95 = 1.96
+
+
+@dataclass
+class ConfidenceEstimate:
+    """
+    Dictionary confidence of one text (or a pool of texts).
+
+    Attributes:
+        confidence: Percentage of sampled tokens that are English words (0-100)
+        valid_tokens: Sampled tokens found in the dictionary
+        sampled_tokens: Tokens examined
+        sampled: True if only part of the text was examined
+        ci_low: Lower bound of the 95% confidence interval (percentage)
+        ci_high: Upper bound of the 95% confidence interval (percentage)
+    """
+
+    confidence: float
+    valid_tokens: int
+    sampled_tokens: int
+    sampled: bool
+    ci_low: float
+    ci_high: float
+
+    @property
+    def interval(self) -> tuple[float, float]:
+        """The 95% confidence interval as (low, high) percentages."""
+        return self.ci_low, self.ci_high
+
+
+def wilson_interval(successes: int, trials: int, z: float = _Z_95) -> tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion, as percentages.
+
+    Stays inside [0, 100] and behaves sensibly for small samples and
+    proportions near 0 or 1, unlike the normal approximation.
+
+    Args:
+        successes: Number of successes
+        trials: Number of trials
+        z: z-score of the interval (1.96 for 95%)
+
+    Returns:
+        (low, high) percentages; (0.0, 100.0) when there are no trials
+    """
+    if trials <= 0:
+        return 0.0, 100.0
+
+    p = successes / trials
+    z2 = z * z
+    denominator = 1 + z2 / trials
+    center = (p + z2 / (2 * trials)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials)) / denominator
+    return max(0.0, center - half_width) * 100, min(1.0, center + half_width) * 100
+
+
+class DictionaryConfidenceEstimator:
+    """
+    Streaming, sampling dictionary-confidence estimator.
+
+    Attributes:
+        english_words: Lowercase word set used for lookups
+        sample_chars: Texts longer than this are sampled rather than fully scored
+        sample_windows: Number of stratified windows the sample budget is split into
+        threshold: Decision threshold (percentage) used for early stopping
+        min_tokens: Tokens required before sampling may stop early
+    """
+
+    def __init__(
+        self,
+        english_words: frozenset[str] | set[str],
+        sample_chars: int = CONFIDENCE_SAMPLE_CHARS,
+        sample_windows: int = CONFIDENCE_SAMPLE_WINDOWS,
+        threshold: float = MIN_DICTIONARY_CONFIDENCE,
+        min_tokens: int = CONFIDENCE_MIN_SAMPLE_TOKENS,
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            english_words: Lowercase English word set (see get_english_words())
+            sample_chars: Sample budget in characters per text
+            sample_windows: Windows per sampled text (spread evenly across it)
+            threshold: OCR decision threshold in percent
+            min_tokens: Minimum tokens before the interval may end sampling early
+        """
+        self.english_words = english_words
+        self.sample_chars = max(1, sample_chars)
+        self.sample_windows = max(1, sample_windows)
+        self.threshold = threshold
+        self.min_tokens = min_tokens
+
+    def estimate(self, text: str) -> ConfidenceEstimate:
+        """
+        Estimate the dictionary confidence of a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            ConfidenceEstimate (confidence 0.0 for empty or word-free text)
+        """
+        if not text:
+            return self._make_estimate(0, 0, sampled=False)
+
+        if len(text) <= self.sample_chars:
+            valid, total = self._count_tokens(_TOKEN_PATTERN.finditer(text))
+            return self._make_estimate(valid, total, sampled=False)
+
+        valid = total = 0
+        windows = self._sample_windows(len(text))
+        for index, (start, end) in enumerate(windows, 1):
+            window_valid, window_total = self._count_tokens(self._iter_window_tokens(text, start, end))
+            valid += window_valid
+            total += window_total
+
+            if index < len(windows) and self._is_decided(valid, total):
+                break
+
+        return self._make_estimate(valid, total, sampled=True)
+
+    def score_pages(self, page_texts: Iterable[str]) -> list[ConfidenceEstimate]:
+        """
+        Estimate the confidence of each page independently.
+
+        Args:
+            page_texts: Text per page
+
+        Returns:
+            One ConfidenceEstimate per page, in order
+        """
+        return [self.estimate(page_text) for page_text in page_texts]
+
+    def summarize(self, estimates: Iterable[ConfidenceEstimate]) -> ConfidenceEstimate:
+        """
+        Pool per-page estimates into a document-level estimate.
+
+        Tokens are pooled, so pages contribute in proportion to how many
+        tokens were examined on them.
+
+        Args:
+            estimates: Per-page estimates
+
+        Returns:
+            Pooled ConfidenceEstimate
+        """
+        valid = total = 0
+        sampled = False
+        for estimate in estimates:
+            valid += estimate.valid_tokens
+            total += estimate.sampled_tokens
+            sampled = sampled or estimate.sampled
+        return self._make_estimate(valid, total, sampled=sampled)
+
+    def _count_tokens(self, matches: Iterator[re.Match]) -> tuple[int, int]:
+        """Count (valid, total) tokens without building a token list."""
+        english_words = self.english_words
+        valid = total = 0
+        for match in matches:
+            total += 1
+            if match.group().lower() in english_words:
+                valid += 1
+        return valid, total
+
+    @staticmethod
+    def _iter_window_tokens(text: str, start: int, end: int) -> Iterator[re.Match]:
+        """
+        Yield tokens that start inside [start, end).
+
+        A word cut by the window start is skipped (the \\b anchor sees the
+        preceding letter), and a word cut by the window end is read to its
+        end, so windows never produce partial tokens.
+        """
+        for match in _TOKEN_PATTERN.finditer(text, start):
+            if match.start() >= end:
+                return
+            yield match
+
+    def _sample_windows(self, text_length: int) -> list[tuple[int, int]]:
+        """
+        Place one window in the middle of each of sample_windows equal strata.
+
+        Windows are returned interleaved (even strata first, then odd) so
+        that stopping early still leaves the sample spread across the text.
+        """
+        window_count = self.sample_windows
+        window_chars = max(1, self.sample_chars // window_count)
+        stratum = text_length / window_count
+
+        windows = []
+        for index in range(window_count):
+            start = int(index * stratum + max(0.0, stratum - window_chars) / 2)
+            windows.append((start, min(text_length, start + window_chars)))
+
+        return windows[0::2] + windows[1::2]
+
+    def _is_decided(self, valid: int, total: int) -> bool:
+        """True once enough tokens were seen and the interval excludes the threshold."""
+        if total < self.min_tokens:
+            return False
+        low, high = wilson_interval(valid, total)
+        return low > self.threshold or high <= self.threshold
+
+    @staticmethod
+    def _make_estimate(valid: int, total: int, sampled: bool) -> ConfidenceEstimate:
+        """Build a ConfidenceEstimate from token counts."""
+        confidence = (valid / total) * 100 if total else 0.0
+        low, high = wilson_interval(valid, total) if total else (0.0, 0.0)
+        return ConfidenceEstimate(
+            confidence=confidence,
+            valid_tokens=valid,
+            sampled_tokens=total,
+            sampled=sampled,
+            ci_low=low,
+            ci_high=high,
+        )
@@ -0,0 +1,133 @@
+"""
+English Dictionary Module
+
+Process-wide, lazily built English word set for dictionary-confidence scoring.
+
+Building {word.lower() for word in nltk.corpus.words.words()} reads and
+lowercases ~236k words, and used to happen in every RawTextExtractor
+constructor - once per file during a corpus rebuild. This module builds the
+set at most once per process and shares a single frozenset with every
+extractor. The first build is also serialized to CACHE_DIR as a pickled
+frozenset, so later processes skip NLTK entirely and just unpickle it.
+
+Usage:
+    from src.extraction.english_dictionary import get_english_words
+
+    english_words = get_english_words()  # frozenset, shared
+    stats = get_dictionary_load_stats()  # {'source': 'disk_cache', 'load_ms': 41.2, ...}
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.config import CACHE_DIR, DEBUG_MODE
+from src.logging_config import debug, warning
+
+# Bump if the word normalization changes (invalidates the on-disk copy)
+DICTIONARY_FORMAT_VERSION = 1
+DICTIONARY_CACHE_FILE = CACHE_DIR / f"english_words_v{DICTIONARY_FORMAT_VERSION}.pickle"
+
+_english_words: frozenset[str] | None = None
+_load_stats: dict = {}
+_lock = threading.Lock()
+
+
+def get_english_words(cache_file: Path | None = None) -> frozenset[str]:
+    """
+    Return the shared lowercase English word set, building it on first use.
+
+    Thread-safe: concurrent first callers wait for a single build.
+
+    Args:
+        cache_file: On-disk pickle location (defaults to DICTIONARY_CACHE_FILE)
+
+    Returns:
+        Frozenset of lowercase English words
+    """
+    global _english_words
+    if _english_words is not None:
+        return _english_words
+
+    with _lock:
+        if _english_words is None:
+            _english_words = _load(cache_file or DICTIONARY_CACHE_FILE)
+    return _english_words
+
+
+def get_dictionary_load_stats() -> dict:
+    """
+    Report how the shared dictionary was loaded.
+
+    Returns:
+        Dict with 'source' ('disk_cache' or 'nltk'), 'load_ms' and 'word_count',
+        or an empty dict if the dictionary has not been loaded yet
+    """
+    return dict(_load_stats)
+
+
+def reset_english_words() -> None:
+    """Drop the in-memory dictionary so the next call reloads it (for tests)."""
+    global _english_words
+    with _lock:
+        _english_words = None
+        _load_stats.clear()
+
+
+def _load(cache_file: Path) -> frozenset[str]:
+    """Load from the pickle cache if possible, otherwise build from NLTK."""
+    start = time.perf_counter()
+
+    words = _read_cache(cache_file)
+    source = 'disk_cache'
+    if words is None:
+        words = _build_from_nltk()
+        source = 'nltk'
+        _write_cache(cache_file, words)
+
+    load_ms = (time.perf_counter() - start) * 1000
+    _load_stats.update({'source': source, 'load_ms': round(load_ms, 1), 'word_count': len(words)})
+    debug(f"[DICTIONARY] Loaded {len(words)} English words from {source} in {load_ms:.0f} ms")
+    return words
+
+
+def _build_from_nltk() -> frozenset[str]:
+    """Build the word set from the NLTK words corpus, downloading it if needed."""
+    import nltk
+    from nltk.corpus import words
+
+    try:
+        return frozenset(word.lower() for word in words.words())
+    except LookupError:
+        warning("NLTK words corpus not found. Downloading...")
+        nltk.download('words', quiet=not DEBUG_MODE)
+        return frozenset(word.lower() for word in words.words())
+
+
+def _read_cache(cache_file: Path) -> frozenset[str] | None:
+    """Unpickle the cached word set, or None if missing/unreadable."""
+    try:
+        with open(cache_file, 'rb') as f:
+            words = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        debug(f"[DICTIONARY] Ignoring unreadable cache {cache_file.name}: {e}")
+        return None
+
+    return words if isinstance(words, frozenset) and words else None
+
+
+def _write_cache(cache_file: Path, words: frozenset[str]) -> None:
+    """Atomically pickle the word set so other processes can reuse it."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(words, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        debug(f"[DICTIONARY] Could not write cache {cache_file}: {e}")
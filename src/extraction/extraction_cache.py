@@ -0,0 +1,338 @@
+"""
+Extraction Cache Module
+
+Content-addressed on-disk cache for RawTextExtractor.process_document().
+
+Reopening a case re-extracts every file, including OCR that can take
+minutes per document. This cache stores the final extraction result keyed
+by the file's content hash plus the settings that affect the output
+(extractor/sanitizer versions, OCR settings, jurisdiction), so an unchanged
+file returns in milliseconds. Renaming or moving a file still hits; editing
+it, or changing any keyed setting, misses.
+
+Storage: %APPDATA%/LocalScribe/cache/extraction/<key>.json
+Eviction: LRU by file modification time (touched on every hit), capped at
+EXTRACTION_CACHE_MAX_MB.
+
+Command line:
+    python -m src.extraction.extraction_cache --stats
+    python -m src.extraction.extraction_cache --list
+    python -m src.extraction.extraction_cache --purge
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.config import CACHE_DIR, EXTRACTION_CACHE_MAX_MB
+from src.logging_config import debug_log
+
+# Bump when the on-disk entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Result fields persisted in an entry (per-file fields like filename are not cached)
+CACHED_FIELDS = (
+    'status',
+    'method',
+    'confidence',
+    'extracted_text',
+    'page_count',
+    'page_offsets',
+    'page_results',
+    'case_numbers',
+    'sanitization_stats',
+)
+
+# Read files in 1MB blocks when hashing
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: str | Path) -> str:
+    """
+    Compute the SHA-256 of a file's contents without loading it whole.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        while block := f.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Content-addressed extraction result cache with LRU eviction.
+
+    Thread-safe: entries are written to a temp file and atomically renamed,
+    and eviction is serialized with a lock.
+
+    Example:
+        cache = ExtractionCache()
+        key = cache.make_key(file_path, {'ocr_dpi': 300})
+        result = cache.get(key)
+        if result is None:
+            result = extract(file_path)
+            cache.put(key, result)
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_size_mb: float = EXTRACTION_CACHE_MAX_MB):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for entries. Defaults to CACHE_DIR/extraction.
+            max_size_mb: Total size cap before least-recently-used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR / "extraction"
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def make_key(self, file_path: str | Path, settings: dict[str, Any]) -> str:
+        """
+        Build a cache key from file content and extraction settings.
+
+        Args:
+            file_path: Path to the source document
+            settings: JSON-serializable settings that affect the output
+
+        Returns:
+            Hex key string
+        """
+        settings_blob = json.dumps(settings, sort_keys=True)
+        digest = hashlib.sha256()
+        digest.update(hash_file(file_path).encode())
+        digest.update(f"|v{CACHE_FORMAT_VERSION}|".encode())
+        digest.update(settings_blob.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Dict of CACHED_FIELDS, or None on a miss or unreadable entry
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            debug_log(f"[EXTRACTION CACHE] Discarding unreadable entry {key[:12]}: {e}")
+            self._remove(entry_path)
+            self.misses += 1
+            return None
+
+        if entry.get('format_version') != CACHE_FORMAT_VERSION:
+            self._remove(entry_path)
+            self.misses += 1
+            return None
+
+        # Touch for LRU ordering
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return entry['result']
+
+    def put(self, key: str, result: dict) -> bool:
+        """
+        Store an extraction result.
+
+        Only CACHED_FIELDS are persisted. Triggers eviction if the cache
+        exceeds its size cap.
+
+        Args:
+            key: Key from make_key()
+            result: Result dict from RawTextExtractor.process_document()
+
+        Returns:
+            True if the entry was written
+        """
+        entry = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'created_at': time.time(),
+            'source_filename': result.get('filename'),
+            'result': {field: result.get(field) for field in CACHED_FIELDS},
+        }
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except (OSError, TypeError, ValueError) as e:
+            debug_log(f"[EXTRACTION CACHE] Failed to write entry {key[:12]}: {e}")
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used entries until under the size cap.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            entries = self._scan_entries()
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_size_bytes:
+                return 0
+
+            removed = 0
+            for path, size, _ in sorted(entries, key=lambda e: e[2]):
+                if total <= self.max_size_bytes:
+                    break
+                if self._remove(path):
+                    total -= size
+                    removed += 1
+
+        debug_log(f"[EXTRACTION CACHE] Evicted {removed} entries "
+                  f"({total / (1024 * 1024):.1f}MB remaining)")
+        return removed
+
+    def purge(self) -> int:
+        """
+        Delete every cache entry.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = sum(1 for path, _, _ in self._scan_entries() if self._remove(path))
+        debug_log(f"[EXTRACTION CACHE] Purged {removed} entries")
+        return removed
+
+    def list_entries(self) -> list[dict[str, Any]]:
+        """
+        Describe cached entries, most recently used first.
+
+        Returns:
+            List of dicts with key, source_filename, method, size_bytes, last_used
+        """
+        described = []
+        for path, size, last_used in sorted(self._scan_entries(), key=lambda e: e[2], reverse=True):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            described.append({
+                'key': path.stem,
+                'source_filename': entry.get('source_filename'),
+                'method': entry.get('result', {}).get('method'),
+                'size_bytes': size,
+                'last_used': last_used,
+            })
+        return described
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, size_mb, max_size_mb, hits, misses, cache_dir
+        """
+        entries = self._scan_entries()
+        return {
+            'entries': len(entries),
+            'size_mb': round(sum(size for _, size, _ in entries) / (1024 * 1024), 2),
+            'max_size_mb': round(self.max_size_bytes / (1024 * 1024), 2),
+            'hits': self.hits,
+            'misses': self.misses,
+            'cache_dir': str(self.cache_dir),
+        }
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+
+    def _scan_entries(self) -> list[tuple[Path, int, float]]:
+        """Return (path, size_bytes, mtime) for every entry on disk."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed by another thread
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        """Delete an entry, ignoring races with other threads."""
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+
+# Global singleton instance
+_extraction_cache: ExtractionCache | None = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Get the global ExtractionCache singleton.
+
+    Returns:
+        ExtractionCache instance
+    """
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionCache()
+    return _extraction_cache
+
+
+def main():
+    """Command-line interface to inspect and purge the extraction cache."""
+    parser = argparse.ArgumentParser(description="LocalScribe extraction cache maintenance")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--stats', action='store_true', help='Show cache size and entry count (default)')
+    group.add_argument('--list', action='store_true', help='List cached documents, most recent first')
+    group.add_argument('--purge', action='store_true', help='Delete all cached extraction results')
+    args = parser.parse_args()
+
+    cache = get_extraction_cache()
+
+    if args.purge:
+        print(f"Removed {cache.purge()} cached extraction(s)")
+    elif args.list:
+        for entry in cache.list_entries():
+            last_used = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['last_used']))
+            print(f"{entry['key'][:12]}  {last_used}  {entry['size_bytes'] / 1024:8.1f} KB  "
+                  f"{entry['method'] or '-':<14} {entry['source_filename'] or '?'}")
+    else:
+        stats = cache.get_stats()
+        print(f"Cache directory: {stats['cache_dir']}")
+        print(f"Entries: {stats['entries']}")
+        print(f"Size: {stats['size_mb']} MB / {stats['max_size_mb']} MB")
+
+
+if __name__ == "__main__":
+    main()
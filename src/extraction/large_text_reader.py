@@ -0,0 +1,157 @@
+"""
+Large Text Reader Module
+
+Bounded-memory reading of very large TXT/RTF inputs (court reporter exports
+can reach hundreds of MB).
+
+Reading such a file with f.read() and then normalizing and sanitizing it
+keeps several full-size copies alive at once: raw, decoded, normalized and
+sanitized. This module memory-maps the file instead and yields decoded text
+in windows of roughly LARGE_TEXT_WINDOW_MB, so each downstream stage only
+ever holds one window's intermediates.
+
+Windows always end just after a newline, and never right after a line that
+ends in a hyphen (ignoring trailing whitespace). Line-based stages therefore
+see whole lines, and de-hyphenation never needs to join words across two
+windows. Newlines are translated exactly as open() in text mode does
+(\\r\\n and \\r become \\n), and undecodable bytes are dropped as with
+errors='ignore'.
+
+Usage:
+    from src.extraction.large_text_reader import iter_file_windows
+
+    for window in iter_file_windows("transcript.txt"):
+        process(window)  # each window ends at a line boundary
+"""
+
+import codecs
+import io
+import mmap
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from src.config import LARGE_TEXT_WINDOW_MB
+
+DEFAULT_WINDOW_BYTES = int(LARGE_TEXT_WINDOW_MB * 1024 * 1024)
+
+
+def find_window_cut(text: str) -> int:
+    """
+    Find where a window may safely end.
+
+    Args:
+        text: Buffered text
+
+    Returns:
+        Index just past the last newline that is not preceded (ignoring
+        whitespace) by a hyphen, or 0 if there is no such newline
+    """
+    newline = text.rfind('\n')
+    while newline >= 0:
+        before = newline - 1
+        while before >= 0 and text[before].isspace():
+            before -= 1
+        if before < 0 or text[before] != '-':
+            return newline + 1
+        newline = text.rfind('\n', 0, before)
+    return 0
+
+
+def iter_line_windows(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Regroup arbitrary text chunks into windows that end at safe line breaks.
+
+    A chunk without a safe cut is carried into the next one, so a window can
+    exceed the chunk size only for pathological input (e.g. no newlines).
+
+    Args:
+        chunks: Consecutive pieces of one text
+
+    Yields:
+        Non-empty windows whose concatenation equals the input
+    """
+    carry = ''
+    for chunk in chunks:
+        buffer = carry + chunk if carry else chunk
+        cut = find_window_cut(buffer)
+        if cut == 0:
+            carry = buffer
+            continue
+        yield buffer[:cut]
+        carry = buffer[cut:]
+
+    if carry:
+        yield carry
+
+
+def iter_decoded_chunks(
+    file_path: str | Path,
+    chunk_bytes: int = DEFAULT_WINDOW_BYTES,
+    encoding: str = 'utf-8',
+) -> Iterator[str]:
+    """
+    Memory-map a file and decode it chunk by chunk.
+
+    Multi-byte characters and \\r\\n pairs split across chunk boundaries are
+    handled by an incremental decoder, matching open(..., errors='ignore').
+
+    Args:
+        file_path: File to read
+        chunk_bytes: Bytes mapped and decoded per chunk
+        encoding: Text encoding
+
+    Yields:
+        Decoded text chunks
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(errors='ignore'), translate=True
+    )
+
+    with open(file_path, 'rb') as f:
+        if f.seek(0, io.SEEK_END) == 0:
+            return  # mmap cannot map empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped)
+            for start in range(0, size, chunk_bytes):
+                end = min(start + chunk_bytes, size)
+                text = decoder.decode(mapped[start:end], final=end == size)
+                if text:
+                    yield text
+
+
+def iter_file_windows(
+    file_path: str | Path,
+    window_bytes: int = DEFAULT_WINDOW_BYTES,
+    encoding: str = 'utf-8',
+) -> Iterator[str]:
+    """
+    Yield a text file's decoded contents in line-aligned windows.
+
+    Args:
+        file_path: File to read
+        window_bytes: Approximate window size in bytes
+        encoding: Text encoding
+
+    Yields:
+        Windows whose concatenation equals open(file_path, encoding=encoding,
+        errors='ignore').read()
+    """
+    yield from iter_line_windows(iter_decoded_chunks(file_path, window_bytes, encoding))
+
+
+def iter_text_windows(text: str, window_chars: int = DEFAULT_WINDOW_BYTES) -> Iterator[str]:
+    """
+    Yield an in-memory text in line-aligned windows.
+
+    Used for RTF, where striprtf needs the whole document at once but the
+    stripped text can still be processed window by window.
+
+    Args:
+        text: Text to split
+        window_chars: Approximate window size in characters
+
+    Yields:
+        Windows whose concatenation equals text
+    """
+    chunks = (text[start:start + window_chars] for start in range(0, len(text), window_chars))
+    yield from iter_line_windows(chunks)
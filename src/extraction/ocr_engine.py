@@ -0,0 +1,334 @@
+"""
+OCR Engine Module
+
+Bounded-memory, process-parallel OCR for scanned PDF pages.
+
+The naive approach - convert_from_path() on the whole file, then OCR each
+image - holds every page bitmap in RAM at once (gigabytes for a 300-page
+scan at 300 DPI) and OCRs one page at a time. This engine instead:
+
+1. Splits the requested pages into small windows (OCR_WINDOW_PAGES)
+2. Sends each window to a worker, which rasterizes just that window with
+   pdf2image's first_page/last_page and OCRs it with Tesseract
+3. Caps how many windows are queued at once, so peak bitmap memory is
+   bounded by workers x window size regardless of document length
+4. Reassembles the text in page order and reports per-page progress
+
+Adaptive resolution (OCR_ADAPTIVE_DPI): each window is first rasterized at
+OCR_FAST_DPI. Near-blank pages (low pixel variance) skip Tesseract entirely,
+and only pages whose fast-pass text scores below OCR_CONFIDENCE_THRESHOLD on
+the dictionary check are re-rasterized and re-OCR'd at the full OCR_DPI.
+
+Usage:
+    from src.extraction.ocr_engine import OCREngine
+
+    engine = OCREngine()
+    page_texts = engine.ocr_pages("scan.pdf", [1, 2, 3, 7])
+    # {1: '...', 2: '...', 3: '...', 7: '...'}
+
+Testing:
+    Pass strategy=SequentialStrategy() to run windows inline without
+    spawning worker processes.
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+
+import pytesseract
+from pdf2image import convert_from_path
+from PIL import Image, ImageStat
+
+from src.config import (
+    OCR_ADAPTIVE_DPI,
+    OCR_BLANK_PAGE_VARIANCE,
+    OCR_CONFIDENCE_THRESHOLD,
+    OCR_DPI,
+    OCR_FAST_DPI,
+    OCR_MAX_WINDOWS_IN_FLIGHT,
+    OCR_MAX_WORKERS,
+    OCR_WINDOW_PAGES,
+    OCR_WORKER_RAM_GB,
+)
+from src.logging_config import debug
+from src.parallel import ExecutorStrategy, ProcessPoolStrategy, SequentialStrategy
+
+# Blank-page check samples every Nth pixel in each direction
+_VARIANCE_SAMPLE_STEP = 4
+
+# Per-process confidence estimator for the adaptive pass (built on first use)
+_confidence_estimator = None
+
+
+def page_pixel_variance(image) -> float:
+    """
+    Grayscale pixel variance of a page, computed on a subsampled copy.
+
+    Nearest-neighbour subsampling keeps the pixel distribution, so a page
+    with any text stays far above the blank threshold while scanner noise
+    on an empty page stays below it.
+    """
+    width, height = image.size
+    sample = image.convert('L').resize(
+        (max(1, width // _VARIANCE_SAMPLE_STEP), max(1, height // _VARIANCE_SAMPLE_STEP)),
+        Image.NEAREST,
+    )
+    return ImageStat.Stat(sample).var[0]
+
+
+def _text_confidence(text: str) -> float:
+    """Dictionary confidence of OCR text, using a per-process estimator."""
+    global _confidence_estimator
+    if _confidence_estimator is None:
+        from src.extraction.dictionary_confidence import DictionaryConfidenceEstimator
+        from src.extraction.english_dictionary import get_english_words
+        _confidence_estimator = DictionaryConfidenceEstimator(
+            get_english_words(), threshold=OCR_CONFIDENCE_THRESHOLD
+        )
+    return _confidence_estimator.estimate(text).confidence
+
+
+def _ocr_image(image) -> tuple[str, float]:
+    """OCR one bitmap and return (text, ocr_ms)."""
+    start = time.perf_counter()
+    text = pytesseract.image_to_string(image)
+    return text, (time.perf_counter() - start) * 1000
+
+
+def _rerun_at_full_dpi(file_path: str, page_number: int, dpi: int) -> tuple[str, float, float]:
+    """Rasterize and OCR a single page at full resolution: (text, rasterization_ms, ocr_ms)."""
+    start = time.perf_counter()
+    images = convert_from_path(file_path, dpi=dpi, first_page=page_number, last_page=page_number)
+    rasterization_ms = (time.perf_counter() - start) * 1000
+    if not images:
+        return '', rasterization_ms, 0.0
+
+    image = images[0]
+    try:
+        text, ocr_ms = _ocr_image(image)
+    finally:
+        image.close()
+    return text, rasterization_ms, ocr_ms
+
+
+def ocr_page_window(task: tuple[str, int, int, int, int | None]) -> list[tuple[int, str, dict]]:
+    """
+    Rasterize and OCR one window of consecutive pages.
+
+    Runs inside a worker process, so it must stay a module-level function
+    with picklable arguments. Bitmaps are released as soon as each page is
+    OCR'd; only the window's images are ever held at once.
+
+    With a fast_dpi, the window is rasterized at that resolution first, and
+    only pages scoring below OCR_CONFIDENCE_THRESHOLD are redone at dpi
+    (keeping whichever pass scored higher). Pages below
+    OCR_BLANK_PAGE_VARIANCE are returned as '' without calling Tesseract.
+
+    Args:
+        task: (file_path, first_page, last_page, dpi, fast_dpi) with 1-based
+              pages; fast_dpi None disables the adaptive pass
+
+    Returns:
+        List of (page_number, text, details) in page order, where details has
+        rasterization_ms, ocr_ms, dpi (of the kept text), retries and blank.
+        The window's rasterization time is split evenly across its pages.
+    """
+    file_path, first_page, last_page, dpi, fast_dpi = task
+    first_pass_dpi = fast_dpi or dpi
+
+    start = time.perf_counter()
+    images = convert_from_path(file_path, dpi=first_pass_dpi, first_page=first_page, last_page=last_page)
+    rasterization_ms = (time.perf_counter() - start) * 1000 / max(1, len(images))
+
+    results = []
+    for page_number in range(first_page, first_page + len(images)):
+        image = images[page_number - first_page]
+        details = {
+            'rasterization_ms': rasterization_ms,
+            'ocr_ms': 0.0,
+            'dpi': first_pass_dpi,
+            'retries': 0,
+            'blank': False,
+        }
+
+        try:
+            if page_pixel_variance(image) < OCR_BLANK_PAGE_VARIANCE:
+                text = ''
+                details['blank'] = True
+            else:
+                text, details['ocr_ms'] = _ocr_image(image)
+        finally:
+            images[page_number - first_page] = None  # Release bitmap before the next page
+            image.close()
+
+        if fast_dpi and fast_dpi < dpi and not details['blank']:
+            confidence = _text_confidence(text)
+            if confidence < OCR_CONFIDENCE_THRESHOLD:
+                retry_text, retry_raster_ms, retry_ocr_ms = _rerun_at_full_dpi(file_path, page_number, dpi)
+                details['retries'] = 1
+                details['rasterization_ms'] += retry_raster_ms
+                details['ocr_ms'] += retry_ocr_ms
+                if _text_confidence(retry_text) >= confidence:
+                    text = retry_text
+                    details['dpi'] = dpi
+
+        results.append((page_number, text, details))
+
+    return results
+
+
+class OCREngine:
+    """
+    Windowed OCR engine with a bounded number of bitmaps in flight.
+
+    Attributes:
+        dpi: Full rasterization resolution
+        fast_dpi: First-pass resolution for adaptive OCR (None = single pass at dpi)
+        window_pages: Pages rasterized per worker task
+        max_workers: Worker processes (from get_optimal_workers() by default)
+        max_windows_in_flight: Cap on queued windows across all workers
+    """
+
+    def __init__(
+        self,
+        dpi: int = OCR_DPI,
+        window_pages: int = OCR_WINDOW_PAGES,
+        max_workers: int | None = None,
+        strategy: ExecutorStrategy | None = None,
+        fast_dpi: int | None = OCR_FAST_DPI if OCR_ADAPTIVE_DPI else None,
+    ):
+        """
+        Initialize the OCR engine.
+
+        Args:
+            dpi: Rasterization resolution (default OCR_DPI)
+            window_pages: Pages per rasterization window (default OCR_WINDOW_PAGES)
+            max_workers: Number of worker processes. Defaults to
+                        get_optimal_workers(OCR_WORKER_RAM_GB, OCR_MAX_WORKERS).
+            strategy: ExecutorStrategy to use instead of a ProcessPoolStrategy
+                     (e.g. SequentialStrategy for tests). Not shut down by the engine.
+            fast_dpi: Low-resolution first pass; pages scoring below
+                     OCR_CONFIDENCE_THRESHOLD are redone at dpi. Defaults to
+                     OCR_FAST_DPI when OCR_ADAPTIVE_DPI is on; None disables it.
+        """
+        self.dpi = dpi
+        self.fast_dpi = fast_dpi if fast_dpi and fast_dpi < dpi else None
+        self.window_pages = max(1, window_pages)
+        self._strategy = strategy
+
+        if strategy is not None:
+            self.max_workers = strategy.max_workers
+        elif max_workers is not None:
+            self.max_workers = max(1, max_workers)
+        else:
+            from src.system_resources import get_optimal_workers
+            self.max_workers = get_optimal_workers(
+                task_ram_gb=OCR_WORKER_RAM_GB, max_workers=OCR_MAX_WORKERS
+            )
+
+        self.max_windows_in_flight = self.max_workers * OCR_MAX_WINDOWS_IN_FLIGHT
+
+    def ocr_pages(
+        self,
+        file_path: str | Path,
+        page_numbers: list[int],
+        progress_callback: Callable[[int, int], None] | None = None,
+        page_timings: dict[int, dict[str, float]] | None = None,
+        page_details: dict[int, dict] | None = None,
+    ) -> dict[int, str]:
+        """
+        OCR the given pages of a PDF.
+
+        Args:
+            file_path: Path to the PDF
+            page_numbers: 1-based page numbers to OCR (any order, duplicates ignored)
+            progress_callback: Optional callback(pages_done, pages_total),
+                             called as each window completes
+            page_timings: Optional dict filled with
+                         {page_number: {'rasterization_ms': ..., 'ocr_ms': ...}}
+            page_details: Optional dict filled with
+                         {page_number: {'dpi': ..., 'retries': ..., 'blank': ...}}
+
+        Returns:
+            OCR text keyed by page number, in page order
+
+        Raises:
+            Exception: The first rasterization/Tesseract error from any window
+        """
+        page_numbers = sorted(set(page_numbers))
+        if not page_numbers:
+            return {}
+
+        windows = self._build_windows(page_numbers)
+        total_pages = len(page_numbers)
+        debug(f"[OCR] {total_pages} page(s) in {len(windows)} window(s), "
+              f"{self.max_workers} worker(s), dpi={self.dpi}, fast_dpi={self.fast_dpi}")
+
+        # Single worker: skip process startup entirely
+        strategy = self._strategy
+        owns_strategy = strategy is None
+        if owns_strategy:
+            strategy = SequentialStrategy() if self.max_workers == 1 else ProcessPoolStrategy(self.max_workers)
+
+        page_texts: dict[int, str] = {}
+        pending: set[Future] = set()
+        pages_done = 0
+
+        def collect(done: set[Future]):
+            nonlocal pages_done
+            for future in done:
+                for page_number, text, details in future.result():
+                    page_texts[page_number] = text
+                    pages_done += 1
+                    if page_timings is not None:
+                        page_timings.setdefault(page_number, {}).update({
+                            'rasterization_ms': round(details['rasterization_ms'], 1),
+                            'ocr_ms': round(details['ocr_ms'], 1),
+                        })
+                    if page_details is not None:
+                        page_details[page_number] = {
+                            'dpi': details['dpi'],
+                            'retries': details['retries'],
+                            'blank': details['blank'],
+                        }
+            if progress_callback:
+                progress_callback(pages_done, total_pages)
+
+        try:
+            file_str = str(file_path)
+            for first_page, last_page in windows:
+                # Backpressure: never queue more windows than the in-flight cap
+                while len(pending) >= self.max_windows_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                pending.add(strategy.submit(
+                    ocr_page_window, (file_str, first_page, last_page, self.dpi, self.fast_dpi)
+                ))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        finally:
+            if owns_strategy:
+                strategy.shutdown(wait=True, cancel_futures=True)
+
+        return {n: page_texts.get(n, '') for n in page_numbers}
+
+    def _build_windows(self, page_numbers: list[int]) -> list[tuple[int, int]]:
+        """
+        Split sorted page numbers into (first, last) windows.
+
+        Windows never span a gap (so unrequested pages are not rasterized)
+        and never exceed window_pages pages.
+        """
+        windows: list[tuple[int, int]] = []
+        for page_number in page_numbers:
+            if windows:
+                first_page, last_page = windows[-1]
+                if page_number == last_page + 1 and page_number - first_page < self.window_pages:
+                    windows[-1] = (first_page, page_number)
+                    continue
+            windows.append((page_number, page_number))
+        return windows
@@ -16,37 +16,86 @@ import argparse
 import os
 import re
 import time
+from bisect import bisect_left
+from collections.abc import Iterator
 from pathlib import Path
 
-# NLP
-import nltk
-
 # PDF processing
 import pdfplumber
-import pytesseract
-from nltk.corpus import words
-
-# OCR
-from pdf2image import convert_from_path
 
 # Local imports
 from src.config import (
+    CONFIDENCE_SAMPLE_CHARS,
+    CONFIDENCE_SAMPLE_WINDOWS,
     DEBUG_DEFAULT_FILE,
     DEBUG_MODE,
+    EXTRACTION_CACHE_ENABLED,
     LARGE_FILE_WARNING_MB,
+    LARGE_TEXT_STREAMING_MB,
     MAX_FILE_SIZE_MB,
     MIN_DICTIONARY_CONFIDENCE,
+    MIN_DIGITAL_PAGE_CHARS,
     MIN_LINE_LENGTH,
+    OCR_ADAPTIVE_DPI,
+    OCR_BLANK_PAGE_VARIANCE,
     OCR_CONFIDENCE_THRESHOLD,
     OCR_DPI,
+    OCR_FAST_DPI,
+)
+
+# Dictionary confidence (sampled, streaming)
+from src.extraction.dictionary_confidence import ConfidenceEstimate, DictionaryConfidenceEstimator
+
+# Shared English dictionary (built once per process)
+from src.extraction.english_dictionary import get_english_words
+
+# Extraction result cache
+from src.extraction.extraction_cache import ExtractionCache, get_extraction_cache
+
+# Windowed reading of very large TXT/RTF files
+from src.extraction.large_text_reader import (
+    DEFAULT_WINDOW_BYTES,
+    iter_decoded_chunks,
+    iter_file_windows,
+    iter_text_windows,
 )
 
+# OCR
+from src.extraction.ocr_engine import OCREngine
+
 # Character sanitization
 from src.sanitization import CharacterSanitizer
 
 # Logging (use canonical location for new code)
 from src.logging_config import Timer, debug, error, info, warning
 
+# Bump whenever a change alters extracted_text (or page_offsets, or
+# sanitization_stats) for the same input file, so stale ExtractionCache
+# entries stop matching
+EXTRACTOR_VERSION = 3
+
+# De-hyphenation: a word split by a hyphen at the end of a line
+DEHYPHENATION_PATTERN = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.txt', '.rtf')
+
+# Keys of result['timings'] (milliseconds), in pipeline order. Only stages that
+# ran are present. rasterization/ocr are summed across OCR worker processes;
+# ocr_wall is the elapsed time of the whole OCR step.
+TIMING_STAGES = (
+    'cache_lookup',
+    'text_read',
+    'pdf_extraction',
+    'confidence_check',
+    'rasterization',
+    'ocr',
+    'ocr_wall',
+    'case_numbers',
+    'normalization',
+    'sanitization',
+    'total',
+)
+
 
 class RawTextExtractor:
     """
@@ -61,22 +110,41 @@ class RawTextExtractor:
     2.5: Character Sanitization: Fix mojibake, remove control chars, handle redactions
     """
 
-    def __init__(self, jurisdiction: str = "ny"):
+    def __init__(
+        self,
+        jurisdiction: str = "ny",
+        use_cache: bool = EXTRACTION_CACHE_ENABLED,
+        cache: ExtractionCache | None = None,
+        ocr_max_workers: int | None = None,
+        sanitizer_max_workers: int | None = None,
+    ):
         """
         Initialize the RawTextExtractor.
 
         Args:
             jurisdiction: Legal jurisdiction for keyword loading (ny, ca, federal)
+            use_cache: If True, reuse results from the on-disk ExtractionCache
+                      for files whose content and settings are unchanged
+            cache: ExtractionCache to use (defaults to the shared global cache)
+            ocr_max_workers: OCR worker processes per document (default: sized
+                            by OCREngine). Batch runs that already parallelize
+                            across documents pass 1 to avoid nested pools.
+            sanitizer_max_workers: Worker processes for sanitizing very long texts
+                                  (default: sized by CharacterSanitizer; 1 = serial)
         """
         self.jurisdiction = jurisdiction
         self.legal_keywords: set[str] = set()
-        self.english_words: set[str] = set()
-        self.character_sanitizer = CharacterSanitizer()
+        self.english_words: frozenset[str] = frozenset()
+        self.character_sanitizer = CharacterSanitizer(max_workers=sanitizer_max_workers)
+        self.cache = (cache or get_extraction_cache()) if use_cache else None
+        self.ocr_max_workers = ocr_max_workers
 
         with Timer("RawTextExtractor initialization"):
             self._load_keywords()
             self._load_dictionary()
 
+        self.confidence_estimator = DictionaryConfidenceEstimator(self.english_words)
+
     def _load_keywords(self):
         """Load legal keywords for the jurisdiction."""
         debug(f"Loading legal keywords for jurisdiction: {self.jurisdiction}")
@@ -93,19 +161,15 @@ class RawTextExtractor:
         debug(f"Loaded {len(self.legal_keywords)} legal keywords")
 
     def _load_dictionary(self):
-        """Load NLTK English words corpus."""
-        debug("Loading NLTK English words corpus")
+        """
+        Attach the shared English word set.
 
-        try:
-            # Try to load the words corpus
-            self.english_words = {word.lower() for word in words.words()}
-            debug(f"Loaded {len(self.english_words)} English words")
-        except LookupError:
-            # Download if not available
-            warning("NLTK words corpus not found. Downloading...")
-            nltk.download('words', quiet=not DEBUG_MODE)
-            self.english_words = {word.lower() for word in words.words()}
-            debug(f"Downloaded and loaded {len(self.english_words)} English words")
+        The set is built once per process (and cached on disk) by
+        english_dictionary.get_english_words(), so creating many extractors
+        - e.g. one per corpus file - no longer reloads the NLTK corpus.
+        """
+        self.english_words = get_english_words()
+        debug(f"Using shared English dictionary ({len(self.english_words)} words)")
 
     def process_document(self, file_path: str, progress_callback=None) -> dict:
         """
@@ -121,12 +185,23 @@ class RawTextExtractor:
                 - filename: Name of the file
                 - file_path: Full path to file
                 - status: 'success', 'warning', or 'error'
-                - method: 'direct_read', 'digital_text', 'ocr', 'rtf_extraction'
+                - method: 'direct_read', 'digital_text', 'ocr', 'mixed', 'rtf_extraction'
                 - confidence: OCR confidence score (0-100)
+                - page_results: Per-page dicts (page_number, method, confidence) for PDFs;
+                  OCR'd pages also carry ocr_dpi, ocr_retries and blank
                 - extracted_text: Extracted and normalized text content
                 - page_count: Number of pages (for PDFs)
+                - page_offsets: Offset in extracted_text where each page starts (for
+                  PDFs; a page with no text left starts where the next one does),
+                  or None
                 - file_size: File size in bytes
                 - case_numbers: List of detected case numbers
+                - sanitization_stats: CharacterSanitizer statistics
+                - from_cache: True if the result was served from ExtractionCache
+                - streamed: True if a large TXT/RTF was processed in windows
+                - timings: Milliseconds per stage that ran (see TIMING_STAGES), plus 'total'
+                - page_timings: Per-page dicts (page_number, extraction_ms,
+                  rasterization_ms, ocr_ms) for PDFs extracted in this call
                 - error_message: Error description (if status is 'error')
         """
         file_path = Path(file_path)
@@ -150,10 +225,18 @@ class RawTextExtractor:
             'confidence': 0,
             'extracted_text': '',
             'page_count': None,  # Changed from 'pages' to match FileReviewTable
+            'page_offsets': None,
             'file_size': 0,      # Changed from 'size_mb' to store bytes (not MB)
             'case_numbers': [],
+            'sanitization_stats': {},
+            'from_cache': False,
+            'streamed': False,
+            'timings': {},
+            'page_timings': [],
             'error_message': None
         }
+        timings = result['timings']
+        start_time = time.perf_counter()
 
         try:
             with Timer(f"Processing {filename}"):
@@ -183,12 +266,35 @@ class RawTextExtractor:
                 # Determine file type and process
                 file_extension = file_path.suffix.lower()
 
+                # Serve unchanged files from the extraction cache
+                cache_key = None
+                if self.cache is not None and file_extension in SUPPORTED_EXTENSIONS:
+                    with Timer("Extraction cache lookup", auto_log=False) as timer:
+                        cache_key = self.cache.make_key(file_path, self._cache_settings())
+                        cached = self.cache.get(cache_key)
+                    timings['cache_lookup'] = round(timer.duration_ms, 1)
+                    if cached is not None:
+                        result.update(cached)
+                        result['from_cache'] = True
+                        debug(f"Loaded {filename} from extraction cache")
+                        report_progress("Loaded from cache", 100)
+                        return result
+
                 report_progress("Extracting text", 20)
 
-                if file_extension in ['.txt', '.rtf']:
-                    result.update(self._process_text_file(file_path))
+                if file_extension in ['.txt', '.rtf'] and size_mb >= LARGE_TEXT_STREAMING_MB:
+                    stage_result = self._process_large_text_file(file_path, report_progress)
+                elif file_extension in ['.txt', '.rtf']:
+                    stage_result = self._process_text_file(file_path)
                 elif file_extension == '.pdf':
-                    result.update(self._process_pdf(file_path))
+                    stage_result = self._process_pdf(file_path, report_progress)
+                else:
+                    stage_result = None
+
+                if stage_result is not None:
+                    timings.update(stage_result.pop('timings', {}))
+                    page_lines = stage_result.pop('page_lines', None)
+                    result.update(stage_result)
                 else:
                     result['status'] = 'error'
                     result['error_message'] = f"Unsupported file type: {file_extension}. Supported formats: PDF, TXT, RTF"
@@ -198,17 +304,22 @@ class RawTextExtractor:
                 report_progress("Extracting case numbers", 60)
 
                 # Extract case numbers from raw text (before normalization removes short lines)
-                if result['status'] != 'error' and result['extracted_text']:
-                    result['case_numbers'] = self._extract_case_numbers(result['extracted_text'])
+                if result['status'] != 'error' and result['extracted_text'] and not result['streamed']:
+                    with Timer("Case number extraction", auto_log=False) as timer:
+                        result['case_numbers'] = self._extract_case_numbers(result['extracted_text'])
+                    timings['case_numbers'] = round(timer.duration_ms, 1)
                     if result['case_numbers']:
                         debug(f"Found case numbers: {result['case_numbers']}")
 
                 report_progress("Normalizing text", 70)
 
                 # Apply basic text normalization
-                if result['status'] != 'error' and result['extracted_text']:
-                    with Timer("Text normalization"):
-                        result['extracted_text'] = self._normalize_text(result['extracted_text'])
+                if result['status'] != 'error' and result['extracted_text'] and not result['streamed']:
+                    with Timer("Text normalization") as timer:
+                        result['extracted_text'] = self._normalize_text(
+                            result['extracted_text'], page_lines=page_lines
+                        )
+                    timings['normalization'] = round(timer.duration_ms, 1)
 
                     # Check if normalization resulted in empty text
                     if len(result['extracted_text'].strip()) == 0:
@@ -220,22 +331,38 @@ class RawTextExtractor:
 
                 # Apply character sanitization (Step 2.5)
                 # Fixes mojibake, removes control chars, handles redactions, transliterates accents
-                if result['status'] != 'error' and result['extracted_text']:
-                    with Timer("Character sanitization"):
-                        sanitized_text, sanitization_stats = self.character_sanitizer.sanitize(result['extracted_text'])
+                if result['status'] != 'error' and result['extracted_text'] and not result['streamed']:
+                    with Timer("Character sanitization") as timer:
+                        normalized_text = result['extracted_text']
+                        sanitized_text, sanitization_stats = self.character_sanitizer.sanitize(normalized_text)
                         result['extracted_text'] = sanitized_text
-
-                        # Log sanitization details
+                        result['sanitization_stats'] = sanitization_stats
+
+                        # Sanitization works within lines, so page starts stay on the same lines
+                        if page_lines is not None:
+                            if sanitized_text.count('\n') == normalized_text.count('\n'):
+                                result['page_offsets'] = self._page_offsets(
+                                    sanitized_text, page_lines
+                                )
+                            else:
+                                debug("Sanitization changed the line count; page offsets dropped")
+
+                        # Log sanitization details (stage breakdown only when tracing)
                         if any(sanitization_stats.values()):
                             debug(f"Character sanitization stats: {sanitization_stats}")
+                        if self.character_sanitizer.trace:
                             for log_entry in self.character_sanitizer.get_log():
                                 debug(f"  - {log_entry}")
+                    timings['sanitization'] = round(timer.duration_ms, 1)
 
                 # Set status based on confidence
                 if result['status'] == 'success':
                     if result['confidence'] < OCR_CONFIDENCE_THRESHOLD:
                         result['status'] = 'warning'
 
+                if cache_key and result['status'] != 'error':
+                    self.cache.put(cache_key, result)
+
                 report_progress("Complete", 100)
                 debug(f"DEBUG_EXTRACTOR: Final result for {filename} - file_size: {result['file_size']}, page_count: {result['page_count']}")
 
@@ -244,12 +371,33 @@ class RawTextExtractor:
             result['error_message'] = f"Unexpected error: {str(e)}"
             error(f"Error processing {filename}: {str(e)}", exc_info=True)
             report_progress("Error", 0)
+        finally:
+            timings['total'] = round((time.perf_counter() - start_time) * 1000, 1)
 
         return result
 
+    def _cache_settings(self) -> dict:
+        """Settings that change extraction output; part of every cache key."""
+        return {
+            'extractor_version': EXTRACTOR_VERSION,
+            'sanitizer_version': CharacterSanitizer.VERSION,
+            'jurisdiction': self.jurisdiction,
+            'ocr_dpi': OCR_DPI,
+            'ocr_fast_dpi': OCR_FAST_DPI if OCR_ADAPTIVE_DPI else None,
+            'ocr_retry_threshold': OCR_CONFIDENCE_THRESHOLD,
+            'ocr_blank_page_variance': OCR_BLANK_PAGE_VARIANCE,
+            'min_dictionary_confidence': MIN_DICTIONARY_CONFIDENCE,
+            'min_digital_page_chars': MIN_DIGITAL_PAGE_CHARS,
+            'confidence_sample_chars': CONFIDENCE_SAMPLE_CHARS,
+            'confidence_sample_windows': CONFIDENCE_SAMPLE_WINDOWS,
+            'min_line_length': MIN_LINE_LENGTH,
+            'transliterate': self.character_sanitizer.transliterate,
+        }
+
     def _process_text_file(self, file_path: Path) -> dict:
         """Process TXT or RTF file."""
         debug(f"Processing as text file: {file_path.name}")
+        start_time = time.perf_counter()
 
         try:
             # Check if RTF or plain text
@@ -273,6 +421,7 @@ class RawTextExtractor:
                 'method': method,
                 'confidence': 100,
                 'extracted_text': text,
+                'timings': {'text_read': round((time.perf_counter() - start_time) * 1000, 1)},
                 'status': 'success'
             }
         except Exception as e:
@@ -281,42 +430,438 @@ class RawTextExtractor:
                 'error_message': f"Failed to read text file: {str(e)}"
             }
 
-    def _process_pdf(self, file_path: Path) -> dict:
-        """Process PDF file (digital or scanned)."""
+    def _process_large_text_file(
+        self,
+        file_path: Path,
+        progress_callback=None,
+        window_bytes: int = DEFAULT_WINDOW_BYTES,
+    ) -> dict:
+        """
+        Process a large TXT or RTF file window by window.
+
+        The file is memory-mapped and decoded in line-aligned windows (see
+        large_text_reader). Case-number extraction, normalization and
+        sanitization run on each window in turn, so only the final text and
+        one window's intermediates are held at once. RTF must be stripped as
+        a whole document, so only the stages after striprtf are windowed.
+
+        The text matches the non-windowed path: windows end on line
+        boundaries that de-hyphenation cannot span, and the document-level
+        strip is applied to the first and last windows. Sanitization runs
+        through one IncrementalSanitization, so its stats are those of the
+        stitched text, not a sum over windows.
+
+        Args:
+            file_path: Path to the TXT/RTF file
+            progress_callback: Optional callback(message, percent), reported in the 20-90% range
+            window_bytes: Approximate window size (default LARGE_TEXT_WINDOW_MB)
+
+        Returns:
+            Result fields with 'streamed' set, including case_numbers and sanitization_stats
+        """
+        debug(f"Processing as large text file (windowed): {file_path.name}")
+        timings = {'text_read': 0.0, 'case_numbers': 0.0, 'normalization': 0.0, 'sanitization': 0.0}
+        total_chars = max(1, file_path.stat().st_size)
+
+        try:
+            if file_path.suffix.lower() == '.rtf':
+                from striprtf.striprtf import rtf_to_text
+
+                with Timer("RTF extraction") as timer:
+                    text = rtf_to_text(''.join(iter_decoded_chunks(file_path)))
+                timings['text_read'] += timer.duration_ms
+                total_chars = max(1, len(text))
+                windows = iter_text_windows(text, window_bytes)
+                method = 'rtf_extraction'
+            else:
+                windows = iter_file_windows(file_path, window_bytes)
+                method = 'direct_read'
+
+            case_numbers: set[str] = set()
+            sanitized_parts: list[str] = []
+            sanitization = self.character_sanitizer.begin()
+            pending: str | None = None  # Normalized window awaiting sanitization
+            chars_done = 0
+
+            def sanitize_window(window_text: str):
+                start = time.perf_counter()
+                sanitized_parts.append(sanitization.feed(window_text))
+                timings['sanitization'] += (time.perf_counter() - start) * 1000
+
+            read_start = time.perf_counter()
+            for window in windows:
+                timings['text_read'] += (time.perf_counter() - read_start) * 1000
+
+                start = time.perf_counter()
+                case_numbers.update(self._extract_case_numbers(window))
+                timings['case_numbers'] += (time.perf_counter() - start) * 1000
+
+                start = time.perf_counter()
+                normalized = self._normalize_text(window, strip=False)
+                timings['normalization'] += (time.perf_counter() - start) * 1000
+
+                if normalized:
+                    # Hold one window back so the last one can be right-stripped
+                    if pending is not None:
+                        sanitize_window(pending)
+                    pending = normalized if sanitized_parts or pending is not None else normalized.lstrip()
+
+                chars_done += len(window)
+                if progress_callback:
+                    progress_callback("Processing large file", 20 + int(70 * min(1.0, chars_done / total_chars)))
+                read_start = time.perf_counter()
+
+            if pending is not None:
+                sanitize_window(pending.rstrip())
+
+            text = '\n'.join(sanitized_parts)
+            stats = sanitization.stats()
+        except Exception as e:
+            return {
+                'status': 'error',
+                'error_message': f"Failed to read text file: {str(e)}"
+            }
+
+        if not text.strip():
+            return {
+                'status': 'error',
+                'error_message': "Unable to extract readable text. File may be corrupted or contain only images.",
+                'streamed': True,
+            }
+
+        return {
+            'method': method,
+            'confidence': 100,
+            'extracted_text': text,
+            'case_numbers': list(case_numbers),
+            'sanitization_stats': stats,
+            'streamed': True,
+            'timings': {stage: round(ms, 1) for stage, ms in timings.items()},
+            'status': 'success'
+        }
+
+    def _process_pdf(self, file_path: Path, progress_callback=None) -> dict:
+        """
+        Process PDF file (digital, scanned, or a mix of both).
+
+        Each page is classified on its own: pages whose digital text passes
+        the dictionary check keep it, and only the pages that fail are
+        rasterized and OCR'd. A single scanned exhibit inside a long digital
+        transcript therefore costs one page of OCR, not the whole file.
+
+        Args:
+            file_path: Path to the PDF
+            progress_callback: Optional callback(message, percent) for per-page
+                             OCR progress (reported in the 20-60% range)
+
+        Returns:
+            Result fields, including 'timings' (pdf_extraction, confidence_check,
+            and for OCR'd files rasterization, ocr and ocr_wall) and 'page_timings'
+        """
         debug(f"Processing as PDF: {file_path.name}")
+        timings: dict[str, float] = {}
+        page_timings: dict[int, dict[str, float]] = {}
+        ocr_details: dict[int, dict] = {}
 
         # Step 1: Try digital text extraction
-        with Timer("Digital PDF text extraction"):
-            text, page_count, error_type = self._extract_pdf_text(file_path)
+        with Timer("Digital PDF text extraction") as timer:
+            page_texts, page_count, error_type = self._extract_pdf_pages(file_path, page_timings=page_timings)
+        timings['pdf_extraction'] = round(timer.duration_ms, 1)
 
-        if text is None:
+        if page_texts is None:
             # Error occurred
             # ... (error handling as before)
             return {
                 'status': 'error',
                 'error_message': '...',
-                'page_count': page_count
+                'page_count': page_count,
+                'timings': timings,
             }
 
-        # Step 2: Heuristic check
-        with Timer("Dictionary confidence check"):
-            dictionary_confidence = self._calculate_dictionary_confidence(text)
-        debug(f"Dictionary confidence: {dictionary_confidence:.1f}%")
+        # Step 2: Page-level heuristic check
+        with Timer("Dictionary confidence check") as timer:
+            page_estimates = self.confidence_estimator.score_pages(page_texts)
+        timings['confidence_check'] = round(timer.duration_ms, 1)
+
+        ocr_page_numbers = [
+            page_number
+            for page_number, (page_text, estimate) in enumerate(zip(page_texts, page_estimates, strict=True), 1)
+            if not self._is_digital_page(page_text, estimate.confidence)
+        ]
 
         # Decision
-        if dictionary_confidence > MIN_DICTIONARY_CONFIDENCE and len(text) > 1000:
-            debug("Using digital text extraction")
+        if not ocr_page_numbers:
+            debug("Using digital text extraction for all pages")
             return {
                 'method': 'digital_text',
                 'confidence': 100,
-                'extracted_text': text,
+                'extracted_text': self._join_pages(page_texts),
+                'page_lines': self._page_lines(page_texts),
                 'page_count': page_count,
+                'page_results': [
+                    self._page_result(n, 'digital_text', estimate)
+                    for n, estimate in enumerate(page_estimates, 1)
+                ],
+                'timings': timings,
+                'page_timings': self._page_timing_list(page_timings),
                 'status': 'success'
             }
-        else:
-            debug("Digital text quality insufficient. Performing OCR...")
-            with Timer("OCR Processing"):
-                return self._perform_ocr(file_path, page_count)
+
+        debug(f"Digital text quality insufficient on {len(ocr_page_numbers)}/{page_count} pages. "
+              f"Performing OCR on those pages...")
+        try:
+            with Timer("OCR Processing") as timer:
+                ocr_texts = self._ocr_pages(
+                    file_path, ocr_page_numbers, progress_callback,
+                    page_timings=page_timings, page_details=ocr_details,
+                )
+        except Exception as e:
+            return {
+                'status': 'error',
+                'error_message': f"OCR processing failed: {str(e)}",
+                'page_count': page_count,
+                'timings': timings,
+            }
+
+        # Worker-side stage totals (summed across processes) plus elapsed wall time
+        timings['rasterization'] = round(sum(t.get('rasterization_ms', 0.0) for t in page_timings.values()), 1)
+        timings['ocr'] = round(sum(t.get('ocr_ms', 0.0) for t in page_timings.values()), 1)
+        timings['ocr_wall'] = round(timer.duration_ms, 1)
+
+        result = self._merge_page_results(page_texts, page_estimates, ocr_texts, ocr_details)
+        result['timings'] = timings
+        result['page_timings'] = self._page_timing_list(page_timings)
+        return result
+
+    def _is_digital_page(self, page_text: str, confidence: float) -> bool:
+        """Return True if a page's digital text is good enough to skip OCR."""
+        return confidence > MIN_DICTIONARY_CONFIDENCE and len(page_text.strip()) >= MIN_DIGITAL_PAGE_CHARS
+
+    def _merge_page_results(
+        self,
+        page_texts: list[str],
+        page_estimates: list[ConfidenceEstimate],
+        ocr_texts: dict[int, str],
+        ocr_details: dict[int, dict] | None = None,
+    ) -> dict:
+        """
+        Merge digital and OCR'd pages back together in page order.
+
+        Args:
+            page_texts: Digital text per page (index 0 = page 1)
+            page_estimates: Dictionary confidence of each page's digital text
+            ocr_texts: OCR text keyed by 1-based page number
+            ocr_details: Optional OCR dpi/retries/blank keyed by page number,
+                        copied into the page's 'page_results' entry
+
+        Returns:
+            Result dictionary with per-page methods in 'page_results'
+        """
+        merged_texts = []
+        page_results = []
+        weighted_confidence = 0.0
+        total_chars = 0
+
+        for page_number, (page_text, estimate) in enumerate(zip(page_texts, page_estimates, strict=True), 1):
+            if page_number in ocr_texts:
+                page_text = ocr_texts[page_number]
+                estimate = self.confidence_estimator.estimate(page_text)
+                method = 'ocr'
+                # Digital pages count as 100%, matching whole-document digital extraction
+                effective_confidence = estimate.confidence
+            else:
+                method = 'digital_text'
+                effective_confidence = 100
+
+            merged_texts.append(page_text)
+            page_result = self._page_result(page_number, method, estimate)
+            if method == 'ocr' and ocr_details and page_number in ocr_details:
+                details = ocr_details[page_number]
+                page_result.update({
+                    'ocr_dpi': details['dpi'],
+                    'ocr_retries': details['retries'],
+                    'blank': details['blank'],
+                })
+            page_results.append(page_result)
+
+            # Weight by text length so near-empty pages don't skew the score
+            weight = len(page_text.strip())
+            weighted_confidence += effective_confidence * weight
+            total_chars += weight
+
+        confidence = weighted_confidence / total_chars if total_chars else 0.0
+        ocr_count = len(ocr_texts)
+        method = 'ocr' if ocr_count == len(page_texts) else 'mixed'
+        debug(f"OCR confidence: {confidence:.1f}% ({ocr_count}/{len(page_texts)} pages OCR'd)")
+
+        return {
+            'method': method,
+            'confidence': int(confidence),
+            'extracted_text': self._join_pages(merged_texts),
+            'page_lines': self._page_lines(merged_texts),
+            'page_count': len(page_texts),
+            'page_results': page_results,
+            'status': 'success'
+        }
+
+    @staticmethod
+    def _page_result(page_number: int, method: str, estimate: ConfidenceEstimate) -> dict:
+        """Build one 'page_results' entry."""
+        return {
+            'page_number': page_number,
+            'method': method,
+            'confidence': round(estimate.confidence, 1),
+            'confidence_interval': [round(estimate.ci_low, 1), round(estimate.ci_high, 1)],
+            'sampled': estimate.sampled,
+        }
+
+    @staticmethod
+    def _page_timing_list(page_timings: dict[int, dict[str, float]]) -> list[dict]:
+        """Flatten {page_number: timings} into 'page_timings' entries in page order."""
+        return [
+            {'page_number': page_number, **page_timings[page_number]}
+            for page_number in sorted(page_timings)
+        ]
+
+    @staticmethod
+    def _join_pages(page_texts: list[str]) -> str:
+        """Join per-page text once, one trailing newline per non-empty page."""
+        return ''.join(f"{page_text}\n" for page_text in page_texts if page_text)
+
+    @staticmethod
+    def _page_lines(page_texts: list[str]) -> list[int]:
+        """Index of each page's first line in _join_pages(page_texts)."""
+        page_lines = []
+        line_count = 0
+        for page_text in page_texts:
+            page_lines.append(line_count)
+            if page_text:
+                line_count += page_text.count('\n') + 1
+        return page_lines
+
+    @staticmethod
+    def _page_offsets(text: str, page_lines: list[int]) -> list[int]:
+        """
+        Convert page start lines into character offsets.
+
+        Args:
+            text: Final extracted text
+            page_lines: Non-decreasing index of each page's first line in text
+
+        Returns:
+            Offset of each page's first line (len(text) for pages past the last line)
+        """
+        offsets = []
+        line, offset = 0, 0
+        for target in page_lines:
+            while line < target:
+                newline = text.find('\n', offset)
+                if newline < 0:
+                    line, offset = target, len(text)
+                    break
+                line, offset = line + 1, newline + 1
+            offsets.append(offset)
+        return offsets
+
+    @staticmethod
+    def _remove_page_lines(page_lines: list[int], removed: list[int]) -> None:
+        """
+        Move page start lines (in place) past lines removed from the text.
+
+        A page whose first line was removed starts at its next remaining line.
+
+        Args:
+            page_lines: Index of each page's first line, updated in place
+            removed: Sorted indexes of the removed lines
+        """
+        if removed:
+            for page, line in enumerate(page_lines):
+                page_lines[page] = line - bisect_left(removed, line)
+
+    @staticmethod
+    def _dehyphenate(text: str, page_lines: list[int] | None = None) -> str:
+        """
+        Rejoin words hyphenated across a line break.
+
+        Args:
+            text: Text to de-hyphenate
+            page_lines: Optional index of each page's first line, updated in
+                       place; a page whose first line is joined onto the
+                       previous page's last line starts at its next line
+
+        Returns:
+            De-hyphenated text
+        """
+        if page_lines is None:
+            return DEHYPHENATION_PATTERN.sub(r'\1\2', text)
+
+        # Ordinal of every newline swallowed by a rejoin
+        joined_newlines: list[int] = []
+        newline_count = 0
+        position = 0
+
+        def rejoin(match: re.Match) -> str:
+            nonlocal newline_count, position
+            newline_count += text.count('\n', position, match.end(1))
+            swallowed = text.count('\n', match.end(1), match.start(2))
+            joined_newlines.extend(range(newline_count, newline_count + swallowed))
+            newline_count += swallowed
+            position = match.start(2)
+            return match.group(1) + match.group(2)
+
+        text = DEHYPHENATION_PATTERN.sub(rejoin, text)
+
+        # Line n follows newline n - 1; if that newline was swallowed, line n
+        # now continues the line before it, and the page starts one line later
+        previous = 0
+        for page, line in enumerate(page_lines):
+            joined = bisect_left(joined_newlines, line)
+            moved = line - joined
+            if joined and joined_newlines[joined - 1] == line - 1:
+                moved += 1
+            previous = page_lines[page] = max(moved, previous)
+        return text
+
+    def iter_pdf_pages(self, file_path: str | Path) -> Iterator[tuple[int, str]]:
+        """
+        Stream digital text from a PDF one page at a time.
+
+        Yields each page as soon as pdfplumber decodes it and releases the
+        page's cached layout objects afterwards, so pdfplumber holds roughly
+        one page of layout data instead of the whole document. This is raw
+        digital text only: process_document() still collects every page
+        before normalizing and sanitizing, because per-page OCR fallback,
+        cross-page de-hyphenation and page number removal need the whole
+        document.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Yields:
+            (page_number, text) tuples. page_number is 1-based; text is ''
+            for pages with no extractable text (e.g. scanned images).
+
+        Raises:
+            Exception: Any pdfplumber error (password, corruption, etc.)
+        """
+        with pdfplumber.open(file_path) as pdf:
+            yield from self._iter_open_pdf_pages(pdf)
+
+    def _iter_open_pdf_pages(self, pdf) -> Iterator[tuple[int, str]]:
+        """Yield (page_number, text) from an already-open pdfplumber document."""
+        page_count = len(pdf.pages)
+
+        for i, page in enumerate(pdf.pages, 1):
+            if DEBUG_MODE and i % 10 == 0:
+                debug(f"Extracting page {i}/{page_count}")
+
+            try:
+                page_text = page.extract_text() or ''
+            finally:
+                # Drop parsed chars/layout objects; pdf.pages keeps the Page alive
+                page.close()
+
+            yield i, page_text
 
     def _extract_pdf_text(self, file_path: Path) -> tuple[str | None, int, str | None]:
         """
@@ -326,8 +871,33 @@ class RawTextExtractor:
             (text, page_count, error_type) where error_type is None on success,
             or one of: 'password', 'corrupted', 'empty', 'unknown'
         """
+        page_texts, page_count, error_type = self._extract_pdf_pages(file_path)
+        if page_texts is None:
+            return None, page_count, error_type
+        return self._join_pages(page_texts), page_count, None
+
+    def _extract_pdf_pages(
+        self,
+        file_path: Path,
+        page_timings: dict[int, dict[str, float]] | None = None,
+    ) -> tuple[list[str] | None, int, str | None]:
+        """
+        Extract digital text from each PDF page using pdfplumber.
+
+        Pages are streamed via _iter_open_pdf_pages() into a preallocated
+        list, so the text is only joined once by the caller, avoiding
+        quadratic string concatenation on large (1,000+ page) documents.
+
+        Args:
+            file_path: Path to the PDF
+            page_timings: Optional dict filled with {page_number: {'extraction_ms': ...}}
+
+        Returns:
+            (page_texts, page_count, error_type) where page_texts[i] is the
+            text of page i+1 ('' if none) and error_type is None on success,
+            or one of: 'password', 'corrupted', 'empty', 'unknown'
+        """
         try:
-            text = ""
             page_count = 0
 
             with pdfplumber.open(file_path) as pdf:
@@ -338,15 +908,16 @@ class RawTextExtractor:
                     error("PDF has no pages")
                     return None, 0, 'empty'
 
-                for i, page in enumerate(pdf.pages, 1):
-                    if DEBUG_MODE and i % 10 == 0:
-                        debug(f"Extracting page {i}/{page_count}")
-
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+                page_texts = [''] * page_count
+                page_start = time.perf_counter()
+                for page_number, page_text in self._iter_open_pdf_pages(pdf):
+                    page_texts[page_number - 1] = page_text
+                    if page_timings is not None:
+                        page_end = time.perf_counter()
+                        page_timings[page_number] = {'extraction_ms': round((page_end - page_start) * 1000, 1)}
+                        page_start = page_end
 
-            return text, page_count, None
+            return page_texts, page_count, None
 
         except Exception as e:
             error_msg = str(e).lower()
@@ -369,73 +940,52 @@ class RawTextExtractor:
         """
         Calculate what percentage of words are valid English words.
 
+        Long texts are sampled; see DictionaryConfidenceEstimator.
+
         Args:
             text: Text to analyze
 
         Returns:
             Confidence percentage (0-100)
         """
-        if not text:
-            return 0.0
-
-        # Tokenize (simple split on whitespace and punctuation)
-        tokens = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-
-        if len(tokens) == 0:
-            return 0.0
-
-        # Count valid English words
-        valid_words = sum(1 for token in tokens if token in self.english_words)
-
-        confidence = (valid_words / len(tokens)) * 100
-        return confidence
-
-    def _perform_ocr(self, file_path: Path, page_count: int) -> dict:
+        return self.confidence_estimator.estimate(text).confidence
+
+    def _ocr_pages(
+        self,
+        file_path: Path,
+        page_numbers: list[int],
+        progress_callback=None,
+        page_timings: dict[int, dict[str, float]] | None = None,
+        page_details: dict[int, dict] | None = None,
+    ) -> dict[int, str]:
         """
-        Perform OCR on PDF using Tesseract.
+        Rasterize and OCR selected PDF pages using the windowed OCREngine.
 
         Args:
             file_path: Path to PDF
-            page_count: Number of pages (from pdfplumber)
+            page_numbers: Sorted 1-based page numbers to OCR
+            progress_callback: Optional callback(message, percent)
+            page_timings: Optional dict receiving per-page rasterization_ms/ocr_ms
+            page_details: Optional dict receiving per-page dpi/retries/blank
 
         Returns:
-            Result dictionary
-        """
-        debug(f"Starting OCR on {file_path.name}")
-
-        try:
-            # Convert PDF to images
-            with Timer("PDF to images conversion"):
-                images = convert_from_path(str(file_path), dpi=OCR_DPI)
+            OCR text keyed by page number
 
-            # OCR each page
-            ocr_text = ""
-            for i, image in enumerate(images, 1):
-                if DEBUG_MODE:
-                    debug(f"OCR processing page {i}/{len(images)}")
-
-                with Timer(f"OCR page {i}", auto_log=DEBUG_MODE):
-                    page_text = pytesseract.image_to_string(image)
-                    ocr_text += page_text + "\n"
-
-            # Calculate confidence
-            confidence = self._calculate_dictionary_confidence(ocr_text)
-            debug(f"OCR confidence: {confidence:.1f}%")
+        Raises:
+            Exception: If rasterization or Tesseract fails
+        """
+        debug(f"Starting OCR on {len(page_numbers)} page(s) of {file_path.name}")
 
-            return {
-                'method': 'ocr',
-                'confidence': int(confidence),
-                'extracted_text': ocr_text,
-                'page_count': page_count or len(images),
-                'status': 'success'
-            }
+        def report_ocr_progress(pages_done: int, pages_total: int):
+            if progress_callback:
+                percent = 20 + int(40 * pages_done / pages_total)
+                progress_callback(f"OCR page {pages_done}/{pages_total}", percent)
 
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error_message': f"OCR processing failed: {str(e)}",
-                'page_count': page_count
-            }
+        engine = OCREngine(max_workers=self.ocr_max_workers)
+        return engine.ocr_pages(
+            file_path, page_numbers, report_ocr_progress,
+            page_timings=page_timings, page_details=page_details,
+        )
 
     def _is_page_number(self, line: str) -> bool:
         """
@@ -501,7 +1051,9 @@ class RawTextExtractor:
 
         return list(set(case_numbers))  # Remove duplicates
 
-    def _normalize_text(self, text: str) -> str:
+    def _normalize_text(
+        self, text: str, strip: bool = True, page_lines: list[int] | None = None
+    ) -> str:
         """
         Apply basic text normalization rules (Step 2 of pipeline).
 
@@ -519,6 +1071,10 @@ class RawTextExtractor:
 
         Args:
             text: Raw extracted text
+            strip: Strip leading/trailing whitespace from the result. Windowed
+                  callers pass False and strip only the document's ends.
+            page_lines: Optional index of each page's first line in text, updated
+                       in place to the page's first line in the normalized text
 
         Returns:
             Fully normalized text
@@ -531,7 +1087,7 @@ class RawTextExtractor:
         original_len = len(text)
 
         try:
-            text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+            text = self._dehyphenate(text, page_lines)
             duration = time.time() - start
             debug(f"    ✅ SUCCESS ({duration:.3f}s) - Rejoin hyphenated words")
             debug(f"       Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
@@ -548,13 +1104,17 @@ class RawTextExtractor:
         try:
             lines = text.split('\n')
             lines_filtered = []
-            for line in lines:
+            removed_lines = []
+            for index, line in enumerate(lines):
                 if not self._is_page_number(line):
                     lines_filtered.append(line)
                 else:
+                    removed_lines.append(index)
                     debug(f"    Removed page number: {line}")
             removed_count = len(lines) - len(lines_filtered)
             text = '\n'.join(lines_filtered)
+            if page_lines is not None:
+                self._remove_page_lines(page_lines, removed_lines)
             duration = time.time() - start
             debug(f"    ✅ SUCCESS ({duration:.3f}s) - Removed {removed_count} page markers")
             debug(f"       Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
@@ -570,7 +1130,8 @@ class RawTextExtractor:
 
         try:
             normalized_lines = []
-            for line in text.split('\n'):
+            removed_lines = []
+            for index, line in enumerate(text.split('\n')):
                 # Minimum length check
                 if len(line) <= MIN_LINE_LENGTH:
                     # Exception: Allow short legal headers even if under minimum length
@@ -580,6 +1141,7 @@ class RawTextExtractor:
                         any(keyword in line for keyword in self.legal_keywords)
                     )
                     if not is_legal_header:
+                        removed_lines.append(index)
                         continue
 
                 # Check if line has lowercase letters
@@ -599,9 +1161,13 @@ class RawTextExtractor:
                 # Keep line if it passes all tests
                 if (has_lowercase or is_legal_header) and alpha_count > other_count:
                     normalized_lines.append(line)
+                else:
+                    removed_lines.append(index)
 
             removed_count = len(text.split('\n')) - len(normalized_lines)
             text = '\n'.join(normalized_lines)
+            if page_lines is not None:
+                self._remove_page_lines(page_lines, removed_lines)
             duration = time.time() - start
             debug(f"    ✅ SUCCESS ({duration:.3f}s) - Filtered {removed_count} lines")
             debug(f"       Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
@@ -618,7 +1184,8 @@ class RawTextExtractor:
         try:
             # Remove excess blank lines (max 1 between paragraphs)
             text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-            text = text.strip()
+            if strip:
+                text = text.strip()
             duration = time.time() - start
             debug(f"    ✅ SUCCESS ({duration:.3f}s) - Normalize whitespace")
             debug(f"       Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
@@ -0,0 +1,118 @@
+"""
+Extraction Timing Summary Module
+
+Aggregates the per-stage 'timings' of many process_document() results into
+a batch summary: p50/p95 per stage and the slowest files. Used by
+ProcessingWorker and the batch extraction CLI, so throughput problems can
+be located without DEBUG_MODE or parsing debug_flow.txt.
+
+Usage:
+    from src.extraction.timing_summary import summarize_timings, format_timing_summary
+
+    summary = summarize_timings(results)
+    summary['stages']['ocr']['p95']     # 8123.4 (ms)
+    summary['slowest'][0]['filename']   # 'scanned_exhibits.pdf'
+    print(format_timing_summary(summary))
+"""
+
+import math
+from collections.abc import Iterable
+
+from src.extraction.raw_text_extractor import TIMING_STAGES
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Linearly interpolated percentile of a list of numbers.
+
+    Args:
+        values: Numbers (need not be sorted; must not be empty)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The interpolated value
+    """
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_timings(results: Iterable[dict], slowest: int = 5) -> dict:
+    """
+    Aggregate per-stage timings across extraction results.
+
+    Results without a 'timings' dict (e.g. from older cache formats) are
+    ignored. Each stage is summarized over the documents where it ran.
+
+    Args:
+        results: Result dicts from RawTextExtractor.process_document()
+        slowest: Number of slowest documents to list
+
+    Returns:
+        Dict with:
+            - documents: Number of results with timings
+            - stages: {stage: {'count', 'p50', 'p95', 'max', 'total'}} in ms,
+              in pipeline order
+            - slowest: [{'filename', 'total_ms', 'slowest_stage'}], slowest first
+    """
+    stage_values: dict[str, list[float]] = {}
+    totals: list[tuple[float, str, dict]] = []
+
+    for result in results:
+        timings = result.get('timings')
+        if not timings:
+            continue
+        for stage, ms in timings.items():
+            stage_values.setdefault(stage, []).append(ms)
+        totals.append((timings.get('total', 0.0), result.get('filename', '?'), timings))
+
+    ordered_stages = [s for s in TIMING_STAGES if s in stage_values]
+    ordered_stages += sorted(s for s in stage_values if s not in TIMING_STAGES)
+
+    stages = {}
+    for stage in ordered_stages:
+        values = stage_values[stage]
+        stages[stage] = {
+            'count': len(values),
+            'p50': round(percentile(values, 50), 1),
+            'p95': round(percentile(values, 95), 1),
+            'max': round(max(values), 1),
+            'total': round(sum(values), 1),
+        }
+
+    slowest_docs = []
+    for total_ms, filename, timings in sorted(totals, key=lambda t: t[0], reverse=True)[:slowest]:
+        # ocr_wall overlaps rasterization/ocr, and total covers everything
+        stage_times = {s: ms for s, ms in timings.items() if s not in ('total', 'ocr_wall')}
+        slowest_docs.append({
+            'filename': filename,
+            'total_ms': total_ms,
+            'slowest_stage': max(stage_times, key=stage_times.get) if stage_times else None,
+        })
+
+    return {'documents': len(totals), 'stages': stages, 'slowest': slowest_docs}
+
+
+def format_timing_summary(summary: dict) -> str:
+    """
+    Render a summary from summarize_timings() as a plain-text table.
+
+    Args:
+        summary: Output of summarize_timings()
+
+    Returns:
+        Multi-line string
+    """
+    lines = [f"Timing summary ({summary['documents']} documents, ms)",
+             f"  {'stage':<18}{'n':>6}{'p50':>10}{'p95':>10}{'max':>10}"]
+    for stage, stats in summary['stages'].items():
+        lines.append(f"  {stage:<18}{stats['count']:>6}{stats['p50']:>10.1f}"
+                     f"{stats['p95']:>10.1f}{stats['max']:>10.1f}")
+    if summary['slowest']:
+        lines.append("  Slowest files:")
+        for doc in summary['slowest']:
+            lines.append(f"    {doc['total_ms']:>10.1f}  {doc['filename']} "
+                         f"(mostly {doc['slowest_stage'] or '-'})")
+    return "\n".join(lines)
@@ -11,16 +11,18 @@ Architecture:
     from "how to parallelize". This enables:
 
     1. Production use: ThreadPoolStrategy for actual parallel execution
-    2. Testing: SequentialStrategy for deterministic, debuggable tests
-    3. Future extension: Easy to add ProcessPoolStrategy if needed
+    2. CPU-bound work: ProcessPoolStrategy (e.g. OCR of rasterized pages)
+    3. Testing: SequentialStrategy for deterministic, debuggable tests
 
 Components:
     ExecutorStrategy - Abstract base class defining the execution interface
     ThreadPoolStrategy - Thread-based parallel execution (production)
+    ProcessPoolStrategy - Process-based parallel execution (CPU-bound work)
     SequentialStrategy - Sequential execution (testing/debugging)
     ParallelTaskRunner - High-level task orchestration with callbacks
     TaskResult - Dataclass for task execution results
     ProgressAggregator - Thread-safe progress aggregation with throttling
+    PartialTextForwarder - Throttled forwarding of streamed model output to the UI
 
 Usage Example:
     from src.parallel import (
@@ -72,15 +74,17 @@ Performance Notes:
 
 from .executor_strategy import (
     ExecutorStrategy,
+    ProcessPoolStrategy,
     ThreadPoolStrategy,
     SequentialStrategy,
 )
 from .task_runner import ParallelTaskRunner, TaskResult
-from .progress_aggregator import ProgressAggregator, ProgressState
+from .progress_aggregator import PartialTextForwarder, ProgressAggregator, ProgressState
 
 __all__ = [
     # Strategies
     'ExecutorStrategy',
+    'ProcessPoolStrategy',
     'ThreadPoolStrategy',
     'SequentialStrategy',
     # Task runner
@@ -89,4 +93,5 @@ __all__ = [
     # Progress tracking
     'ProgressAggregator',
     'ProgressState',
+    'PartialTextForwarder',
 ]
@@ -5,7 +5,7 @@ Implements Strategy Pattern to separate "what to parallelize" from
 "how to parallelize". Enables dependency injection for testing.
 
 Design Principles:
-- Strategy Pattern: Different execution strategies (ThreadPool, Sequential)
+- Strategy Pattern: Different execution strategies (ThreadPool, ProcessPool, Sequential)
   implement the same interface, allowing runtime selection.
 - Dependency Injection: Workers accept strategy as parameter, enabling
   deterministic testing with SequentialStrategy.
@@ -24,7 +24,7 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, Future
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Callable, TypeVar, Iterator
 import os
 
@@ -163,6 +163,63 @@ class ThreadPoolStrategy(ExecutorStrategy):
         self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
 
 
+class ProcessPoolStrategy(ExecutorStrategy):
+    """
+    Process-based parallel execution strategy.
+
+    Optimal for CPU-bound work that holds the GIL or needs isolated memory,
+    such as OCR of rasterized pages: each worker process decodes its own
+    bitmaps, and that memory is returned to the OS when the pool shuts down.
+
+    Functions and items must be picklable (module-level functions, plain
+    data arguments). Lambdas and bound methods of unpicklable objects will
+    fail on submit.
+
+    Args:
+        max_workers: Maximum worker processes. Defaults to min(cpu_count, 4).
+
+    Example:
+        with ProcessPoolStrategy(max_workers=4) as strategy:
+            results = list(strategy.map(ocr_window, windows))
+    """
+
+    def __init__(self, max_workers: int = None):
+        """
+        Initialize process pool strategy.
+
+        Args:
+            max_workers: Max processes. Defaults to min(cpu_count, 4) for
+                        memory safety on typical business laptops.
+        """
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 4, 4)
+
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self.max_workers = max_workers
+
+    def submit(self, fn: Callable[[T], R], item: T) -> Future:
+        """Submit a single task to the process pool."""
+        return self._executor.submit(fn, item)
+
+    def map(self, fn: Callable[[T], R], items: list[T]) -> Iterator[R]:
+        """
+        Map function over items using the process pool.
+
+        Note: Results are returned in submission order (not completion order).
+        """
+        return self._executor.map(fn, items)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """
+        Shutdown the process pool.
+
+        Args:
+            wait: If True, wait for pending tasks to complete.
+            cancel_futures: If True, attempt to cancel pending futures.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
 class SequentialStrategy(ExecutorStrategy):
     """
     Sequential execution strategy for testing and debugging.
@@ -209,3 +209,80 @@ class ProgressAggregator:
         """Get total number of tasks (thread-safe)."""
         with self._lock:
             return self._state.total_tasks
+
+
+class PartialTextForwarder:
+    """
+    Forwards streamed model output to the UI queue as it is generated.
+
+    Called with each token; accumulates the text and sends it as
+    ('summary_partial', {'filename': filename, 'text': text_so_far}) at most
+    once per throttle_ms. Call flush() when the stream ends so the last
+    tokens are shown.
+
+    Thread-safe: Can be called from multiple worker threads.
+
+    Args:
+        ui_queue: Queue (or multiprocessing.Queue) for UI messages.
+        filename: Document the text belongs to, or None for the meta-summary.
+        throttle_ms: Minimum milliseconds between updates (default 100).
+
+    Example:
+        forwarder = PartialTextForwarder(ui_queue, filename="complaint.pdf")
+        summary = model_manager.generate_text(prompt, on_token=forwarder)
+        forwarder.flush()
+    """
+
+    def __init__(self, ui_queue: Queue, filename: str | None = None, throttle_ms: int = 100):
+        """
+        Initialize the forwarder.
+
+        Args:
+            ui_queue: Queue for UI messages.
+            filename: Document the text belongs to, or None for the meta-summary.
+            throttle_ms: Minimum ms between updates (default 100).
+        """
+        self.ui_queue = ui_queue
+        self.filename = filename
+        self.throttle_ms = throttle_ms
+        self._pieces: list[str] = []
+        self._sent = 0
+        self._last_update = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, token: str) -> None:
+        """
+        Add a token, sending the text so far if the throttle time has passed.
+
+        Args:
+            token: Next piece of generated text.
+        """
+        with self._lock:
+            self._pieces.append(token)
+            if time.time() * 1000 - self._last_update >= self.throttle_ms:
+                self._send_update()
+
+    def flush(self) -> None:
+        """Send any text not yet forwarded."""
+        with self._lock:
+            if self._sent < len(self._pieces):
+                self._send_update()
+
+    @property
+    def text(self) -> str:
+        """Get the text received so far (thread-safe)."""
+        with self._lock:
+            return ''.join(self._pieces)
+
+    def _send_update(self) -> None:
+        """
+        Send the accumulated text to the UI queue.
+
+        Internal method - must be called while holding _lock.
+        """
+        self.ui_queue.put(('summary_partial', {
+            'filename': self.filename,
+            'text': ''.join(self._pieces).strip(),
+        }))
+        self._sent = len(self._pieces)
+        self._last_update = time.time() * 1000
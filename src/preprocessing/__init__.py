@@ -6,6 +6,8 @@ Each preprocessor is a standalone class that can be enabled/disabled independent
 
 Pipeline Architecture:
 - BasePreprocessor: Abstract base class defining the preprocessor interface
+- LinePreprocessor: Base class for line-local preprocessors
+- LineStream: Lazy stream of lines passed between pipeline stages
 - PreprocessingPipeline: Orchestrates multiple preprocessors in sequence
 - Individual preprocessors: LineNumberRemover, HeaderFooterRemover, etc.
 
@@ -21,9 +23,22 @@ Usage:
         QAConverter(),
     ])
     cleaned_text = pipeline.process(raw_text)
+
+    # Preprocess several documents separately, in parallel, with caching:
+    cleaned_texts = preprocess_documents([text_a, text_b])
 """
 
-from src.preprocessing.base import BasePreprocessor, PreprocessingPipeline
+from src.preprocessing.base import (
+    BasePreprocessor,
+    LinePreprocessor,
+    LineStream,
+    PreprocessingPipeline,
+)
+from src.preprocessing.document_preprocessor import (
+    PreprocessingCache,
+    get_preprocessing_cache,
+    preprocess_documents,
+)
 from src.preprocessing.header_footer_remover import HeaderFooterRemover
 from src.preprocessing.line_number_remover import LineNumberRemover
 from src.preprocessing.qa_converter import QAConverter
@@ -53,10 +68,15 @@ def create_default_pipeline() -> PreprocessingPipeline:
 
 __all__ = [
     'BasePreprocessor',
+    'LinePreprocessor',
+    'LineStream',
     'PreprocessingPipeline',
     'LineNumberRemover',
     'HeaderFooterRemover',
     'TitlePageRemover',
     'QAConverter',
     'create_default_pipeline',
+    'PreprocessingCache',
+    'get_preprocessing_cache',
+    'preprocess_documents',
 ]
@@ -8,11 +8,22 @@ Design Principles:
 - Single Responsibility: Each preprocessor does one thing well
 - Open/Closed: Add new preprocessors without modifying existing code
 - Testable: Each preprocessor can be unit tested in isolation
+
+Streaming:
+The pipeline passes a lazy LineStream from stage to stage instead of a
+full string. Line-local preprocessors (LinePreprocessor subclasses)
+transform each line as it flows past; whole-document preprocessors run a
+pre-scan over their input stream and return a stream that applies the
+resulting plan. The text is materialized once, at the end.
 """
 
+import inspect
 import time
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any
 
 from src.logging_config import debug_log
@@ -35,6 +46,136 @@ class PreprocessingResult:
     processing_time_ms: float = 0.0
 
 
+def iter_lines(text: str, start: int = 0, end: int | None = None) -> Iterator[str]:
+    """
+    Lazily yield the lines of text[start:end], as text[start:end].split('\\n') would.
+
+    Args:
+        text: Source text
+        start: Offset of the first character
+        end: Offset past the last character (default: end of text)
+
+    Yields:
+        Each line without its trailing newline
+    """
+    if end is None:
+        end = len(text)
+    find = text.find
+    while True:
+        newline = find('\n', start, end)
+        if newline < 0:
+            yield text[start:end]
+            return
+        yield text[start:newline]
+        start = newline + 1
+
+
+def iter_with_last(lines: Iterable[str]) -> Iterator[tuple[str, bool]]:
+    """
+    Yield each line with a flag that is True for the final line.
+
+    Gives a stage one line of lookahead, for patterns whose trailing
+    whitespace can run on past a line break.
+
+    Args:
+        lines: Lines in order
+
+    Yields:
+        (line, is_last) tuples
+    """
+    lines = iter(lines)
+    previous = next(lines, None)
+    if previous is None:
+        return
+    for line in lines:
+        yield previous, False
+        previous = line
+    yield previous, True
+
+
+def _no_changes(counts: Counter) -> tuple[int, dict[str, Any]]:
+    return 0, {}
+
+
+class LineStream:
+    """
+    Re-iterable stream of document lines produced by a chain of preprocessors.
+
+    Each iteration starts a fresh pass over the source text, re-running the
+    stages that feed this stream, so a pre-scan can take as many passes as
+    it needs without an intermediate string being built.
+
+    Attributes:
+        text: The stream as a string, when it is known without joining
+              (e.g. the untouched pipeline input); otherwise None
+        page_offsets: Offset where each page starts in the stream's text, when
+                      known (the extractor's 'page_offsets' for the untouched
+                      pipeline input); otherwise None
+        counts: Counter filled by the producing stage during the latest pass
+        timed: If True, iterating accumulates production time in `seconds`
+        seconds: Time spent producing lines while timed, including the time
+                 of the streams this one reads from
+    """
+
+    # Lines produced per clock reading while timed
+    TIMING_BATCH_LINES = 1024
+
+    def __init__(
+        self,
+        produce: Callable[[Counter], Iterator[str]],
+        summarize: Callable[[Counter], tuple[int, dict[str, Any]]] = _no_changes,
+        text: str | None = None,
+        page_offsets: list[int] | None = None,
+    ):
+        """
+        Args:
+            produce: Returns a fresh line iterator, recording counts in the
+                     Counter it is given
+            summarize: Turns the counts of a complete pass into
+                       (changes_made, metadata)
+            text: The stream as a string, if already available
+            page_offsets: Offset where each page starts in the stream's text
+        """
+        self._produce = produce
+        self._summarize = summarize
+        self.text = text
+        self.page_offsets = page_offsets
+        self.counts: Counter = Counter()
+        self.timed = False
+        self.seconds = 0.0
+
+    @classmethod
+    def from_text(cls, text: str, page_offsets: list[int] | None = None) -> 'LineStream':
+        """Stream the lines of a string without splitting it up front."""
+        return cls(lambda counts: iter_lines(text), text=text, page_offsets=page_offsets)
+
+    def __iter__(self) -> Iterator[str]:
+        self.counts = Counter()
+        lines = self._produce(self.counts)
+        return self._timed(lines) if self.timed else lines
+
+    def _timed(self, lines: Iterator[str]) -> Iterator[str]:
+        """Pass lines through, adding the time taken to produce them to `seconds`."""
+        clock = time.perf_counter
+        while True:
+            start = clock()
+            batch = list(islice(lines, self.TIMING_BATCH_LINES))
+            self.seconds += clock() - start
+            if not batch:
+                return
+            yield from batch
+
+    def summary(self) -> tuple[int, dict[str, Any]]:
+        """(changes_made, metadata) of the producing stage for the latest pass."""
+        return self._summarize(self.counts)
+
+    def materialize(self) -> str:
+        """Join the stream into a string (free when `text` is already known)."""
+        if self.text is not None:
+            return self.text
+        return '\n'.join(self)
+
+
 class BasePreprocessor(ABC):
     """
     Abstract base class for text preprocessors.
@@ -74,16 +215,157 @@ class BasePreprocessor(ABC):
         """
         pass
 
+    def stream(self, lines: LineStream) -> LineStream:
+        """
+        Return this preprocessor's output as a stream over `lines`.
+
+        The default materializes `lines` and runs process(), so any
+        preprocessor works in the pipeline. Line-local and pre-scan
+        preprocessors override it to avoid the intermediate string.
+
+        Args:
+            lines: Output of the previous stage
+
+        Returns:
+            LineStream of processed lines
+        """
+        result = self.process(lines.materialize())
+        return LineStream(
+            lambda counts: iter_lines(result.text),
+            summarize=lambda counts: (result.changes_made, result.metadata),
+            text=result.text,
+        )
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(enabled={self.enabled})"
 
 
+class LinePreprocessor(BasePreprocessor):
+    """
+    Base class for preprocessors that work one line at a time.
+
+    Subclasses implement transform_line() and summarize(); process() and
+    stream() are built on them, so both give the same result. A subclass
+    whose patterns can run on past a line break (trailing whitespace that
+    would also match the newline in the joined text) overrides
+    transform_lines() and carries that state from line to line.
+
+    Example:
+        class Upper(LinePreprocessor):
+            name = "Upper"
+
+            def transform_line(self, line, counts):
+                if line.islower():
+                    counts['upper'] += 1
+                    return line.upper()
+                return line
+
+            def summarize(self, counts):
+                return counts['upper'], {'upper': counts['upper']}
+    """
+
+    @abstractmethod
+    def transform_line(self, line: str, counts: Counter) -> str:
+        """
+        Transform one line, recording what changed in `counts`.
+
+        Args:
+            line: Line without its trailing newline
+            counts: Counter shared by every line of one pass
+
+        Returns:
+            Transformed line (must not contain a newline)
+        """
+        pass
+
+    @abstractmethod
+    def summarize(self, counts: Counter) -> tuple[int, dict[str, Any]]:
+        """
+        Turn the counts of a complete pass into (changes_made, metadata).
+
+        Args:
+            counts: Counter filled by transform_line()
+
+        Returns:
+            Tuple of changes made and result metadata
+        """
+        pass
+
+    def transform_lines(self, lines: Iterable[str], counts: Counter) -> Iterator[str]:
+        """Lazily apply transform_line() to each line."""
+        transform = self.transform_line
+        for line in lines:
+            yield transform(line, counts)
+
+    def stream(self, lines: LineStream) -> LineStream:
+        return LineStream(
+            lambda counts: self.transform_lines(lines, counts),
+            summarize=self.summarize,
+        )
+
+    def process(self, text: str) -> PreprocessingResult:
+        """
+        Transform every line of the text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            PreprocessingResult with transformed text and change counts
+        """
+        if not text:
+            return PreprocessingResult(text=text, changes_made=0)
+
+        counts: Counter = Counter()
+        result = '\n'.join(self.transform_lines(iter_lines(text), counts))
+        changes, metadata = self.summarize(counts)
+        return PreprocessingResult(text=result, changes_made=changes, metadata=metadata)
+
+
+@dataclass
+class LineFilterPlan:
+    """
+    Outcome of a whole-document pre-scan that removes complete lines.
+
+    Attributes:
+        drop_lines: Exact lines to remove wherever they occur
+        changes_made: Number of lines the plan removes
+        metadata: Result metadata, known once the scan is done
+    """
+    drop_lines: frozenset[str]
+    changes_made: int = 0
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def apply(self, lines: Iterable[str]) -> Iterator[str]:
+        """Lazily yield the lines the plan keeps."""
+        drop_lines = self.drop_lines
+        if not drop_lines:
+            return iter(lines)
+        return (line for line in lines if line not in drop_lines)
+
+    def stream(self, lines: LineStream) -> LineStream:
+        """Stream `lines` with the plan applied."""
+        return LineStream(
+            lambda counts: self.apply(lines),
+            summarize=lambda counts: (self.changes_made, self.metadata),
+            text=None if self.drop_lines else lines.text,
+            page_offsets=None if self.drop_lines else lines.page_offsets,
+        )
+
+
+def _accepts_page_offsets(preprocessor: BasePreprocessor) -> bool:
+    """Whether a preprocessor's process() takes a page_offsets argument."""
+    return 'page_offsets' in inspect.signature(preprocessor.process).parameters
+
+
 class PreprocessingPipeline:
     """
     Orchestrates multiple preprocessors in sequence.
 
     Preprocessors are executed in order, with each receiving the output
-    of the previous. Disabled preprocessors are skipped.
+    of the previous. Disabled preprocessors are skipped. Stages are chained
+    as LineStreams, so the cleaned text is built once instead of once per
+    preprocessor.
 
     Attributes:
         preprocessors: List of preprocessor instances to execute
@@ -139,12 +421,18 @@ class PreprocessingPipeline:
                 return True
         return False
 
-    def process(self, text: str) -> str:
+    def process(self, text: str, page_offsets: list[int] | None = None) -> str:
         """
         Run all enabled preprocessors on the input text.
 
+        Stages are chained as lazy line streams and the result is joined
+        once at the end. If streaming fails part-way, the text is processed
+        again stage by stage so one faulty preprocessor cannot lose the rest.
+
         Args:
             text: Raw input text to process
+            page_offsets: Offset where each page starts in text (the
+                         extractor's 'page_offsets'), passed to the first stage
 
         Returns:
             Cleaned text after all preprocessing steps
@@ -154,21 +442,99 @@ class PreprocessingPipeline:
 
         self.total_changes = 0
         self._last_run_stats = {}
-        current_text = text
         pipeline_start = time.time()
 
         enabled_count = sum(1 for p in self.preprocessors if p.enabled)
         debug_log(f"[PREPROCESSING] Starting pipeline with {enabled_count} "
                   f"enabled preprocessors on {len(text)//1024}KB text")
 
+        source = lines = LineStream.from_text(text, page_offsets)
+        stages: list[tuple[BasePreprocessor, LineStream, float]] = []
+
         for preprocessor in self.preprocessors:
             if not preprocessor.enabled:
                 debug_log(f"[PREPROCESSING] Skipping disabled: {preprocessor.name}")
                 continue
 
+            # Pre-scans run here; line-local work happens during the final join
             start_time = time.time()
             try:
-                result = preprocessor.process(current_text)
+                lines = preprocessor.stream(lines)
+                stages.append((preprocessor, lines, (time.time() - start_time) * 1000))
+            except Exception as e:
+                debug_log(f"[PREPROCESSING] Error in {preprocessor.name}: {e}")
+                # Continue with unchanged stream on error
+                self._last_run_stats[preprocessor.name] = {
+                    'error': str(e),
+                    'changes': 0,
+                    'time_ms': (time.time() - start_time) * 1000,
+                }
+
+        # Time the join: a stream's time includes the streams it reads from,
+        # so each stage's own share is the difference from its input's
+        for stream in [source] + [stage_lines for _, stage_lines, _ in stages]:
+            stream.timed = True
+
+        stream_start = time.time()
+        try:
+            current_text = lines.materialize()
+        except Exception as e:
+            debug_log(f"[PREPROCESSING] Streaming failed ({e}), processing stage by stage")
+            return self._process_sequential(text, page_offsets)
+        stream_ms = (time.time() - stream_start) * 1000
+
+        input_seconds = source.seconds
+        for preprocessor, stage_lines, scan_ms in stages:
+            changes, metadata = stage_lines.summary()
+            transform_ms = max(0.0, stage_lines.seconds - input_seconds) * 1000
+            input_seconds = stage_lines.seconds
+            self.total_changes += changes
+            self._last_run_stats[preprocessor.name] = {
+                'changes': changes,
+                'time_ms': scan_ms + transform_ms,
+                'scan_ms': scan_ms,
+                'metadata': metadata,
+            }
+            debug_log(f"[PREPROCESSING] {preprocessor.name}: {changes} changes in "
+                      f"{scan_ms + transform_ms:.1f}ms (pre-scan {scan_ms:.1f}ms)")
+
+        total_time = (time.time() - pipeline_start) * 1000
+        debug_log(f"[PREPROCESSING] Pipeline complete: {self.total_changes} total changes "
+                  f"in {total_time:.1f}ms (streamed in {stream_ms:.1f}ms), "
+                  f"output {len(current_text)//1024}KB")
+
+        return current_text
+
+    def _process_sequential(self, text: str, page_offsets: list[int] | None = None) -> str:
+        """
+        Run each enabled preprocessor's process() on the full text in turn.
+
+        Fallback for process(): slower and holds a full copy per stage, but
+        isolates errors to the stage that raised them. Page offsets are
+        passed to every stage that accepts them until a stage changes the
+        text.
+
+        Args:
+            text: Raw input text to process
+            page_offsets: Offset where each page starts in text
+
+        Returns:
+            Cleaned text after all preprocessing steps
+        """
+        self.total_changes = 0
+        self._last_run_stats = {}
+        current_text = text
+
+        for preprocessor in self.preprocessors:
+            if not preprocessor.enabled:
+                continue
+
+            start_time = time.time()
+            try:
+                if page_offsets is not None and _accepts_page_offsets(preprocessor):
+                    result = preprocessor.process(current_text, page_offsets=page_offsets)
+                else:
+                    result = preprocessor.process(current_text)
                 elapsed_ms = (time.time() - start_time) * 1000
 
                 self.total_changes += result.changes_made
@@ -181,6 +547,8 @@ class PreprocessingPipeline:
                 debug_log(f"[PREPROCESSING] {preprocessor.name}: "
                           f"{result.changes_made} changes in {elapsed_ms:.1f}ms")
 
+                if result.text != current_text:
+                    page_offsets = None  # No longer match the text
                 current_text = result.text
 
             except Exception as e:
@@ -192,16 +560,17 @@ class PreprocessingPipeline:
                     'time_ms': (time.time() - start_time) * 1000,
                 }
 
-        total_time = (time.time() - pipeline_start) * 1000
-        debug_log(f"[PREPROCESSING] Pipeline complete: {self.total_changes} total changes "
-                  f"in {total_time:.1f}ms, output {len(current_text)//1024}KB")
-
         return current_text
 
     def get_stats(self) -> dict[str, dict[str, Any]]:
         """
         Get statistics from the last pipeline run.
 
+        Each stage reports 'changes', 'metadata' and 'time_ms'. When streamed,
+        'time_ms' is the stage's pre-scan ('scan_ms', which includes running
+        the stages before it for each pass it makes) plus its share of the
+        final join; after a fallback it is the stage's process() time.
+
         Returns:
             Dictionary mapping preprocessor names to their stats
         """
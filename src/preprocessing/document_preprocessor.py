@@ -0,0 +1,299 @@
+"""
+Per-Document Preprocessing
+
+Runs the default preprocessing pipeline on each document separately and
+memoizes the results by content hash.
+
+Preprocessing documents one at a time keeps header/footer frequency counts
+and title page detection within a document, and lets a large file run in
+its own worker process instead of holding up the rest. The in-memory cache
+means re-running a summary on the same case skips preprocessing entirely.
+
+The extractor's page offsets can be passed along so title page removal
+works on real pages instead of guessing page breaks.
+
+Usage:
+    from src.preprocessing import preprocess_documents
+
+    cleaned_texts = preprocess_documents(
+        [doc['extracted_text'] for doc in docs],
+        page_offsets=[doc.get('page_offsets') for doc in docs],
+    )
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any
+
+from src.config import (
+    PREPROCESSING_CACHE_MAX_MB,
+    PREPROCESSING_MAX_WORKERS,
+    PREPROCESSING_PARALLEL_MIN_CHARS,
+    PREPROCESSING_WORKER_RAM_GB,
+)
+from src.logging_config import debug_log
+from src.parallel import ExecutorStrategy, ProcessPoolStrategy, SequentialStrategy
+
+
+def hash_text(text: str) -> str:
+    """
+    Compute the SHA-256 of a text's UTF-8 encoding.
+
+    Args:
+        text: Document text
+
+    Returns:
+        Hex digest string
+    """
+    return hashlib.sha256(text.encode('utf-8', errors='surrogatepass')).hexdigest()
+
+
+def document_key(text: str, page_offsets: list[int] | None = None) -> str:
+    """
+    Cache key of a document: its content hash, plus its page offsets if any.
+
+    Args:
+        text: Document text
+        page_offsets: Offset where each page starts in text, if known
+
+    Returns:
+        Hex digest string (hash_text(text) when there are no page offsets)
+    """
+    key = hash_text(text)
+    if page_offsets is None:
+        return key
+    return hash_text(key + ',' + ','.join(map(str, page_offsets)))
+
+
+def preprocess_document(text: str, page_offsets: list[int] | None = None) -> tuple[str, int]:
+    """
+    Run the default preprocessing pipeline on one document.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        text: Extracted document text
+        page_offsets: Offset where each page starts in text, if known
+
+    Returns:
+        Tuple of (preprocessed text, total changes made)
+    """
+    from src.preprocessing import create_default_pipeline
+
+    pipeline = create_default_pipeline()
+    result = pipeline.process(text, page_offsets=page_offsets)
+    return result, pipeline.total_changes
+
+
+def _preprocess_job(job: tuple[str, list[int] | None]) -> tuple[str, int]:
+    """preprocess_document() on a (text, page_offsets) pair, for ExecutorStrategy.submit()."""
+    return preprocess_document(*job)
+
+
+class PreprocessingCache:
+    """
+    In-memory LRU cache of preprocessed document texts, keyed by content hash.
+
+    Thread-safe. Entries are evicted least-recently-used first once the
+    cached text exceeds the size cap.
+
+    Example:
+        cache = PreprocessingCache()
+        key = document_key(text)
+        cleaned = cache.get(key)
+        if cleaned is None:
+            cleaned, _ = preprocess_document(text)
+            cache.put(key, cleaned)
+    """
+
+    def __init__(self, max_size_mb: float = PREPROCESSING_CACHE_MAX_MB):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size_mb: Total size cap (counted in characters) before
+                        least-recently-used entries are evicted
+        """
+        self.max_size_chars = int(max_size_mb * 1024 * 1024)
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._size_chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a preprocessed text.
+
+        Args:
+            key: Key from document_key()
+
+        Returns:
+            Preprocessed text, or None on a miss
+        """
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Store a preprocessed text, evicting old entries above the size cap.
+
+        Args:
+            key: Key from document_key()
+            text: Preprocessed text
+        """
+        if len(text) > self.max_size_chars:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_chars -= len(previous)
+            self._entries[key] = text
+            self._size_chars += len(text)
+
+            while self._size_chars > self.max_size_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_chars -= len(evicted)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size_chars = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, size_mb, max_size_mb, hits, misses
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_mb': round(self._size_chars / (1024 * 1024), 2),
+                'max_size_mb': round(self.max_size_chars / (1024 * 1024), 2),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+# Global singleton instance
+_preprocessing_cache: PreprocessingCache | None = None
+
+
+def get_preprocessing_cache() -> PreprocessingCache:
+    """
+    Get the global PreprocessingCache singleton.
+
+    Returns:
+        PreprocessingCache instance
+    """
+    global _preprocessing_cache
+    if _preprocessing_cache is None:
+        _preprocessing_cache = PreprocessingCache()
+    return _preprocessing_cache
+
+
+def _default_max_workers() -> int:
+    """Worker processes for preprocessing, bounded by available RAM."""
+    from src.system_resources import get_optimal_workers
+
+    return get_optimal_workers(
+        task_ram_gb=PREPROCESSING_WORKER_RAM_GB, max_workers=PREPROCESSING_MAX_WORKERS
+    )
+
+
+def preprocess_documents(
+    texts: list[str],
+    page_offsets: list[list[int] | None] | None = None,
+    cache: PreprocessingCache | None = None,
+    strategy: ExecutorStrategy | None = None,
+    max_workers: int | None = None,
+    parallel_min_chars: int = PREPROCESSING_PARALLEL_MIN_CHARS,
+) -> list[str]:
+    """
+    Preprocess each document separately, reusing cached results.
+
+    Documents not in the cache are preprocessed in worker processes when
+    there are several of them totalling at least `parallel_min_chars`,
+    otherwise in this process. A document whose preprocessing fails is
+    returned unchanged and not cached.
+
+    Args:
+        texts: Extracted text of each document
+        page_offsets: Per document, the offset where each page starts (the
+                     extractor's 'page_offsets'), or None where unknown
+        cache: Cache to use. Defaults to the global preprocessing cache.
+        strategy: ExecutorStrategy to use for uncached documents instead of
+                 choosing between a ProcessPoolStrategy and in-process work
+        max_workers: Worker processes. Defaults to
+                    get_optimal_workers(PREPROCESSING_WORKER_RAM_GB, PREPROCESSING_MAX_WORKERS)
+        parallel_min_chars: Minimum uncached characters for a process pool
+
+    Returns:
+        Preprocessed texts, in the order of `texts`
+    """
+    cache = cache if cache is not None else get_preprocessing_cache()
+    if page_offsets is None:
+        page_offsets = [None] * len(texts)
+    results: list[str | None] = [None] * len(texts)
+
+    # Identical documents (e.g. a file added twice) are preprocessed once
+    missing: dict[str, list[int]] = {}
+    for index, text in enumerate(texts):
+        if not text:
+            results[index] = text
+            continue
+        key = document_key(text, page_offsets[index])
+        cached = cache.get(key)
+        if cached is not None:
+            results[index] = cached
+        else:
+            missing.setdefault(key, []).append(index)
+
+    if missing:
+        missing_chars = sum(len(texts[indexes[0]]) for indexes in missing.values())
+        owns_strategy = False
+        if strategy is None and len(missing) > 1 and missing_chars >= parallel_min_chars:
+            workers = min(max_workers or _default_max_workers(), len(missing))
+            if workers > 1:
+                strategy = ProcessPoolStrategy(workers)
+                owns_strategy = True
+        executor = strategy if strategy is not None else SequentialStrategy()
+
+        debug_log(f"[PREPROCESSING] {len(texts) - sum(map(len, missing.values()))} of "
+                  f"{len(texts)} documents cached; preprocessing {len(missing)} "
+                  f"({missing_chars // 1024}KB) with {executor.max_workers} worker(s)")
+
+        try:
+            futures: dict[str, Future] = {
+                key: executor.submit(_preprocess_job, (texts[indexes[0]], page_offsets[indexes[0]]))
+                for key, indexes in missing.items()
+            }
+            for key, future in futures.items():
+                indexes = missing[key]
+                try:
+                    preprocessed, changes = future.result()
+                except Exception as e:
+                    debug_log(f"[PREPROCESSING] Document preprocessing failed (using raw text): {e}")
+                    preprocessed = texts[indexes[0]]
+                else:
+                    cache.put(key, preprocessed)
+                    debug_log(f"[PREPROCESSING] Document {key[:12]}: {changes} changes")
+                for index in indexes:
+                    results[index] = preprocessed
+        finally:
+            if owns_strategy:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    return results
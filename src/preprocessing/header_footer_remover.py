@@ -13,8 +13,15 @@ Common patterns:
 
 import re
 from collections import Counter
+from collections.abc import Iterable
 
-from src.preprocessing.base import BasePreprocessor, PreprocessingResult
+from src.preprocessing.base import (
+    BasePreprocessor,
+    LineFilterPlan,
+    LineStream,
+    PreprocessingResult,
+)
+from src.utils.pattern_bank import PatternBank
 
 
 class HeaderFooterRemover(BasePreprocessor):
@@ -30,6 +37,11 @@ class HeaderFooterRemover(BasePreprocessor):
     3. Lines appearing 3+ times AND matching patterns → remove
     4. Preserve unique content lines
 
+    Runs in linear time as a two-pass pre-scan (count, then check each
+    distinct raw variant of a frequent line against the patterns once)
+    that yields a LineFilterPlan; the removal itself is a set lookup per
+    line, so the remover streams in the pipeline.
+
     This is conservative by design - would rather keep some headers
     than accidentally remove important content.
     """
@@ -79,6 +91,12 @@ class HeaderFooterRemover(BasePreprocessor):
         re.compile(r',?\s*(?:LLP|PLLC|P\.?C\.?|LLC|L\.L\.C\.)\s*$', re.IGNORECASE),
     ]
 
+    # Skips patterns whose literal anchor ("page", "court", ...) is not in the line
+    HEADER_FOOTER_BANK = PatternBank(HEADER_FOOTER_PATTERNS)
+
+    # Trailing page number stripped during normalization ("SMITH DEPOSITION - 12")
+    TRAILING_PAGE_NUMBER = re.compile(r'\s*-?\s*\d+\s*-?\s*$')
+
     def _normalize_line(self, line: str) -> str:
         """
         Normalize a line for comparison purposes.
@@ -95,8 +113,10 @@ class HeaderFooterRemover(BasePreprocessor):
         # Strip whitespace
         normalized = line.strip()
 
-        # Remove trailing page numbers (common in headers)
-        normalized = re.sub(r'\s*-?\s*\d+\s*-?\s*$', '', normalized)
+        # Remove trailing page numbers (common in headers); only lines ending
+        # in a digit or dash can have one, which skips the costly search
+        if normalized[-1:].isdigit() or normalized.endswith('-'):
+            normalized = self.TRAILING_PAGE_NUMBER.sub('', normalized)
 
         # Collapse whitespace
         normalized = ' '.join(normalized.split())
@@ -122,66 +142,99 @@ class HeaderFooterRemover(BasePreprocessor):
             return False
 
         # Check against patterns
-        for pattern in self.HEADER_FOOTER_PATTERNS:
-            if pattern.search(line):
-                return True
+        return self.HEADER_FOOTER_BANK.search_any(line)
 
-        return False
-
-    def process(self, text: str) -> PreprocessingResult:
+    def scan(self, lines: Iterable[str]) -> LineFilterPlan:
         """
-        Remove repetitive headers and footers from text.
+        Find the repetitive headers/footers in a document.
+
+        Iterates `lines` twice, so it must be re-iterable (a list or a
+        LineStream).
 
         Args:
-            text: Input text potentially containing headers/footers
+            lines: Lines of the document
 
         Returns:
-            PreprocessingResult with cleaned text and metadata
+            LineFilterPlan removing every variant of each header/footer
         """
-        if not text:
-            return PreprocessingResult(text=text, changes_made=0)
-
-        lines = text.split('\n')
+        normalize = self._normalize_line
 
         # Count normalized line frequencies
         line_counts: Counter = Counter()
         for line in lines:
-            normalized = self._normalize_line(line)
-            if normalized:  # Don't count empty lines
+            normalized = normalize(line)
+            if normalized:
                 line_counts[normalized] += 1
 
-        # Find lines that appear frequently AND match patterns
+        frequent = {
+            normalized for normalized, count in line_counts.items()
+            if count >= self.MIN_OCCURRENCES
+        }
+        if not frequent:
+            return LineFilterPlan(
+                drop_lines=frozenset(),
+                metadata={'unique_patterns_removed': 0, 'total_lines_removed': 0, 'examples': []},
+            )
+
+        # A frequent line is removed if any of its raw variants matches a pattern,
+        # so each distinct raw variant is checked once. The first few occurrences
+        # of each frequent line are kept for the examples.
+        variants: dict[str, str] = {}
         lines_to_remove: set[str] = set()
-        for normalized_line, count in line_counts.items():
-            if count >= self.MIN_OCCURRENCES:
-                # Check if any original line with this normalization matches patterns
-                for line in lines:
-                    if self._normalize_line(line) == normalized_line:
-                        if self._is_header_footer_candidate(line):
-                            lines_to_remove.add(normalized_line)
-                            break
-
-        # Remove matching lines
-        result_lines = []
-        removed_count = 0
-        removed_examples = []
-
-        for line in lines:
-            normalized = self._normalize_line(line)
-            if normalized in lines_to_remove:
-                removed_count += 1
-                # Track first few examples for debugging
-                if len(removed_examples) < 5:
-                    removed_examples.append(line.strip()[:50])
-            else:
-                result_lines.append(line)
+        first_occurrences: dict[str, list[tuple[int, str]]] = {}
+        for index, line in enumerate(lines):
+            normalized = normalize(line)
+            if normalized not in frequent:
+                continue
+            if line not in variants:
+                variants[line] = normalized
+                if normalized not in lines_to_remove and self._is_header_footer_candidate(line):
+                    lines_to_remove.add(normalized)
+            occurrences = first_occurrences.setdefault(normalized, [])
+            if len(occurrences) < 5:
+                occurrences.append((index, line.strip()[:50]))
+
+        # Track first few examples for debugging
+        removed_occurrences = sorted(
+            occurrence
+            for normalized in lines_to_remove
+            for occurrence in first_occurrences[normalized]
+        )
+        removed_count = sum(line_counts[normalized] for normalized in lines_to_remove)
 
-        return PreprocessingResult(
-            text='\n'.join(result_lines),
+        return LineFilterPlan(
+            drop_lines=frozenset(
+                line for line, normalized in variants.items() if normalized in lines_to_remove
+            ),
             changes_made=removed_count,
             metadata={
                 'unique_patterns_removed': len(lines_to_remove),
                 'total_lines_removed': removed_count,
-                'examples': removed_examples,
+                'examples': [example for _, example in removed_occurrences[:5]],
             }
         )
+
+    def stream(self, lines: LineStream) -> LineStream:
+        return self.scan(lines).stream(lines)
+
+    def process(self, text: str) -> PreprocessingResult:
+        """
+        Remove repetitive headers and footers from text.
+
+        Args:
+            text: Input text potentially containing headers/footers
+
+        Returns:
+            PreprocessingResult with cleaned text and metadata
+        """
+        if not text:
+            return PreprocessingResult(text=text, changes_made=0)
+
+        lines = LineStream.from_text(text)
+        plan = self.scan(lines)
+
+        return PreprocessingResult(
+            text=plan.stream(lines).materialize(),
+            changes_made=plan.changes_made,
+            metadata=plan.metadata,
+        )
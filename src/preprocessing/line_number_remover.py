@@ -12,14 +12,20 @@ Patterns handled:
 Does NOT remove:
 - Numbers that are part of content (dates, case numbers, citations)
 - Page numbers (handled by RawTextExtractor)
+
+Works line by line, so it can run as a streaming pipeline stage, with a
+line of lookahead around lines that hold only a number.
 """
 
 import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import Any
 
-from src.preprocessing.base import BasePreprocessor, PreprocessingResult
+from src.preprocessing.base import LinePreprocessor, iter_with_last
 
 
-class LineNumberRemover(BasePreprocessor):
+class LineNumberRemover(LinePreprocessor):
     """
     Removes line numbers from legal transcript margins.
 
@@ -51,46 +57,179 @@ class LineNumberRemover(BasePreprocessor):
     # Pattern for pipe-prefixed line numbers (|1, |2, etc.)
     PIPE_PATTERN = re.compile(r'^\|([1-9]|1[0-9]|2[0-5])\s*', re.MULTILINE)
 
-    def process(self, text: str) -> PreprocessingResult:
+    # A line holding nothing but a margin number. Around such a line the
+    # patterns' whitespace runs through line breaks in the joined text.
+    NUMBER_ONLY_PATTERN = re.compile(r'(\s*)([1-9]|1[0-9]|2[0-5])\s*')
+
+    # A line holding nothing but a pipe-prefixed line number (as PIPE_PATTERN
+    # matches it: one digit, then only whitespace)
+    PIPE_ONLY_PATTERN = re.compile(r'\|[1-9]\s*')
+
+    def transform_line(self, line: str, counts: Counter) -> str:
         """
-        Remove line numbers from text margins.
+        Remove a margin line number from one line.
 
         Args:
-            text: Input text potentially containing line numbers
+            line: Line potentially starting or ending with a line number
+            counts: Removals per kind, accumulated over the pass
 
         Returns:
-            PreprocessingResult with cleaned text and change count
+            Line without the line number
         """
-        if not text:
-            return PreprocessingResult(text=text, changes_made=0)
+        # Remove line numbers at start of line
+        # Preserve any leading whitespace before the number
+        line, start_count = self.LINE_START_PATTERN.subn(r'\1', line)
 
-        changes = 0
-        result = text
+        # Remove line numbers at end of line
+        end_count = pipe_count = 0
+        if line[-1:].isdigit():
+            line, end_count = self.LINE_END_PATTERN.subn('', line)
 
-        # Remove line numbers at start of lines
-        # Preserve any leading whitespace before the number
-        def replace_start(match):
-            nonlocal changes
-            changes += 1
-            # Keep leading whitespace, remove number and extra spaces
-            return match.group(1)
+        # Remove pipe-prefixed line numbers
+        if line.startswith('|'):
+            line, pipe_count = self.PIPE_PATTERN.subn('', line)
 
-        result = self.LINE_START_PATTERN.sub(replace_start, result)
+        if start_count or end_count or pipe_count:
+            counts['start_line_numbers'] += start_count
+            counts['end_line_numbers'] += end_count
+            counts['pipe_line_numbers'] += pipe_count
+        return line
 
-        # Remove line numbers at end of lines
-        result, end_count = self.LINE_END_PATTERN.subn('', result)
-        changes += end_count
+    def transform_lines(self, lines: Iterable[str], counts: Counter) -> Iterator[str]:
+        """
+        Remove line numbers in three chained passes, one per pattern.
 
-        # Remove pipe-prefixed line numbers
-        result, pipe_count = self.PIPE_PATTERN.subn('', result)
-        changes += pipe_count
-
-        return PreprocessingResult(
-            text=result,
-            changes_made=changes,
-            metadata={
-                'start_line_numbers': changes - end_count - pipe_count,
-                'end_line_numbers': end_count,
-                'pipe_line_numbers': pipe_count,
-            }
-        )
+        Gives the same text as running each pattern over the joined
+        document in turn. Lines are transformed one at a time except
+        around a line that holds only a number, where the patterns'
+        whitespace spans line breaks: a lone start number or pipe number
+        swallows the blank lines after it (the next line's text moves up
+        onto it), and a lone end number swallows the blank lines before it.
+
+        Args:
+            lines: Input lines
+            counts: Removals per kind, accumulated over the pass
+
+        Yields:
+            Lines without line numbers
+        """
+        lines = self._remove_start_numbers(lines, counts)
+        lines = self._remove_end_numbers(lines, counts)
+        return self._remove_pipe_numbers(lines, counts)
+
+    def _remove_start_numbers(self, lines: Iterable[str], counts: Counter) -> Iterator[str]:
+        """Apply LINE_START_PATTERN, whose \\s{2,} after a lone number spans line breaks."""
+        held = None  # (prefix, match, line) of a lone number whose whitespace run continues
+        blanks: list[str] = []  # Blank lines inside that run
+        run = 0  # Length of the run so far
+        for line, is_last in iter_with_last(lines):
+            prefix = ''
+            if held is not None:
+                if not line or line.isspace():
+                    blanks.append(line)
+                    run += 1 + len(line)
+                    if not is_last:
+                        continue
+                    line = None
+                held_prefix, number, held_line = held
+                held = None
+                if line is not None:
+                    run += 1 + len(line) - len(line.lstrip())
+                if run < 2:
+                    # Only a line break follows the number: no match
+                    yield held_prefix + held_line
+                    if line is None:
+                        yield from blanks
+                        continue
+                else:
+                    counts['start_line_numbers'] += 1
+                    if line is None:
+                        yield held_prefix + number.group(1)
+                        continue
+                    body = line.lstrip()
+                    if len(body) < len(line):
+                        # Indentation swallowed: resumes mid-line, so no match here
+                        yield held_prefix + number.group(1) + body
+                        continue
+                    prefix = held_prefix + number.group(1)
+
+            number = self.NUMBER_ONLY_PATTERN.fullmatch(line)
+            if number and not is_last:
+                held = (prefix, number, line)
+                blanks = []
+                run = len(line) - number.end(2)
+                continue
+            line, start_count = self.LINE_START_PATTERN.subn(r'\1', line)
+            counts['start_line_numbers'] += start_count
+            yield prefix + line
+
+    def _remove_end_numbers(self, lines: Iterable[str], counts: Counter) -> Iterator[str]:
+        """Apply LINE_END_PATTERN, whose \\s{2,} before a lone number spans line breaks."""
+        anchor = None  # Last non-blank line (or the first line), held back in case it is trimmed
+        blanks: list[str] = []  # Blank lines after the anchor
+        for line in lines:
+            if not line or line.isspace():
+                if anchor is None:
+                    anchor = line
+                else:
+                    blanks.append(line)
+                continue
+
+            number = anchor is not None and self.NUMBER_ONLY_PATTERN.fullmatch(line)
+            if number and number.end(2) == len(line):
+                indent = number.end(1)
+                run = (len(anchor) - len(anchor.rstrip()) + sum(len(b) + 1 for b in blanks)
+                       + 1 + indent)
+                if run >= 2:
+                    # The whitespace back to the anchor's text goes with the number
+                    counts['end_line_numbers'] += 1
+                    anchor = anchor.rstrip()
+                    blanks = []
+                    continue
+
+            end_count = 0
+            if line[-1].isdigit():
+                line, end_count = self.LINE_END_PATTERN.subn('', line)
+                counts['end_line_numbers'] += end_count
+            if anchor is not None:
+                yield anchor
+                yield from blanks
+            anchor = line
+            blanks = []
+
+        if anchor is not None:
+            yield anchor
+            yield from blanks
+
+    def _remove_pipe_numbers(self, lines: Iterable[str], counts: Counter) -> Iterator[str]:
+        """Apply PIPE_PATTERN, whose \\s* after a lone pipe number spans line breaks."""
+        swallowing = False  # A lone pipe number's whitespace is running on into this line
+        for line, is_last in iter_with_last(lines):
+            if swallowing:
+                if not line or line.isspace():
+                    if is_last:
+                        yield ''
+                    continue
+                swallowing = False
+                body = line.lstrip()
+                if len(body) < len(line):
+                    # Indentation swallowed: resumes mid-line, so no match here
+                    yield body
+                    continue
+
+            if line.startswith('|'):
+                if not is_last and self.PIPE_ONLY_PATTERN.fullmatch(line):
+                    counts['pipe_line_numbers'] += 1
+                    swallowing = True
+                    continue
+                line, pipe_count = self.PIPE_PATTERN.subn('', line)
+                counts['pipe_line_numbers'] += pipe_count
+            yield line
+
+    def summarize(self, counts: Counter) -> tuple[int, dict[str, Any]]:
+        metadata = {
+            'start_line_numbers': counts['start_line_numbers'],
+            'end_line_numbers': counts['end_line_numbers'],
+            'pipe_line_numbers': counts['pipe_line_numbers'],
+        }
+        return sum(metadata.values()), metadata
@@ -9,14 +9,21 @@ Handles various formats:
 - "Q:" / "A:"
 - "Q " / "A " (space only)
 - All followed by the actual question/answer text
+
+Works line by line, so it can run as a streaming pipeline stage.
+A bare marker line ("Q." with the question on the next line) is
+joined to the following text, as a whole-document regex would.
 """
 
 import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import Any
 
-from src.preprocessing.base import BasePreprocessor, PreprocessingResult
+from src.preprocessing.base import LinePreprocessor, iter_with_last
 
 
-class QAConverter(BasePreprocessor):
+class QAConverter(LinePreprocessor):
     """
     Converts Q./A. notation to readable format.
 
@@ -55,45 +62,134 @@ class QAConverter(BasePreprocessor):
         re.MULTILINE
     )
 
-    def process(self, text: str) -> PreprocessingResult:
+    # A line holding nothing but a Q./A. marker. The whitespace after the
+    # marker runs on through the line break, so the text on the next
+    # non-blank line is pulled up after "Question:"/"Answer:"
+    MARKER_ONLY_PATTERN = re.compile(r'(\s*)([QA])([.:])?\s*')
+
+    # Original Q./A. markers, counted for metadata. At the end of a line the
+    # line break is the whitespace after the marker.
+    MARKER_COUNT_PATTERN = re.compile(r'\s*([QA])[.:](\s)?')
+
+    # "BY" or "BY MR." ending a line, whose examiner name may follow on the next line
+    BY_PARTIAL_PATTERN = re.compile(r'\s*BY(?:\s+(?:MR\.|MS\.|MRS\.))?\s*')
+
+    @staticmethod
+    def _replace_qa(match: re.Match) -> str:
+        indent = match.group(1)  # Preserve indentation
+        letter = match.group(2).upper()
+
+        if letter == 'Q':
+            return f"{indent}Question: "
+        else:  # A
+            return f"{indent}Answer: "
+
+    def transform_line(self, line: str, counts: Counter) -> str:
         """
-        Convert Q./A. notation to Question:/Answer: format.
+        Convert a leading Q./A. marker to Question:/Answer:.
 
         Args:
-            text: Input text with Q./A. notation
+            line: Line with optional Q./A. notation
+            counts: Conversions, accumulated over the pass
 
         Returns:
-            PreprocessingResult with converted text
+            Converted line
+        """
+        converted, changes = self.QA_PATTERN.subn(self._replace_qa, line)
+        counts['changes'] += changes
+        return converted
+
+    def transform_lines(self, lines: Iterable[str], counts: Counter) -> Iterator[str]:
+        """
+        Convert markers line by line, joining a bare marker to the next line.
+
+        Gives the same text as QA_PATTERN over the joined document: a line
+        holding only "Q." becomes "Question: " followed by the next
+        non-blank line. When that line was indented it is taken as-is;
+        otherwise it starts a line of its own and is converted too.
+
+        Args:
+            lines: Input lines
+            counts: Conversions and markers, accumulated over the pass
+
+        Yields:
+            Converted lines
         """
-        if not text:
-            return PreprocessingResult(text=text, changes_made=0)
-
-        changes = 0
-        result = text
-
-        def replace_qa(match):
-            nonlocal changes
-            changes += 1
-            indent = match.group(1)  # Preserve indentation
-            letter = match.group(2).upper()
-
-            if letter == 'Q':
-                return f"{indent}Question: "
-            else:  # A
-                return f"{indent}Answer: "
-
-        result = self.QA_PATTERN.sub(replace_qa, result)
-
-        # Optionally format "BY MR./MS." markers
-        # These can stay as-is or be formatted - keeping them helps context
-        by_count = len(self.BY_PATTERN.findall(result))
-
-        return PreprocessingResult(
-            text=result,
-            changes_made=changes,
-            metadata={
-                'questions_converted': sum(1 for m in re.finditer(r'^(\s*)Q[.:]\s', text, re.MULTILINE)),
-                'answers_converted': sum(1 for m in re.finditer(r'^(\s*)A[.:]\s', text, re.MULTILINE)),
-                'examiner_markers': by_count,
-            }
-        )
+        return self._count_examiner_markers(self._convert_lines(lines, counts), counts)
+
+    def _convert_lines(self, lines: Iterable[str], counts: Counter) -> Iterator[str]:
+        """Apply QA_PATTERN, carrying a bare marker over to the next non-blank line."""
+        carry = None  # Converted bare marker waiting for the text that follows it
+        for line, is_last in iter_with_last(lines):
+            marker = self.MARKER_COUNT_PATTERN.match(line)
+            if marker and (marker.group(2) or (marker.end() == len(line) and not is_last)):
+                key = 'questions_converted' if marker.group(1) == 'Q' else 'answers_converted'
+                counts[key] += 1
+
+            prefix = ''
+            if carry is not None:
+                if not line or line.isspace():
+                    # The marker's whitespace swallows blank lines
+                    if is_last:
+                        yield carry
+                    continue
+                body = line.lstrip()
+                if len(body) < len(line):
+                    # Indentation swallowed too: not at a line start, so not converted
+                    yield carry + body
+                    carry = None
+                    continue
+                prefix, carry = carry, None
+
+            bare = self.MARKER_ONLY_PATTERN.fullmatch(line)
+            if bare and not is_last:
+                counts['changes'] += 1
+                carry = prefix + self._replace_qa(bare)
+                continue
+            yield prefix + self.transform_line(line, counts)
+
+    def _count_examiner_markers(self, lines: Iterable[str], counts: Counter) -> Iterator[str]:
+        """Count BY_PATTERN matches in the converted lines, passing the lines through."""
+        partial = None  # "BY"/"BY MR." (plus blank lines) awaiting the rest of the marker
+        swallowing = False  # A marker's trailing whitespace is running on into this line
+        for line in lines:
+            if swallowing:
+                if not line or line.isspace():
+                    yield line
+                    continue
+                swallowing = False
+                if line[0].isspace():
+                    yield line
+                    continue
+
+            if partial is not None:
+                candidate = f"{partial}\n{line}"
+                match = self.BY_PATTERN.match(candidate)
+                if match:
+                    counts['examiner_markers'] += 1
+                    partial = None
+                    swallowing = match.end() == len(candidate)
+                    yield line
+                    continue
+                if self.BY_PARTIAL_PATTERN.fullmatch(candidate):
+                    partial = candidate
+                    yield line
+                    continue
+                partial = None
+
+            # "BY MR./MS." markers stay as-is - keeping them helps context
+            if 'BY' in line:
+                match = self.BY_PATTERN.match(line)
+                if match:
+                    counts['examiner_markers'] += 1
+                    swallowing = match.end() == len(line)
+                elif self.BY_PARTIAL_PATTERN.fullmatch(line):
+                    partial = line
+            yield line
+
+    def summarize(self, counts: Counter) -> tuple[int, dict[str, Any]]:
+        return counts['changes'], {
+            'questions_converted': counts['questions_converted'],
+            'answers_converted': counts['answers_converted'],
+            'examiner_markers': counts['examiner_markers'],
+        }
@@ -13,8 +13,12 @@ Common title page patterns:
 """
 
 import re
+from collections.abc import Iterator
+from itertools import pairwise
+from typing import Any
 
-from src.preprocessing.base import BasePreprocessor, PreprocessingResult
+from src.preprocessing.base import BasePreprocessor, LineStream, PreprocessingResult, iter_lines
+from src.utils.pattern_bank import PatternBank
 
 
 class TitlePageRemover(BasePreprocessor):
@@ -22,9 +26,16 @@ class TitlePageRemover(BasePreprocessor):
     Removes title/cover pages from legal documents.
 
     Strategy:
-    1. Split text into page-like chunks (by form feeds or large gaps)
-    2. Score each chunk for "title page" characteristics
-    3. Remove chunks that score above threshold
+    1. Split text into pages (by the extractor's page offsets if given,
+       otherwise by form feeds or large gaps)
+    2. Score the first pages for "title page" characteristics
+    3. Remove pages that score above threshold
+
+    With page offsets, only the first pages are located and copied for
+    scoring, and the result is the text after the removed pages (a slice),
+    so the cost grows with the first pages rather than the document. In a
+    streaming pipeline the kept pages flow on as lines without the
+    document being rebuilt.
 
     Title pages typically have:
     - Case captions with parties
@@ -92,37 +103,101 @@ class TitlePageRemover(BasePreprocessor):
         (re.compile(r'BY\s+(?:MR\.|MS\.|MRS\.)', re.IGNORECASE), -1),
     ]
 
-    def _split_into_pages(self, text: str) -> list:
+    # Both lists as one bank, with each pattern's points at the same index
+    SCORING_BANK = PatternBank(pattern for pattern, _ in TITLE_PAGE_PATTERNS + CONTENT_PATTERNS)
+    SCORING_POINTS = [points for _, points in TITLE_PAGE_PATTERNS + CONTENT_PATTERNS]
+
+    # Boundaries between pages: form feeds, or large gaps when there are none
+    FORM_FEED_PATTERN = re.compile(r'\f')
+    PAGE_BREAK_PATTERN = re.compile(r'\n{4,}|\n\s*-{10,}\s*\n')
+
+    # Any non-whitespace character (a page without one is blank)
+    NON_SPACE_PATTERN = re.compile(r'\S')
+
+    # Only the first pages are checked - title pages are at the beginning
+    PAGES_TO_ANALYZE = 3
+
+    # Without page breaks, the lines in the first ~2000 chars of a text longer
+    # than 3000 chars are the only title page candidate
+    FALLBACK_MIN_CHARS = 3000
+    FALLBACK_TITLE_CHARS = 2000
+
+    def _offset_spans(self, text: str, page_offsets: list[int]) -> list[tuple[int, int]] | None:
         """
-        Split text into page-like chunks.
+        Locate the first pages from the extractor's page offsets.
 
-        Uses form feed characters if present, otherwise uses
-        large whitespace gaps as page boundaries.
+        Pages are contiguous: each runs up to the next page's start, and a
+        blank page is part of the page before it. Only the first
+        PAGES_TO_ANALYZE pages are located; the rest of the document is one
+        final span.
 
         Args:
             text: Full document text
+            page_offsets: Offset where each page starts
 
         Returns:
-            List of page-like text chunks
+            List of (start, end) offsets, or None if the offsets do not fit the text
         """
-        # Try form feed first
-        if '\f' in text:
-            pages = text.split('\f')
-            return [p for p in pages if p.strip()]
-
-        # Try page break patterns
-        page_break = re.compile(r'\n{4,}|\n\s*-{10,}\s*\n')
-        parts = page_break.split(text)
+        if any(b < a for a, b in pairwise(page_offsets)) or (
+            page_offsets and not 0 <= page_offsets[0] <= page_offsets[-1] <= len(text)
+        ):
+            return None
+
+        spans: list[tuple[int, int]] = []
+        start = 0
+        for offset in page_offsets[1:]:
+            if len(spans) == self.PAGES_TO_ANALYZE:
+                break
+            if offset > start and self.NON_SPACE_PATTERN.search(text, start, offset):
+                spans.append((start, offset))
+                start = offset
+            elif spans:
+                spans[-1] = (spans[-1][0], offset)
+                start = offset
+        if start < len(text) and self.NON_SPACE_PATTERN.search(text, start):
+            spans.append((start, len(text)))
+        elif spans:
+            spans[-1] = (spans[-1][0], len(text))
+        return spans
+
+    def _page_spans(self, text: str) -> tuple[list[tuple[int, int]], str]:
+        """
+        Split text into page-like chunks as (start, end) offsets.
 
-        if len(parts) > 1:
-            return [p for p in parts if p.strip()]
+        Uses form feed characters if present, otherwise uses
+        large whitespace gaps as page boundaries.
 
-        # No clear page breaks - return first ~2000 chars as "title page candidate"
-        # and rest as "content"
-        if len(text) > 3000:
-            return [text[:2000], text[2000:]]
+        Args:
+            text: Full document text
 
-        return [text]
+        Returns:
+            Tuple of (offsets of non-blank chunks, string the chunks are
+            rejoined with)
+        """
+        # Try form feed first, then page break patterns
+        pattern = self.FORM_FEED_PATTERN if '\f' in text else self.PAGE_BREAK_PATTERN
+        boundaries = [match.span() for match in pattern.finditer(text)]
+
+        if boundaries:
+            spans = []
+            start = 0
+            for boundary_start, boundary_end in boundaries:
+                spans.append((start, boundary_start))
+                start = boundary_end
+            spans.append((start, len(text)))
+            return [
+                (start, end) for start, end in spans
+                if self.NON_SPACE_PATTERN.search(text, start, end)
+            ], '\n\n'
+
+        # No clear page breaks - the opening lines are the "title page
+        # candidate" and the rest is "content", split at a line break
+        if len(text) > self.FALLBACK_MIN_CHARS:
+            cut = text.find('\n', self.FALLBACK_TITLE_CHARS)
+            if cut >= 0:
+                return [(0, cut), (cut + 1, len(text))], '\n'
+
+        return [(0, len(text))], ''
 
     def _score_page(self, page_text: str) -> int:
         """
@@ -137,17 +212,8 @@ class TitlePageRemover(BasePreprocessor):
         Returns:
             Integer score
         """
-        score = 0
-
-        # Check title page patterns
-        for pattern, points in self.TITLE_PAGE_PATTERNS:
-            if pattern.search(page_text):
-                score += points
-
-        # Check content patterns (reduce score)
-        for pattern, points in self.CONTENT_PATTERNS:
-            if pattern.search(page_text):
-                score += points  # points are negative
+        # Title page patterns add points, content patterns (negative points) reduce them
+        score = sum(self.SCORING_POINTS[index] for index in self.SCORING_BANK.matching(page_text))
 
         # Short pages with high scores are more likely title pages
         if len(page_text.strip()) < 500 and score > 0:
@@ -155,54 +221,120 @@ class TitlePageRemover(BasePreprocessor):
 
         return score
 
-    def process(self, text: str) -> PreprocessingResult:
+    def _plan(
+        self, text: str, page_offsets: list[int] | None = None
+    ) -> tuple[list[tuple[int, int]] | None, str, int, dict[str, Any]]:
         """
-        Remove title pages from text.
+        Decide which pages to keep.
 
         Args:
-            text: Input text potentially containing title pages
+            text: Full document text
+            page_offsets: Offset where each page starts, if known
 
         Returns:
-            PreprocessingResult with cleaned text and metadata
+            Tuple of (offsets of kept pages, or None to keep the text as-is,
+            string the kept pages are joined with, pages removed, metadata)
         """
-        if not text:
-            return PreprocessingResult(text=text, changes_made=0)
-
-        pages = self._split_into_pages(text)
+        pages = self._offset_spans(text, page_offsets) if page_offsets else None
+        if pages is not None:
+            # Real pages are contiguous, so kept pages are runs of the text
+            separator = ''
+            page_count = len(page_offsets)
+            scored = self.PAGES_TO_ANALYZE
+        else:
+            pages, separator = self._page_spans(text)
+            page_count = len(pages)
+            # Without page breaks, the rest of the document is not a page
+            scored = 1 if separator == '\n' else self.PAGES_TO_ANALYZE
 
         # If only one "page", don't remove it
         if len(pages) <= 1:
-            return PreprocessingResult(
-                text=text,
-                changes_made=0,
-                metadata={'pages_analyzed': 1, 'pages_removed': 0}
-            )
+            return None, '', 0, {'pages_analyzed': 1, 'pages_removed': 0}
 
         # Score and filter pages
-        # Only check first 3 pages - title pages are at the beginning
-        kept_pages = []
-        removed_count = 0
+        kept_pages: list[tuple[int, int]] = []
         removed_scores = []
 
-        for i, page in enumerate(pages):
-            if i < 3:  # Only analyze first 3 pages
-                score = self._score_page(page)
+        for i, (start, end) in enumerate(pages):
+            if i < scored:
+                score = self._score_page(text[start:end])
                 if score >= self.REMOVAL_THRESHOLD:
-                    removed_count += 1
                     removed_scores.append(score)
                     continue  # Skip this page
 
-            kept_pages.append(page)
+            if not separator and kept_pages and kept_pages[-1][1] == start:
+                kept_pages[-1] = (kept_pages[-1][0], end)
+            else:
+                kept_pages.append((start, end))
+
+        metadata = {
+            'pages_analyzed': page_count,
+            'pages_removed': len(removed_scores),
+            'removed_scores': removed_scores,
+        }
+        # Only pages split at page breaks are rejoined differently than they were
+        if separator != '\n\n' and not removed_scores:
+            return None, '', 0, metadata
+        return kept_pages, separator, len(removed_scores), metadata
+
+    @staticmethod
+    def _iter_kept_lines(text: str, pages: list[tuple[int, int]], separator: str) -> Iterator[str]:
+        """Lines of separator.join(pages), as splitting the joined text would give."""
+        pieces = []
+        for i, (start, end) in enumerate(pages):
+            if i and separator:
+                pieces.append((separator, 0, len(separator)))
+            pieces.append((text, start, end))
+
+        carry = ''
+        for source, start, end in pieces:
+            lines = iter_lines(source, start, end)
+            pending = carry + next(lines)
+            for line in lines:
+                yield pending
+                pending = line
+            carry = pending
+        yield carry
+
+    def stream(self, lines: LineStream) -> LineStream:
+        # Page detection needs the whole text; free when this is the first stage
+        text = lines.materialize()
+        pages, separator, removed_count, metadata = self._plan(text, lines.page_offsets)
+        if pages is None:
+            return LineStream(
+                lambda counts: iter_lines(text),
+                summarize=lambda counts: (removed_count, metadata),
+                text=text,
+                page_offsets=lines.page_offsets,
+            )
+        return LineStream(
+            lambda counts: self._iter_kept_lines(text, pages, separator),
+            summarize=lambda counts: (removed_count, metadata),
+        )
+
+    def process(self, text: str, page_offsets: list[int] | None = None) -> PreprocessingResult:
+        """
+        Remove title pages from text.
+
+        Args:
+            text: Input text potentially containing title pages
+            page_offsets: Offset where each page starts (the extractor's
+                         'page_offsets'); guessed from page breaks if None
+
+        Returns:
+            PreprocessingResult with cleaned text and metadata
+        """
+        if not text:
+            return PreprocessingResult(text=text, changes_made=0)
+
+        pages, separator, removed_count, metadata = self._plan(text, page_offsets)
 
-        # Rejoin pages
-        result = '\n\n'.join(kept_pages)
+        # Rejoin pages; with page offsets, usually one slice after the title pages
+        if pages is not None:
+            text = separator.join(text[start:end] for start, end in pages)
 
         return PreprocessingResult(
-            text=result,
+            text=text,
             changes_made=removed_count,
-            metadata={
-                'pages_analyzed': len(pages),
-                'pages_removed': removed_count,
-                'removed_scores': removed_scores,
-            }
+            metadata=metadata,
         )
@@ -208,6 +208,41 @@ class ProgressiveSummarizer:
         debug_log(f"Adaptive boundaries: {boundaries}")
         return boundaries
 
+    def _get_pipeline_windows(
+        self,
+        total_chunks: int,
+        batch_boundaries: list[int],
+        window_size: int | None = None
+    ) -> list[list[int]]:
+        """
+        Group chunk numbers into windows that can be summarized concurrently.
+
+        A window never crosses a batch boundary, so every chunk in it sees
+        the progressive summary from the last completed boundary.
+
+        Args:
+            total_chunks: Number of chunks in the document
+            batch_boundaries: Chunk numbers from _get_batch_boundaries()
+            window_size: Most chunks per window (default: fast_mode.pipeline_window)
+
+        Returns:
+            Lists of consecutive chunk numbers (e.g., [[1, 2, 3], [4, 5], [6, 7, 8]])
+        """
+        if window_size is None:
+            window_size = self.config.get('fast_mode', {}).get('pipeline_window', 1)
+        window_size = max(1, int(window_size))
+
+        windows = []
+        current = []
+        for chunk_num in range(1, total_chunks + 1):
+            current.append(chunk_num)
+            if len(current) >= window_size or chunk_num in batch_boundaries:
+                windows.append(current)
+                current = []
+        if current:
+            windows.append(current)
+        return windows
+
     def chunk_document(self, text: str) -> list[Chunk]:
         """
         Chunk a document using the chunking engine.
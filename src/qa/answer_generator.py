@@ -17,6 +17,7 @@ Ollama to be running.
 import re
 from enum import Enum
 
+from src.ai.ollama_scheduler import Priority
 from src.config import (
     DEBUG_MODE,
     QA_MAX_TOKENS,
@@ -168,11 +169,12 @@ class AnswerGenerator:
         prompt = self._build_qa_prompt(question, context)
 
         try:
-            # Generate response
+            # Generate response (interactive lane: jumps ahead of queued batch work)
             response = self.ollama_manager.generate_text(
                 prompt=prompt,
                 max_tokens=QA_MAX_TOKENS,
-                temperature=QA_TEMPERATURE
+                temperature=QA_TEMPERATURE,
+                priority=Priority.INTERACTIVE
             )
 
             if response and response.strip():
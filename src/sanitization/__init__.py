@@ -6,6 +6,18 @@ cleaning up problematic characters introduced during extraction and OCR that
 would otherwise cause issues with AI model processing (Ollama, etc.).
 """
 
-from .character_sanitizer import CharacterSanitizer
+from .character_sanitizer import (
+    SANITIZATION_STAGES,
+    CharacterSanitizer,
+    IncrementalSanitization,
+    SanitizationRecord,
+    summarize_sanitization,
+)
 
-__all__ = ["CharacterSanitizer"]
+__all__ = [
+    "SANITIZATION_STAGES",
+    "CharacterSanitizer",
+    "IncrementalSanitization",
+    "SanitizationRecord",
+    "summarize_sanitization",
+]
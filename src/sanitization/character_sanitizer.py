@@ -15,14 +15,53 @@ Problems addressed:
 
 Uses ftfy for encoding recovery + unicodedata for character classification.
 Optionally uses unidecode for transliteration (ASCII-safe output).
+
+Engine:
+    The text is processed in line-aligned chunks of about SANITIZER_CHUNK_CHARS.
+    Chunks of plain printable ASCII (the bulk of most transcripts) cannot be
+    changed by ftfy, NFKC or unidecode, so they skip those stages entirely.
+    Character removal and space folding run as one str.translate() over a
+    lazily built codepoint table, and whitespace runs are collapsed once over
+    the joined result. Output and stats are identical to the original
+    six-pass implementation (kept as LegacyCharacterSanitizer in
+    tests/legacy_sanitizer.py; see scripts/benchmark_sanitizer.py).
+
+    Texts longer than SANITIZER_PARALLEL_MIN_CHARS are split at line breaks
+    into segments that are sanitized in a process pool (sanitize_segment()).
+    Everything except the positional change counts and newline runs is local
+    to a line, so the stitched result is identical to the serial path.
+    IncrementalSanitization (CharacterSanitizer.begin()) applies the same
+    stitching to a document fed in pieces by the caller.
+
+Audit log:
+    sanitize() formats no log text. get_log() renders a short summary of the
+    last call on demand. With trace=True (default: DEBUG_MODE) each call also
+    records per-stage SanitizationRecords (duration, input/output length,
+    counts); get_records() returns them and summarize_sanitization()
+    aggregates them across a batch.
 """
 
 import re
+import threading
 import time
 import unicodedata
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from operator import ne
 
 import ftfy
 
+from src.config import (
+    DEBUG_MODE,
+    SANITIZER_CHUNK_CHARS,
+    SANITIZER_MAX_WORKERS,
+    SANITIZER_PARALLEL_MIN_CHARS,
+    SANITIZER_PARALLEL_SEGMENT_CHARS,
+    SANITIZER_WORKER_RAM_GB,
+)
+from src.parallel import ExecutorStrategy, ProcessPoolStrategy
+
 try:
     from unidecode import unidecode
     HAS_UNIDECODE = True
@@ -30,6 +69,344 @@ except ImportError:
     HAS_UNIDECODE = False
 
 
+# Bytes that ftfy, NFKC and unidecode never change (tab, newline, printable ASCII).
+# ftfy does strip other control characters, rewrite \r and unescape &amp; etc.
+_PLAIN_ASCII_BYTES = b'\t\n' + bytes(range(0x20, 0x7f))
+_HTML_ENTITY_START = re.compile(r'&[#0-9A-Za-z]')
+
+_REDACTION_CHARS = ('█', '▓', '▒')
+_REDACTION_RUNS = re.compile(r'█{2,}|▓{2,}|▒{2,}')
+
+# Category Cc other than tab/newline: replaced by a space rather than dropped
+_CC_CHARS = re.compile(r'[\x00-\x08\x0b-\x1f\x7f-\x9f]')
+
+# Literal-prefix patterns: faster than ' {2,}' or one alternation of both rules
+_SPACE_RUNS = re.compile(r'  +')
+_NEWLINE_RUNS = re.compile(r'\n\n\n+')
+
+_SPACE_LIKE = '\t\u00a0\u2000\u2001'  # Tab, non-breaking space, en quad, em quad
+
+
+class _CharacterTable(dict):
+    """
+    str.translate() table for problematic characters and space folding.
+
+    Filled lazily, so unicodedata.category() runs once per distinct codepoint
+    instead of once per character. Every C* character except newline and tab
+    is dropped, Cc characters becoming a space; tab and the space-like
+    characters become a plain space. (Private-use, surrogate and zero-width
+    characters are all C* and were always handled by that rule.)
+    """
+
+    def __missing__(self, codepoint: int) -> int | str | None:
+        char = chr(codepoint)
+        if char in _SPACE_LIKE:
+            value = ' '
+        elif char == '\n':
+            value = codepoint
+        else:
+            category = unicodedata.category(char)
+            if category == 'Cc':
+                value = ' '
+            elif category[0] == 'C':
+                value = None
+            else:
+                value = codepoint
+        self[codepoint] = value
+        return value
+
+
+_CHARACTER_TABLE = _CharacterTable()
+
+
+# Longest surplus IncrementalSanitization carries between pieces (see _PositionalDiff)
+_MAX_CARRIED_SHIFT = 1 << 16
+
+
+class _PositionalDiff:
+    """
+    Count positions where two texts differ, feeding them chunk by chunk.
+
+    Equivalent to sum(a != b for a, b in zip(before, after)) over the joined
+    texts. While every chunk pair has equal length the texts stay aligned and
+    only changed chunks are compared. Once a chunk changes length, later
+    chunks are compared shifted, as zip() would: positions both texts have
+    reached are compared as they arrive, and only the longer text's surplus
+    (as long as the net length change so far) is carried to the next add().
+
+    With max_shift set, a surplus longer than that is cut to its newest
+    max_shift characters, so the carried text stays bounded however far the
+    texts drift apart. The count is then approximate: it compares the texts
+    as if they had been realigned at that point.
+    """
+
+    def __init__(self, max_shift: int | None = None):
+        self.count = 0
+        self.max_shift = max_shift
+        self._before = ''
+        self._after = ''
+
+    @property
+    def aligned(self) -> bool:
+        """True while no surplus is carried (unchanged text can be skipped)."""
+        return not self._before and not self._after
+
+    def add(self, before: str, after: str) -> None:
+        if not self.aligned or len(before) != len(after):
+            before, after = self._before + before, self._after + after
+            self.count += sum(map(ne, before, after))
+            common = min(len(before), len(after))
+            self._before, self._after = before[common:], after[common:]
+            if self.max_shift and len(self._before) + len(self._after) > self.max_shift:
+                self._before = self._before[-self.max_shift:]
+                self._after = self._after[-self.max_shift:]
+        elif before is not after and before != after:
+            self.count += sum(map(ne, before, after))
+
+    def total(self) -> int:
+        # zip() stops at the shorter text, so the surplus is never compared
+        self._before = self._after = ''
+        return self.count
+
+
+def _iter_chunks(text: str, chunk_chars: int) -> Iterator[str]:
+    """
+    Split text into chunks that each end just after a newline.
+
+    ftfy fixes text line by line, and nothing after a newline can compose
+    with it under NFKC, so each stage gives the same result chunk by chunk
+    as on the whole text.
+    """
+    start = 0
+    while start < len(text):
+        cut = text.find('\n', start + chunk_chars - 1) + 1
+        if cut == 0:
+            cut = len(text)
+        yield text[start:cut]
+        start = cut
+
+
+def _is_plain_ascii(chunk: str) -> bool:
+    """True if no stage before redaction handling could change the chunk."""
+    return (
+        chunk.isascii()
+        and not chunk.encode('ascii').translate(None, _PLAIN_ASCII_BYTES)
+        and ('&' not in chunk or _HTML_ENTITY_START.search(chunk) is None)
+    )
+
+
+# Stage names used in SanitizationRecords, in pipeline order
+SANITIZATION_STAGES = (
+    'ascii_fast_path',
+    'mojibake',
+    'unicode_normalization',
+    'transliteration',
+    'redactions',
+    'problematic_chars',
+    'whitespace',
+)
+
+
+class _StageClock:
+    """Accumulate [duration_ms, in_len, out_len] per stage while tracing."""
+
+    def __init__(self):
+        self.stages: dict[str, list] = {}
+        self._start = time.perf_counter()
+
+    def reset(self) -> None:
+        self._start = time.perf_counter()
+
+    def lap(self, stage: str, before: str, after: str) -> None:
+        now = time.perf_counter()
+        entry = self.stages.setdefault(stage, [0.0, 0, 0])
+        entry[0] += (now - self._start) * 1000
+        entry[1] += len(before)
+        entry[2] += len(after)
+        self._start = now
+
+
+@dataclass
+class SegmentResult:
+    """
+    Sanitized segment plus what the caller needs to aggregate statistics.
+
+    Attributes:
+        text: Sanitized text (space and newline runs collapsed within the segment)
+        control_removed: Control/format/private-use characters removed or replaced
+        redactions: Redaction block characters seen
+        chunks: Chunks processed
+        fast_chunks: Chunks that took the plain-ASCII fast path
+        changes: (offset, length, fixed, normalized, transliterated) for every
+                 chunk that ftfy, NFKC or unidecode changed, where offset/length
+                 locate the chunk in the input segment and the other fields are
+                 the chunk after stage 1, 2 and 3
+        stages: {stage: [duration_ms, in_len, out_len]} when tracing, else None
+    """
+
+    text: str
+    control_removed: int = 0
+    redactions: int = 0
+    chunks: int = 0
+    fast_chunks: int = 0
+    changes: list[tuple[int, int, str, str, str]] = field(default_factory=list)
+    stages: dict[str, list] | None = None
+
+
+def sanitize_segment(task: tuple[str, bool, int, str | bool, bool]) -> SegmentResult:
+    """
+    Sanitize one line-aligned segment (worker function for parallel mode).
+
+    Module-level so it can be pickled for a ProcessPoolStrategy.
+
+    Args:
+        task: Tuple of (segment, transliterate, chunk_chars, unescape_html, trace).
+              unescape_html is ftfy's setting at the segment start: 'auto', or
+              False once an earlier segment contained '<'. trace enables
+              per-stage timing (SegmentResult.stages).
+
+    Returns:
+        SegmentResult
+    """
+    segment, transliterate, chunk_chars, unescape_html, trace = task
+    result = SegmentResult(text='')
+    clock = _StageClock() if trace else None
+    cleaned_chunks = []
+    offset = 0
+
+    for chunk in _iter_chunks(segment, chunk_chars):
+        result.chunks += 1
+        if clock:
+            clock.reset()
+        if _is_plain_ascii(chunk):
+            result.fast_chunks += 1
+            cleaned = chunk.replace('\t', ' ')
+            if clock:
+                clock.lap('ascii_fast_path', chunk, cleaned)
+        else:
+            fixed = ftfy.fix_text(chunk, unescape_html=unescape_html)
+            if clock:
+                clock.lap('mojibake', chunk, fixed)
+            normalized = unicodedata.normalize('NFKC', fixed)
+            if clock:
+                clock.lap('unicode_normalization', fixed, normalized)
+            text = normalized
+            if transliterate:
+                text = unidecode(normalized)
+                if clock:
+                    clock.lap('transliteration', normalized, text)
+            if not (fixed == chunk and normalized == chunk and text == chunk):
+                result.changes.append((offset, len(chunk), fixed, normalized, text))
+
+            chunk_redactions = sum(text.count(char) for char in _REDACTION_CHARS)
+            if chunk_redactions:
+                result.redactions += chunk_redactions
+                redacted = _REDACTION_RUNS.sub(' [REDACTED] ', text)
+            else:
+                redacted = text
+            if clock:
+                clock.lap('redactions', text, redacted)
+
+            cleaned = redacted.translate(_CHARACTER_TABLE)
+            result.control_removed += (
+                len(redacted) - len(cleaned) + len(_CC_CHARS.findall(redacted))
+            )
+            if clock:
+                clock.lap('problematic_chars', redacted, cleaned)
+        cleaned_chunks.append(cleaned)
+
+        # ftfy stops unescaping HTML entities for the rest of a text once a line contains '<'
+        if unescape_html and '<' in chunk:
+            unescape_html = False
+        offset += len(chunk)
+
+    if clock:
+        clock.reset()
+    joined = ''.join(cleaned_chunks)
+    result.text = _NEWLINE_RUNS.sub('\n\n', _SPACE_RUNS.sub(' ', joined))
+    if clock:
+        clock.lap('whitespace', joined, result.text)
+        result.stages = clock.stages
+    return result
+
+
+@dataclass
+class SanitizationRecord:
+    """
+    Structured trace of one sanitization stage (or 'total') for one sanitize() call.
+
+    Attributes:
+        stage: One of SANITIZATION_STAGES, or 'total' for the whole call
+        duration_ms: Time spent in the stage (summed over chunks and segments;
+                     worker time in parallel mode)
+        in_len: Characters the stage received
+        out_len: Characters the stage produced
+        counts: Stage-specific counters (e.g. {'mojibake_fixed': 3})
+    """
+
+    stage: str
+    duration_ms: float
+    in_len: int
+    out_len: int
+    counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def delta(self) -> int:
+        """Change in length (out_len - in_len)."""
+        return self.out_len - self.in_len
+
+
+# Stats keys reported on each stage's record
+_STAGE_COUNTS = {
+    'mojibake': ('mojibake_fixed',),
+    'transliteration': ('transliterations',),
+    'redactions': ('redactions_replaced',),
+    'problematic_chars': ('control_chars_removed', 'private_use_removed'),
+}
+
+
+def _empty_stats() -> dict[str, int]:
+    """The stats dict returned by sanitize(), with every count at zero."""
+    return {
+        "chars_removed": 0,
+        "mojibake_fixed": 0,
+        "control_chars_removed": 0,
+        "redactions_replaced": 0,
+        "private_use_removed": 0,
+        "transliterations": 0,
+    }
+
+
+def summarize_sanitization(records: Iterable[SanitizationRecord]) -> dict[str, dict]:
+    """
+    Aggregate SanitizationRecords, e.g. from every document of a batch.
+
+    Args:
+        records: Records from CharacterSanitizer.get_records() of any number of calls
+
+    Returns:
+        {stage: {'calls', 'duration_ms', 'in_len', 'out_len', <summed counts>}}
+        in pipeline order, with 'total' last
+    """
+    summary: dict[str, dict] = {}
+    for record in records:
+        entry = summary.setdefault(
+            record.stage, {'calls': 0, 'duration_ms': 0.0, 'in_len': 0, 'out_len': 0}
+        )
+        entry['calls'] += 1
+        entry['duration_ms'] += record.duration_ms
+        entry['in_len'] += record.in_len
+        entry['out_len'] += record.out_len
+        for name, value in record.counts.items():
+            entry[name] = entry.get(name, 0) + value
+
+    order = SANITIZATION_STAGES + ('total',)
+    return {
+        stage: summary[stage]
+        for stage in sorted(summary, key=lambda s: order.index(s) if s in order else len(order))
+    }
+
+
 class CharacterSanitizer:
     """
     Sanitize text for reliable AI model processing.
@@ -38,13 +415,26 @@ class CharacterSanitizer:
     1. Fix mojibake using ftfy
     2. Normalize Unicode (NFKC form)
     3. Transliterate stray accents (optional, requires unidecode)
-    4. Remove/replace control characters
-    5. Handle redacted characters
-    6. Clean up private-use Unicode
-    7. Normalize whitespace
+    4. Handle redacted characters
+    5. Remove/replace control, format and private-use characters
+    6. Normalize whitespace
     """
 
-    def __init__(self, preserve_newlines: bool = True, transliterate: bool = True):
+    # Bump whenever sanitized output changes for the same input
+    # (invalidates cached extraction results)
+    VERSION = 1
+
+    def __init__(
+        self,
+        preserve_newlines: bool = True,
+        transliterate: bool = True,
+        chunk_chars: int = SANITIZER_CHUNK_CHARS,
+        max_workers: int | None = None,
+        strategy: ExecutorStrategy | None = None,
+        parallel_min_chars: int = SANITIZER_PARALLEL_MIN_CHARS,
+        segment_chars: int = SANITIZER_PARALLEL_SEGMENT_CHARS,
+        trace: bool | None = None,
+    ):
         """
         Initialize the sanitizer.
 
@@ -52,16 +442,45 @@ class CharacterSanitizer:
             preserve_newlines: If True, keep actual newlines. If False, replace with spaces.
             transliterate: If True (default), convert accented chars (é/ê) to ASCII equivalents.
                          Requires 'unidecode' library. Falls back to ftfy if unavailable.
+            chunk_chars: Approximate chunk size; the ASCII fast path is decided per chunk.
+            max_workers: Worker processes for long texts. Defaults to
+                        get_optimal_workers(SANITIZER_WORKER_RAM_GB, SANITIZER_MAX_WORKERS);
+                        1 disables parallel mode.
+            strategy: ExecutorStrategy to use instead of a ProcessPoolStrategy
+                     (e.g. SequentialStrategy for tests); enables parallel mode even
+                     with one worker. Not shut down by the sanitizer.
+            parallel_min_chars: Texts at least this long are sanitized in parallel segments
+            segment_chars: Approximate segment size in parallel mode
+            trace: Record per-stage SanitizationRecords (see get_records()).
+                  Defaults to DEBUG_MODE; when off, sanitize() formats no log text.
         """
         self.preserve_newlines = preserve_newlines
         self.transliterate = transliterate and HAS_UNIDECODE
-        self.sanitization_log = []
+        self.chunk_chars = max(1, chunk_chars)
+        self.parallel_min_chars = parallel_min_chars
+        self.segment_chars = max(self.chunk_chars, segment_chars)
+        self._strategy = strategy
+        self._max_workers = strategy.max_workers if strategy is not None else max_workers
+        self.trace = DEBUG_MODE if trace is None else trace
+        # Last call's summary/records, per thread: one sanitizer is shared by
+        # RawTextExtractor across ProcessingWorker threads
+        self._last = threading.local()
+
+    @property
+    def max_workers(self) -> int:
+        """Worker processes for parallel mode (resolved on first use)."""
+        if self._max_workers is None:
+            from src.system_resources import get_optimal_workers
+            self._max_workers = get_optimal_workers(
+                task_ram_gb=SANITIZER_WORKER_RAM_GB, max_workers=SANITIZER_MAX_WORKERS
+            )
+        return max(1, self._max_workers)
 
     def sanitize(self, text: str) -> tuple[str, dict]:
         """
         Sanitize text and return cleaned text + statistics.
 
-        6-stage pipeline with comprehensive logging:
+        Stages (applied per chunk, ASCII chunks skipping 1-3):
         1. Fix mojibake using ftfy
         2. Normalize Unicode (NFKC form)
         3. Transliterate stray accents (optional, requires unidecode)
@@ -81,293 +500,229 @@ class CharacterSanitizer:
             - private_use_removed: Count of private-use chars removed
             - transliterations: Count of accented chars converted to ASCII
         """
-        self.sanitization_log = []
-        stats = {
-            "chars_removed": 0,
-            "mojibake_fixed": 0,
-            "control_chars_removed": 0,
-            "redactions_replaced": 0,
-            "private_use_removed": 0,
-            "transliterations": 0,
+        stats = _empty_stats()
+
+        start = time.perf_counter()
+        segments = self._split_segments(text)
+        tasks, _ = self._segment_tasks(segments, 'auto')
+        results, cleaned_text, seam_ms = self._run_segments(tasks)
+
+        mojibake, transliterations = _PositionalDiff(), _PositionalDiff()
+        self._add_positional_changes(segments, results, mojibake, transliterations)
+        stats["mojibake_fixed"] = mojibake.total()
+        stats["transliterations"] = transliterations.total() if self.transliterate else 0
+        stats["redactions_replaced"] = sum(r.redactions for r in results)
+        stats["control_chars_removed"] = sum(r.control_removed for r in results)
+        stats["chars_removed"] = stats["control_chars_removed"]
+
+        # Kept unformatted; get_log() renders it only when asked
+        summary = {
+            'duration_ms': (time.perf_counter() - start) * 1000,
+            'in_len': len(text),
+            'out_len': len(cleaned_text),
+            'segments': len(segments),
+            'chunks': sum(r.chunks for r in results),
+            'fast_chunks': sum(r.fast_chunks for r in results),
+            'stats': stats.copy(),
         }
+        self._last.summary = summary
+        self._last.records = self._build_records(summary, results, seam_ms) if self.trace else []
 
-        # Stage 1: Fix mojibake (encoding corruption)
-        self._log("Stage 1: Mojibake recovery (ftfy)")
-        start = time.time()
-        original_len = len(text)
-        try:
-            text, mojibake_count = self._fix_mojibake(text)
-            stats["mojibake_fixed"] = mojibake_count
-            duration = time.time() - start
-            self._log(f"  ✅ SUCCESS ({duration:.3f}s) - Fixed {mojibake_count} chars")
-            self._log(f"     Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
-        except Exception as e:
-            duration = time.time() - start
-            self._log(f"  ❌ FAILED ({duration:.3f}s) - {type(e).__name__}: {str(e)}")
-            raise
-
-        # Stage 2: Normalize Unicode (NFKC form)
-        self._log("Stage 2: Unicode normalization (NFKC)")
-        start = time.time()
-        original_len = len(text)
-        try:
-            text = self._normalize_unicode(text)
-            duration = time.time() - start
-            self._log(f"  ✅ SUCCESS ({duration:.3f}s)")
-            self._log(f"     Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
-        except Exception as e:
-            duration = time.time() - start
-            self._log(f"  ❌ FAILED ({duration:.3f}s) - {type(e).__name__}: {str(e)}")
-            raise
-
-        # Stage 3: Transliterate stray accents (ê → e, é → e, etc.)
-        if self.transliterate:
-            self._log("Stage 3: Transliteration (accent conversion)")
-            start = time.time()
-            original_len = len(text)
-            try:
-                text, trans_count = self._transliterate_text(text)
-                stats["transliterations"] = trans_count
-                duration = time.time() - start
-                self._log(f"  ✅ SUCCESS ({duration:.3f}s) - Transliterated {trans_count} chars")
-                self._log(f"     Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
-            except Exception as e:
-                duration = time.time() - start
-                self._log(f"  ❌ FAILED ({duration:.3f}s) - {type(e).__name__}: {str(e)}")
-                raise
-        else:
-            self._log("Stage 3: Transliteration (SKIPPED - disabled)")
+        return cleaned_text, stats
 
-        # Stage 4: Handle redacted characters (██ → [REDACTED])
-        self._log("Stage 4: Redaction handling")
-        start = time.time()
-        original_len = len(text)
-        try:
-            text, redactions = self._handle_redactions(text)
-            stats["redactions_replaced"] = redactions
-            duration = time.time() - start
-            self._log(f"  ✅ SUCCESS ({duration:.3f}s) - Replaced {redactions} redaction chars")
-            self._log(f"     Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
-        except Exception as e:
-            duration = time.time() - start
-            self._log(f"  ❌ FAILED ({duration:.3f}s) - {type(e).__name__}: {str(e)}")
-            raise
-
-        # Stage 5: Remove/replace problematic characters
-        self._log("Stage 5: Problematic character removal")
-        start = time.time()
-        original_len = len(text)
-        try:
-            text, removed, control_removed, private_use = self._clean_problematic_chars(text)
-            stats["control_chars_removed"] = control_removed
-            stats["private_use_removed"] = private_use
-            duration = time.time() - start
-            self._log(f"  ✅ SUCCESS ({duration:.3f}s) - Removed {control_removed} control + {private_use} private-use chars")
-            self._log(f"     Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
-        except Exception as e:
-            duration = time.time() - start
-            self._log(f"  ❌ FAILED ({duration:.3f}s) - {type(e).__name__}: {str(e)}")
-            raise
-
-        # Stage 6: Clean up excessive whitespace
-        self._log("Stage 6: Whitespace normalization")
-        start = time.time()
-        original_len = len(text)
-        try:
-            text = self._clean_whitespace(text)
-            duration = time.time() - start
-            self._log(f"  ✅ SUCCESS ({duration:.3f}s)")
-            self._log(f"     Input: {original_len} | Output: {len(text)} | Delta: {len(text) - original_len:+d}")
-        except Exception as e:
-            duration = time.time() - start
-            self._log(f"  ❌ FAILED ({duration:.3f}s) - {type(e).__name__}: {str(e)}")
-            raise
-
-        stats["chars_removed"] = removed + control_removed + private_use
+    def begin(self) -> 'IncrementalSanitization':
+        """Start sanitizing one document piece by piece (see IncrementalSanitization)."""
+        return IncrementalSanitization(self)
 
-        return text, stats
+    def _split_segments(self, text: str) -> list[str]:
+        """Split text into line-aligned segments when it is long enough for parallel mode."""
+        parallel = self._strategy is not None or self.max_workers > 1
+        if parallel and len(text) >= self.parallel_min_chars:
+            return list(_iter_chunks(text, self.segment_chars))
+        return [text]
 
-    def _fix_mojibake(self, text: str) -> tuple[str, int]:
+    def _segment_tasks(
+        self, segments: list[str], unescape_html: str | bool
+    ) -> tuple[list[tuple], str | bool]:
         """
-        Fix mojibake (encoding corruption) using ftfy.
+        Build sanitize_segment() tasks, carrying ftfy's HTML setting across segments.
 
-        Examples:
-            'ñêcessary' → 'necessary'
-            'dccedêñt' → 'decedent'
-            'Defeñdañt' → 'Defendant'
+        Returns:
+            (tasks, unescape_html) where unescape_html is the setting after the last segment
         """
-        original = text
-        text = ftfy.fix_text(text)
-
-        # Count changes by comparing character counts
-        # Note: ftfy might also add/remove chars, so count actual mojibake fixes
-        # strict=False: strings may have different lengths after ftfy processing
-        fixes = sum(1 for a, b in zip(original, text, strict=False) if a != b)
-
-        if fixes > 0:
-            self._log(f"Fixed {fixes} mojibake/encoding corruption characters")
-
-        return text, fixes
-
-    def _normalize_unicode(self, text: str) -> str:
+        tasks = []
+        for segment in segments:
+            tasks.append((segment, self.transliterate, self.chunk_chars, unescape_html, self.trace))
+            if unescape_html and '<' in segment:
+                unescape_html = False
+        return tasks, unescape_html
+
+    def _run_segments(self, tasks: list[tuple]) -> tuple[list[SegmentResult], str, float]:
         """
-        Normalize Unicode to NFKC form.
+        Sanitize the segments (in parallel if there is more than one) and stitch them.
 
-        NFKC (Compatibility Decomposition + Canonical Composition):
-        - Decomposes characters to base forms
-        - Recomposes into canonical form
-        - Handles ligatures, superscripts, etc.
+        Returns:
+            (results, cleaned_text, seam_ms)
         """
-        original_len = len(text)
-        text = unicodedata.normalize('NFKC', text)
-
-        if len(text) != original_len:
-            self._log(f"Unicode normalization: {original_len} → {len(text)} chars")
+        if len(tasks) <= 1:
+            results = [sanitize_segment(task) for task in tasks]
+            return results, results[0].text if results else '', 0.0
 
-        return text
+        results = self._sanitize_parallel(tasks)
+        seam_start = time.perf_counter()
+        # A run of blank lines may straddle two segments
+        cleaned_text = _NEWLINE_RUNS.sub('\n\n', ''.join(r.text for r in results))
+        return results, cleaned_text, (time.perf_counter() - seam_start) * 1000
 
-    def _transliterate_text(self, text: str) -> tuple[str, int]:
+    def _sanitize_parallel(self, tasks: list[tuple]) -> list[SegmentResult]:
         """
-        Transliterate accented characters to ASCII equivalents.
-
-        Examples:
-            'ñêcessary' → 'necessary' (both ñ and ê become their base forms)
-            'locãted' → 'located'
-            'dccedêñt' → 'dccedent'
+        Sanitize segments in worker processes, returning results in input order.
 
-        This fixes corruption where OCR/extraction introduces stray accents.
-        Uses unidecode to convert all accented chars to ASCII.
+        At most two segments per worker are queued at a time, bounding how
+        many pickled segment copies exist at once.
         """
-        if not HAS_UNIDECODE:
-            return text, 0
+        strategy = self._strategy
+        owns_strategy = strategy is None
+        if owns_strategy:
+            strategy = ProcessPoolStrategy(self.max_workers)
 
-        original = text
-        text = unidecode(text)
+        results: list[SegmentResult | None] = [None] * len(tasks)
+        pending: dict[Future, int] = {}
+        max_in_flight = self.max_workers * 2
 
-        # Count changes (strict=False: unidecode may change string length)
-        transliterations = sum(1 for a, b in zip(original, text, strict=False) if a != b)
+        def collect(done: set[Future]):
+            for future in done:
+                results[pending.pop(future)] = future.result()
 
-        if transliterations > 0:
-            self._log(f"Transliterated {transliterations} accented characters to ASCII")
-
-        return text, transliterations
-
-    def _handle_redactions(self, text: str) -> tuple[str, int]:
+        try:
+            for index, task in enumerate(tasks):
+                while len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[strategy.submit(sanitize_segment, task)] = index
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        finally:
+            if owns_strategy:
+                strategy.shutdown(wait=True, cancel_futures=True)
+
+        return results
+
+    def _add_positional_changes(
+        self,
+        segments: list[str],
+        results: list[SegmentResult],
+        mojibake: _PositionalDiff,
+        transliterations: _PositionalDiff,
+    ) -> None:
         """
-        Replace redacted characters (██) with [REDACTED] marker.
+        Feed the segments' mojibake and transliteration changes to the counters.
 
-        Common redaction patterns:
-        - ██ (U+2588 FULL BLOCK repeated)
-        - ▓▓ (U+2593 DARK SHADE repeated)
-        - ████ (longer sequences)
+        Both counts compare each stage's input and output position by position,
+        so a length change in one chunk shifts every later comparison. The
+        chunks each segment reported as changed are replayed in order, and
+        unchanged text is only fed in once an earlier change has shifted
+        the alignment.
         """
-        original = text
-
-        # Replace sequences of redaction blocks with marker
-        text = re.sub(r'(█{2,})', ' [REDACTED] ', text)
-        text = re.sub(r'(▓{2,})', ' [REDACTED] ', text)
-        text = re.sub(r'(▒{2,})', ' [REDACTED] ', text)
+        for segment, result in zip(segments, results, strict=True):
+            position = 0
+            for offset, length, fixed, normalized, transliterated in result.changes:
+                self._add_unchanged(segment, position, offset, mojibake, transliterations)
+                mojibake.add(segment[offset:offset + length], fixed)
+                transliterations.add(normalized, transliterated)
+                position = offset + length
+            self._add_unchanged(segment, position, len(segment), mojibake, transliterations)
 
-        redactions = original.count('█') + original.count('▓') + original.count('▒')
-
-        if redactions > 0:
-            self._log(f"Replaced {redactions} redaction characters with [REDACTED] markers")
-
-        return text, redactions
+    @staticmethod
+    def _add_unchanged(
+        segment: str, start: int, end: int, *counters: _PositionalDiff
+    ) -> None:
+        """Feed text no stage changed to counters that are no longer aligned."""
+        if start >= end:
+            return
+        shifted = [counter for counter in counters if not counter.aligned]
+        if shifted:
+            unchanged = segment[start:end]
+            for counter in shifted:
+                counter.add(unchanged, unchanged)
 
-    def _clean_problematic_chars(self, text: str) -> tuple[str, int, int, int]:
+    @staticmethod
+    def _build_records(
+        summary: dict, results: list[SegmentResult], seam_ms: float
+    ) -> list[SanitizationRecord]:
+        """Merge per-segment stage timings into one record per stage, plus 'total'."""
+        stats = summary['stats']
+        merged: dict[str, list] = {}
+        for result in results:
+            for stage, (duration_ms, in_len, out_len) in (result.stages or {}).items():
+                entry = merged.setdefault(stage, [0.0, 0, 0])
+                entry[0] += duration_ms
+                entry[1] += in_len
+                entry[2] += out_len
+        if 'whitespace' in merged:
+            merged['whitespace'][0] += seam_ms
+            merged['whitespace'][2] = summary['out_len']
+
+        records = []
+        for stage in SANITIZATION_STAGES:
+            if stage not in merged:
+                continue
+            duration_ms, in_len, out_len = merged[stage]
+            counts = {name: stats[name] for name in _STAGE_COUNTS.get(stage, ())}
+            if stage == 'ascii_fast_path':
+                counts['chunks'] = summary['fast_chunks']
+            records.append(SanitizationRecord(stage, duration_ms, in_len, out_len, counts))
+
+        records.append(SanitizationRecord(
+            'total', summary['duration_ms'], summary['in_len'], summary['out_len'],
+            {**stats, 'segments': summary['segments'], 'chunks': summary['chunks']},
+        ))
+        return records
+
+    def get_records(self) -> list[SanitizationRecord]:
         """
-        Remove or replace problematic characters.
+        Return the stage records of this thread's last sanitize() call.
 
-        Returns:
-            (cleaned_text, other_replaced_count, control_removed_count, private_use_count)
+        Empty unless tracing is enabled. Aggregate records of many calls
+        with summarize_sanitization().
         """
-        cleaned = []
-        control_removed = 0
-        private_use_removed = 0
-        other_replaced = 0
-
-        for char in text:
-            category = unicodedata.category(char)
-
-            # Control characters (C* category)
-            if category[0] == 'C':
-                # Special handling for newlines and tabs (preserve if desired)
-                if char in '\n\t':
-                    # Keep newlines/tabs, they're useful for structure
-                    cleaned.append(char)
-                else:
-                    # Remove other control chars (spaces, format chars, etc.)
-                    control_removed += 1
-
-                    # Replace with space for readability (except for invisible chars)
-                    if category == 'Cc':  # Control characters
-                        cleaned.append(' ')
-                    # Skip format characters (Cf) entirely
-                    # Skip other C-category chars entirely
-
-            # Private-use characters (Co category)
-            elif category == 'Co':
-                private_use_removed += 1
-                cleaned.append(' ')
-
-            # Surrogate characters (Cs category) - malformed UTF-8
-            elif category == 'Cs':
-                private_use_removed += 1
-                cleaned.append('?')
-
-            # Other problematic characters
-            # Zero-width characters, combining marks that appear corrupted
-            elif char in '\u200b\u200c\u200d\ufeff':  # Zero-width space, ZWJ, BOM, etc.
-                other_replaced += 1
-                cleaned.append(' ')
-
-            # Keep everything else
-            else:
-                cleaned.append(char)
-
-        text = ''.join(cleaned)
+        return list(getattr(self._last, 'records', []))
 
-        if control_removed > 0:
-            self._log(f"Removed {control_removed} control characters")
-        if private_use_removed > 0:
-            self._log(f"Removed {private_use_removed} private-use/surrogate characters")
-        if other_replaced > 0:
-            self._log(f"Replaced {other_replaced} zero-width characters with spaces")
-
-        return text, other_replaced, control_removed, private_use_removed
-
-    def _clean_whitespace(self, text: str) -> str:
+    def get_log(self) -> list[str]:
         """
-        Clean up excessive whitespace while preserving document structure.
+        Return a readable log of this thread's last sanitize() call.
 
-        - Replace multiple spaces with single space
-        - Replace multiple blank lines with double newline (paragraph break)
-        - Preserve leading/trailing newlines for document integrity
+        Formatted on demand from the call's summary (and its stage records
+        when tracing), so nothing is formatted unless this is called.
         """
-        # Replace tabs with spaces
-        text = text.replace('\t', ' ')
-
-        # Replace non-breaking spaces and similar with regular spaces
-        text = text.replace('\u00a0', ' ')  # Non-breaking space
-        text = text.replace('\u2000', ' ')  # En quad
-        text = text.replace('\u2001', ' ')  # Em quad
-
-        # Clean up multiple spaces (but not newlines)
-        text = re.sub(r' {2,}', ' ', text)
-
-        # Clean up multiple blank lines (preserve max 2 newlines = 1 blank line)
-        text = re.sub(r'\n{3,}', '\n\n', text)
-
-        return text
-
-    def _log(self, message: str) -> None:
-        """Log sanitization actions for debugging."""
-        self.sanitization_log.append(message)
-
-    def get_log(self) -> list[str]:
-        """Return the sanitization log."""
-        return self.sanitization_log.copy()
+        summary = getattr(self._last, 'summary', None)
+        if summary is None:
+            return []
+
+        stats = summary['stats']
+        chunks = summary['chunks']
+        lines = [
+            f"Sanitized {chunks} chunks in {summary['segments']} segment(s) in "
+            f"{summary['duration_ms'] / 1000:.3f}s ({summary['fast_chunks']} plain ASCII, "
+            f"{chunks - summary['fast_chunks']} full pipeline)",
+            f"  Input: {summary['in_len']} | Output: {summary['out_len']} | "
+            f"Delta: {summary['out_len'] - summary['in_len']:+d}",
+        ]
+        for record in self.get_records():
+            if record.stage != 'total':
+                lines.append(f"  {record.stage}: {record.duration_ms:.1f}ms, "
+                             f"{record.in_len} → {record.out_len} chars ({record.delta:+d})")
+        if stats["mojibake_fixed"]:
+            lines.append(f"Fixed {stats['mojibake_fixed']} mojibake/encoding corruption characters")
+        if stats["transliterations"]:
+            lines.append(f"Transliterated {stats['transliterations']} accented characters to ASCII")
+        if stats["redactions_replaced"]:
+            lines.append(f"Replaced {stats['redactions_replaced']} redaction characters with [REDACTED] markers")
+        if stats["control_chars_removed"]:
+            lines.append(f"Removed {stats['control_chars_removed']} control characters")
+        return lines
 
     @staticmethod
     def example_usage() -> None:
@@ -395,3 +750,80 @@ class CharacterSanitizer:
         # Use cleaned text for AI processing
         summary = ollama_model.generate(cleaned_text)
         """)
+
+
+class IncrementalSanitization:
+    """
+    Sanitize one document fed in consecutive line-aligned pieces.
+
+    For callers that never hold the whole document, like RawTextExtractor's
+    windowed TXT/RTF path. The pieces are treated as joined by newlines:
+    feed() returns each piece sanitized, and stats() reports what sanitize()
+    would for the joined text. Summing each piece's stats would not match,
+    because the positional mojibake and transliteration counts shift once a
+    fix changes the text's length. Only the net length change is carried
+    between pieces, capped at _MAX_CARRIED_SHIFT characters; beyond that the
+    two counts are approximate. Joining the pieces is left to the caller,
+    so a run of blank lines split across a join is not collapsed.
+
+    Example:
+        incremental = sanitizer.begin()
+        text = '\\n'.join(incremental.feed(window) for window in windows)
+        stats = incremental.stats()
+    """
+
+    def __init__(self, sanitizer: CharacterSanitizer):
+        """
+        Args:
+            sanitizer: CharacterSanitizer whose settings and workers are used
+        """
+        self._sanitizer = sanitizer
+        self._mojibake = _PositionalDiff(max_shift=_MAX_CARRIED_SHIFT)
+        self._transliterations = _PositionalDiff(max_shift=_MAX_CARRIED_SHIFT)
+        self._unescape_html: str | bool = 'auto'
+        self._redactions = 0
+        self._control_removed = 0
+        self._started = False
+
+    def feed(self, piece: str) -> str:
+        """
+        Sanitize the next piece of the document.
+
+        Args:
+            piece: Text following the previous piece after a newline
+
+        Returns:
+            The piece sanitized
+        """
+        sanitizer = self._sanitizer
+        if self._started:
+            # The joining newline, which no stage changes
+            sanitizer._add_unchanged('\n', 0, 1, self._mojibake, self._transliterations)
+        self._started = True
+
+        segments = sanitizer._split_segments(piece)
+        tasks, self._unescape_html = sanitizer._segment_tasks(segments, self._unescape_html)
+        results, cleaned_text, _ = sanitizer._run_segments(tasks)
+
+        sanitizer._add_positional_changes(
+            segments, results, self._mojibake, self._transliterations
+        )
+        self._redactions += sum(r.redactions for r in results)
+        self._control_removed += sum(r.control_removed for r in results)
+        return cleaned_text
+
+    def stats(self) -> dict[str, int]:
+        """
+        Stats for the whole document, as sanitize() reports them for the joined text.
+
+        Call once, after the last piece has been fed.
+        """
+        stats = _empty_stats()
+        stats["mojibake_fixed"] = self._mojibake.total()
+        stats["transliterations"] = (
+            self._transliterations.total() if self._sanitizer.transliterate else 0
+        )
+        stats["redactions_replaced"] = self._redactions
+        stats["control_chars_removed"] = self._control_removed
+        stats["chars_removed"] = self._control_removed
+        return stats
@@ -28,25 +28,53 @@ Usage:
         max_words=200
     )
     print(result.summary)
+
+    # Or, from a coroutine running alongside other documents:
+    result = await summarizer.asummarize(text, "complaint.pdf")
 """
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, TypeVar
 
+from src.ai.ollama_model_manager import GenerationCancelled
+from src.ai.ollama_scheduler import get_ollama_scheduler
 from src.logging_config import debug_log, error, info
 from src.progressive_summarizer import ProgressiveSummarizer
 
 from .result_types import DocumentSummaryResult
 
+T = TypeVar('T')
+
 if TYPE_CHECKING:
     from src.ai.ollama_model_manager import OllamaModelManager
     from src.prompting import PromptAdapter
 
 
+async def _gather_or_cancel(coros: Iterable[Awaitable[T]]) -> list[T]:
+    """
+    Await coroutines concurrently, cancelling the rest if one raises.
+
+    Plain asyncio.gather() leaves the others running after the first error,
+    holding scheduler slots and Ollama compute for results nobody reads.
+    The first exception is re-raised as is, once the others have unwound.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 class DocumentSummarizer(ABC):
     """
     Abstract base class for document summarization.
@@ -63,7 +91,8 @@ class DocumentSummarizer(ABC):
         filename: str,
         max_words: int = 200,
         progress_callback: Callable[[int, str], None] | None = None,
-        stop_check: Callable[[], bool] | None = None
+        stop_check: Callable[[], bool] | None = None,
+        partial_callback: Callable[[str], None] | None = None
     ) -> DocumentSummaryResult:
         """
         Summarize a single document.
@@ -74,12 +103,41 @@ class DocumentSummarizer(ABC):
             max_words: Target word count for the final summary.
             progress_callback: Optional callback(percent, message) for progress updates.
             stop_check: Optional callable that returns True if processing should stop.
+            partial_callback: Optional callback(token) receiving the final summary
+                            as it is generated, for live display.
 
         Returns:
             DocumentSummaryResult with the summary and metadata.
         """
         pass
 
+    async def asummarize(
+        self,
+        text: str,
+        filename: str,
+        max_words: int = 200,
+        progress_callback: Callable[[int, str], None] | None = None,
+        stop_check: Callable[[], bool] | None = None,
+        partial_callback: Callable[[str], None] | None = None
+    ) -> DocumentSummaryResult:
+        """
+        Async version of summarize().
+
+        The default runs the blocking summarize() in a worker thread so any
+        implementation can be awaited. Implementations that generate through
+        the model manager's async API should override this instead.
+
+        Args:
+            Same as summarize().
+
+        Returns:
+            DocumentSummaryResult with the summary and metadata.
+        """
+        return await asyncio.to_thread(
+            self.summarize, text, filename, max_words,
+            progress_callback, stop_check, partial_callback
+        )
+
 
 class ProgressiveDocumentSummarizer(DocumentSummarizer):
     """
@@ -99,11 +157,17 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
     focus areas through all stages of summarization, ensuring the final
     summary emphasizes what the user cares about.
 
+    With a pipeline window above 1, chunks between two batch boundaries are
+    summarized concurrently against the progressive summary from the last
+    boundary; only the first chunk of each window gets its predecessor's
+    summary as local context.
+
     Attributes:
         model_manager: OllamaModelManager for text generation.
         config_path: Path to chunking configuration (optional).
         prompt_adapter: Optional PromptAdapter for focus-aware prompts.
         preset_id: Template preset ID for focus extraction.
+        pipeline_window: Chunks summarized concurrently (None: from config).
     """
 
     def __init__(
@@ -111,7 +175,8 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
         model_manager: OllamaModelManager,
         config_path: Path | None = None,
         prompt_adapter: "PromptAdapter | None" = None,
-        preset_id: str = "factual-summary"
+        preset_id: str = "factual-summary",
+        pipeline_window: int | None = None
     ):
         """
         Initialize the progressive document summarizer.
@@ -123,11 +188,15 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
                           prompts. If None, uses default hardcoded prompts.
             preset_id: Template preset ID for focus extraction. Used with
                       prompt_adapter to thread user's focus through prompts.
+            pipeline_window: Most chunks of one batch summarized concurrently.
+                           Uses fast_mode.pipeline_window from the chunking
+                           config if None; 1 processes chunks serially.
         """
         self.model_manager = model_manager
         self.config_path = config_path
         self.prompt_adapter = prompt_adapter
         self.preset_id = preset_id
+        self.pipeline_window = pipeline_window
         self._model_name: str | None = None  # Cached model name for adapter
 
     def summarize(
@@ -136,17 +205,50 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
         filename: str,
         max_words: int = 200,
         progress_callback: Callable[[int, str], None] | None = None,
-        stop_check: Callable[[], bool] | None = None
+        stop_check: Callable[[], bool] | None = None,
+        partial_callback: Callable[[str], None] | None = None
     ) -> DocumentSummaryResult:
         """
         Summarize a document using progressive chunking.
 
+        Blocking wrapper that runs asummarize() on the Ollama scheduler's
+        event loop. Must not be called from a coroutine on that loop.
+
         Args:
             text: Full document text.
             filename: Original filename for tracking.
             max_words: Target summary length in words.
             progress_callback: Optional progress callback(percent, message).
             stop_check: Optional callable returning True if should stop.
+            partial_callback: Optional callback(token) streaming the final summary.
+                            While it streams, stop_check also cancels generation.
+
+        Returns:
+            DocumentSummaryResult with summary and processing metadata.
+        """
+        return get_ollama_scheduler().run(self.asummarize(
+            text, filename, max_words, progress_callback, stop_check, partial_callback
+        ))
+
+    async def asummarize(
+        self,
+        text: str,
+        filename: str,
+        max_words: int = 200,
+        progress_callback: Callable[[int, str], None] | None = None,
+        stop_check: Callable[[], bool] | None = None,
+        partial_callback: Callable[[str], None] | None = None
+    ) -> DocumentSummaryResult:
+        """
+        Summarize a document using progressive chunking (async).
+
+        Each generation awaits the model manager's async API, so many
+        documents can be summarized concurrently on one event loop while
+        the scheduler bounds how many requests reach Ollama at once.
+        Callbacks are invoked on the event loop thread.
+
+        Args:
+            Same as summarize().
 
         Returns:
             DocumentSummaryResult with summary and processing metadata.
@@ -166,14 +268,25 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
             )
 
         try:
+            # Focus extraction generates through the blocking API; warm the
+            # adapter's cache off the loop so prompt building never blocks it
+            get_focus = getattr(self.prompt_adapter, 'get_focus_for_preset', None)
+            if get_focus:
+                await asyncio.to_thread(get_focus, self.preset_id, self._get_model_name())
+
+            # Building the summarizer (config, embeddings), chunking and the
+            # DataFrame updates are CPU-bound; they run in worker threads so
+            # other documents' streams and interactive requests on the
+            # scheduler loop are not stalled
+
             # Create a fresh ProgressiveSummarizer for this document
-            progressive = ProgressiveSummarizer(self.config_path)
+            progressive = await asyncio.to_thread(ProgressiveSummarizer, self.config_path)
 
             # Step 1: Chunk the document
             if progress_callback:
                 progress_callback(5, f"Chunking {filename}...")
 
-            chunks = progressive.chunk_document(text)
+            chunks = await asyncio.to_thread(progressive.chunk_document, text)
             chunk_count = len(chunks)
 
             if chunk_count == 0:
@@ -190,73 +303,90 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
             debug_log(f"[DOC SUMMARIZER] {filename}: {chunk_count} chunks")
 
             # Step 2: Prepare DataFrame for tracking
-            progressive.prepare_chunks_dataframe(chunks)
+            await asyncio.to_thread(progressive.prepare_chunks_dataframe, chunks)
 
             # Step 3: Get batch boundaries for progressive updates
-            batch_boundaries = progressive._get_batch_boundaries(chunk_count)
+            batch_boundaries = await asyncio.to_thread(
+                progressive._get_batch_boundaries, chunk_count
+            )
 
-            # Step 4: Process each chunk
+            # Step 4: Process chunks window by window. Chunks in a window are
+            # summarized concurrently; windows never cross a batch boundary,
+            # so each sees the progressive summary from the last boundary.
+            windows = progressive._get_pipeline_windows(
+                chunk_count, batch_boundaries, self.pipeline_window
+            )
             chunk_summaries = []
             target_chunk_words = 75  # Target words per chunk summary
 
-            for i, chunk in enumerate(chunks):
+            for window in windows:
                 # Check for cancellation
                 if stop_check and stop_check():
                     return DocumentSummaryResult(
                         filename=filename,
                         summary="",
                         word_count=0,
-                        chunk_count=i,
+                        chunk_count=len(chunk_summaries),
                         processing_time_seconds=time.time() - start_time,
                         success=False,
                         error_message="Processing cancelled by user"
                     )
 
-                chunk_num = i + 1
-                progress_percent = int(10 + (chunk_num / chunk_count) * 80)
+                last_num = window[-1]
+                progress_percent = int(10 + (last_num / chunk_count) * 80)
 
                 if progress_callback:
+                    chunk_label = (f"chunk {last_num}" if len(window) == 1
+                                   else f"chunks {window[0]}-{last_num}")
                     progress_callback(
                         progress_percent,
-                        f"{filename}: chunk {chunk_num}/{chunk_count}"
+                        f"{filename}: {chunk_label}/{chunk_count}"
                     )
 
-                # Generate chunk summary with context
-                chunk_summary = self._summarize_chunk(
-                    progressive=progressive,
-                    chunk_num=chunk_num,
-                    chunk_text=chunk.text,
-                    target_words=target_chunk_words
+                # Generate chunk summaries with context (prompts are built
+                # before any summary in this window is written back); if one
+                # fails, the rest of the window is cancelled
+                window_summaries = await _gather_or_cancel(
+                    self._summarize_chunk(
+                        progressive=progressive,
+                        chunk_num=chunk_num,
+                        chunk_text=chunks[chunk_num - 1].text,
+                        target_words=target_chunk_words
+                    )
+                    for chunk_num in window
                 )
 
-                chunk_summaries.append(chunk_summary)
+                chunk_summaries.extend(window_summaries)
 
                 # Update DataFrame
-                progressive.df.loc[
-                    progressive.df['chunk_num'] == chunk_num,
-                    'chunk_summary'
-                ] = chunk_summary
+                await asyncio.to_thread(
+                    self._record_in_dataframe, progressive, window, 'chunk_summary',
+                    window_summaries
+                )
 
                 # Update progressive summary at batch boundaries
-                if chunk_num in batch_boundaries:
-                    progressive.current_progressive_summary = self._update_progressive_summary(
+                if last_num in batch_boundaries:
+                    progressive_summary = await self._update_progressive_summary(
                         chunk_summaries,
                         filename,
                         max_words=max(50, max_words // 2)  # Progressive summary shorter than final
                     )
-                    progressive.df.loc[
-                        progressive.df['chunk_num'] == chunk_num,
-                        'progressive_summary'
-                    ] = progressive.current_progressive_summary
+                    progressive.current_progressive_summary = progressive_summary
+                    await asyncio.to_thread(
+                        self._record_in_dataframe, progressive, [last_num],
+                        'progressive_summary', [progressive_summary]
+                    )
 
             # Step 5: Generate final summary from all chunk summaries
             if progress_callback:
                 progress_callback(95, f"Finalizing {filename} summary...")
 
-            final_summary = self._generate_final_summary(
+            final_summary = await self._generate_final_summary(
                 chunk_summaries=chunk_summaries,
                 filename=filename,
-                max_words=max_words
+                max_words=max_words,
+                partial_callback=partial_callback,
+                stop_check=stop_check
             )
 
             processing_time = time.time() - start_time
@@ -273,6 +403,17 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
                 success=True
             )
 
+        except GenerationCancelled:
+            return DocumentSummaryResult(
+                filename=filename,
+                summary="",
+                word_count=0,
+                chunk_count=chunk_count,
+                processing_time_seconds=time.time() - start_time,
+                success=False,
+                error_message="Processing cancelled by user"
+            )
+
         except Exception as e:
             error(f"[DOC SUMMARIZER] Failed to summarize {filename}: {e}")
             return DocumentSummaryResult(
@@ -285,7 +426,7 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
                 error_message=str(e)
             )
 
-    def _summarize_chunk(
+    async def _summarize_chunk(
         self,
         progressive: ProgressiveSummarizer,
         chunk_num: int,
@@ -314,15 +455,9 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
             global_context = progressive.current_progressive_summary or "Document analysis just started."
             local_context = self._get_local_context(progressive, chunk_num)
 
-            # Get model name for adapter (cached)
-            if not self._model_name:
-                self._model_name = getattr(
-                    self.model_manager, 'loaded_model_name', 'phi-3-mini'
-                )
-
             prompt = self.prompt_adapter.create_chunk_prompt(
                 preset_id=self.preset_id,
-                model_name=self._model_name,
+                model_name=self._get_model_name(),
                 global_context=global_context,
                 local_context=local_context,
                 chunk_text=chunk_text,
@@ -340,13 +475,41 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
         # Use 1.5x tokens per word with buffer
         max_tokens = int(target_words * 2.0)
 
-        summary = self.model_manager.generate_text(
+        summary = await self.model_manager.agenerate_text(
             prompt=prompt,
             max_tokens=max_tokens
         )
 
         return summary.strip()
 
+    @staticmethod
+    def _record_in_dataframe(
+        progressive: ProgressiveSummarizer,
+        chunk_nums: list[int],
+        column: str,
+        values: list[str]
+    ) -> None:
+        """
+        Store per-chunk values in the progressive summarizer's DataFrame.
+
+        Args:
+            progressive: ProgressiveSummarizer with chunk data.
+            chunk_nums: Chunk numbers (1-indexed) to update.
+            column: DataFrame column to set.
+            values: Value for each chunk number.
+        """
+        df = progressive.df
+        for chunk_num, value in zip(chunk_nums, values, strict=True):
+            df.loc[df['chunk_num'] == chunk_num, column] = value
+
+    def _get_model_name(self) -> str:
+        """Get the model name used for adapter prompts (cached)."""
+        if not self._model_name:
+            self._model_name = getattr(
+                self.model_manager, 'loaded_model_name', 'phi-3-mini'
+            )
+        return self._model_name
+
     def _get_local_context(
         self,
         progressive: ProgressiveSummarizer,
@@ -374,7 +537,7 @@ class ProgressiveDocumentSummarizer(DocumentSummarizer):
 
         return "Previous section summary not available."
 
-    def _update_progressive_summary(
+    async def _update_progressive_summary(
         self,
         chunk_summaries: list[str],
         filename: str,
@@ -414,15 +577,17 @@ Create a brief progressive summary ({max_words} words max) that captures:
 Progressive Summary:"""
 
         max_tokens = int(max_words * 2.0)
-        summary = self.model_manager.generate_text(prompt=prompt, max_tokens=max_tokens)
+        summary = await self.model_manager.agenerate_text(prompt=prompt, max_tokens=max_tokens)
 
         return summary.strip()
 
-    def _generate_final_summary(
+    async def _generate_final_summary(
         self,
         chunk_summaries: list[str],
         filename: str,
-        max_words: int = 200
+        max_words: int = 200,
+        partial_callback: Callable[[str], None] | None = None,
+        stop_check: Callable[[], bool] | None = None
     ) -> str:
         """
         Generate the final document summary from all chunk summaries.
@@ -435,9 +600,15 @@ Progressive Summary:"""
             chunk_summaries: List of all chunk summaries.
             filename: Document filename for context.
             max_words: Target word count for final summary.
+            partial_callback: Optional callback(token); when given, the summary
+                            is streamed and stop_check can cancel it mid-generation.
+            stop_check: Optional callable returning True if should stop.
 
         Returns:
             Final document summary string.
+
+        Raises:
+            GenerationCancelled: If stop_check returned True while streaming.
         """
         if not chunk_summaries:
             return ""
@@ -447,15 +618,9 @@ Progressive Summary:"""
 
         # Use focus-aware prompts if adapter is configured
         if self.prompt_adapter:
-            # Get model name for adapter (cached)
-            if not self._model_name:
-                self._model_name = getattr(
-                    self.model_manager, 'loaded_model_name', 'phi-3-mini'
-                )
-
             prompt = self.prompt_adapter.create_document_final_prompt(
                 preset_id=self.preset_id,
-                model_name=self._model_name,
+                model_name=self._get_model_name(),
                 chunk_summaries=combined,
                 filename=filename,
                 max_words=max_words
@@ -479,6 +644,21 @@ Create a unified summary ({min_words}-{max_words} words) that:
 Document Summary:"""
 
         max_tokens = int(max_words * 2.0)
-        summary = self.model_manager.generate_text(prompt=prompt, max_tokens=max_tokens)
+        if partial_callback is None:
+            summary = await self.model_manager.agenerate_text(prompt=prompt, max_tokens=max_tokens)
+        else:
+            stop_event = threading.Event()
+
+            def on_token(token: str):
+                partial_callback(token)
+                if stop_check and stop_check():
+                    stop_event.set()
+
+            summary = await self.model_manager.agenerate_text(
+                prompt=prompt,
+                max_tokens=max_tokens,
+                on_token=on_token,
+                stop_event=stop_event
+            )
 
         return summary.strip()
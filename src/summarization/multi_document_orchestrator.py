@@ -7,13 +7,15 @@ hierarchical approach:
 1. Map Phase: Each document is summarized in parallel using ProgressiveDocumentSummarizer
 2. Reduce Phase: Individual summaries are combined into a meta-summary
 
-The orchestrator uses the existing parallel infrastructure (ThreadPoolStrategy,
-ParallelTaskRunner, ProgressAggregator) to maximize throughput while maintaining
-responsive UI feedback.
+By default the map phase runs every document as a coroutine on the Ollama
+scheduler's event loop, so concurrency is bounded by the scheduler rather than
+by a thread per document. An injected ExecutorStrategy (e.g. SequentialStrategy
+for deterministic tests) switches back to ParallelTaskRunner. Progress goes
+through ProgressAggregator either way to keep UI feedback responsive.
 
 Architecture:
     MultiDocumentOrchestrator
-        ├── Map Phase: ParallelTaskRunner + ProgressiveDocumentSummarizer
+        ├── Map Phase: asummarize() coroutines (or ParallelTaskRunner + strategy)
         └── Reduce Phase: Meta-summary generation from individual summaries
 
 Usage:
@@ -41,6 +43,7 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
 from typing import TYPE_CHECKING, Callable
@@ -50,8 +53,8 @@ from src.logging_config import debug_log, error, info
 from src.parallel import (
     ExecutorStrategy,
     ParallelTaskRunner,
+    PartialTextForwarder,
     ProgressAggregator,
-    ThreadPoolStrategy,
 )
 
 from .document_summarizer import DocumentSummarizer
@@ -69,8 +72,9 @@ class MultiDocumentOrchestrator:
     Orchestrates hierarchical multi-document summarization.
 
     Coordinates parallel document processing (map phase) followed by
-    meta-summary generation (reduce phase). Uses the Strategy Pattern
-    for parallel execution, enabling both production and test modes.
+    meta-summary generation (reduce phase). Production runs the map phase
+    on the Ollama scheduler's event loop; an injected ExecutorStrategy
+    runs it through ParallelTaskRunner instead (used for testing).
 
     The orchestrator:
     1. Accepts a list of documents with extracted text
@@ -85,7 +89,8 @@ class MultiDocumentOrchestrator:
     Attributes:
         document_summarizer: Summarizer for individual documents.
         model_manager: OllamaModelManager for meta-summary generation.
-        strategy: ExecutorStrategy for parallel processing.
+        strategy: ExecutorStrategy for parallel processing, or None for the
+                 async map phase.
         prompt_adapter: Optional PromptAdapter for focus-aware meta-summary.
         preset_id: Template preset ID for focus extraction.
     """
@@ -104,8 +109,9 @@ class MultiDocumentOrchestrator:
         Args:
             document_summarizer: Summarizer for individual documents.
             model_manager: OllamaModelManager for AI text generation.
-            strategy: ExecutorStrategy for parallel execution.
-                     Defaults to ThreadPoolStrategy with PARALLEL_MAX_WORKERS.
+            strategy: ExecutorStrategy for parallel execution. If None (default),
+                     documents are summarized as coroutines on the Ollama
+                     scheduler, at most PARALLEL_MAX_WORKERS at a time.
             prompt_adapter: Optional PromptAdapter for generating focus-aware
                           meta-summary prompts. If None, uses default prompts.
             preset_id: Template preset ID for focus extraction. Used with
@@ -113,7 +119,7 @@ class MultiDocumentOrchestrator:
         """
         self.document_summarizer = document_summarizer
         self.model_manager = model_manager
-        self.strategy = strategy or ThreadPoolStrategy(max_workers=PARALLEL_MAX_WORKERS)
+        self.strategy = strategy
         self.prompt_adapter = prompt_adapter
         self.preset_id = preset_id
         self._model_name: str | None = None  # Cached model name for adapter
@@ -227,9 +233,12 @@ class MultiDocumentOrchestrator:
         """
         Phase 1: Summarize each document in parallel.
 
-        Uses ParallelTaskRunner with the configured strategy to process
-        documents concurrently. Progress is reported via both callback
-        and ProgressAggregator (if ui_queue provided).
+        Without a strategy, each document's asummarize() runs as a coroutine
+        on the model manager's scheduler (up to PARALLEL_MAX_WORKERS documents
+        at once); with one, ParallelTaskRunner runs summarize() through it.
+        Progress is reported via both callback and ProgressAggregator (if
+        ui_queue provided); each document's final summary is also streamed to
+        ui_queue as 'summary_partial' messages.
 
         Args:
             documents: List of documents to summarize.
@@ -249,10 +258,9 @@ class MultiDocumentOrchestrator:
             aggregator = ProgressAggregator(ui_queue, throttle_ms=100)
             aggregator.set_total(doc_count)
 
-        def summarize_single_document(doc: dict) -> DocumentSummaryResult:
-            """Process a single document (runs in thread pool)."""
+        def prepare_document(doc: dict) -> tuple[dict, PartialTextForwarder | None]:
+            """Build summarize() arguments for one document."""
             filename = doc['filename']
-            text = doc['extracted_text']
 
             if aggregator:
                 aggregator.update(filename, f"Summarizing {filename}...")
@@ -272,25 +280,70 @@ class MultiDocumentOrchestrator:
             def should_stop() -> bool:
                 return self._stop_event.is_set()
 
-            result = self.document_summarizer.summarize(
-                text=text,
-                filename=filename,
-                max_words=max_words,
-                progress_callback=doc_progress,
-                stop_check=should_stop
-            )
+            # Stream the final summary to the UI as it is generated
+            forwarder = PartialTextForwarder(ui_queue, filename=filename) if ui_queue else None
+
+            kwargs = {
+                'text': doc['extracted_text'],
+                'filename': filename,
+                'max_words': max_words,
+                'progress_callback': doc_progress,
+                'stop_check': should_stop,
+                'partial_callback': forwarder,
+            }
+            return kwargs, forwarder
+
+        def finish_document(filename: str, forwarder: PartialTextForwarder | None):
+            """Flush streamed text and mark the document complete, even if it failed."""
+            if forwarder:
+                forwarder.flush()
 
             if aggregator:
                 aggregator.complete(filename)
 
-            return result
-
         def on_task_complete(task_id: str, result: DocumentSummaryResult):
             """Callback when a document finishes."""
             results[result.filename] = result
             debug_log(f"[MULTI-DOC] Completed: {result.filename} "
                      f"({result.word_count} words, {result.chunk_count} chunks)")
 
+        if self.strategy is None:
+            async def summarize_all() -> list[DocumentSummaryResult | BaseException]:
+                semaphore = asyncio.Semaphore(PARALLEL_MAX_WORKERS)
+
+                async def summarize_single_document(doc: dict) -> DocumentSummaryResult:
+                    """Process a single document (runs on the scheduler loop)."""
+                    async with semaphore:
+                        kwargs, forwarder = prepare_document(doc)
+                        try:
+                            return await self.document_summarizer.asummarize(**kwargs)
+                        finally:
+                            finish_document(doc['filename'], forwarder)
+
+                return await asyncio.gather(
+                    *(summarize_single_document(doc) for doc in documents),
+                    return_exceptions=True
+                )
+
+            outcomes = self.model_manager.scheduler.run(summarize_all())
+
+            for doc, outcome in zip(documents, outcomes, strict=True):
+                if isinstance(outcome, BaseException):
+                    error(f"[MULTI-DOC] Failed: {doc['filename']}: {outcome}")
+                    results[doc['filename']] = self._failed_result(doc['filename'], outcome)
+                else:
+                    on_task_complete(doc['filename'], outcome)
+
+            return results
+
+        def summarize_single_document(doc: dict) -> DocumentSummaryResult:
+            """Process a single document (runs via the strategy)."""
+            kwargs, forwarder = prepare_document(doc)
+            try:
+                return self.document_summarizer.summarize(**kwargs)
+            finally:
+                finish_document(doc['filename'], forwarder)
+
         # Create task runner with strategy
         runner = ParallelTaskRunner(
             strategy=self.strategy,
@@ -307,18 +360,24 @@ class MultiDocumentOrchestrator:
         for task_result in task_results:
             if not task_result.success:
                 # Create failed result for documents that errored
-                results[task_result.task_id] = DocumentSummaryResult(
-                    filename=task_result.task_id,
-                    summary="",
-                    word_count=0,
-                    chunk_count=0,
-                    processing_time_seconds=0,
-                    success=False,
-                    error_message=str(task_result.error)
+                results[task_result.task_id] = self._failed_result(
+                    task_result.task_id, task_result.error
                 )
 
         return results
 
+    def _failed_result(self, filename: str, exc: BaseException | None) -> DocumentSummaryResult:
+        """Build the result recorded for a document whose summarization raised."""
+        return DocumentSummaryResult(
+            filename=filename,
+            summary="",
+            word_count=0,
+            chunk_count=0,
+            processing_time_seconds=0,
+            success=False,
+            error_message=str(exc)
+        )
+
     def _reduce_phase(
         self,
         summaries: list[DocumentSummaryResult],
@@ -344,10 +403,10 @@ class MultiDocumentOrchestrator:
         formatted_summaries = self._format_summaries_for_prompt(summaries)
 
         # Check if combined summaries fit in context window
-        estimated_tokens = len(formatted_summaries) // 4
+        summary_tokens = self.model_manager.token_counter.count(formatted_summaries)
         context_available = OLLAMA_CONTEXT_WINDOW - 500  # Reserve for prompt and output
 
-        if estimated_tokens > context_available:
+        if summary_tokens > context_available:
             # Too large - need to chunk the summaries
             return self._generate_chunked_meta_summary(summaries, max_words)
         else:
@@ -447,7 +506,8 @@ Meta-Summary:"""
         Generate meta-summary for large document sets via chunking.
 
         When combined summaries exceed context window, this method:
-        1. Groups summaries into batches that fit in context
+        1. Packs consecutive summaries into as few batches as fit in context,
+           measured with the model's token counter
         2. Generates intermediate summaries for each batch
         3. Combines intermediate summaries into final meta-summary
 
@@ -458,17 +518,17 @@ Meta-Summary:"""
         Returns:
             Meta-summary string.
         """
-        # Calculate how many summaries can fit per batch
-        avg_summary_length = sum(len(s.summary) for s in summaries) // len(summaries)
-        context_budget = (OLLAMA_CONTEXT_WINDOW - 500) * 4  # Convert tokens to chars
-        summaries_per_batch = max(2, context_budget // (avg_summary_length + 100))
+        # Pack as many formatted summaries per batch as fit in the context budget
+        context_available = OLLAMA_CONTEXT_WINDOW - 500  # Reserve for prompt and output
+        formatted = [self._format_summaries_for_prompt([s]) for s in summaries]
+        batches = self.model_manager.token_counter.pack(formatted, context_available)
 
-        debug_log(f"[MULTI-DOC] Chunking {len(summaries)} summaries into batches of {summaries_per_batch}")
+        debug_log(f"[MULTI-DOC] Packed {len(summaries)} summaries into {len(batches)} batches")
 
         # Process batches
         intermediate_summaries = []
-        for i in range(0, len(summaries), summaries_per_batch):
-            batch = summaries[i:i + summaries_per_batch]
+        for batch_indices in batches:
+            batch = [summaries[i] for i in batch_indices]
             batch_formatted = self._format_summaries_for_prompt(batch)
 
             batch_summary = self._generate_direct_meta_summary(
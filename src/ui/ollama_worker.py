@@ -1,19 +1,32 @@
 import multiprocessing
+import multiprocessing.synchronize
 import time
 import traceback
 
-from src.ai.ollama_model_manager import OllamaModelManager
+from src.ai.ollama_model_manager import GenerationCancelled, OllamaModelManager
 from src.config import QUEUE_TIMEOUT_SECONDS
 from src.logging_config import debug_log
+from src.parallel.progress_aggregator import PartialTextForwarder
 
 
 def ollama_generation_worker_process(
     input_queue: multiprocessing.Queue,
-    output_queue: multiprocessing.Queue
+    output_queue: multiprocessing.Queue,
+    terminate_event: multiprocessing.synchronize.Event | None = None
 ):
     """
     Target function for the multiprocessing worker that handles Ollama AI generation.
+
+    Summaries are streamed: ('summary_partial', {'filename': None, 'text': ...})
+    messages carry the text generated so far, then ('summary_result', ...) the
+    final (length-enforced) summary.
+
+    Termination is signalled through terminate_event, which is checked while a
+    task runs; the "TERMINATE" queue message only wakes the idle loop. Reading
+    the queue mid-task would consume (and lose) tasks queued behind it.
     """
+    if terminate_event is None:
+        terminate_event = multiprocessing.Event()
     model_manager = None
     model_initialized = False
     try:
@@ -42,35 +55,37 @@ def ollama_generation_worker_process(
                     debug_log(f"[OLLAMA WORKER] Received GENERATE_SUMMARY task. Preset: {preset_id}, Max words: {max_words}")
 
                     start_time = time.time()
-
-                    # Instead of directly calling, we'll monitor for termination during the potentially long call
-                    # We can't interrupt the requests.post directly, but we can monitor before/after.
-                    # Send an initial progress message
                     output_queue.put(('progress', (0, "Starting AI generation (this may take a while)...")))
 
-                    # The generate_summary itself is blocking, so we cannot send continuous updates from within it.
-                    # However, we can track if a terminate signal comes *before* or *after* the call.
-                    # The requests.post call does have a timeout, which is the primary control.
-
                     # Check for termination right before the blocking call
-                    if not input_queue.empty():
-                        if input_queue.get_nowait() == "TERMINATE":
-                            debug_log("[OLLAMA WORKER] Termination signal received before generate_summary. Aborting task.")
-                            output_queue.put(('cancelled', "AI generation task cancelled."))
-                            continue # Skip the generation and await next task/termination
-
-                    summary = model_manager.generate_summary(
-                        case_text=case_text,
-                        max_words=max_words,
-                        preset_id=preset_id
-                    )
+                    if terminate_event.is_set():
+                        debug_log("[OLLAMA WORKER] Termination signal received before generate_summary. Aborting task.")
+                        output_queue.put(('cancelled', "AI generation task cancelled."))
+                        continue # Skip the generation and await next task/termination
+
+                    # Stream the summary: partial text goes to the UI as it is generated,
+                    # and termination requested mid-generation closes the Ollama connection.
+                    forwarder = PartialTextForwarder(output_queue)
+
+                    try:
+                        summary = model_manager.generate_summary(
+                            case_text=case_text,
+                            max_words=max_words,
+                            preset_id=preset_id,
+                            on_token=forwarder,
+                            stop_event=terminate_event
+                        )
+                    except GenerationCancelled:
+                        debug_log("[OLLAMA WORKER] Termination signal received during generate_summary. Aborting task.")
+                        output_queue.put(('cancelled', "AI generation task cancelled."))
+                        continue
+                    forwarder.flush()
 
                     # After generation, check again for termination (if user pressed Escape right after summary was generated)
-                    if not input_queue.empty():
-                        if input_queue.get_nowait() == "TERMINATE":
-                            debug_log("[OLLAMA WORKER] Termination signal received after generate_summary. Discarding result.")
-                            output_queue.put(('cancelled', "AI generation task cancelled after completion."))
-                            continue
+                    if terminate_event.is_set():
+                        debug_log("[OLLAMA WORKER] Termination signal received after generate_summary. Discarding result.")
+                        output_queue.put(('cancelled', "AI generation task cancelled after completion."))
+                        continue
 
                     elapsed_time = time.time() - start_time
                     debug_log(f"[OLLAMA WORKER] Summary generated in {elapsed_time:.2f} seconds.")
@@ -88,13 +103,10 @@ def ollama_generation_worker_process(
                     load_start_time = time.time()
                     model_loaded = False
                     while not model_loaded:
-                        try:
-                            if input_queue.get(timeout=QUEUE_TIMEOUT_SECONDS) == "TERMINATE": # Check termination while loading
-                                debug_log("[OLLAMA WORKER] Termination signal received during model loading. Aborting.")
-                                output_queue.put(('cancelled', "Model loading cancelled."))
-                                return # Exit process if terminated during critical load
-                        except multiprocessing.queues.Empty:
-                            pass # No termination signal, continue loading attempt
+                        if terminate_event.is_set(): # Check termination while loading
+                            debug_log("[OLLAMA WORKER] Termination signal received during model loading. Aborting.")
+                            output_queue.put(('cancelled', "Model loading cancelled."))
+                            return # Exit process if terminated during critical load
 
                         # Attempt to load model - this call blocks until model is ready
                         if model_manager.load_model(model_name):
@@ -166,6 +166,24 @@ class QueueMessageHandler:
         if self.orchestrator:
             self.orchestrator.on_summary_complete()
 
+    def handle_summary_partial(self, data):
+        """
+        Handle 'summary_partial' message - summary text streamed so far.
+
+        Args:
+            data: Dictionary with 'text' and 'filename' (None for the
+                  single-document/meta summary)
+        """
+        filename = data.get('filename')
+        if filename:
+            self.main_window.summary_results.update_outputs(
+                document_summaries={filename: data.get('text', '')}
+            )
+        else:
+            self.main_window.summary_results.update_outputs(
+                meta_summary=data.get('text', '')
+            )
+
     def handle_multi_doc_result(self, data):
         """
         Handle 'multi_doc_result' message - multi-document summarization complete.
@@ -435,6 +453,7 @@ class QueueMessageHandler:
             'vocab_csv_generated': self.handle_vocab_csv_generated,
             'processing_finished': self.handle_processing_finished,
             'summary_result': self.handle_summary_result,
+            'summary_partial': self.handle_summary_partial,
             'multi_doc_result': self.handle_multi_doc_result,
             'error': self.handle_error,
             # Vector Store Q&A handlers (Session 24)
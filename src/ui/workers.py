@@ -21,6 +21,7 @@ from queue import Empty, Queue
 
 from src.config import PARALLEL_MAX_WORKERS
 from src.extraction import RawTextExtractor
+from src.extraction.timing_summary import format_timing_summary, summarize_timings
 from src.logging_config import debug_log
 from src.parallel import (
     ExecutorStrategy,
@@ -49,6 +50,8 @@ class ProcessingWorker(threading.Thread):
         jurisdiction: Legal jurisdiction for document parsing (default "ny").
         strategy: ExecutorStrategy for parallel execution (injectable for testing).
         processed_results: List of extraction results after processing.
+        timing_summary: Per-stage p50/p95 and slowest files for the batch
+                        (see summarize_timings), set when processing finishes.
 
     Example:
         # Standard usage (parallel)
@@ -92,6 +95,7 @@ class ProcessingWorker(threading.Thread):
         self.extractor = RawTextExtractor(jurisdiction=self.jurisdiction)
 
         self.processed_results = []
+        self.timing_summary: dict = {}
         self._stop_event = threading.Event()
         self._runner = None  # Track runner for cancellation
 
@@ -189,6 +193,10 @@ class ProcessingWorker(threading.Thread):
                     # Log errors but continue with other documents
                     debug_log(f"[PROCESSING WORKER] Document failed: {task_result.task_id} - {task_result.error}")
 
+            self.timing_summary = summarize_timings(self.processed_results)
+            if self.timing_summary['documents']:
+                debug_log(f"[PROCESSING WORKER] {format_timing_summary(self.timing_summary)}")
+
             # Send completion message if not cancelled
             if not self._stop_event.is_set():
                 self.ui_queue.put(('processing_finished', self.processed_results))
@@ -410,6 +418,8 @@ class OllamaAIWorkerManager:
         self.ui_queue = ui_queue
         self.input_queue = multiprocessing.Queue()
         self.output_queue = multiprocessing.Queue()
+        # Set to cancel the running task; the queue then only carries tasks
+        self.terminate_event = multiprocessing.Event()
         self.process = None
         self.is_running = False
 
@@ -433,9 +443,10 @@ class OllamaAIWorkerManager:
         self._clear_queue(self.output_queue)
 
         debug_log("[OLLAMA MANAGER] Starting Ollama AI worker process.")
+        self.terminate_event = multiprocessing.Event()
         self.process = multiprocessing.Process(
             target=ollama_generation_worker_process,
-            args=(self.input_queue, self.output_queue),
+            args=(self.input_queue, self.output_queue, self.terminate_event),
             daemon=True # Daemon process allows main process to exit even if worker is alive
         )
         self.process.start()
@@ -453,7 +464,8 @@ class OllamaAIWorkerManager:
         if self.is_running and self.process and self.process.is_alive():
             debug_log("[OLLAMA MANAGER] Sending TERMINATE signal to worker.")
             try:
-                self.input_queue.put_nowait("TERMINATE")  # Non-blocking put
+                self.terminate_event.set()  # Cancels a task in progress
+                self.input_queue.put_nowait("TERMINATE")  # Wakes an idle worker
 
                 if blocking:
                     # Wait briefly for graceful shutdown
@@ -545,14 +557,15 @@ class MultiDocSummaryWorker(threading.Thread):
             documents: List of document dicts with 'filename' and 'extracted_text'.
             ui_queue: Queue for UI communication.
             ai_params: Dict with 'summary_length', 'meta_length', 'model_name', etc.
-            strategy: ExecutorStrategy for parallel execution. Defaults to
-                     ThreadPoolStrategy with PARALLEL_MAX_WORKERS.
+            strategy: ExecutorStrategy for parallel execution. If None (default),
+                     the orchestrator summarizes documents as coroutines on
+                     the shared Ollama scheduler instead of a thread pool.
         """
         super().__init__(daemon=True)
         self.documents = documents
         self.ui_queue = ui_queue
         self.ai_params = ai_params
-        self.strategy = strategy or ThreadPoolStrategy(max_workers=PARALLEL_MAX_WORKERS)
+        self.strategy = strategy
         self._stop_event = threading.Event()
         self._orchestrator = None
 
@@ -562,7 +575,8 @@ class MultiDocSummaryWorker(threading.Thread):
         self._stop_event.set()
         if self._orchestrator:
             self._orchestrator.stop()
-        self.strategy.shutdown(wait=False, cancel_futures=True)
+        if self.strategy:
+            self.strategy.shutdown(wait=False, cancel_futures=True)
 
     def run(self):
         """Execute multi-document summarization in background thread."""
@@ -646,7 +660,8 @@ class MultiDocSummaryWorker(threading.Thread):
 
         finally:
             # Cleanup
-            self.strategy.shutdown(wait=False)
+            if self.strategy:
+                self.strategy.shutdown(wait=False)
             gc.collect()
 
 
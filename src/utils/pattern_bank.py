@@ -0,0 +1,212 @@
+"""
+Pattern Bank: Match a list of regexes against a text with a literal prefilter.
+
+Preprocessing and chunking each keep a bank of regexes that is tried one
+pattern at a time against every line, page or paragraph, and most of those
+patterns cannot match most inputs. PatternBank derives, for each pattern,
+the literal strings a match must contain (e.g. "court" for SUPREME\\s+COURT,
+or any one of "llp", "pllc", ... for an alternation). A text is lowercased
+once, and only patterns whose anchor occurs in it are run, in list order.
+Results are exactly those of trying every pattern.
+
+A single alternation of all patterns with named groups was measured slower
+than this under CPython's re (it tries every alternative at every position,
+losing each pattern's own prefix search), and could not report every
+pattern that matches when matches overlap.
+
+Usage:
+    from src.utils.pattern_bank import PatternBank
+
+    bank = PatternBank([re.compile(r'supreme\\s+court', re.IGNORECASE), ...])
+    if bank.search_any(line): ...
+    first = bank.search(paragraph)        # (index, match) or None
+    matched = bank.matching(page_text)    # indexes of every matching pattern
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse
+
+_REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT}
+if hasattr(sre_parse, 'POSSESSIVE_REPEAT'):
+    _REPEATS.add(sre_parse.POSSESSIVE_REPEAT)
+
+
+def _anchor_score(anchors: frozenset[str]) -> tuple[int, int]:
+    """Rank anchor sets: longest shortest literal first, then fewest alternatives."""
+    return min(map(len, anchors)), -len(anchors)
+
+
+def _required_literals(items, ignorecase: bool) -> frozenset[str] | None:
+    """
+    Find literals one of which every match of a parsed (sub)pattern contains.
+
+    Only ASCII literals are used, lowercased when the pattern ignores case.
+    Scoped inline flags and anything unrecognised contribute nothing, so the
+    result is conservative.
+
+    Args:
+        items: Parsed pattern (sequence of (opcode, argument) pairs)
+        ignorecase: Whether the pattern is case-insensitive
+
+    Returns:
+        Set of alternative literals, or None if no anchor could be found
+    """
+    best: frozenset[str] | None = None
+    run: list[str] = []
+
+    def consider(anchors: frozenset[str] | None):
+        nonlocal best
+        if anchors and all(anchors) and (best is None or _anchor_score(anchors) > _anchor_score(best)):
+            best = anchors
+
+    def flush():
+        if run:
+            literal = ''.join(run)
+            consider(frozenset([literal.lower() if ignorecase else literal]))
+            run.clear()
+
+    for op, av in items:
+        if op is sre_parse.LITERAL and av < 128:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is sre_parse.SUBPATTERN:
+            _group, add_flags, del_flags, pattern = av
+            if not (add_flags or del_flags):
+                consider(_required_literals(pattern, ignorecase))
+        elif op in _REPEATS:
+            min_count, _max_count, pattern = av
+            if min_count >= 1:
+                consider(_required_literals(pattern, ignorecase))
+        elif op is sre_parse.BRANCH:
+            _, alternatives = av
+            branches = [_required_literals(alternative, ignorecase) for alternative in alternatives]
+            if all(branches):
+                consider(frozenset().union(*branches))
+        elif op is getattr(sre_parse, 'ATOMIC_GROUP', None):
+            consider(_required_literals(av, ignorecase))
+    flush()
+    return best
+
+
+def literal_anchors(pattern: re.Pattern) -> frozenset[str] | None:
+    """
+    Literals one of which must appear in any text the pattern matches.
+
+    Args:
+        pattern: Compiled str pattern
+
+    Returns:
+        Set of alternative literals (lowercase if the pattern ignores case),
+        or None if the pattern has no usable anchor
+    """
+    if not isinstance(pattern.pattern, str):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+    return _required_literals(parsed, bool(pattern.flags & re.IGNORECASE))
+
+
+class PatternBank:
+    """
+    An ordered list of regexes searched together against one text at a time.
+
+    Attributes:
+        patterns: The compiled patterns, in priority order
+        anchors: Per pattern, the literals one of which a match must contain
+                (None if the pattern is always run)
+    """
+
+    def __init__(self, patterns: Iterable[re.Pattern | str], flags: int = 0):
+        """
+        Initialize the bank.
+
+        Args:
+            patterns: Compiled patterns, or pattern strings compiled with `flags`
+            flags: re flags for pattern strings
+        """
+        self.patterns: list[re.Pattern] = [
+            pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+            for pattern in patterns
+        ]
+        self.anchors: list[frozenset[str] | None] = [
+            literal_anchors(pattern) for pattern in self.patterns
+        ]
+        # (index, bound search, anchors, whether anchors are matched against lowercased text)
+        self._checks = [
+            (
+                index,
+                pattern.search,
+                tuple(anchors) if anchors else None,
+                bool(pattern.flags & re.IGNORECASE),
+            )
+            for index, (pattern, anchors) in enumerate(zip(self.patterns, self.anchors, strict=True))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _iter_matches(self, text: str) -> Iterator[tuple[int, re.Match]]:
+        """
+        Yield (index, match) for each pattern that matches, in list order.
+
+        A pattern is only run if one of its anchors occurs in the text.
+        Case-insensitive anchors are only checked on ASCII text, where
+        lowercasing agrees with re's case folding.
+        """
+        lowered = text.lower() if text.isascii() else None
+        for index, search, anchors, folded in self._checks:
+            if anchors is not None:
+                haystack = lowered if folded else text
+                if haystack is not None:
+                    for anchor in anchors:
+                        if anchor in haystack:
+                            break
+                    else:
+                        continue
+            match = search(text)
+            if match:
+                yield index, match
+
+    def search(self, text: str) -> tuple[int, re.Match] | None:
+        """
+        Find the first pattern, in list order, that matches anywhere in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            (pattern index, match) or None if no pattern matches
+        """
+        return next(self._iter_matches(text), None)
+
+    def search_any(self, text: str) -> bool:
+        """
+        Check whether any pattern matches anywhere in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            True if at least one pattern matches
+        """
+        return self.search(text) is not None
+
+    def matching(self, text: str) -> list[int]:
+        """
+        Find every pattern that matches anywhere in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Indexes of the matching patterns, in list order
+        """
+        return [index for index, _ in self._iter_matches(text)]
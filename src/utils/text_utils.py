@@ -20,10 +20,15 @@ def combine_document_texts(
     Combine extracted text from multiple documents into a single string.
 
     Optionally applies smart preprocessing to clean text before AI summarization.
+    Each document is preprocessed on its own (in parallel for large cases) and
+    the result is cached by content hash, so combining the same documents again
+    skips preprocessing. A document's 'page_offsets' from the extractor, if
+    present, let title page removal use its real page boundaries.
 
     Args:
         documents: List of document result dictionaries. Each dict should have
-                  'extracted_text' key (and optionally 'filename' for headers).
+                  'extracted_text' key (and optionally 'filename' for headers
+                  and 'page_offsets').
         include_headers: If True, prefix each document's text with its filename
                         formatted as "--- filename ---"
         separator: String to use between documents (default: double newline)
@@ -44,10 +49,25 @@ def combine_document_texts(
         >>> combine_document_texts(docs, include_headers=True)
         '--- a.pdf ---\\nHello\\n\\n--- b.pdf ---\\nWorld'
     """
+    documents = [doc for doc in documents if doc.get('extracted_text')]
+    texts = [doc['extracted_text'] for doc in documents]
+
+    # Apply preprocessing if enabled
+    if preprocess and texts:
+        try:
+            from src.preprocessing import preprocess_documents
+            texts = preprocess_documents(
+                texts, page_offsets=[doc.get('page_offsets') for doc in documents]
+            )
+            debug_log(f"[TEXT UTILS] Preprocessing applied to {len(texts)} documents")
+        except ImportError as e:
+            debug_log(f"[TEXT UTILS] Preprocessing not available: {e}")
+        except Exception as e:
+            debug_log(f"[TEXT UTILS] Preprocessing error (using raw text): {e}")
+
     combined_parts = []
 
-    for doc in documents:
-        text = doc.get('extracted_text', '')
+    for doc, text in zip(documents, texts, strict=True):
         if not text:
             continue
 
@@ -57,18 +77,4 @@ def combine_document_texts(
         else:
             combined_parts.append(text)
 
-    combined_text = separator.join(combined_parts)
-
-    # Apply preprocessing if enabled
-    if preprocess and combined_text:
-        try:
-            from src.preprocessing import create_default_pipeline
-            pipeline = create_default_pipeline()
-            combined_text = pipeline.process(combined_text)
-            debug_log(f"[TEXT UTILS] Preprocessing applied: {pipeline.total_changes} changes")
-        except ImportError as e:
-            debug_log(f"[TEXT UTILS] Preprocessing not available: {e}")
-        except Exception as e:
-            debug_log(f"[TEXT UTILS] Preprocessing error (using raw text): {e}")
-
-    return combined_text
+    return separator.join(combined_parts)
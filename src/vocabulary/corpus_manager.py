@@ -85,6 +85,9 @@ class CorpusManager:
         self._cache_file = self.cache_dir / "bm25_idf_index.json"
         self._corpus_hash: str | None = None
 
+        # Shared extractor, created on first use (see _get_extractor)
+        self._extractor = None
+
         # Ensure directories exist
         self.corpus_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -253,6 +256,18 @@ class CorpusManager:
             files.update(self.corpus_dir.glob(f"*{ext.upper()}"))
         return sorted(files)
 
+    def _get_extractor(self):
+        """
+        Return a RawTextExtractor shared by every corpus file.
+
+        Created lazily so a CorpusManager that only reads the cached IDF
+        index never pays the extractor's startup cost.
+        """
+        if self._extractor is None:
+            from src.extraction import RawTextExtractor
+            self._extractor = RawTextExtractor()
+        return self._extractor
+
     def _extract_text(self, file_path: Path) -> str:
         """
         Extract text from a document file.
@@ -266,15 +281,12 @@ class CorpusManager:
             Extracted text content
         """
         try:
-            from src.extraction import RawTextExtractor
-
-            extractor = RawTextExtractor()
-            result = extractor.extract(str(file_path))
+            result = self._get_extractor().process_document(str(file_path))
 
-            if result.get("success"):
-                return result.get("text", "")
+            if result.get("status") != "error":
+                return result.get("extracted_text", "")
             else:
-                debug_log(f"[BM25] Extraction failed for {file_path.name}: {result.get('error')}")
+                debug_log(f"[BM25] Extraction failed for {file_path.name}: {result.get('error_message')}")
                 return ""
 
         except Exception as e:
@@ -499,26 +511,24 @@ class CorpusManager:
         Raises:
             Exception: If extraction or preprocessing fails
         """
-        from src.extraction import RawTextExtractor
         from src.preprocessing import PreprocessingPipeline
         from src.sanitization import CharacterSanitizer
 
         debug_log(f"[Corpus] Preprocessing: {file_path.name}")
 
         # Step 1: Extract text
-        extractor = RawTextExtractor()
-        result = extractor.extract(str(file_path))
+        result = self._get_extractor().process_document(str(file_path))
 
-        if not result.get("success"):
-            raise Exception(f"Extraction failed: {result.get('error', 'Unknown error')}")
+        if result.get("status") == "error":
+            raise Exception(f"Extraction failed: {result.get('error_message') or 'Unknown error'}")
 
-        raw_text = result.get("text", "")
+        raw_text = result.get("extracted_text", "")
         if not raw_text.strip():
             raise Exception("Extracted text is empty")
 
         # Step 2: Sanitize (fix encoding, mojibake, etc.)
         sanitizer = CharacterSanitizer()
-        clean_text = sanitizer.sanitize(raw_text)
+        clean_text, _ = sanitizer.sanitize(raw_text)
 
         # Step 3: Preprocess (remove headers, footers, line numbers, title pages)
         pipeline = PreprocessingPipeline()
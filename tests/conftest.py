@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures.
+
+Keeps the suite away from the user's real LocalScribe cache: every test sees
+an empty CACHE_DIR under its own tmp_path, so no test reads a result cached
+by an earlier run or leaves stub output behind for the application.
+"""
+
+import pytest
+
+import src.config
+from src.ai import response_cache
+from src.extraction import english_dictionary, extraction_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point CACHE_DIR (and the caches that default to it) at tmp_path."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    monkeypatch.setattr(src.config, "CACHE_DIR", cache_dir)
+
+    monkeypatch.setattr(extraction_cache, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(extraction_cache, "_extraction_cache", None)
+
+    monkeypatch.setattr(response_cache, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(response_cache, "_response_cache", None)
+
+    # The in-memory word set is left alone (it only depends on NLTK);
+    # only where it would be pickled to changes
+    monkeypatch.setattr(
+        english_dictionary, "DICTIONARY_CACHE_FILE",
+        cache_dir / english_dictionary.DICTIONARY_CACHE_FILE.name
+    )
+
+    yield cache_dir
+
+    # Close the database a test opened through get_response_cache()
+    if response_cache._response_cache is not None:
+        response_cache._response_cache.close()
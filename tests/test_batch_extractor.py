@@ -0,0 +1,99 @@
+"""
+Tests for headless batch extraction to JSONL.
+"""
+
+import json
+
+import pytest
+
+from src.extraction.batch_extractor import BatchExtractor, discover_files, load_completed
+from src.parallel import SequentialStrategy
+
+
+@pytest.fixture
+def drop_dir(tmp_path):
+    """A directory of small text documents, plus one unsupported file."""
+    drop = tmp_path / "drop"
+    (drop / "nested").mkdir(parents=True)
+    (drop / "a.txt").write_text("The plaintiff filed a complaint against the defendant in court.")
+    (drop / "b.txt").write_text("The defendant answered the complaint and denied the allegations.")
+    (drop / "nested" / "c.txt").write_text("The court granted the motion for summary judgment today.")
+    (drop / "notes.docx").write_text("unsupported")
+    return drop
+
+
+@pytest.fixture
+def batch():
+    """BatchExtractor running inline without worker processes or cache."""
+    return BatchExtractor(use_cache=False, strategy=SequentialStrategy())
+
+
+def read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+class TestDiscoverFiles:
+    """Tests for expanding inputs into document paths."""
+
+    def test_directory_is_recursive_and_filtered(self, drop_dir):
+        names = [p.name for p in discover_files([str(drop_dir)])]
+        assert names == ['a.txt', 'b.txt', 'c.txt']
+
+    def test_glob_pattern(self, drop_dir):
+        names = [p.name for p in discover_files([str(drop_dir / "*.txt")])]
+        assert names == ['a.txt', 'b.txt']
+
+    def test_duplicates_removed(self, drop_dir):
+        paths = discover_files([str(drop_dir), str(drop_dir / "a.txt")])
+        assert len(paths) == 3
+
+
+class TestBatchExtractor:
+    """Tests for JSONL output and resume."""
+
+    def test_writes_one_record_per_document(self, batch, drop_dir, tmp_path):
+        output = tmp_path / "out.jsonl"
+
+        summary = batch.run(discover_files([str(drop_dir)]), output)
+
+        records = read_records(output)
+        assert len(records) == 3
+        assert summary['success'] == 3
+        assert all(r['method'] == 'direct_read' for r in records)
+        assert all(r['extracted_text'] and r['elapsed_ms'] >= 0 for r in records)
+
+    def test_resume_skips_completed_documents(self, batch, drop_dir, tmp_path):
+        output = tmp_path / "out.jsonl"
+        files = discover_files([str(drop_dir)])
+        batch.run(files[:2], output)
+
+        summary = batch.run(files, output, resume=True)
+
+        records = read_records(output)
+        assert summary['skipped'] == 2
+        assert summary['success'] == 1
+        assert sorted(r['filename'] for r in records) == ['a.txt', 'b.txt', 'c.txt']
+
+    def test_resume_drops_truncated_last_line(self, batch, drop_dir, tmp_path):
+        output = tmp_path / "out.jsonl"
+        files = discover_files([str(drop_dir)])
+        batch.run(files[:1], output)
+        with open(output, 'a', encoding='utf-8') as f:
+            f.write('{"file_path": "half-writ')
+
+        assert load_completed(output) == {str(files[0])}
+
+        batch.run(files, output, resume=True)
+        records = read_records(output)
+        assert records[0]['filename'] == 'a.txt'
+        assert sorted(r['filename'] for r in records) == ['a.txt', 'b.txt', 'c.txt']
+
+    def test_without_resume_overwrites(self, batch, drop_dir, tmp_path):
+        output = tmp_path / "out.jsonl"
+        files = discover_files([str(drop_dir)])
+        batch.run(files, output)
+
+        batch.run(files[:1], output)
+
+        assert len(read_records(output)) == 1
@@ -0,0 +1,89 @@
+"""
+Regression benchmarks for the document pipeline.
+
+The benchmark itself (scripts/benchmark_suite.py) is deselected by default;
+run it with:
+
+    python -m pytest -m benchmark
+
+It compares against tests/benchmarks/baseline.json (record one with
+`python scripts/benchmark_suite.py --save-baseline`). Set BENCHMARK_SCALES
+(default "1,10") and BENCHMARK_TOLERANCE (default 0.25) to adjust the run.
+The unmarked tests cover the regression check itself.
+"""
+
+import os
+
+import pytest
+
+from scripts.benchmark_suite import (
+    BASELINE_PATH,
+    DEFAULT_TOLERANCE,
+    compare_results,
+    load_baseline,
+    measure,
+    parse_scales,
+    run_suite,
+)
+
+
+def stage(seconds=1.0, mb_per_s=10.0, peak_mb=50.0):
+    """Stage result dict as stored in a baseline."""
+    return {'megabytes': mb_per_s * seconds, 'seconds': seconds, 'mb_per_s': mb_per_s,
+            'chunks_per_s': None, 'peak_mb': peak_mb}
+
+
+class TestRegressionCheck:
+    """Tests for comparing a run against a baseline."""
+
+    def test_within_tolerance_passes(self):
+        """Small slowdowns and memory growth inside the tolerance are not regressions."""
+        baseline = {'stages': {'sample/sanitization': stage()}}
+        current = {'stages': {'sample/sanitization': stage(mb_per_s=8.5, peak_mb=55.0)}}
+
+        assert compare_results(current, baseline, tolerance=0.25) == []
+
+    def test_slowdown_and_memory_growth_reported(self):
+        """Throughput and peak memory regressions are each reported."""
+        baseline = {'stages': {'synthetic_1x/chunking': stage()}}
+        current = {'stages': {'synthetic_1x/chunking': stage(mb_per_s=5.0, peak_mb=100.0)}}
+
+        regressions = compare_results(current, baseline, tolerance=0.25)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("synthetic_1x/chunking: throughput")
+        assert "peak memory" in regressions[1]
+
+    def test_tiny_and_missing_stages_ignored(self):
+        """Stages too fast to time, or absent from either run, never regress."""
+        baseline = {'stages': {
+            'synthetic_1x/preprocess.qa_converter': stage(seconds=0.001),
+            'synthetic_1x/faiss_index': stage(),
+        }}
+        current = {'stages': {'synthetic_1x/preprocess.qa_converter': stage(seconds=0.001, mb_per_s=1.0)}}
+
+        assert compare_results(current, baseline) == []
+
+    def test_measure_reports_throughput(self):
+        """measure() turns a run into MB/s, chunks/s and peak memory."""
+        result = measure(lambda: len([0] * 1_000_000), megabytes=2.0, repeat=2, trace_memory=True)
+
+        assert result.mb_per_s == pytest.approx(2.0 / result.seconds, rel=1e-2)
+        assert result.chunks_per_s > 0
+        assert result.peak_mb > 5
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+def test_no_regressions_against_baseline():
+    """The pipeline is no slower or hungrier than the recorded baseline."""
+    baseline = load_baseline(BASELINE_PATH)
+    if baseline is None:
+        pytest.skip(f"No baseline at {BASELINE_PATH}; run scripts/benchmark_suite.py --save-baseline")
+
+    results = run_suite(scales=parse_scales(os.environ.get('BENCHMARK_SCALES', '1,10')))
+    tolerance = float(os.environ.get('BENCHMARK_TOLERANCE', DEFAULT_TOLERANCE))
+
+    regressions = compare_results(results, baseline, tolerance)
+
+    assert not regressions, "\n".join(regressions)
@@ -7,7 +7,14 @@ including mojibake, control characters, redacted content, and encoding issues.
 
 import pytest
 
-from src.sanitization import CharacterSanitizer
+from src.parallel import ProcessPoolStrategy, SequentialStrategy
+from src.sanitization import (
+    SANITIZATION_STAGES,
+    CharacterSanitizer,
+    character_sanitizer,
+    summarize_sanitization,
+)
+from tests.legacy_sanitizer import LegacyCharacterSanitizer
 
 
 class TestMojibakeFix:
@@ -353,5 +360,287 @@ class TestEdgeCases:
         assert stats["control_chars_removed"] >= 0
 
 
+class TestFusedEngine:
+    """Test the chunked engine against the original multi-pass implementation."""
+
+    CASES = [
+        "",
+        "Plain ASCII line.\n\n\n\nNext   paragraph\twith  tabs.\n",
+        "ñêcessary dccedêñt Defeñdañt\n" * 20,
+        "Mojibake: cafÃ© donâ€™t\nfine line\n",
+        "Control\x00chars\x07here\x1b[31mred\x1b[0m\r\nCRLF\rCR\x85NEL\n",
+        "Zero\u200bwidth\ufeffBOM\ue000private\u00a0nbsp\u2000quad\n",
+        "Redacted ██ and ▓▓▓ and ▒ and █ single\n",
+        "Ligature \ufb01le and full-width \uff21\uff22 and e\u0301\n",
+        "&amp; &lt; Smith & Jones\n<b>bold</b>\nlater &amp; stays\n",
+        "AT&T v. P&EACUTE;REZ &#169;\n",
+    ]
+
+    @pytest.mark.parametrize("transliterate", [True, False])
+    @pytest.mark.parametrize("chunk_chars", [1, 16, 256, 10**6])
+    def test_identical_to_legacy(self, transliterate, chunk_chars):
+        """Text and stats match the original implementation for every chunk size."""
+        fused = CharacterSanitizer(transliterate=transliterate, chunk_chars=chunk_chars)
+        legacy = LegacyCharacterSanitizer(transliterate=transliterate)
+
+        for text in self.CASES + ["".join(self.CASES) * 3]:
+            assert fused.sanitize(text) == legacy.sanitize(text), repr(text)
+
+    def test_length_change_shifts_positional_counts(self):
+        """A chunk that changes length shifts later positions, exactly as zip() did."""
+        text = "x\x00y\n" + "caf\u00e9 na\u00efve\n" * 10
+        fused = CharacterSanitizer(chunk_chars=1)
+
+        assert fused.sanitize(text) == LegacyCharacterSanitizer().sanitize(text)
+
+    def test_plain_ascii_skips_ftfy(self, monkeypatch):
+        """Printable ASCII chunks never reach ftfy; other chunks still do."""
+        calls = []
+        real_fix_text = character_sanitizer.ftfy.fix_text
+
+        def recording_fix_text(text, **kwargs):
+            calls.append(text)
+            return real_fix_text(text, **kwargs)
+
+        monkeypatch.setattr(character_sanitizer.ftfy, "fix_text", recording_fix_text)
+        sanitizer = CharacterSanitizer(chunk_chars=1)
+
+        sanitizer.sanitize("plain line\nSmith & Jones\nnaïve line\nAT&amp;T\n")
+
+        assert calls == ["naïve line\n", "AT&amp;T\n"]
+
+    def test_html_unescaping_stops_after_tag(self):
+        """Like ftfy on the whole text, entities after a '<' line stay escaped."""
+        sanitizer = CharacterSanitizer(chunk_chars=1)
+
+        cleaned, _ = sanitizer.sanitize("a &amp; b\n<p>\nc &amp; d\n")
+
+        assert cleaned == "a & b\n<p>\nc &amp; d\n"
+
+    def test_stats_keys_unchanged(self):
+        """The stats dict keeps its keys and their order."""
+        _, stats = CharacterSanitizer().sanitize("text")
+
+        assert list(stats) == [
+            "chars_removed",
+            "mojibake_fixed",
+            "control_chars_removed",
+            "redactions_replaced",
+            "private_use_removed",
+            "transliterations",
+        ]
+
+
+class TestParallelSanitization:
+    """Test segment-parallel sanitization of long texts."""
+
+    TEXT = (
+        "Line one &amp; caf\u00e9\n\n\n"
+        "\u200b\n\n\nplain ASCII   line\n"
+        "<b>tag</b> then &amp; stays\n"
+        "\u20ac5 na\u00efve \x00 ██ \ufb01le\n\n\n\n"
+    ) * 10
+
+    def make_sanitizer(self, **kwargs):
+        return CharacterSanitizer(
+            strategy=SequentialStrategy(), parallel_min_chars=0, segment_chars=40, **kwargs
+        )
+
+    @pytest.mark.parametrize("transliterate", [True, False])
+    def test_identical_to_serial(self, transliterate):
+        """Segmented output and stats equal the serial and original results."""
+        parallel = self.make_sanitizer(transliterate=transliterate)
+        serial = CharacterSanitizer(transliterate=transliterate, max_workers=1)
+
+        result = parallel.sanitize(self.TEXT)
+
+        assert result == serial.sanitize(self.TEXT)
+        assert result == LegacyCharacterSanitizer(transliterate=transliterate).sanitize(self.TEXT)
+        assert "segment(s)" in parallel.get_log()[0]
+        assert " 1 segment(s)" not in parallel.get_log()[0]
+
+    def test_blank_lines_across_segment_edge(self):
+        """A run of newlines split between segments still collapses to one blank line."""
+        text = "first\n\n" + "\n\n\nsecond\n"
+        sanitizer = CharacterSanitizer(
+            strategy=SequentialStrategy(), parallel_min_chars=0, segment_chars=7, chunk_chars=1
+        )
+
+        cleaned, _ = sanitizer.sanitize(text)
+
+        assert cleaned == "first\n\nsecond\n"
+
+    def test_below_threshold_runs_serially(self):
+        """Texts shorter than parallel_min_chars are not split."""
+        sanitizer = CharacterSanitizer(
+            strategy=SequentialStrategy(), parallel_min_chars=10**6, segment_chars=40
+        )
+
+        sanitizer.sanitize(self.TEXT)
+
+        assert " 1 segment(s)" in sanitizer.get_log()[0]
+
+    def test_single_worker_runs_serially(self):
+        """max_workers=1 disables parallel mode regardless of length."""
+        sanitizer = CharacterSanitizer(max_workers=1, parallel_min_chars=0, segment_chars=40)
+
+        sanitizer.sanitize(self.TEXT)
+
+        assert " 1 segment(s)" in sanitizer.get_log()[0]
+
+    def test_process_pool(self):
+        """Segments round-trip through worker processes."""
+        with ProcessPoolStrategy(max_workers=2) as strategy:
+            sanitizer = CharacterSanitizer(
+                strategy=strategy, parallel_min_chars=0, segment_chars=200
+            )
+            result = sanitizer.sanitize(self.TEXT)
+
+        assert result == LegacyCharacterSanitizer().sanitize(self.TEXT)
+
+
+class TestIncrementalSanitization:
+    """Test sanitizing a document fed in line-aligned pieces."""
+
+    PIECES = [
+        "Mojibake: caf\u00c3\u00a9 don\u00e2\u20ac\u2122t &amp; more",
+        "x\x00y ██ caf\u00e9 na\u00efve\n\n\n\nmore",
+        "<b>tag</b> then &amp; stays",
+        "\u20ac5 \ufb01le \u200b end",
+    ]
+
+    @pytest.mark.parametrize("transliterate", [True, False])
+    def test_matches_sanitizing_joined_text(self, transliterate):
+        """Pieces joined by newlines give sanitize()'s text and whole-document stats."""
+        sanitizer = CharacterSanitizer(transliterate=transliterate, chunk_chars=1)
+
+        incremental = sanitizer.begin()
+        cleaned = "\n".join(incremental.feed(piece) for piece in self.PIECES)
+
+        assert (cleaned, incremental.stats()) == sanitizer.sanitize("\n".join(self.PIECES))
+
+    def test_stats_are_not_summed_per_piece(self):
+        """A length-changing fix in one piece shifts the positional counts of later pieces."""
+        sanitizer = CharacterSanitizer()
+        summed = sum(sanitizer.sanitize(piece)[1]['mojibake_fixed'] for piece in self.PIECES)
+
+        incremental = sanitizer.begin()
+        for piece in self.PIECES:
+            incremental.feed(piece)
+
+        assert incremental.stats()['mojibake_fixed'] != summed
+
+    def test_carried_text_bounded_after_length_change(self):
+        """After a shortening fix only the net length change is carried, not later windows."""
+        sanitizer = CharacterSanitizer()
+        windows = ["cafÃ© opening"] + [f"Q. Line {i} café — A. Yes." for i in range(500)]
+
+        incremental = sanitizer.begin()
+        cleaned = []
+        for window in windows:
+            cleaned.append(incremental.feed(window))
+            carried = incremental._mojibake._before + incremental._mojibake._after
+            assert len(carried) <= 1
+
+        assert ("\n".join(cleaned), incremental.stats()) == sanitizer.sanitize("\n".join(windows))
+
+    def test_carried_text_capped(self):
+        """A drift longer than max_shift is cut to its newest characters."""
+        diff = character_sanitizer._PositionalDiff(max_shift=4)
+
+        for _ in range(100):
+            diff.add("x" * 10, "y")
+
+        assert len(diff._before) == 4 and diff._after == ""
+        assert diff.total() == 100
+
+
+class TestAuditRecords:
+    """Test the opt-in structured sanitization trace."""
+
+    # Form feed and zero-width space survive ftfy and reach stage 5
+    TEXT = "plain line\ncaf\u00e9 \x0c \u200b done\n\n\n\nmore   text\n"
+
+    def make_sanitizer(self, **kwargs):
+        return CharacterSanitizer(transliterate=False, chunk_chars=1, **kwargs)
+
+    def test_no_records_without_trace(self):
+        """With tracing off only the summary for get_log() is kept."""
+        sanitizer = self.make_sanitizer(trace=False)
+
+        sanitizer.sanitize(self.TEXT)
+
+        assert sanitizer.get_records() == []
+        assert sanitizer.get_log()[0].startswith("Sanitized ")
+
+    def test_records_per_stage(self):
+        """Tracing records each stage that ran, with lengths and counts."""
+        sanitizer = self.make_sanitizer(trace=True)
+
+        cleaned, stats = sanitizer.sanitize(self.TEXT)
+        records = {record.stage: record for record in sanitizer.get_records()}
+
+        assert list(records) == [
+            "ascii_fast_path", "mojibake", "unicode_normalization",
+            "redactions", "problematic_chars", "whitespace", "total",
+        ]
+        assert records["ascii_fast_path"].counts == {"chunks": 5}
+        assert records["mojibake"].counts == {"mojibake_fixed": stats["mojibake_fixed"]}
+        assert records["problematic_chars"].counts["control_chars_removed"] == 2
+        assert records["problematic_chars"].delta == -1  # \u200b dropped, \x0c becomes a space
+        assert records["whitespace"].out_len == len(cleaned)
+        assert records["total"].in_len == len(self.TEXT)
+        assert records["total"].counts["chunks"] == 6
+        assert all(record.duration_ms >= 0 for record in records.values())
+        assert any("problematic_chars" in line for line in sanitizer.get_log())
+
+    def test_parallel_records_match_serial_lengths(self):
+        """Segment records merge into the same per-stage lengths as a serial run."""
+        text = self.TEXT * 20
+        serial = self.make_sanitizer(trace=True, max_workers=1)
+        parallel = self.make_sanitizer(
+            trace=True, strategy=SequentialStrategy(), parallel_min_chars=0, segment_chars=64
+        )
+
+        serial.sanitize(text)
+        parallel.sanitize(text)
+
+        def lengths(sanitizer):
+            return [(r.stage, r.in_len, r.out_len) for r in sanitizer.get_records()]
+
+        assert lengths(parallel) == lengths(serial)
+
+    def test_summarize_across_calls(self):
+        """Records of several calls aggregate per stage."""
+        sanitizer = self.make_sanitizer(trace=True)
+        records = []
+        for _ in range(3):
+            sanitizer.sanitize(self.TEXT)
+            records.extend(sanitizer.get_records())
+
+        summary = summarize_sanitization(records)
+
+        assert list(summary)[-1] == "total"
+        assert set(summary) <= set(SANITIZATION_STAGES) | {"total"}
+        assert summary["total"]["calls"] == 3
+        assert summary["total"]["in_len"] == 3 * len(self.TEXT)
+        assert summary["problematic_chars"]["control_chars_removed"] == 6
+
+    def test_log_is_per_thread(self):
+        """A shared sanitizer reports each thread's own last call."""
+        import threading
+
+        sanitizer = self.make_sanitizer(trace=True)
+        sanitizer.sanitize(self.TEXT)
+        seen = []
+
+        thread = threading.Thread(target=lambda: seen.append(sanitizer.get_log()))
+        thread.start()
+        thread.join()
+
+        assert seen == [[]]
+        assert sanitizer.get_log()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,109 @@
+"""
+Tests for the sampling dictionary-confidence estimator.
+"""
+
+import re
+
+import pytest
+
+from src.extraction import DictionaryConfidenceEstimator
+from src.extraction.dictionary_confidence import wilson_interval
+
+WORDS = frozenset({'the', 'court', 'finds', 'that', 'plaintiff', 'was', 'negligent'})
+GOOD_SENTENCE = "The court finds that plaintiff was negligent. "
+BAD_SENTENCE = "Xqzv brrt qwpl zzkx vvtr mnbq plkj. "
+
+
+def exact_confidence(text: str) -> float:
+    """The original full-scan implementation, for comparison."""
+    tokens = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+    return sum(1 for t in tokens if t in WORDS) / len(tokens) * 100 if tokens else 0.0
+
+
+@pytest.fixture
+def estimator():
+    """Estimator with a small sample budget so sampling is easy to trigger."""
+    return DictionaryConfidenceEstimator(WORDS, sample_chars=400, sample_windows=4, min_tokens=20)
+
+
+class TestDictionaryConfidenceEstimator:
+    """Tests for exact scoring, sampling and early stopping."""
+
+    def test_short_text_matches_full_scan(self, estimator):
+        """Texts within the budget are scored exactly, like the old findall()."""
+        text = GOOD_SENTENCE * 3 + BAD_SENTENCE * 2
+
+        result = estimator.estimate(text)
+
+        assert result.confidence == pytest.approx(exact_confidence(text))
+        assert not result.sampled
+
+    def test_empty_text(self, estimator):
+        """Empty or word-free text scores zero."""
+        assert estimator.estimate("").confidence == 0.0
+        assert estimator.estimate("12345 -- 678").confidence == 0.0
+
+    def test_long_text_is_sampled(self, estimator):
+        """Long texts examine only a bounded number of tokens."""
+        text = GOOD_SENTENCE * 5000
+
+        result = estimator.estimate(text)
+
+        assert result.sampled
+        assert result.confidence == pytest.approx(100.0)
+        assert result.sampled_tokens < 200
+
+    def test_sampling_spans_whole_text(self):
+        """Stratified windows reach every part of the text, not just the start."""
+        estimator = DictionaryConfidenceEstimator(WORDS, sample_chars=800, sample_windows=8, min_tokens=10**9)
+        text = GOOD_SENTENCE * 1000 + BAD_SENTENCE * 1000
+
+        result = estimator.estimate(text)
+
+        assert result.sampled
+        assert 30 < result.confidence < 70
+        assert result.ci_low < 50 < result.ci_high
+
+    def test_windows_do_not_split_words(self, estimator):
+        """Window edges never produce partial tokens that miss the dictionary."""
+        text = "plaintiff " * 10000
+
+        assert estimator.estimate(text).confidence == pytest.approx(100.0)
+
+    def test_stops_early_once_decided(self):
+        """Sampling stops once the interval clears the threshold."""
+        text = BAD_SENTENCE * 5000
+        early = DictionaryConfidenceEstimator(WORDS, sample_chars=4000, sample_windows=8, min_tokens=20)
+        full = DictionaryConfidenceEstimator(WORDS, sample_chars=4000, sample_windows=8, min_tokens=10**9)
+
+        assert early.estimate(text).sampled_tokens < full.estimate(text).sampled_tokens
+        assert early.estimate(text).ci_high <= early.threshold
+
+    def test_score_pages_and_summarize(self, estimator):
+        """Per-page scores pool into a token-weighted document score."""
+        pages = [GOOD_SENTENCE * 2, BAD_SENTENCE * 2]
+
+        scores = estimator.score_pages(pages)
+        summary = estimator.summarize(scores)
+
+        assert [round(s.confidence) for s in scores] == [100, 0]
+        assert summary.confidence == pytest.approx(50.0)
+        assert summary.sampled_tokens == sum(s.sampled_tokens for s in scores)
+
+
+class TestWilsonInterval:
+    """Tests for the Wilson score interval."""
+
+    def test_contains_point_estimate(self):
+        low, high = wilson_interval(80, 100)
+        assert low < 80 < high
+
+    def test_narrows_with_more_trials(self):
+        narrow = wilson_interval(800, 1000)
+        wide = wilson_interval(8, 10)
+        assert narrow[1] - narrow[0] < wide[1] - wide[0]
+
+    def test_bounded(self):
+        assert wilson_interval(0, 5)[0] == 0.0
+        assert wilson_interval(5, 5)[1] == 100.0
+        assert wilson_interval(0, 0) == (0.0, 100.0)
@@ -0,0 +1,80 @@
+"""
+Tests for the shared, lazily loaded English dictionary.
+"""
+
+import pickle
+
+import pytest
+
+from src.extraction import english_dictionary
+from src.extraction.english_dictionary import (
+    get_dictionary_load_stats,
+    get_english_words,
+    reset_english_words,
+)
+
+
+@pytest.fixture
+def fresh_dictionary():
+    """Start each test with no dictionary loaded, and leave none behind."""
+    reset_english_words()
+    yield
+    reset_english_words()
+
+
+class TestEnglishDictionary:
+    """Tests for get_english_words() loading and sharing."""
+
+    def test_returns_same_instance(self, fresh_dictionary, tmp_path):
+        """Repeated calls should share one frozenset rather than rebuild it."""
+        cache_file = tmp_path / "words.pickle"
+
+        first = get_english_words(cache_file)
+        second = get_english_words(cache_file)
+
+        assert first is second
+        assert isinstance(first, frozenset)
+        assert 'the' in first
+
+    def test_builds_from_nltk_then_writes_cache(self, fresh_dictionary, tmp_path):
+        """The first build should come from NLTK and persist a pickle."""
+        cache_file = tmp_path / "words.pickle"
+
+        words = get_english_words(cache_file)
+
+        assert get_dictionary_load_stats()['source'] == 'nltk'
+        assert get_dictionary_load_stats()['word_count'] == len(words)
+        with open(cache_file, 'rb') as f:
+            assert pickle.load(f) == words
+
+    def test_loads_from_disk_cache(self, fresh_dictionary, tmp_path, monkeypatch):
+        """A later process should unpickle the cache without touching NLTK."""
+        cache_file = tmp_path / "words.pickle"
+        with open(cache_file, 'wb') as f:
+            pickle.dump(frozenset({'alpha', 'beta'}), f)
+
+        def fail():
+            raise AssertionError("NLTK should not be used when the cache exists")
+        monkeypatch.setattr(english_dictionary, '_build_from_nltk', fail)
+
+        assert get_english_words(cache_file) == frozenset({'alpha', 'beta'})
+        assert get_dictionary_load_stats()['source'] == 'disk_cache'
+
+    def test_corrupt_cache_is_rebuilt(self, fresh_dictionary, tmp_path, monkeypatch):
+        """An unreadable pickle should fall back to NLTK and be overwritten."""
+        cache_file = tmp_path / "words.pickle"
+        cache_file.write_bytes(b"not a pickle")
+        monkeypatch.setattr(english_dictionary, '_build_from_nltk', lambda: frozenset({'gamma'}))
+
+        assert get_english_words(cache_file) == frozenset({'gamma'})
+        with open(cache_file, 'rb') as f:
+            assert pickle.load(f) == frozenset({'gamma'})
+
+    def test_extractors_share_dictionary(self):
+        """Every RawTextExtractor should reference the same word set."""
+        from src.extraction import RawTextExtractor
+
+        first = RawTextExtractor(use_cache=False)
+        second = RawTextExtractor(use_cache=False)
+
+        assert first.english_words is second.english_words
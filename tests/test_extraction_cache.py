@@ -0,0 +1,132 @@
+"""
+Tests for the content-addressed extraction cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.extraction import ExtractionCache, RawTextExtractor
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an ExtractionCache in a temporary directory."""
+    return ExtractionCache(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Create a small text document."""
+    path = tmp_path / "complaint.txt"
+    path.write_text("The plaintiff alleges negligence against the defendant.")
+    return path
+
+
+class TestExtractionCache:
+    """Tests for ExtractionCache keys, storage and eviction."""
+
+    def test_put_then_get_round_trip(self, cache, sample_file):
+        """Stored results should come back unchanged."""
+        key = cache.make_key(sample_file, {'ocr_dpi': 300})
+        cache.put(key, {'status': 'success', 'method': 'direct_read', 'extracted_text': 'hello'})
+
+        cached = cache.get(key)
+
+        assert cached['method'] == 'direct_read'
+        assert cached['extracted_text'] == 'hello'
+        assert cache.hits == 1
+
+    def test_miss_returns_none(self, cache, sample_file):
+        """Unknown keys should miss."""
+        assert cache.get(cache.make_key(sample_file, {})) is None
+        assert cache.misses == 1
+
+    def test_key_depends_on_content_not_name(self, cache, sample_file, tmp_path):
+        """Renamed copies share a key; edited files do not."""
+        copy = tmp_path / "renamed.txt"
+        copy.write_bytes(sample_file.read_bytes())
+
+        assert cache.make_key(sample_file, {}) == cache.make_key(copy, {})
+
+        copy.write_text("Different content entirely.")
+        assert cache.make_key(sample_file, {}) != cache.make_key(copy, {})
+
+    def test_key_depends_on_settings(self, cache, sample_file):
+        """Changing an extraction setting should change the key."""
+        assert cache.make_key(sample_file, {'ocr_dpi': 300}) != cache.make_key(sample_file, {'ocr_dpi': 200})
+
+    def test_only_cached_fields_are_stored(self, cache, sample_file):
+        """Per-file fields like file_path should not be persisted."""
+        key = cache.make_key(sample_file, {})
+        cache.put(key, {'status': 'success', 'file_path': '/somewhere/else.txt'})
+
+        assert 'file_path' not in cache.get(key)
+
+    def test_lru_eviction_removes_oldest_entries(self, tmp_path, sample_file):
+        """Entries beyond the size cap should be evicted oldest-first."""
+        cache = ExtractionCache(cache_dir=tmp_path / "small", max_size_mb=0.002)  # ~2KB
+        payload = 'x' * 800
+
+        for i in range(3):
+            cache.put(f"key{i}", {'status': 'success', 'extracted_text': payload})
+            entry = cache.cache_dir / f"key{i}.json"
+            os.utime(entry, (time.time() - 100 + i, time.time() - 100 + i))
+        cache.evict()
+
+        assert cache.get("key0") is None
+        assert cache.get("key2") is not None
+
+    def test_purge_and_stats(self, cache):
+        """Purge should empty the cache and stats should reflect it."""
+        cache.put("a", {'status': 'success'})
+        cache.put("b", {'status': 'success'})
+        assert cache.get_stats()['entries'] == 2
+
+        assert cache.purge() == 2
+        assert cache.get_stats()['entries'] == 0
+
+    def test_corrupt_entry_is_discarded(self, cache):
+        """Unreadable entries should count as misses and be removed."""
+        (cache.cache_dir / "bad.json").write_text("{not json")
+
+        assert cache.get("bad") is None
+        assert not (cache.cache_dir / "bad.json").exists()
+
+
+class TestExtractorCacheIntegration:
+    """Tests for ExtractionCache use inside RawTextExtractor."""
+
+    def test_second_run_is_served_from_cache(self, cache, sample_file):
+        """An unchanged file should be returned from the cache."""
+        extractor = RawTextExtractor(cache=cache)
+
+        first = extractor.process_document(str(sample_file))
+        second = extractor.process_document(str(sample_file))
+
+        assert first['from_cache'] is False
+        assert second['from_cache'] is True
+        assert second['extracted_text'] == first['extracted_text']
+        assert second['filename'] == sample_file.name
+
+    def test_modified_file_is_re_extracted(self, cache, sample_file):
+        """Editing a file should bypass its old cache entry."""
+        extractor = RawTextExtractor(cache=cache)
+        extractor.process_document(str(sample_file))
+
+        sample_file.write_text("The defendant denies every allegation in the complaint.")
+        result = extractor.process_document(str(sample_file))
+
+        assert result['from_cache'] is False
+        assert "denies" in result['extracted_text']
+
+    def test_cache_disabled(self, cache, sample_file):
+        """use_cache=False should never read or write the cache."""
+        extractor = RawTextExtractor(use_cache=False, cache=cache)
+
+        extractor.process_document(str(sample_file))
+        result = extractor.process_document(str(sample_file))
+
+        assert result['from_cache'] is False
+        assert cache.get_stats()['entries'] == 0
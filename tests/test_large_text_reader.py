@@ -0,0 +1,119 @@
+"""
+Tests for windowed reading of large TXT/RTF files.
+"""
+
+import pytest
+
+from src.extraction import RawTextExtractor
+from src.extraction.large_text_reader import (
+    find_window_cut,
+    iter_file_windows,
+    iter_line_windows,
+    iter_text_windows,
+)
+
+TRANSCRIPT_LINES = [
+    "  Q.  Did you examine the plaintiff on the morning of the incident?",
+    "  A.  Yes, I examined him in the emergency department at the hospital.",
+    "1",
+    "  Q.  What did the examination reveal about his condition at that time?",
+    "  A.  He had a fracture of the left wrist and compli-",
+    "      cated lacerations on the forearm that required sutures.",
+    "",
+    "",
+    "Page 12",
+    "  THE COURT:  Counsel, please approach the bench for a moment.",
+    "  Caf\u00e9 receipts were marked as Exhibit 4 \u2588\u2588\u2588\u2588 for identification.",
+    "  The witness\u00e2\u20ac\u2122s caf\u00c3\u00a9 notes were also produced.",
+]
+
+
+@pytest.fixture
+def transcript_file(tmp_path):
+    """A transcript-like file with CRLF endings, hyphenation, accents and mojibake."""
+    path = tmp_path / "transcript.txt"
+    body = "\r\n".join(TRANSCRIPT_LINES * 40) + "\r\n"
+    path.write_bytes(body.encode('utf-8'))
+    return path
+
+
+class TestWindowing:
+    """Tests for line-aligned window boundaries."""
+
+    def test_cut_after_last_newline(self):
+        assert find_window_cut("one\ntwo\nthr") == 8
+
+    def test_cut_skips_hyphenated_line_end(self):
+        text = "first line\nsecond compli-\n  cated"
+        assert find_window_cut(text) == len("first line\n")
+
+    def test_no_safe_cut(self):
+        assert find_window_cut("no newline here") == 0
+        assert find_window_cut("hyphen-\n") == 0
+
+    def test_windows_concatenate_to_input(self):
+        text = "\n".join(TRANSCRIPT_LINES * 5)
+        windows = list(iter_text_windows(text, window_chars=50))
+
+        assert "".join(windows) == text
+        assert len(windows) > 1
+        assert all(w.endswith("\n") for w in windows[:-1])
+
+    def test_chunks_without_newlines_are_carried(self):
+        windows = list(iter_line_windows(["abc", "def\ng", "hi"]))
+        assert windows == ["abcdef\n", "ghi"]
+
+    def test_file_windows_match_text_mode_read(self, transcript_file):
+        """Decoding via mmap must equal open(..., errors='ignore').read()."""
+        with open(transcript_file, encoding='utf-8', errors='ignore') as f:
+            expected = f.read()
+
+        # Tiny windows split CRLF pairs and multi-byte characters
+        windows = list(iter_file_windows(transcript_file, window_bytes=7))
+
+        assert "".join(windows) == expected
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert list(iter_file_windows(path)) == []
+
+
+class TestLargeTextExtraction:
+    """The windowed extractor path must match the in-memory path."""
+
+    @pytest.fixture
+    def extractor(self):
+        return RawTextExtractor(use_cache=False)
+
+    @pytest.mark.parametrize("window_bytes", [64, 500, 10**6])
+    def test_windowed_text_matches_in_memory(self, extractor, transcript_file, window_bytes):
+        expected = extractor.process_document(str(transcript_file))
+
+        streamed = extractor._process_large_text_file(transcript_file, window_bytes=window_bytes)
+
+        assert streamed['streamed']
+        assert streamed['extracted_text'] == expected['extracted_text']
+        assert sorted(streamed['case_numbers']) == sorted(expected['case_numbers'])
+        assert streamed['sanitization_stats'] == expected['sanitization_stats']
+
+    def test_large_files_switch_to_windowed_path(self, extractor, transcript_file, monkeypatch):
+        from src.extraction import raw_text_extractor
+        monkeypatch.setattr(raw_text_extractor, "LARGE_TEXT_STREAMING_MB", 0)
+
+        result = extractor.process_document(str(transcript_file))
+
+        assert result['streamed']
+        assert result['status'] == 'success'
+        assert 'normalization' in result['timings']
+
+    def test_rtf_windowed(self, extractor, tmp_path):
+        rtf = tmp_path / "motion.rtf"
+        body = "\\par\n".join(line for line in TRANSCRIPT_LINES * 10 if line)
+        rtf.write_text("{\\rtf1\\ansi " + body + "}")
+        expected = extractor.process_document(str(rtf))
+
+        streamed = extractor._process_large_text_file(rtf, window_bytes=100)
+
+        assert streamed['method'] == 'rtf_extraction'
+        assert streamed['extracted_text'] == expected['extracted_text']
@@ -9,8 +9,11 @@ Tests the new hierarchical map-reduce summarization architecture:
 Uses SequentialStrategy for deterministic testing.
 """
 
+import asyncio
+import threading
+
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from queue import Queue
 
 from src.summarization import (
@@ -19,7 +22,9 @@ from src.summarization import (
     ProgressiveDocumentSummarizer,
     MultiDocumentOrchestrator,
 )
+from src.chunking_engine import Chunk
 from src.parallel import SequentialStrategy
+from src.progressive_summarizer import ProgressiveSummarizer
 
 
 class TestDocumentSummaryResult:
@@ -174,6 +179,144 @@ class TestProgressiveDocumentSummarizer:
 
         assert result.success is False
 
+    def test_chunking_runs_off_the_event_loop(self):
+        """Chunking a long document never blocks the loop other documents share."""
+        threads = []
+
+        def chunk_document(text):
+            threads.append(threading.current_thread())
+            return []
+
+        summarizer = ProgressiveDocumentSummarizer(model_manager=Mock())
+        with patch.object(ProgressiveSummarizer, 'chunk_document', side_effect=chunk_document):
+            result = asyncio.run(summarizer.asummarize("Deposition text. " * 10, "depo.pdf"))
+
+        assert result.error_message == "Document could not be chunked"
+        assert threads and threads[0] is not threading.current_thread()
+
+    def test_final_summary_streams_to_partial_callback(self):
+        """Final summary tokens reach partial_callback; stop_check sets the stop event."""
+        async def fake_agenerate_text(prompt, max_tokens, on_token=None, stop_event=None):
+            for token in ["Plaintiff ", "sued."]:
+                on_token(token)
+            assert stop_event.is_set()
+            return "Plaintiff sued."
+
+        mock_model = Mock()
+        mock_model.agenerate_text = AsyncMock(side_effect=fake_agenerate_text)
+        summarizer = ProgressiveDocumentSummarizer(model_manager=mock_model)
+        partial = []
+
+        summary = asyncio.run(summarizer._generate_final_summary(
+            ["Chunk summary"], "complaint.pdf",
+            partial_callback=partial.append, stop_check=lambda: True
+        ))
+
+        assert summary == "Plaintiff sued."
+        assert partial == ["Plaintiff ", "sued."]
+
+
+class TestPipelinedChunks:
+    """Test concurrent chunk summarization inside batch windows."""
+
+    @staticmethod
+    def summarize_six_chunks(pipeline_window):
+        """Summarize 6 stub chunks (batch boundaries 4 and 6), recording every prompt."""
+        calls = {'prompts': [], 'in_flight': 0, 'max_in_flight': 0, 'overviews': 0}
+
+        async def fake_agenerate_text(prompt, max_tokens=500, **kwargs):
+            calls['prompts'].append(prompt)
+            calls['in_flight'] += 1
+            calls['max_in_flight'] = max(calls['max_in_flight'], calls['in_flight'])
+            await asyncio.sleep(0.01)
+            calls['in_flight'] -= 1
+            if prompt.startswith("CHUNK|"):
+                return "summary of " + prompt.rsplit("|", 1)[1]
+            calls['overviews'] += 1
+            return f"overview {calls['overviews']}"
+
+        mock_model = Mock()
+        mock_model.agenerate_text = AsyncMock(side_effect=fake_agenerate_text)
+        adapter = Mock()
+        adapter.create_chunk_prompt.side_effect = lambda **kw: (
+            f"CHUNK|{kw['global_context']}|{kw['local_context']}|{kw['chunk_text']}"
+        )
+        adapter.create_document_final_prompt.side_effect = lambda **kw: kw['chunk_summaries']
+        chunks = [Chunk(i, f"text {i}", 2) for i in range(1, 7)]
+        summarizer = ProgressiveDocumentSummarizer(
+            model_manager=mock_model, prompt_adapter=adapter, pipeline_window=pipeline_window
+        )
+
+        with patch.object(ProgressiveSummarizer, 'chunk_document', return_value=chunks), \
+                patch.object(ProgressiveSummarizer, '_get_batch_boundaries', return_value=[4, 6]):
+            result = asyncio.run(summarizer.asummarize("Deposition text. " * 10, "depo.pdf"))
+
+        chunk_prompts = {
+            int(p.rsplit(" ", 1)[1]): p.split("|")[1:3]
+            for p in calls['prompts'] if p.startswith("CHUNK|")
+        }
+        return result, calls, chunk_prompts
+
+    def test_window_chunks_run_concurrently_against_last_boundary(self):
+        """Chunks of a window overlap and share the progressive summary from the last boundary."""
+        result, calls, chunk_prompts = self.summarize_six_chunks(pipeline_window=3)
+
+        assert result.success is True
+        assert calls['max_in_flight'] == 3  # Windows: [1, 2, 3], [4], [5, 6]
+        assert chunk_prompts[2] == [
+            "Document analysis just started.", "Previous section summary not available."
+        ]
+        assert chunk_prompts[4][1] == "summary of text 3"
+        assert chunk_prompts[5] == ["overview 1", "summary of text 4"]
+        assert chunk_prompts[6][0] == "overview 1"
+        final_prompt = calls['prompts'][-1]
+        assert final_prompt.index("summary of text 1") < final_prompt.index("summary of text 6")
+
+    def test_serial_window_sees_previous_chunk(self):
+        """A window of 1 keeps the original one-chunk-at-a-time behavior."""
+        result, calls, chunk_prompts = self.summarize_six_chunks(pipeline_window=1)
+
+        assert result.success is True
+        assert calls['max_in_flight'] == 1
+        assert chunk_prompts[2][1] == "summary of text 1"
+        assert chunk_prompts[6] == ["overview 1", "summary of text 5"]
+
+    def test_failed_chunk_cancels_rest_of_window(self):
+        """When one chunk of a window fails, the others are cancelled instead of left running."""
+        cancelled = []
+
+        async def fake_agenerate_text(prompt, max_tokens=500, **kwargs):
+            if prompt.endswith("text 2"):
+                raise RuntimeError("Ollama returned 500")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(prompt.rsplit(" ", 1)[1])
+                raise
+            return "summary"
+
+        mock_model = Mock()
+        mock_model.agenerate_text = AsyncMock(side_effect=fake_agenerate_text)
+        adapter = Mock()
+        adapter.create_chunk_prompt.side_effect = lambda **kw: f"CHUNK|{kw['chunk_text']}"
+        chunks = [Chunk(i, f"text {i}", 2) for i in range(1, 4)]
+        summarizer = ProgressiveDocumentSummarizer(
+            model_manager=mock_model, prompt_adapter=adapter, pipeline_window=3
+        )
+
+        async def summarize():
+            result = await summarizer.asummarize("Deposition text. " * 10, "depo.pdf")
+            # asyncio.run() cancels leftover tasks on exit, so look before it does
+            return result, sorted(cancelled)
+
+        with patch.object(ProgressiveSummarizer, 'chunk_document', return_value=chunks), \
+                patch.object(ProgressiveSummarizer, '_get_batch_boundaries', return_value=[3]):
+            result, cancelled_on_return = asyncio.run(asyncio.wait_for(summarize(), timeout=5))
+
+        assert result.success is False
+        assert result.error_message == "Ollama returned 500"
+        assert cancelled_on_return == ["1", "3"]
+
 
 class TestMultiDocumentOrchestrator:
     """Test MultiDocumentOrchestrator parallel processing."""
@@ -234,6 +377,71 @@ class TestMultiDocumentOrchestrator:
 
         assert orchestrator.strategy.max_workers == 1
 
+    @pytest.mark.parametrize("strategy", [None, SequentialStrategy()], ids=["scheduler", "strategy"])
+    def test_failed_document_still_completes_progress(self, strategy):
+        """A document whose summarization raises still counts toward 100% progress."""
+        def summarize(**kwargs):
+            if kwargs['filename'] == "bad.pdf":
+                raise RuntimeError("Ollama returned 500")
+            return DocumentSummaryResult(
+                filename=kwargs['filename'],
+                summary="Fine.",
+                word_count=1,
+                chunk_count=1,
+                processing_time_seconds=0.0
+            )
+
+        mock_summarizer = Mock()
+        mock_summarizer.summarize.side_effect = summarize
+        mock_summarizer.asummarize = AsyncMock(side_effect=summarize)
+        mock_model = Mock()
+        mock_model.scheduler.run = asyncio.run
+        orchestrator = MultiDocumentOrchestrator(
+            document_summarizer=mock_summarizer,
+            model_manager=mock_model,
+            strategy=strategy
+        )
+        documents = [
+            {"filename": "good.pdf", "extracted_text": "Deposition text. " * 20},
+            {"filename": "bad.pdf", "extracted_text": "Deposition text. " * 20},
+        ]
+        ui_queue = Queue()
+
+        results = orchestrator._map_phase(documents, 100, None, ui_queue)
+
+        assert results["good.pdf"].success and not results["bad.pdf"].success
+        progress = [payload for kind, payload in ui_queue.queue if kind == 'progress']
+        assert progress[-1] == (100, "Processed 2/2 documents")
+
+    def test_reduce_phase_packs_summaries_by_tokens(self):
+        """Oversized summary sets are split into as few token-budgeted batches as fit."""
+        from src.ai.token_counter import TokenCounter
+
+        mock_model = Mock()
+        mock_model.token_counter = TokenCounter("test-model", chars_per_token=4.0)
+        mock_model.generate_text.return_value = "Meta."
+        orchestrator = MultiDocumentOrchestrator(
+            document_summarizer=Mock(),
+            model_manager=mock_model,
+            strategy=SequentialStrategy()
+        )
+        summaries = [
+            DocumentSummaryResult(
+                filename=f"doc{i}.pdf",
+                summary="x" * 1000,  # ~255 tokens with its header
+                word_count=1,
+                chunk_count=1,
+                processing_time_seconds=0.0
+            )
+            for i in range(10)
+        ]
+
+        assert orchestrator._reduce_phase(summaries, max_words=200) == "Meta."
+
+        prompts = [c.kwargs['prompt'] for c in mock_model.generate_text.call_args_list]
+        assert len(prompts) == 3  # Two packed batches plus the final combination
+        assert "doc5.pdf" in prompts[0] and "doc6.pdf" not in prompts[0]
+
 
 class TestIntegrationImports:
     """Test that all components import correctly."""
@@ -0,0 +1,213 @@
+"""
+Tests for the windowed OCR engine.
+
+Rasterization and Tesseract are replaced with fakes so the tests run
+without poppler or tesseract installed.
+"""
+
+import pytest
+
+from src.extraction import ocr_engine
+from src.extraction.ocr_engine import OCREngine
+from src.parallel import SequentialStrategy
+
+
+class FakeImage:
+    """Stand-in for a PIL image that remembers its page number and DPI."""
+
+    def __init__(self, page_number, dpi=300):
+        self.page_number = page_number
+        self.dpi = dpi
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    """Patch pdf2image/pytesseract and record every rasterized window."""
+    windows = []
+
+    def fake_convert(file_path, dpi, first_page, last_page):
+        windows.append((first_page, last_page))
+        return [FakeImage(n, dpi) for n in range(first_page, last_page + 1)]
+
+    monkeypatch.setattr(ocr_engine, "convert_from_path", fake_convert)
+    monkeypatch.setattr(ocr_engine, "page_pixel_variance", lambda image: 1000.0)
+    monkeypatch.setattr(
+        ocr_engine.pytesseract, "image_to_string",
+        lambda image: f"text of page {image.page_number}"
+    )
+    return windows
+
+
+class TestOCREngine:
+    """Tests for OCREngine windowing, ordering and progress."""
+
+    def test_ocr_pages_returns_text_in_page_order(self, fake_ocr):
+        """Every requested page should be OCR'd and keyed by page number."""
+        engine = OCREngine(window_pages=2, strategy=SequentialStrategy())
+
+        result = engine.ocr_pages("scan.pdf", [5, 1, 2, 3])
+
+        assert list(result) == [1, 2, 3, 5]
+        assert result[3] == "text of page 3"
+
+    def test_windows_respect_size_and_gaps(self, fake_ocr):
+        """Windows should be capped at window_pages and never span a gap."""
+        engine = OCREngine(window_pages=2, strategy=SequentialStrategy())
+
+        engine.ocr_pages("scan.pdf", [1, 2, 3, 7, 8])
+
+        assert fake_ocr == [(1, 2), (3, 3), (7, 8)]
+
+    def test_progress_reported_per_window(self, fake_ocr):
+        """Progress should count pages up to the total."""
+        engine = OCREngine(window_pages=2, strategy=SequentialStrategy())
+        progress = []
+
+        engine.ocr_pages("scan.pdf", [1, 2, 3], progress_callback=lambda d, t: progress.append((d, t)))
+
+        assert progress[-1] == (3, 3)
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    def test_empty_page_list(self, fake_ocr):
+        """No pages should mean no rasterization."""
+        engine = OCREngine(strategy=SequentialStrategy())
+
+        assert engine.ocr_pages("scan.pdf", []) == {}
+        assert fake_ocr == []
+
+    def test_window_errors_propagate(self, monkeypatch):
+        """Rasterization failures should surface to the caller."""
+        def broken_convert(*args, **kwargs):
+            raise RuntimeError("poppler not installed")
+
+        monkeypatch.setattr(ocr_engine, "convert_from_path", broken_convert)
+        engine = OCREngine(strategy=SequentialStrategy())
+
+        with pytest.raises(RuntimeError, match="poppler"):
+            engine.ocr_pages("scan.pdf", [1])
+
+    def test_single_worker_runs_without_process_pool(self, fake_ocr):
+        """max_workers=1 should OCR inline instead of starting processes."""
+        engine = OCREngine(max_workers=1)
+
+        result = engine.ocr_pages("scan.pdf", [1, 2])
+
+        assert result == {1: "text of page 1", 2: "text of page 2"}
+
+    def test_page_timings_recorded(self, fake_ocr):
+        """Each OCR'd page should get rasterization and OCR durations."""
+        engine = OCREngine(window_pages=2, strategy=SequentialStrategy())
+        page_timings = {}
+
+        engine.ocr_pages("scan.pdf", [1, 2, 4], page_timings=page_timings)
+
+        assert sorted(page_timings) == [1, 2, 4]
+        assert set(page_timings[1]) == {'rasterization_ms', 'ocr_ms'}
+        assert all(v >= 0 for t in page_timings.values() for v in t.values())
+
+
+class TestAdaptiveOcr:
+    """Tests for the low-DPI first pass, full-DPI retries and blank-page skip."""
+
+    GOOD_TEXT = "The court finds that the plaintiff was negligent."
+    GARBLED_TEXT = "Tbe c0urt flnds tbat tbe pla1ntlff vvas neg1lgent."
+
+    def test_confident_pages_stay_at_fast_dpi(self, fake_ocr, monkeypatch):
+        monkeypatch.setattr(ocr_engine.pytesseract, "image_to_string", lambda image: self.GOOD_TEXT)
+        engine = OCREngine(dpi=300, fast_dpi=150, strategy=SequentialStrategy())
+        details = {}
+
+        engine.ocr_pages("scan.pdf", [1, 2], page_details=details)
+
+        assert details == {n: {'dpi': 150, 'retries': 0, 'blank': False} for n in (1, 2)}
+        assert fake_ocr == [(1, 2)]
+
+    def test_low_confidence_pages_retry_at_full_dpi(self, fake_ocr, monkeypatch):
+        def dpi_dependent_ocr(image):
+            if image.page_number == 2 and image.dpi == 150:
+                return self.GARBLED_TEXT
+            return self.GOOD_TEXT
+
+        monkeypatch.setattr(ocr_engine.pytesseract, "image_to_string", dpi_dependent_ocr)
+        engine = OCREngine(dpi=300, fast_dpi=150, strategy=SequentialStrategy())
+        details = {}
+
+        result = engine.ocr_pages("scan.pdf", [1, 2, 3], page_details=details)
+
+        assert result[2] == self.GOOD_TEXT
+        assert details[2] == {'dpi': 300, 'retries': 1, 'blank': False}
+        assert details[1]['retries'] == 0
+        assert fake_ocr == [(1, 3), (2, 2)]
+
+    def test_retry_that_does_not_help_is_still_counted(self, fake_ocr, monkeypatch):
+        monkeypatch.setattr(ocr_engine.pytesseract, "image_to_string", lambda image: self.GARBLED_TEXT)
+        engine = OCREngine(dpi=300, fast_dpi=150, strategy=SequentialStrategy())
+        details = {}
+
+        engine.ocr_pages("scan.pdf", [1], page_details=details)
+
+        # Ties prefer the full-resolution text
+        assert details[1] == {'dpi': 300, 'retries': 1, 'blank': False}
+
+    def test_blank_pages_skip_tesseract(self, fake_ocr, monkeypatch):
+        ocr_calls = []
+
+        def recording_ocr(image):
+            ocr_calls.append(image.page_number)
+            return self.GOOD_TEXT
+
+        monkeypatch.setattr(ocr_engine.pytesseract, "image_to_string", recording_ocr)
+        monkeypatch.setattr(
+            ocr_engine, "page_pixel_variance",
+            lambda image: 0.5 if image.page_number == 2 else 1000.0
+        )
+        engine = OCREngine(dpi=300, fast_dpi=150, strategy=SequentialStrategy())
+        details = {}
+
+        result = engine.ocr_pages("scan.pdf", [1, 2, 3], page_details=details)
+
+        assert result[2] == ''
+        assert ocr_calls == [1, 3]
+        assert details[2]['blank'] is True
+        assert details[2]['retries'] == 0
+
+    def test_adaptive_disabled_uses_full_dpi(self, fake_ocr, monkeypatch):
+        seen_dpi = []
+        monkeypatch.setattr(
+            ocr_engine.pytesseract, "image_to_string",
+            lambda image: seen_dpi.append(image.dpi) or self.GARBLED_TEXT
+        )
+        engine = OCREngine(dpi=300, fast_dpi=None, strategy=SequentialStrategy())
+
+        engine.ocr_pages("scan.pdf", [1, 2])
+
+        assert seen_dpi == [300, 300]
+
+
+class TestPagePixelVariance:
+    """Tests for the blank-page variance check on real images."""
+
+    def test_blank_page_below_threshold(self):
+        from PIL import Image
+
+        from src.config import OCR_BLANK_PAGE_VARIANCE
+
+        blank = Image.new('L', (400, 520), color=250)
+
+        assert ocr_engine.page_pixel_variance(blank) < OCR_BLANK_PAGE_VARIANCE
+
+    def test_text_page_above_threshold(self):
+        from PIL import Image, ImageDraw
+
+        from src.config import OCR_BLANK_PAGE_VARIANCE
+
+        page = Image.new('RGB', (400, 520), color='white')
+        draw = ImageDraw.Draw(page)
+        for y in range(20, 500, 16):
+            draw.text((20, y), "The plaintiff filed a complaint in the supreme court.", fill='black')
+
+        assert ocr_engine.page_pixel_variance(page) > OCR_BLANK_PAGE_VARIANCE
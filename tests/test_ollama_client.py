@@ -0,0 +1,511 @@
+"""
+Tests for OllamaClient, the pooled keep-alive HTTP client for Ollama,
+OllamaScheduler, the async request scheduler, and for streamed generation
+through OllamaModelManager.
+
+Both clients run against a local stub server that counts connections, can be
+scripted to fail, and can stream chunked NDJSON like Ollama's "stream": true.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import requests
+
+from src.ai.ollama_client import OllamaClient
+from src.ai.ollama_model_manager import GenerationCancelled, GenerationStats, OllamaModelManager
+from src.ai.ollama_scheduler import DeadlineExceeded, OllamaScheduler, Priority
+
+
+class StubOllamaServer(ThreadingHTTPServer):
+    """HTTP/1.1 server answering every request with {"response": "ok"}."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.lock = threading.Lock()
+        self.script = []  # Status codes (or 'drop') for the next requests
+        self.delay = 0.0
+        self.connections = 0
+        self.requests = 0
+        self.prompts = []  # 'prompt' of each POST, in arrival order
+        self.active = 0
+        self.max_active = 0
+        self.stream_chunks = None  # Bytes sent as a chunked body instead of JSON
+        self.chunk_delay = 0.0
+        self.disconnected = threading.Event()  # Client closed a stream early
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with self.server.lock:
+            self.server.prompts.append(json.loads(body or b'{}').get('prompt'))
+        self._respond()
+
+    def _respond(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            action = server.script.pop(0) if server.script else 200
+        try:
+            time.sleep(server.delay)
+            if action == 'drop':
+                self.close_connection = True
+                return
+            if server.stream_chunks is not None and self.command == 'POST':
+                self._stream(server)
+                return
+            body = json.dumps({'response': 'ok'}).encode()
+            self.send_response(action)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _stream(self, server):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for chunk in server.stream_chunks:
+                time.sleep(server.chunk_delay)
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            server.disconnected.set()
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    stub = StubOllamaServer()
+    thread = threading.Thread(target=stub.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+def ndjson(*parts):
+    """One chunk per Ollama NDJSON line."""
+    return [json.dumps(part, ensure_ascii=False).encode() + b'\n' for part in parts]
+
+
+@pytest.fixture
+def client(server):
+    client = OllamaClient(api_base=server.url, pool_size=2, max_retries=2, backoff_seconds=0)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def scheduler(server):
+    scheduler = OllamaScheduler(api_base=server.url, backoff_seconds=0)
+    yield scheduler
+    scheduler.close()
+
+
+class TestKeepAlive:
+    """Tests for connection reuse and pooling."""
+
+    def test_sequential_requests_share_one_connection(self, client, server):
+        """Calls after the first reuse the kept-alive connection."""
+        for _ in range(5):
+            response = client.post("/api/generate", json={'prompt': 'x'}, timeout=5)
+            assert response.json() == {'response': 'ok'}
+
+        assert server.connections == 1
+        assert client.get_stats()['connections_opened'] == 1
+
+    def test_concurrent_callers_bounded_by_pool_size(self, client, server):
+        """More threads than pool slots wait for a connection instead of opening one."""
+        server.delay = 0.05
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            statuses = list(executor.map(
+                lambda _: client.get("/api/tags", timeout=5).status_code, range(12)))
+
+        assert statuses == [200] * 12
+        assert server.max_active <= 2
+        assert server.connections <= 2
+
+
+class TestRetries:
+    """Tests for retrying transient failures."""
+
+    def test_transient_5xx_retried(self, client, server):
+        """A 503 followed by success returns the success."""
+        server.script = [503, 200]
+
+        response = client.post("/api/generate", json={}, timeout=5)
+
+        assert response.status_code == 200
+        assert response.metrics.attempts == 2
+        assert client.get_stats()['retries'] == 1
+
+    def test_dropped_connection_retried(self, client, server):
+        """A connection closed without a response is retried on a new connection."""
+        client.get("/api/tags", timeout=5)
+        server.script = ['drop']
+
+        response = client.get("/api/tags", timeout=5)
+
+        assert response.status_code == 200
+        assert response.metrics.attempts == 2
+        assert server.connections == 2
+
+    def test_last_status_returned_after_retries(self, client, server):
+        """When every attempt fails the final response is returned for the caller to check."""
+        server.script = [500, 500, 500]
+
+        response = client.post("/api/generate", json={}, timeout=5)
+
+        assert response.status_code == 500
+        assert response.metrics.attempts == 3
+
+    def test_client_errors_not_retried(self, client, server):
+        """4xx statuses are returned at once."""
+        server.script = [404]
+
+        assert client.get("/api/tags", timeout=5).metrics.attempts == 1
+        assert server.requests == 1
+
+    def test_unreachable_server_raises_connection_error(self, server):
+        """Connection errors surface as requests' ConnectionError after retrying."""
+        port = server.server_address[1]
+        server.shutdown()
+        server.server_close()
+        client = OllamaClient(api_base=f"http://127.0.0.1:{port}", max_retries=1, backoff_seconds=0)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get("/api/tags", timeout=1)
+        assert client.get_stats()['errors'] == 1
+
+    def test_connect_timeout_not_retried(self, client, monkeypatch):
+        """ConnectTimeout is a ConnectionError, but like other timeouts it is raised at once."""
+        attempts = []
+
+        def time_out(*args, **kwargs):
+            attempts.append(args)
+            raise requests.exceptions.ConnectTimeout("connect timed out")
+
+        monkeypatch.setattr(client.session, "request", time_out)
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            client.get("/api/tags", timeout=1)
+        assert len(attempts) == 1
+        assert client.get_stats()['retries'] == 0
+
+
+class TestMetrics:
+    """Tests for per-request latency metrics."""
+
+    def test_connect_time_only_on_new_connections(self, client, server):
+        """Connect time is recorded when a connection opens, not when one is reused."""
+        first = client.get("/api/tags", timeout=5).metrics
+        second = client.get("/api/tags", timeout=5).metrics
+
+        assert first.connections_opened == 1
+        assert first.connect_ms > 0
+        assert second.connections_opened == 0
+        assert second.connect_ms == 0
+
+    def test_ttfb_within_total(self, client, server):
+        """Server think time shows up in time-to-first-byte."""
+        server.delay = 0.05
+
+        metrics = client.post("/api/generate", json={}, timeout=5).metrics
+
+        assert metrics.status == 200
+        assert 50 <= metrics.ttfb_ms <= metrics.total_ms
+        assert client.get_stats()['avg_ttfb_ms'] >= 50
+
+
+class TestStreaming:
+    """Tests for streamed generation."""
+
+    def test_split_utf8_reassembled(self, client, server):
+        """A multi-byte character split across chunks decodes intact."""
+        body = b''.join(ndjson({'response': 'caf\u00e9'}, {'response': '!', 'done': True}))
+        split = body.index(b'\xc3') + 1
+        server.stream_chunks = [body[:split], body[split:]]
+
+        parts = list(client.stream_json("/api/generate", json={}, timeout=5))
+
+        assert [part['response'] for part in parts] == ['caf\u00e9', '!']
+        assert client.get("/api/tags", timeout=5).status_code == 200
+        assert server.connections == 1  # Fully read streams keep the connection
+
+    def test_stream_text_reports_ttft_and_rate(self, client, scheduler, server):
+        """Tokens arrive in order; Ollama's eval counters give tokens/sec."""
+        server.stream_chunks = ndjson(
+            {'response': 'The '}, {'response': 'court'},
+            {'response': '', 'done': True, 'eval_count': 2, 'eval_duration': 500_000_000},
+        )
+        server.chunk_delay = 0.02
+        manager = OllamaModelManager(client=client, scheduler=scheduler)
+        stats = GenerationStats()
+        tokens = []
+
+        text = manager.generate_text("Summarize", max_tokens=10, on_token=tokens.append)
+        list(manager.stream_text("Summarize", max_tokens=10, stats=stats))
+
+        assert tokens == ['The ', 'court']
+        assert text == "The court"
+        assert stats.tokens == 2
+        assert stats.tokens_per_sec == pytest.approx(4.0)
+        assert 20 <= stats.ttft_ms <= stats.total_ms
+        assert not stats.cancelled
+
+    def test_stop_event_closes_connection(self, client, scheduler, server):
+        """Setting the stop event raises GenerationCancelled and disconnects the server."""
+        server.stream_chunks = ndjson(*({'response': f'w{i} '} for i in range(200)))
+        server.chunk_delay = 0.01
+        manager = OllamaModelManager(client=client, scheduler=scheduler)
+        stop_event = threading.Event()
+        tokens = []
+
+        def on_token(token):
+            tokens.append(token)
+            if len(tokens) == 3:
+                stop_event.set()
+
+        with pytest.raises(GenerationCancelled):
+            manager.generate_text("Summarize", on_token=on_token, stop_event=stop_event)
+
+        assert len(tokens) == 3
+        assert server.disconnected.wait(timeout=5)
+
+
+class FakeWorkerManager:
+    """OllamaModelManager stand-in for the worker process loop."""
+
+    is_connected = False
+
+    def __init__(self):
+        self.generating = threading.Event()
+        self.release = threading.Event()
+
+    def generate_summary(self, case_text, max_words, preset_id, on_token, stop_event):
+        self.generating.set()
+        while not self.release.wait(0.01):
+            if stop_event.is_set():
+                raise GenerationCancelled("stopped")
+        on_token("partial ")
+        return f"summary of {case_text}"
+
+    def unload_model(self):
+        pass
+
+
+class TestWorkerProcess:
+    """Tests for the UI's generation worker loop (run in a thread here)."""
+
+    @pytest.fixture
+    def worker(self, monkeypatch):
+        from queue import Queue
+
+        from src.ui import ollama_worker
+
+        manager = FakeWorkerManager()
+        monkeypatch.setattr(ollama_worker, "OllamaModelManager", lambda: manager)
+        monkeypatch.setattr(ollama_worker, "QUEUE_TIMEOUT_SECONDS", 0.05)
+        input_queue, output_queue, terminate_event = Queue(), Queue(), threading.Event()
+        thread = threading.Thread(
+            target=ollama_worker.ollama_generation_worker_process,
+            args=(input_queue, output_queue, terminate_event),
+            daemon=True,
+        )
+        thread.start()
+        yield manager, input_queue, output_queue, terminate_event
+        input_queue.put("TERMINATE")
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    @staticmethod
+    def summary_task(text):
+        return ("GENERATE_SUMMARY", {'case_text': text, 'max_words': 50, 'preset_id': 'default'})
+
+    @staticmethod
+    def wait_for(output_queue, message_type, count=1):
+        found = []
+        deadline = time.monotonic() + 5
+        while len(found) < count and time.monotonic() < deadline:
+            message = output_queue.get(timeout=5)
+            if message[0] == message_type:
+                found.append(message[1])
+        return found
+
+    def test_task_queued_during_generation_runs(self, worker):
+        """A task queued while a summary streams is run next, not consumed and dropped."""
+        manager, input_queue, output_queue, _ = worker
+        input_queue.put(self.summary_task("first"))
+        assert manager.generating.wait(timeout=5)
+
+        input_queue.put(self.summary_task("second"))
+        time.sleep(0.05)
+        manager.release.set()
+
+        results = self.wait_for(output_queue, 'summary_result', count=2)
+        assert [result['summary'] for result in results] == ["summary of first", "summary of second"]
+
+    def test_terminate_event_cancels_generation(self, worker):
+        """Setting the terminate event stops the streaming summary."""
+        manager, input_queue, output_queue, terminate_event = worker
+        input_queue.put(self.summary_task("first"))
+        assert manager.generating.wait(timeout=5)
+
+        terminate_event.set()
+
+        assert self.wait_for(output_queue, 'cancelled') == ["AI generation task cancelled."]
+
+
+def client_threads():
+    """Live threads, excluding the stub server's per-connection handlers."""
+    return {t for t in threading.enumerate() if 'process_request' not in t.name}
+
+
+class TestScheduler:
+    """Tests for OllamaScheduler's bounded, prioritized request queue."""
+
+    def test_many_requests_bounded_without_threads(self, server):
+        """Fifty coroutines share max_concurrent slots on the one loop thread."""
+        server.delay = 0.02
+        scheduler = OllamaScheduler(api_base=server.url, max_concurrent=3, pool_size=3)
+        before = client_threads()
+
+        async def burst():
+            return await asyncio.gather(*(
+                scheduler.request("/api/generate", json={'prompt': str(i)}) for i in range(50)
+            ))
+
+        try:
+            results = scheduler.run(burst())
+            assert client_threads() - before == {scheduler._thread}
+        finally:
+            scheduler.close()
+
+        assert results == [{'response': 'ok'}] * 50
+        assert server.max_active <= 3
+        assert server.connections <= 3
+        assert scheduler.get_stats()['max_in_flight'] == 3
+
+    def test_interactive_served_before_queued_batch(self, scheduler, server):
+        """An interactive request queued behind batch work is sent next."""
+        scheduler.max_concurrent = 1
+        server.delay = 0.02
+
+        def send(prompt, priority=Priority.BATCH):
+            return asyncio.ensure_future(
+                scheduler.request("/api/generate", json={'prompt': prompt}, priority=priority))
+
+        async def scenario():
+            # Tasks start in creation order: 'running' takes the only slot, the rest queue
+            tasks = [send('running'), send('b1'), send('b2'), send('qa', Priority.INTERACTIVE)]
+            await asyncio.gather(*tasks)
+
+        scheduler.run(scenario())
+
+        assert server.prompts == ['running', 'qa', 'b1', 'b2']
+        assert scheduler.get_stats()['interactive'] == 1
+
+    def test_deadline_expired_in_queue_never_sent(self, scheduler, server):
+        """A request whose deadline passes while queued raises without reaching Ollama."""
+        scheduler.max_concurrent = 1
+        server.delay = 0.2
+
+        async def scenario():
+            return await asyncio.gather(
+                scheduler.request("/api/generate", json={'prompt': 'slow'}),
+                scheduler.request("/api/generate", json={'prompt': 'late'}, deadline=0.05),
+                return_exceptions=True,
+            )
+
+        slow, late = scheduler.run(scenario())
+
+        assert slow == {'response': 'ok'}
+        assert isinstance(late, DeadlineExceeded)
+        assert server.prompts == ['slow']
+        assert scheduler.get_stats()['deadline_exceeded'] == 1
+
+    def test_deadline_in_flight_abandons_request(self, scheduler, server):
+        """A sent request is abandoned once its deadline passes."""
+        server.delay = 0.5
+
+        start = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            scheduler.post("/api/generate", json={}, deadline=0.05)
+
+        assert time.perf_counter() - start < 0.4
+
+    def test_transient_5xx_retried(self, scheduler, server):
+        """The sync facade retries a 503 and returns the decoded success."""
+        server.script = [503, 200]
+
+        assert scheduler.post("/api/generate", json={}) == {'response': 'ok'}
+        assert scheduler.get_stats()['retries'] == 1
+
+    def test_connect_time_and_ttfb_recorded(self, scheduler, server):
+        """Requests record connect time once per connection and server think time as TTFB."""
+        server.delay = 0.05
+
+        scheduler.post("/api/generate", json={})
+        scheduler.post("/api/generate", json={})
+
+        stats = scheduler.get_stats()
+        assert stats['connections_opened'] == 1
+        assert stats['avg_connect_ms'] > 0
+        assert 50 <= stats['avg_ttfb_ms'] <= stats['avg_total_ms']
+
+    def test_client_error_raised(self, scheduler, server):
+        """4xx statuses are raised at once as httpx.HTTPStatusError."""
+        server.script = [404]
+
+        with pytest.raises(httpx.HTTPStatusError):
+            scheduler.post("/api/generate", json={})
+        assert server.requests == 1
+
+    def test_request_from_another_loop(self, scheduler, server):
+        """Awaiting request() on a different event loop forwards it to the scheduler's."""
+        result = asyncio.run(scheduler.request("/api/generate", json={}))
+
+        assert result == {'response': 'ok'}
+
+    def test_run_on_loop_thread_raises(self, scheduler):
+        """Blocking on the scheduler from its own loop is refused instead of deadlocking."""
+        async def nested():
+            scheduler.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError):
+            scheduler.run(nested())
@@ -9,7 +9,7 @@ These tests verify:
 
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -86,20 +86,17 @@ class TestChunkingConfig:
 class TestOllamaPayload:
     """Test that Ollama API payload includes context window."""
 
-    @patch('src.ai.ollama_model_manager.requests.post')
+    @patch('src.ai.ollama_scheduler.OllamaScheduler.request', new_callable=AsyncMock)
     def test_num_ctx_in_payload(self, mock_post):
         """Verify num_ctx is included in Ollama API calls."""
         # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = {
             'response': 'Test summary',
             'eval_count': 10
         }
-        mock_post.return_value = mock_response
 
         # Also mock the connection check
-        with patch('src.ai.ollama_model_manager.requests.get') as mock_get:
+        with patch('src.ai.ollama_client.OllamaClient.get') as mock_get:
             mock_get_response = MagicMock()
             mock_get_response.status_code = 200
             mock_get_response.json.return_value = {'models': []}
@@ -116,7 +113,7 @@ class TestOllamaPayload:
             except Exception:
                 pass  # We just want to check the payload
 
-            # Check that requests.post was called with num_ctx in options
+            # Check that the scheduler's request was called with num_ctx in options
             if mock_post.called:
                 call_args = mock_post.call_args
                 payload = call_args.kwargs.get('json', call_args.args[1] if len(call_args.args) > 1 else {})
@@ -132,8 +129,8 @@ class TestTruncationWarning:
     """Test that truncation warnings are issued appropriately."""
 
     @patch('src.ai.ollama_model_manager.warning')
-    @patch('src.ai.ollama_model_manager.requests.post')
-    @patch('src.ai.ollama_model_manager.requests.get')
+    @patch('src.ai.ollama_scheduler.OllamaScheduler.request', new_callable=AsyncMock)
+    @patch('src.ai.ollama_client.OllamaClient.get')
     def test_warning_on_large_prompt(self, mock_get, mock_post, mock_warning):
         """Verify warning is issued when prompt approaches context limit."""
         # Setup mocks
@@ -142,10 +139,7 @@ class TestTruncationWarning:
         mock_get_response.json.return_value = {'models': []}
         mock_get.return_value = mock_get_response
 
-        mock_post_response = MagicMock()
-        mock_post_response.status_code = 200
-        mock_post_response.json.return_value = {'response': 'Summary', 'eval_count': 10}
-        mock_post.return_value = mock_post_response
+        mock_post.return_value = {'response': 'Summary', 'eval_count': 10}
 
         from src.ai.ollama_model_manager import OllamaModelManager
 
@@ -167,8 +161,8 @@ class TestTruncationWarning:
         )
 
     @patch('src.ai.ollama_model_manager.warning')
-    @patch('src.ai.ollama_model_manager.requests.post')
-    @patch('src.ai.ollama_model_manager.requests.get')
+    @patch('src.ai.ollama_scheduler.OllamaScheduler.request', new_callable=AsyncMock)
+    @patch('src.ai.ollama_client.OllamaClient.get')
     def test_no_warning_on_small_prompt(self, mock_get, mock_post, mock_warning):
         """Verify no warning for prompts well under context limit."""
         # Setup mocks
@@ -177,10 +171,7 @@ class TestTruncationWarning:
         mock_get_response.json.return_value = {'models': []}
         mock_get.return_value = mock_get_response
 
-        mock_post_response = MagicMock()
-        mock_post_response.status_code = 200
-        mock_post_response.json.return_value = {'response': 'Summary', 'eval_count': 10}
-        mock_post.return_value = mock_post_response
+        mock_post.return_value = {'response': 'Summary', 'eval_count': 10}
 
         from src.ai.ollama_model_manager import OllamaModelManager
 
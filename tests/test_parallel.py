@@ -5,6 +5,7 @@ Tests cover:
 - ExecutorStrategy implementations (ThreadPool, Sequential)
 - ParallelTaskRunner with callbacks and cancellation
 - ProgressAggregator throttling and thread safety
+- PartialTextForwarder streaming of model output
 - Integration with ProcessingWorker
 """
 
@@ -24,6 +25,8 @@ sys.path.insert(0, str(project_root))
 from src.parallel import (
     ExecutorStrategy,
     ParallelTaskRunner,
+    PartialTextForwarder,
+    ProcessPoolStrategy,
     ProgressAggregator,
     ProgressState,
     SequentialStrategy,
@@ -127,6 +130,23 @@ class TestThreadPoolStrategy:
             assert future.result(timeout=1) == 42
 
 
+class TestProcessPoolStrategy:
+    """Test ProcessPoolStrategy for CPU-bound execution."""
+
+    def test_processpool_map_processes_all_items(self):
+        """Process pool returns results for picklable functions in order."""
+        with ProcessPoolStrategy(max_workers=2) as strategy:
+            results = list(strategy.map(abs, [-1, -2, -3]))
+        assert results == [1, 2, 3]
+
+    def test_processpool_submit_returns_future(self):
+        """Submit returns a Future resolved by a worker process."""
+        with ProcessPoolStrategy(max_workers=1) as strategy:
+            future = strategy.submit(abs, -7)
+            assert future.result(timeout=30) == 7
+            assert strategy.max_workers == 1
+
+
 class TestParallelTaskRunner:
     """Test ParallelTaskRunner for task orchestration."""
 
@@ -342,6 +362,36 @@ class TestProgressAggregator:
         assert "Task" in text or "running" in text
 
 
+class TestPartialTextForwarder:
+    """Test PartialTextForwarder streaming of generated text."""
+
+    def test_forwarder_sends_text_so_far(self):
+        """Each update carries the accumulated text for its document."""
+        queue = Queue()
+        forwarder = PartialTextForwarder(queue, filename="doc.pdf", throttle_ms=0)
+
+        forwarder("The ")
+        forwarder("plaintiff")
+
+        messages = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert messages[-1] == ('summary_partial', {'filename': "doc.pdf", 'text': "The plaintiff"})
+
+    def test_forwarder_flush_sends_throttled_tail(self):
+        """Tokens held back by throttling are sent by flush(), once."""
+        queue = Queue()
+        forwarder = PartialTextForwarder(queue, throttle_ms=10_000)
+
+        for token in ["a", "b", "c"]:
+            forwarder(token)
+        forwarder.flush()
+        forwarder.flush()
+
+        messages = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert len(messages) == 2
+        assert messages[-1][1]['text'] == "abc"
+        assert forwarder.text == "abc"
+
+
 class TestProgressState:
     """Test ProgressState dataclass."""
 
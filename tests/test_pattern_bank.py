@@ -0,0 +1,81 @@
+"""
+Tests for PatternBank, the literal-prefiltered regex bank.
+
+The bank must give exactly the results of trying each pattern in turn.
+"""
+
+import random
+import re
+
+from src.preprocessing import HeaderFooterRemover, TitlePageRemover
+from src.utils.pattern_bank import PatternBank, literal_anchors
+
+
+class TestLiteralAnchors:
+    """Tests for deriving the literals a match must contain."""
+
+    def test_longest_literal_run_lowercased(self):
+        """Case-insensitive patterns anchor on their longest literal, lowercased."""
+        assert literal_anchors(re.compile(r'SUPREME\s+COURT', re.IGNORECASE)) == {'supreme'}
+
+    def test_alternation_gives_any_of(self):
+        """Every branch of a required alternation contributes an anchor."""
+        pattern = re.compile(r'^(MR|MS|DR)\.\s+[A-Z]')
+        assert literal_anchors(pattern) == {'MR', 'MS', 'DR'}
+
+    def test_optional_parts_ignored(self):
+        """Optional groups and classes give no anchor."""
+        assert literal_anchors(re.compile(r'(?:the\s+)?\d+')) is None
+        assert literal_anchors(re.compile(r'^\s*-?\s*\d+\s*-?\s*$')) is None
+
+
+class TestPatternBank:
+    """Tests for PatternBank lookups."""
+
+    def test_search_returns_first_pattern_in_list_order(self):
+        """A later match of an earlier pattern wins over an earlier match of a later one."""
+        bank = PatternBank([r'^ARGUMENT', r'^Q\.'], re.MULTILINE)
+
+        index, match = bank.search("Q. Where?\nARGUMENT")
+
+        assert index == 0
+        assert match.group(0) == "ARGUMENT"
+        assert bank.search("Nothing here") is None
+
+    def test_matching_reports_overlapping_patterns(self):
+        """Every pattern that matches is reported, even when matches overlap."""
+        bank = PatternBank([r'court\s+reporter', r'certified\s+court', r'reporter'], re.IGNORECASE)
+
+        assert bank.matching("Certified Court Reporter") == [0, 1, 2]
+
+    def test_case_sensitive_anchor_checked_on_raw_text(self):
+        """Anchors of case-sensitive patterns are not matched case-insensitively."""
+        bank = PatternBank([r'^\s*Q[\.:]'], re.MULTILINE)
+
+        assert bank.matching("  Q. Yes") == [0]
+        assert bank.matching("  q. yes") == []
+
+    def test_non_ascii_text_runs_every_pattern(self):
+        """Unicode case folding (here the Kelvin sign) is honoured."""
+        bank = PatternBank([r'kelvin'], re.IGNORECASE)
+
+        assert bank.search_any("\u212aELVIN")
+
+    def test_agrees_with_pattern_loop(self):
+        """Randomized inputs give the results of trying each pattern in turn."""
+        banks = [
+            HeaderFooterRemover.HEADER_FOOTER_PATTERNS,
+            [pattern for pattern, _ in TitlePageRemover.TITLE_PAGE_PATTERNS],
+            [pattern for pattern, _ in TitlePageRemover.CONTENT_PATTERNS],
+        ]
+        words = ("Page 12 - v. plaintiff Defendant, INDEX NO. supreme court of the state LLP "
+                 "P.C. CONFIDENTIAL exhibit 4 --- x Q. A: THE WITNESS: BY MR. Esq. \n K").split(' ')
+        rng = random.Random(0)
+
+        for patterns in banks:
+            bank = PatternBank(patterns)
+            for _ in range(300):
+                text = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+                expected = [i for i, pattern in enumerate(patterns) if pattern.search(text)]
+                assert bank.matching(text) == expected
+                assert bank.search_any(text) == bool(expected)
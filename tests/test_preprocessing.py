@@ -4,14 +4,27 @@ Tests for the Smart Preprocessing Pipeline
 Tests each preprocessor in isolation and the pipeline as a whole.
 """
 
+import time
+
+import pytest
+
 from src.preprocessing import (
+    BasePreprocessor,
     HeaderFooterRemover,
     LineNumberRemover,
+    LinePreprocessor,
+    LineStream,
+    PreprocessingCache,
     PreprocessingPipeline,
     QAConverter,
     TitlePageRemover,
     create_default_pipeline,
+    document_preprocessor,
+    preprocess_documents,
 )
+from src.preprocessing.base import PreprocessingResult
+from src.preprocessing.document_preprocessor import hash_text
+from src.utils.text_utils import combine_document_texts
 
 
 class TestLineNumberRemover:
@@ -46,6 +59,24 @@ class TestLineNumberRemover:
         assert result.text == "First line\nSecond line"
         assert result.changes_made == 2
 
+    def test_lone_number_before_blank_line_removed(self):
+        """A margin number alone on its line is dropped with the blank line after it."""
+        remover = LineNumberRemover()
+        text = "He testified.\n5\n\nMore testimony."
+        result = remover.process(text)
+
+        assert result.text == "He testified.\nMore testimony."
+        assert result.metadata['start_line_numbers'] == 1
+
+    def test_lone_end_number_takes_preceding_blank_lines(self):
+        """An end-of-line number after blank lines goes with the whitespace before it."""
+        remover = LineNumberRemover()
+        text = "He testified.  \n\n  7\nMore testimony."
+        result = remover.process(text)
+
+        assert result.text == "He testified.\nMore testimony."
+        assert result.metadata['end_line_numbers'] == 1
+
 
 class TestHeaderFooterRemover:
     """Tests for HeaderFooterRemover preprocessor."""
@@ -75,6 +106,34 @@ class TestHeaderFooterRemover:
         assert result.text == text
         assert result.changes_made == 0
 
+    def test_later_variant_matching_pattern_removes_all(self):
+        """A frequent line goes if any raw variant matches, even after non-matching ones."""
+        remover = HeaderFooterRemover()
+        # All normalize to "confidential draft"; the padded variants are too long
+        # to be headers, so only the last one matches
+        padded = "CONFIDENTIAL" + " " * 120 + "DRAFT"
+        text = "\n".join([padded, "Body one", padded, "Body two", "CONFIDENTIAL DRAFT", "Body three"])
+
+        result = remover.process(text)
+
+        assert result.text == "Body one\nBody two\nBody three"
+        assert result.metadata == {
+            'unique_patterns_removed': 1,
+            'total_lines_removed': 3,
+            'examples': [padded[:50], padded[:50], "CONFIDENTIAL DRAFT"],
+        }
+
+    def test_frequent_non_header_lines_kept(self):
+        """Repeated answers that match no pattern stay, alongside removed headers."""
+        remover = HeaderFooterRemover()
+        pages = [f"CONFIDENTIAL - {n}\nA. Yes.\nQ. Testimony {n}" for n in range(1, 5)]
+
+        result = remover.process("\n".join(pages))
+
+        assert result.text.count("A. Yes.") == 4
+        assert "CONFIDENTIAL" not in result.text
+        assert result.changes_made == 4
+
 
 class TestQAConverter:
     """Tests for Q/A Converter preprocessor."""
@@ -107,6 +166,24 @@ class TestQAConverter:
         assert "Answer: I saw the accident." in result.text
         assert result.changes_made == 2
 
+    def test_bare_marker_joined_to_next_line(self):
+        """A marker alone on its line is joined to the question or answer below it."""
+        converter = QAConverter()
+        text = "Q.\nWhere were you?\nA.\nAt home."
+        result = converter.process(text)
+
+        assert result.text == "Question: Where were you?\nAnswer: At home."
+        assert result.metadata['questions_converted'] == 1
+        assert result.metadata['answers_converted'] == 1
+
+    def test_bare_marker_stream_matches_process(self):
+        """Streaming through the pipeline joins a bare marker the same way."""
+        text = "Q.\n\n   Where were you?\nBY MR.\nSMITH:\nA.\nAt home."
+        pipeline = PreprocessingPipeline([QAConverter(), Shouter()])
+
+        assert pipeline.process(text) == QAConverter().process(text).text.upper()
+        assert pipeline.get_stats()["Q/A Converter"]['metadata']['examiner_markers'] == 1
+
 
 class TestTitlePageRemover:
     """Tests for TitlePageRemover preprocessor."""
@@ -152,6 +229,29 @@ A.  John Doe.
         assert result.text == text
         assert result.changes_made == 0
 
+    def test_page_offsets_remove_leading_pages_as_slice(self):
+        """With the extractor's page offsets, the result is the text after the title page."""
+        remover = TitlePageRemover()
+        title = make_transcript(pages=0) + "\n"
+        text = title + make_transcript(pages=4).split("\f", 1)[1].replace("\f", "\n")
+
+        result = remover.process(text, page_offsets=[0, len(title)])
+
+        assert result.text == text[len(title):]
+        assert result.metadata['pages_removed'] == 1
+
+    def test_long_text_without_page_breaks_keeps_body(self):
+        """Without page breaks only the opening lines are a title page candidate."""
+        remover = TitlePageRemover()
+        caption = make_transcript(pages=0) + "\n"
+        body = "The plaintiff and the defendant appeared with their attorneys for trial.\n" * 80
+        text = caption + body
+
+        result = remover.process(text)
+
+        assert result.text == text[text.index("\n", TitlePageRemover.FALLBACK_TITLE_CHARS) + 1:]
+        assert result.changes_made == 1
+
 
 class TestPreprocessingPipeline:
     """Tests for the PreprocessingPipeline orchestrator."""
@@ -219,3 +319,243 @@ class TestPreprocessingPipeline:
         stats = pipeline.get_stats()
         assert isinstance(stats, dict)
         assert any("Q/A Converter" in name for name in stats.keys())
+
+
+def make_transcript(pages: int = 6) -> str:
+    """Title page plus numbered Q/A pages with a running header, separated by form feeds."""
+    title = (
+        "SUPREME COURT OF THE STATE OF NEW YORK\nCOUNTY OF QUEENS\n"
+        "JOHN DOE, Plaintiff,\n    -against-\nJANE SMITH, Defendant.\n"
+        "Index No. 123456/2024\nDEPOSITION OF JOHN DOE"
+    )
+    body = []
+    for page in range(1, pages + 1):
+        lines = [f"DOE DEPOSITION - Page {page}"]
+        for number in range(1, 11):
+            marker = "Q." if number % 2 else "A."
+            lines.append(f"{number}  {marker}  Statement {page}-{number}.")
+        lines.append("BY MR. JONES:")
+        body.append("\n".join(lines))
+    return "\f".join([title, *body])
+
+
+class RaisingLineStage(LinePreprocessor):
+    """Line preprocessor that fails on its first line."""
+
+    name = "Raising Line Stage"
+
+    def transform_line(self, line, counts):
+        raise ValueError("boom")
+
+    def summarize(self, counts):
+        return 0, {}
+
+
+class SlowLineStage(LinePreprocessor):
+    """Line preprocessor that takes 1ms per line."""
+
+    name = "Slow Line Stage"
+
+    def transform_line(self, line, counts):
+        time.sleep(0.001)
+        return line
+
+    def summarize(self, counts):
+        return 0, {}
+
+
+class Shouter(BasePreprocessor):
+    """Whole-text preprocessor without streaming support."""
+
+    name = "Shouter"
+
+    def process(self, text):
+        return PreprocessingResult(text=text.upper(), changes_made=1)
+
+
+class TestStreamingPipeline:
+    """Tests for the line-streaming pipeline."""
+
+    def test_matches_stage_by_stage_processing(self):
+        """Streaming gives the text and stats of running each process() in turn."""
+        text = make_transcript()
+        pipeline = create_default_pipeline()
+
+        result = pipeline.process(text)
+
+        expected = text
+        for preprocessor in create_default_pipeline().preprocessors:
+            stage = preprocessor.process(expected)
+            expected = stage.text
+            stats = pipeline.get_stats()[preprocessor.name]
+            assert (stats['changes'], stats['metadata']) == (stage.changes_made, stage.metadata)
+        assert result == expected
+        assert "Question: Statement 1-1." in result
+        assert "SUPREME COURT" not in result
+        assert "DEPOSITION - Page" not in result
+
+    def test_line_counts_not_inflated_by_pre_scans(self):
+        """A line stage before a multi-pass pre-scan reports a single pass of changes."""
+        text = make_transcript()
+        pipeline = PreprocessingPipeline([LineNumberRemover(), HeaderFooterRemover()])
+
+        pipeline.process(text)
+
+        assert pipeline.get_stats()["Line Number Remover"]['changes'] == 60
+
+    def test_lone_markers_and_numbers_join_lines_as_whole_text_regexes_do(self):
+        """A bare Q. marker or margin number swallows the line break after it."""
+        text = "Q.\nWhere were you?\n12\n\nA.  Home."
+        pipeline = PreprocessingPipeline([LineNumberRemover(), QAConverter()])
+
+        assert pipeline.process(text) == "Question: Where were you?\nAnswer: Home."
+
+    def test_non_streaming_preprocessor_supported(self):
+        """Preprocessors that only implement process() still run in order."""
+        pipeline = PreprocessingPipeline([QAConverter(), Shouter(), LineNumberRemover()])
+
+        result = pipeline.process("Q.  one\n2  two")
+
+        assert result == "QUESTION: ONE\nTWO"
+        assert pipeline.total_changes == 3
+
+    def test_failure_while_streaming_falls_back(self):
+        """An error raised mid-stream only skips the failing stage."""
+        pipeline = PreprocessingPipeline([QAConverter(), RaisingLineStage()])
+
+        result = pipeline.process("Q.  one")
+
+        assert result == "Question: one"
+        assert pipeline.get_stats()["Raising Line Stage"]['error'] == "boom"
+
+    def test_stats_time_line_work_done_while_joining(self):
+        """A line stage's time covers its transforms, not just its (empty) pre-scan."""
+        pipeline = PreprocessingPipeline([QAConverter(), SlowLineStage()])
+
+        pipeline.process("Q.  one\n" * 30)
+
+        stats = pipeline.get_stats()["Slow Line Stage"]
+        assert stats['time_ms'] >= 30
+        assert stats['scan_ms'] < stats['time_ms']
+
+    def test_fallback_passes_page_offsets(self):
+        """Stage-by-stage processing still gives the extractor's page offsets to the first stage."""
+        title = make_transcript(pages=0) + "\n"
+        text = title + make_transcript(pages=2).split("\f", 1)[1].replace("\f", "\n")
+        pipeline = PreprocessingPipeline([TitlePageRemover(), RaisingLineStage()])
+
+        result = pipeline.process(text, page_offsets=[0, len(title)])
+
+        assert result == text[len(title):]
+        assert pipeline.get_stats()["Raising Line Stage"]['error'] == "boom"
+
+    def test_line_stream_restarts_each_pass(self):
+        """Each iteration re-reads the source, and from_text keeps the string."""
+        lines = LineStream.from_text("a\n\nb\n")
+
+        assert list(lines) == list(lines) == ["a", "", "b", ""]
+        assert lines.materialize() == "a\n\nb\n"
+
+
+class TestDocumentPreprocessing:
+    """Tests for per-document preprocessing with caching."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Record the texts actually run through the pipeline."""
+        seen = []
+        original = document_preprocessor.preprocess_document
+
+        def counting(text, page_offsets=None):
+            seen.append(text)
+            return original(text, page_offsets)
+
+        monkeypatch.setattr(document_preprocessor, 'preprocess_document', counting)
+        return seen
+
+    def test_header_counts_stay_within_a_document(self):
+        """A line repeated twice in each of two documents is not a header."""
+        doc = "CONFIDENTIAL\nBody of the page.\nCONFIDENTIAL\nMore body."
+
+        separate = preprocess_documents([doc, doc.replace("body", "text")], cache=PreprocessingCache())
+
+        assert all(text.count("CONFIDENTIAL") == 2 for text in separate)
+        assert "CONFIDENTIAL" not in create_default_pipeline().process(doc + "\n" + doc)
+
+    def test_rerun_uses_cache(self, calls):
+        """Preprocessing the same documents again skips the pipeline."""
+        cache = PreprocessingCache()
+        texts = ["1  Q.  First?", "1  A.  Second."]
+
+        first = preprocess_documents(texts, cache=cache)
+        second = preprocess_documents(texts, cache=cache)
+
+        assert first == second == ["Question: First?", "Answer: Second."]
+        assert len(calls) == 2
+        assert cache.get_stats()['hits'] == 2
+
+    def test_duplicate_and_empty_documents(self, calls):
+        """Identical documents are preprocessed once; empty ones pass through."""
+        result = preprocess_documents(["Q.  Same", "", "Q.  Same"], cache=PreprocessingCache())
+
+        assert result == ["Question: Same", "", "Question: Same"]
+        assert calls == ["Q.  Same"]
+
+    def test_failure_returns_raw_text_uncached(self, monkeypatch):
+        """A failing document keeps its raw text and is retried next time."""
+        def failing(text, page_offsets=None):
+            raise RuntimeError("worker died")
+
+        monkeypatch.setattr(document_preprocessor, 'preprocess_document', failing)
+        cache = PreprocessingCache()
+
+        assert preprocess_documents(["Q.  Raw"], cache=cache) == ["Q.  Raw"]
+        assert cache.get(hash_text("Q.  Raw")) is None
+
+    def test_process_pool_matches_in_process(self):
+        """Worker processes give the same texts as in-process preprocessing."""
+        texts = [f"{n}  Q.  Question {n}?\n{n}  A.  Answer {n}." for n in range(1, 4)]
+
+        parallel = preprocess_documents(
+            texts, cache=PreprocessingCache(), max_workers=2, parallel_min_chars=0
+        )
+
+        assert parallel == preprocess_documents(texts, cache=PreprocessingCache())
+
+    def test_cache_evicts_least_recently_used(self):
+        """Entries beyond the size cap are evicted oldest-use first."""
+        cache = PreprocessingCache(max_size_mb=10 / (1024 * 1024))
+        cache.put("a", "12345")
+        cache.put("b", "12345")
+        cache.get("a")
+        cache.put("c", "12345")
+
+        assert cache.get("a") == "12345"
+        assert cache.get("b") is None
+
+    def test_page_offsets_reach_title_page_remover(self):
+        """Documents' page offsets are used for title page removal and kept in the cache key."""
+        cache = PreprocessingCache()
+        title = make_transcript(pages=0) + "\n"
+        text = title + "Q.  Where do you live?\nA.  In Queens."
+
+        with_offsets, without_offsets = preprocess_documents(
+            [text, text], page_offsets=[[0, len(title)], None], cache=cache
+        )
+
+        assert with_offsets == "Question: Where do you live?\nAnswer: In Queens."
+        assert "SUPREME COURT" in without_offsets
+        assert cache.get_stats()['entries'] == 2
+
+    def test_combine_adds_headers_after_preprocessing(self):
+        """Filename headers are added to the already preprocessed documents."""
+        docs = [
+            {'filename': 'a.pdf', 'extracted_text': "1  Q.  Hello?"},
+            {'filename': 'b.pdf', 'extracted_text': ""},
+            {'filename': 'c.pdf', 'extracted_text': "1  A.  World."},
+        ]
+
+        combined = combine_document_texts(docs, include_headers=True)
+
+        assert combined == "--- a.pdf ---\nQuestion: Hello?\n\n--- c.pdf ---\nAnswer: World."
+
@@ -160,3 +160,21 @@ def test_generate_summary_metadata_single_item(progressive_summarizer_instance):
     assert metadata['document_count'] == 1
     assert metadata['average_summary_length'] == len('This document is about cats and dogs.'.split()) # 7 words
     assert metadata['most_frequent_keyword'] in ['cat', 'dog', 'pet'] # Can be any if counts are equal
+
+def test_pipeline_windows_stop_at_batch_boundaries(progressive_summarizer_instance):
+    """
+    Windows hold at most window_size chunks and never cross a batch boundary.
+    """
+    boundaries = progressive_summarizer_instance._get_batch_boundaries(12)  # [5, 10, 12]
+
+    windows = progressive_summarizer_instance._get_pipeline_windows(12, boundaries, window_size=3)
+
+    assert windows == [[1, 2, 3], [4, 5], [6, 7, 8], [9, 10], [11, 12]]
+
+def test_pipeline_windows_default_to_serial(progressive_summarizer_instance):
+    """
+    Without fast_mode.pipeline_window every chunk is its own window.
+    """
+    windows = progressive_summarizer_instance._get_pipeline_windows(3, [3])
+
+    assert windows == [[1], [2], [3]]
@@ -102,6 +102,19 @@ class TestTextFileProcesing:
         assert result['confidence'] == 100
         assert len(result['extracted_text']) > 0
 
+    def test_process_txt_file_reports_stage_timings(self, tmp_path):
+        """Each stage that ran should appear in the timings breakdown."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("The plaintiff alleges negligence.\nThe defendant denies all allegations.")
+
+        # Bypass the extraction cache so every stage actually runs
+        result = RawTextExtractor(use_cache=False).process_document(str(test_file))
+
+        timings = result['timings']
+        assert {'text_read', 'normalization', 'sanitization', 'total'} <= set(timings)
+        assert 'pdf_extraction' not in timings
+        assert timings['total'] >= timings['text_read']
+
 
 class TestPageNumberRemoval:
     """Tests for page number removal."""
@@ -306,5 +319,172 @@ The defendant said \ldblquote no comment\rdblquote in response.\par
         assert 'defendant' in result['extracted_text'].lower()
 
 
+class TestStreamingPdfExtraction:
+    """Tests for page-by-page PDF extraction."""
+
+    SAMPLE_PDF = (
+        Path(__file__).parent.parent / "sampleDocuments"
+        / "700321_2022_LUIGI_NAPOLITANO_v_ROBERT_L_WIGHTON_M_D_et_al_ANSWER_13.pdf"
+    )
+
+    @pytest.fixture
+    def extractor(self):
+        return RawTextExtractor()
+
+    def test_iter_pdf_pages_yields_pages_in_order(self, extractor):
+        """Pages should be yielded one at a time with 1-based page numbers."""
+        if not self.SAMPLE_PDF.exists():
+            pytest.skip("Sample PDF not found")
+
+        pages = list(extractor.iter_pdf_pages(self.SAMPLE_PDF))
+
+        assert len(pages) > 1
+        assert [number for number, _ in pages] == list(range(1, len(pages) + 1))
+        assert all(isinstance(text, str) for _, text in pages)
+
+    def test_extract_pdf_text_matches_streamed_pages(self, extractor):
+        """Joined extraction should equal the streamed pages joined once."""
+        if not self.SAMPLE_PDF.exists():
+            pytest.skip("Sample PDF not found")
+
+        text, page_count, error_type = extractor._extract_pdf_text(self.SAMPLE_PDF)
+        streamed = "".join(f"{t}\n" for _, t in extractor.iter_pdf_pages(self.SAMPLE_PDF) if t)
+
+        assert error_type is None
+        assert page_count == len(list(extractor.iter_pdf_pages(self.SAMPLE_PDF)))
+        assert text == streamed
+
+    def test_extract_pdf_text_invalid_file(self, extractor, tmp_path):
+        """A non-PDF file should be reported as an error, not raise."""
+        bad_pdf = tmp_path / "broken.pdf"
+        bad_pdf.write_bytes(b"not a pdf at all")
+
+        text, page_count, error_type = extractor._extract_pdf_text(bad_pdf)
+
+        assert text is None
+        assert page_count == 0
+        assert error_type is not None
+
+
+class TestPerPageOcrFallback:
+    """Tests for page-level digital/OCR classification."""
+
+    DIGITAL_PAGE = (
+        "The plaintiff filed a complaint against the defendant in the supreme court. "
+        "The defendant answered the complaint and denied each of the allegations."
+    )
+
+    @pytest.fixture
+    def extractor(self):
+        return RawTextExtractor()
+
+    def test_all_digital_pages_skip_ocr(self, extractor, monkeypatch, tmp_path):
+        """A fully digital PDF should never call the OCR engine."""
+        monkeypatch.setattr(
+            extractor, "_extract_pdf_pages",
+            lambda path, page_timings=None: ([self.DIGITAL_PAGE, self.DIGITAL_PAGE], 2, None)
+        )
+
+        def fail_ocr(path, pages, progress_callback=None, page_timings=None, page_details=None):
+            raise AssertionError("OCR should not run")
+
+        monkeypatch.setattr(extractor, "_ocr_pages", fail_ocr)
+
+        result = extractor._process_pdf(tmp_path / "digital.pdf")
+
+        assert result['method'] == 'digital_text'
+        assert result['confidence'] == 100
+        assert [p['method'] for p in result['page_results']] == ['digital_text', 'digital_text']
+
+    def test_only_failing_pages_are_ocrd(self, extractor, monkeypatch, tmp_path):
+        """Only the scanned page should be OCR'd and merged back in order."""
+        monkeypatch.setattr(
+            extractor, "_extract_pdf_pages",
+            lambda path, page_timings=None: ([self.DIGITAL_PAGE, "", self.DIGITAL_PAGE], 3, None)
+        )
+        ocr_calls = []
+
+        def fake_ocr(path, pages, progress_callback=None, page_timings=None, page_details=None):
+            ocr_calls.append(list(pages))
+            return {2: "The witness signed the exhibit in the presence of the notary."}
+
+        monkeypatch.setattr(extractor, "_ocr_pages", fake_ocr)
+
+        result = extractor._process_pdf(tmp_path / "mixed.pdf")
+
+        assert ocr_calls == [[2]]
+        assert result['method'] == 'mixed'
+        assert {'pdf_extraction', 'confidence_check', 'ocr', 'ocr_wall'} <= set(result['timings'])
+        assert [p['method'] for p in result['page_results']] == ['digital_text', 'ocr', 'digital_text']
+        text = result['extracted_text']
+        assert text.index("witness signed") > text.index("plaintiff filed")
+        assert text.rindex("plaintiff filed") > text.index("witness signed")
+
+    def test_all_scanned_pages_report_ocr(self, extractor, monkeypatch, tmp_path):
+        """A fully scanned PDF should report the 'ocr' method."""
+        monkeypatch.setattr(extractor, "_extract_pdf_pages", lambda path, page_timings=None: (["", ""], 2, None))
+        monkeypatch.setattr(
+            extractor, "_ocr_pages",
+            lambda path, pages, progress_callback=None, page_timings=None, page_details=None: dict.fromkeys(pages, self.DIGITAL_PAGE)
+        )
+
+        result = extractor._process_pdf(tmp_path / "scanned.pdf")
+
+        assert result['method'] == 'ocr'
+        assert result['confidence'] > 80
+
+    def test_ocr_details_reported_per_page(self, extractor, monkeypatch, tmp_path):
+        """OCR'd pages should report the DPI kept, retries and blank detection."""
+        monkeypatch.setattr(extractor, "_extract_pdf_pages", lambda path, page_timings=None: (["", ""], 2, None))
+
+        def fake_ocr(path, pages, progress_callback=None, page_timings=None, page_details=None):
+            page_details.update({
+                1: {'dpi': 300, 'retries': 1, 'blank': False},
+                2: {'dpi': 150, 'retries': 0, 'blank': True},
+            })
+            return {1: self.DIGITAL_PAGE, 2: ""}
+
+        monkeypatch.setattr(extractor, "_ocr_pages", fake_ocr)
+
+        result = extractor._process_pdf(tmp_path / "scanned.pdf")
+
+        first, second = result['page_results']
+        assert (first['ocr_dpi'], first['ocr_retries'], first['blank']) == (300, 1, False)
+        assert (second['ocr_dpi'], second['blank']) == (150, True)
+
+    def test_ocr_failure_returns_error(self, extractor, monkeypatch, tmp_path):
+        """OCR failures should surface as an error result."""
+        monkeypatch.setattr(extractor, "_extract_pdf_pages", lambda path, page_timings=None: ([""], 1, None))
+
+        def broken_ocr(path, pages, progress_callback=None, page_timings=None, page_details=None):
+            raise RuntimeError("tesseract missing")
+
+        monkeypatch.setattr(extractor, "_ocr_pages", broken_ocr)
+
+        result = extractor._process_pdf(tmp_path / "scanned.pdf")
+
+        assert result['status'] == 'error'
+        assert 'tesseract missing' in result['error_message']
+
+    def test_page_offsets_follow_normalization(self, monkeypatch, tmp_path):
+        """Page offsets point at each page's first remaining line of the final text."""
+        extractor = RawTextExtractor(use_cache=False)
+        pages = [
+            self.DIGITAL_PAGE + "\nPage 1",
+            "2\n" + self.DIGITAL_PAGE + " The com-",
+            "plaint was served on the defendant.\n" + self.DIGITAL_PAGE,
+        ]
+        monkeypatch.setattr(extractor, "_extract_pdf_pages", lambda path, page_timings=None: (pages, 3, None))
+        pdf_path = tmp_path / "paged.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+
+        result = extractor.process_document(str(pdf_path))
+
+        first, second, third = result['extracted_text'].split('\n')
+        # The page 3 words joined onto page 2's last line stay with page 2
+        assert second.endswith("The complaint was served on the defendant.")
+        assert result['page_offsets'] == [0, len(first) + 1, len(first) + len(second) + 2]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,198 @@
+"""
+Tests for the on-disk LLM response cache.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.ai import OllamaModelManager, ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a ResponseCache in a temporary directory."""
+    cache = ResponseCache(db_path=tmp_path / "responses.sqlite3")
+    yield cache
+    cache.close()
+
+
+def make_payload(prompt="Extract parties", **overrides):
+    """A /api/generate payload like OllamaModelManager builds."""
+    payload = {
+        'model': 'gemma3:1b',
+        'prompt': prompt,
+        'stream': False,
+        'options': {'num_ctx': 2048, 'temperature': 0.0, 'top_p': 0.9, 'num_predict': 500},
+    }
+    for name, value in overrides.items():
+        if name in ('temperature', 'top_p', 'num_predict', 'num_ctx'):
+            payload['options'][name] = value
+        else:
+            payload[name] = value
+    return payload
+
+
+class TestResponseCache:
+    """Tests for ResponseCache keys, storage and eviction."""
+
+    def test_put_then_get_round_trip(self, cache):
+        """Stored text comes back unchanged and counts as a hit."""
+        key = cache.make_key(make_payload())
+        cache.put(key, '{"parties": []}', model='gemma3:1b')
+
+        assert cache.get(key) == '{"parties": []}'
+        assert cache.hits == 1
+
+    def test_miss_returns_none(self, cache):
+        """Unknown keys miss."""
+        assert cache.get(cache.make_key(make_payload())) is None
+        assert cache.misses == 1
+
+    @pytest.mark.parametrize('field, value', [
+        ('model', 'llama3:8b'),
+        ('prompt', 'Extract dates'),
+        ('temperature', 0.3),
+        ('top_p', 0.5),
+        ('num_predict', 100),
+        ('num_ctx', 4096),
+        ('format', 'json'),
+    ])
+    def test_key_depends_on_generation_settings(self, cache, field, value):
+        """Changing anything that affects the output changes the key."""
+        assert cache.make_key(make_payload(**{field: value})) != cache.make_key(make_payload())
+
+    def test_key_ignores_streaming(self, cache):
+        """Streamed and non-streamed requests share entries."""
+        assert cache.make_key(make_payload(stream=True)) == cache.make_key(make_payload())
+
+    def test_only_deterministic_requests_apply(self, tmp_path, cache):
+        """Temperature above 0 is cached only when explicitly enabled."""
+        assert cache.applies_to(make_payload(temperature=0))
+        assert not cache.applies_to(make_payload(temperature=0.3))
+
+        # Ollama ignores a top-level temperature, so it does not make a request deterministic
+        top_level = make_payload(temperature=0.3)
+        top_level['temperature'] = 0
+        assert not cache.applies_to(top_level)
+
+        enabled = ResponseCache(db_path=tmp_path / "all.sqlite3", cache_all_temperatures=True)
+        assert enabled.applies_to(make_payload(temperature=0.3))
+        enabled.close()
+
+    def test_lru_eviction_removes_least_recently_used(self, tmp_path):
+        """Entries beyond the size cap are evicted least-recently-used first."""
+        cache = ResponseCache(db_path=tmp_path / "small.sqlite3", max_size_mb=0.002)  # ~2KB
+        text = 'x' * 800
+
+        cache.put("key0", text)
+        cache.put("key1", text)
+        cache.get("key0")  # key1 is now least recently used
+        cache.put("key2", text)
+
+        assert cache.get("key1") is None
+        assert cache.get("key0") == text
+        assert cache.get("key2") == text
+        assert cache.get_stats()['size_mb'] <= 0.002
+        cache.close()
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """A new cache over the same file sees earlier entries and their size."""
+        db_path = tmp_path / "responses.sqlite3"
+        first = ResponseCache(db_path=db_path)
+        first.put("key", "Plaintiff sued. " * 2000)
+        first.close()
+
+        second = ResponseCache(db_path=db_path)
+
+        assert second.get("key") == "Plaintiff sued. " * 2000
+        assert second.get_stats()['size_mb'] == 0.03
+        second.close()
+
+    def test_purge_and_stats(self, cache):
+        """Purge empties the cache; stats report hits, misses and hit rate."""
+        cache.put("a", "one")
+        cache.put("b", "two")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats['entries'] == 2
+        assert stats['hit_rate'] == 0.5
+
+        assert cache.purge() == 2
+        assert cache.get_stats()['entries'] == 0
+
+
+@pytest.fixture
+def manager_factory(cache):
+    """Build OllamaModelManagers whose scheduler is an AsyncMock returning canned text."""
+    def build(response='{"parties": {"plaintiffs": ["Smith"]}}', **kwargs):
+        scheduler = Mock()
+        scheduler.request = AsyncMock(return_value={'response': response, 'done': True})
+        scheduler.run = asyncio.run
+        with patch('src.ai.ollama_client.OllamaClient.get') as mock_get:
+            mock_get.return_value = MagicMock(status_code=200, json=lambda: {'models': []})
+            manager = OllamaModelManager(scheduler=scheduler, response_cache=cache, **kwargs)
+        manager.is_connected = True
+        return manager
+    return build
+
+
+class TestModelManagerCacheIntegration:
+    """Tests for ResponseCache use inside OllamaModelManager."""
+
+    def test_repeated_structured_request_served_from_cache(self, manager_factory, cache):
+        """The second identical extraction does not reach Ollama."""
+        manager = manager_factory()
+
+        first = manager.generate_structured("Extract parties")
+        second = manager.generate_structured("Extract parties")
+
+        assert first == second == {'parties': {'plaintiffs': ['Smith']}}
+        assert manager.scheduler.request.await_count == 1
+        assert cache.hits == 1
+
+    def test_sampled_text_not_cached_by_default(self, manager_factory, cache):
+        """Summaries at temperature above 0 always regenerate."""
+        manager = manager_factory(response="A summary.")
+
+        manager.generate_text("Summarize", temperature=0.3)
+        manager.generate_text("Summarize", temperature=0.3)
+
+        assert manager.scheduler.request.await_count == 2
+        assert cache.get_stats()['entries'] == 0
+
+    def test_sampling_settings_sent_in_options(self, manager_factory):
+        """Temperature, top_p and num_predict go where Ollama reads them: in options."""
+        manager = manager_factory(response="A summary.")
+
+        manager.generate_text("Summarize", max_tokens=200, temperature=0, top_p=0.8)
+
+        payload = manager.scheduler.request.await_args.kwargs['json']
+        options = payload['options']
+        assert (options['temperature'], options['top_p'], options['num_predict']) == (0, 0.8, 200)
+        assert not {'temperature', 'top_p', 'num_predict'} & payload.keys()
+
+    def test_cache_hit_replayed_to_on_token(self, manager_factory):
+        """A streamed caller receives a cached answer through on_token."""
+        manager = manager_factory(response="The court ruled.")
+        manager.generate_text("Summarize", temperature=0)
+        tokens = []
+
+        text = manager.generate_text("Summarize", temperature=0, on_token=tokens.append)
+
+        assert text == "The court ruled."
+        assert tokens == ["The court ruled."]
+        assert manager.scheduler.request.await_count == 1
+
+    def test_cache_disabled(self, manager_factory, cache):
+        """use_cache=False never reads or writes the cache."""
+        manager = manager_factory(use_cache=False)
+
+        manager.generate_structured("Extract parties")
+        manager.generate_structured("Extract parties")
+
+        assert manager.scheduler.request.await_count == 2
+        assert cache.get_stats()['entries'] == 0
@@ -0,0 +1,67 @@
+"""
+Tests for batch aggregation of extraction stage timings.
+"""
+
+import pytest
+
+from src.extraction.timing_summary import format_timing_summary, percentile, summarize_timings
+
+
+def make_result(filename, **timings):
+    return {'filename': filename, 'timings': timings}
+
+
+class TestPercentile:
+    """Tests for the interpolated percentile helper."""
+
+    def test_median_of_odd_list(self):
+        assert percentile([3, 1, 2], 50) == 2
+
+    def test_interpolates(self):
+        assert percentile([0, 10], 95) == pytest.approx(9.5)
+
+    def test_single_value(self):
+        assert percentile([7], 95) == 7
+
+
+class TestSummarizeTimings:
+    """Tests for summarize_timings()."""
+
+    def test_stages_summarized_where_they_ran(self):
+        results = [
+            make_result("a.txt", text_read=1.0, sanitization=2.0, total=4.0),
+            make_result("b.pdf", pdf_extraction=50.0, ocr=900.0, ocr_wall=500.0, sanitization=4.0, total=960.0),
+            make_result("c.pdf", pdf_extraction=30.0, sanitization=6.0, total=40.0),
+        ]
+
+        summary = summarize_timings(results)
+
+        assert summary['documents'] == 3
+        assert summary['stages']['sanitization']['count'] == 3
+        assert summary['stages']['sanitization']['p50'] == 4.0
+        assert summary['stages']['pdf_extraction']['count'] == 2
+        assert summary['stages']['ocr']['max'] == 900.0
+
+    def test_stages_in_pipeline_order(self):
+        summary = summarize_timings([make_result("a.pdf", total=3.0, sanitization=1.0, pdf_extraction=2.0)])
+
+        assert list(summary['stages']) == ['pdf_extraction', 'sanitization', 'total']
+
+    def test_slowest_files(self):
+        results = [make_result(f"doc{i}.pdf", ocr=i * 10.0, ocr_wall=i * 5.0, total=i * 11.0) for i in range(10)]
+
+        summary = summarize_timings(results, slowest=3)
+
+        assert [d['filename'] for d in summary['slowest']] == ['doc9.pdf', 'doc8.pdf', 'doc7.pdf']
+        assert summary['slowest'][0]['slowest_stage'] == 'ocr'
+
+    def test_results_without_timings_ignored(self):
+        summary = summarize_timings([{'filename': 'old.pdf'}, make_result("a.txt", total=1.0)])
+
+        assert summary['documents'] == 1
+
+    def test_format_includes_stages_and_files(self):
+        text = format_timing_summary(summarize_timings([make_result("slow.pdf", ocr=5.0, total=6.0)]))
+
+        assert 'ocr' in text
+        assert 'slow.pdf' in text
@@ -0,0 +1,101 @@
+"""
+Tests for TokenCounter, the per-model token counting service.
+"""
+
+import pytest
+
+from src.ai.token_counter import TokenCounter, find_tokenizer_file
+
+
+@pytest.fixture
+def estimator():
+    """A counter with no tokenizer file, estimating at 4 chars/token."""
+    return TokenCounter("test-model", chars_per_token=4.0)
+
+
+@pytest.fixture
+def tokenizers_dir(tmp_path):
+    """A directory holding a word-level tokenizer saved as the 'gemma3' family file."""
+    tokenizers = pytest.importorskip("tokenizers")
+    vocab = {'[UNK]': 0, 'the': 1, 'court': 2, 'ruled': 3}
+    tokenizer = tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab, unk_token='[UNK]'))
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tokenizer.save(str(tmp_path / "gemma3.json"))
+    return tmp_path
+
+
+class TestEstimator:
+    """Tests for the fallback estimate."""
+
+    def test_counts_round_up(self, estimator):
+        """Partial tokens count as whole ones so budgets are never overrun."""
+        assert estimator.count("x" * 400) == 100
+        assert estimator.count("x" * 401) == 101
+        assert estimator.count("") == 0
+        assert not estimator.is_exact
+
+    def test_counts_are_memoized(self, estimator):
+        """Measuring the same string again is served from the LRU cache."""
+        estimator.count("The court ruled.")
+        estimator.count("The court ruled.")
+
+        assert estimator._count_cached.cache_info().hits == 1
+
+    def test_calibrates_from_observed_counts(self, estimator):
+        """Real prompt token counts reported by Ollama replace the default ratio."""
+        estimator.count("x" * 300)
+        estimator.calibrate("x" * 3000, 1000)
+
+        assert estimator.chars_per_token == pytest.approx(3.0)
+        assert estimator.count("x" * 300) == 100  # Memoized count was invalidated
+
+    def test_implausible_observations_ignored(self, estimator):
+        """A tiny count (e.g. a prefix-cached prompt) does not skew the estimate."""
+        estimator.calibrate("x" * 3000, 10)
+
+        assert estimator.chars_per_token == 4.0
+
+
+class TestTokenizerFile:
+    """Tests for loading the model's real tokenizer."""
+
+    def test_family_file_found_for_sized_model(self, tokenizers_dir):
+        """gemma3:1b falls back to the gemma3 family tokenizer."""
+        assert find_tokenizer_file("gemma3:1b", tokenizers_dir) == tokenizers_dir / "gemma3.json"
+        assert find_tokenizer_file("llama3:8b", tokenizers_dir) is None
+
+    def test_exact_counts_from_tokenizer(self, tokenizers_dir):
+        """Counts come from the tokenizer and calibration is ignored."""
+        counter = TokenCounter("gemma3:1b", find_tokenizer_file("gemma3:1b", tokenizers_dir))
+        counter.calibrate("x" * 3000, 1000)
+
+        assert counter.is_exact
+        assert counter.count("the court ruled") == 3
+
+    def test_unreadable_file_falls_back_to_estimate(self, tmp_path):
+        """A corrupt tokenizer file is reported and the estimator used instead."""
+        bad = tmp_path / "broken.json"
+        bad.write_text("{not json")
+
+        counter = TokenCounter("broken", bad, chars_per_token=4.0)
+
+        assert not counter.is_exact
+        assert counter.count("x" * 8) == 2
+
+
+class TestPack:
+    """Tests for greedy prompt packing."""
+
+    def test_packs_consecutive_texts_under_budget(self, estimator):
+        """Texts fill each group up to the budget, separators included."""
+        texts = ["x" * 40] * 5  # 10 tokens each; "\n\n" costs 1
+
+        assert estimator.pack(texts, budget=31) == [[0, 1], [2, 3], [4]]
+        assert estimator.pack(texts, budget=32) == [[0, 1, 2], [3, 4]]
+        assert estimator.pack(texts, budget=54) == [[0, 1, 2, 3, 4]]
+
+    def test_oversized_text_gets_own_group(self, estimator):
+        """A text larger than the budget is never merged or dropped."""
+        texts = ["x" * 40, "x" * 400, "x" * 40]
+
+        assert estimator.pack(texts, budget=30) == [[0], [1], [2]]